@@ -0,0 +1,150 @@
+import atexit
+import copy
+import hashlib
+import threading
+import time
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from app.utils import LRUCache, memoize_for_request
+from users.models import User
+
+
+validated_tokens = LRUCache(max_size=settings.JWT_VALIDATED_TOKEN_CACHE_SIZE)
+users = LRUCache(max_size=settings.JWT_USER_CACHE_SIZE)
+
+CACHE_VERSION_KEY = "a12n_jwt_cache_version"
+
+
+def get_cache_version() -> str:
+    """
+    Version of the per-process caches shared by all processes. Entries cached with another version are stale:
+    the version is changed when a user is deactivated or deleted and when a token is blacklisted.
+    """
+    return memoize_for_request(CACHE_VERSION_KEY, lambda: cache.get_or_set(CACHE_VERSION_KEY, uuid4().hex, timeout=None))
+
+
+def bump_cache_version() -> None:
+    cache.set(CACHE_VERSION_KEY, uuid4().hex, timeout=None)
+
+
+def get_cached(lru_cache: LRUCache, key: Any) -> Any | None:
+    entry = lru_cache.get(key)
+    if entry is None:
+        return None
+
+    version, value = entry
+    return value if version == get_cache_version() else None
+
+
+def get_user(user_id: Any) -> User:
+    """Return user by id from the per-process cache, evicted on every save of the user"""
+    user = get_cached(users, user_id)
+    if user is None:
+        user = User.objects.get(pk=user_id)
+        users.set(user_id, (get_cache_version(), user), timeout=settings.JWT_USER_CACHE_SECONDS)
+
+    return copy.copy(user)  # requests must not share the instance
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that verifies every token once per process.
+
+    Validated tokens are cached by hash of the raw token until they expire, but not longer than
+    JWT_VALIDATED_TOKEN_CACHE_SECONDS. Every process drops its cached tokens and users once the shared cache version is changed,
+    so a blacklisted token or a deactivated user stops working everywhere at once.
+    """
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        key = hashlib.sha256(raw_token).hexdigest()
+        token = get_cached(validated_tokens, key)
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            validated_tokens.set(key, (get_cache_version(), token), timeout=min(settings.JWT_VALIDATED_TOKEN_CACHE_SECONDS, token["exp"] - time.time()))
+
+        return token
+
+    def get_user(self, validated_token: Token) -> User:
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        try:
+            user = get_user(user_id)
+        except User.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
+
+
+class LastLoginBuffer:
+    """
+    Collect last logins of the process and write them with one query
+    when LAST_LOGIN_FLUSH_SIZE users are collected or LAST_LOGIN_FLUSH_INTERVAL_SECONDS have passed.
+    A timer flushes logins left pending when no more logins are recorded.
+    """
+
+    def __init__(self) -> None:
+        self.pending: dict[UUID, datetime] = {}
+        self.flushed_at = time.monotonic()
+        self.lock = threading.Lock()
+        self.timer: threading.Timer | None = None
+
+    def record(self, user: User) -> None:
+        with self.lock:
+            self.pending[user.pk] = timezone.now()
+            is_due = len(self.pending) >= settings.LAST_LOGIN_FLUSH_SIZE or time.monotonic() - self.flushed_at >= settings.LAST_LOGIN_FLUSH_INTERVAL_SECONDS
+            if not is_due and self.timer is None:
+                self.timer = threading.Timer(settings.LAST_LOGIN_FLUSH_INTERVAL_SECONDS, self.flush_on_timer)
+                self.timer.daemon = True
+                self.timer.start()
+
+        if is_due:
+            self.flush()
+
+    def flush_on_timer(self) -> None:
+        try:
+            self.flush()
+        finally:
+            connection.close()  # the connection of the timer thread
+
+    def flush(self) -> None:
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.flushed_at = time.monotonic()
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+        if not pending:
+            return
+
+        with connection.cursor() as cursor:
+            table = connection.ops.quote_name(User._meta.db_table)  # noqa: SLF001
+            values = ", ".join(["(%s::uuid, %s::timestamptz)"] * len(pending))
+            cursor.execute(
+                f"UPDATE {table} SET last_login = logins.last_login FROM (VALUES {values}) AS logins (id, last_login) "  # noqa: S608
+                f"WHERE {table}.id = logins.id AND ({table}.last_login IS NULL OR {table}.last_login < logins.last_login)",
+                [value for user_id_and_login in pending.items() for value in user_id_and_login],
+            )
+
+
+last_logins = LastLoginBuffer()
+atexit.register(last_logins.flush)
@@ -1,8 +1,11 @@
 from typing import Any
 
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenObtainSlidingSerializer
 from rest_social_auth.serializers import JWTSlidingSerializer
 
+from a12n.api.authentication import last_logins
+
 
 class SlidingTokenObtainByUsernameCodeSerializer(serializers.Serializer):
     username = serializers.CharField(max_length=70)
@@ -14,6 +17,14 @@ class ResponseSlidingTokenObtainByUsernameCodeSerializer(serializers.Serializer)
     token = serializers.CharField(max_length=4096)
 
 
+class BatchedLastLoginTokenObtainSlidingSerializer(TokenObtainSlidingSerializer):
+    def validate(self, attrs: dict[str, Any]) -> dict[str, str]:
+        data = super().validate(attrs)
+        last_logins.record(self.user)
+
+        return data
+
+
 class SocialJWTSlidingSerializer(JWTSlidingSerializer):
     def get_token(self, obj: Any) -> str:
         return str(self.get_token_instance())
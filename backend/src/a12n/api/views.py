@@ -14,7 +14,13 @@ from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.tokens import SlidingToken
 from rest_social_auth.views import SocialJWTSlidingOnlyAuthView
 
-from a12n.api.serializers import ResponseSlidingTokenObtainByUsernameCodeSerializer, SlidingTokenObtainByUsernameCodeSerializer, SocialJWTSlidingSerializer
+from a12n.api.authentication import get_user
+from a12n.api.serializers import (
+    BatchedLastLoginTokenObtainSlidingSerializer,
+    ResponseSlidingTokenObtainByUsernameCodeSerializer,
+    SlidingTokenObtainByUsernameCodeSerializer,
+    SocialJWTSlidingSerializer,
+)
 from a12n.api.throttling import AuthAnonRateThrottle, AuthByEmailCodeAnonRateThrottle
 from a12n.services.token_by_code_generator import TokenGeneratorByCode
 from users.models import User
@@ -40,6 +46,7 @@ class TokenObtainByCodeView(APIView):
 
 class TokenObtainByPasswordView(jwt.TokenObtainSlidingView):
     throttle_classes = [AuthAnonRateThrottle]
+    serializer_class = BatchedLastLoginTokenObtainSlidingSerializer
 
 
 class TokenRefreshView(jwt.TokenRefreshSlidingView):
@@ -54,7 +61,7 @@ class TokenRefreshView(jwt.TokenRefreshSlidingView):
         except (TokenError, KeyError) as e:
             raise InvalidToken(e.args[0])
 
-        user = User.objects.get(pk=user_id)
+        user = get_user(user_id)
         if not user.is_active:
             raise InvalidToken("Inactive user")
 
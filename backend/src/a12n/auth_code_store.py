@@ -0,0 +1,132 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cache
+from uuid import UUID, uuid4
+
+import redis
+from django.conf import settings
+
+from a12n.models import PasswordlessEmailAuthCode, default_expiration, gen_code
+from users.models import User
+
+
+@dataclass
+class AuthCode:
+    id: UUID
+    user: User
+    code: str
+    expires: datetime | None = None
+
+
+class DatabaseAuthCodeStore:
+    """Codes are rows of PasswordlessEmailAuthCode, stale ones are deleted by the purge task"""
+
+    def create(self, user: User) -> AuthCode:
+        auth_code = PasswordlessEmailAuthCode.objects.create(user=user)
+        return AuthCode(id=auth_code.id, user=user, code=auth_code.code, expires=auth_code.expires)
+
+    def get_valid_code(self, user: User, code: str) -> AuthCode | None:
+        auth_code = PasswordlessEmailAuthCode.objects.get_valid_code(user, code)
+        if auth_code is None:
+            return None
+
+        return AuthCode(id=auth_code.id, user=user, code=auth_code.code, expires=auth_code.expires)
+
+    def consume(self, user: User, code: str) -> bool:
+        return PasswordlessEmailAuthCode.objects.consume_valid_code(user, code)
+
+    def get_username_and_code(self, code_id: str) -> tuple[str, str] | None:
+        return PasswordlessEmailAuthCode.objects.values_list("user__username", "code").filter(id=code_id).first()
+
+    def purge(self) -> int:
+        return PasswordlessEmailAuthCode.objects.purge(retention=settings.PASSWORDLESS_EMAIL_CODE_RETENTION)
+
+
+class RedisAuthCodeStore:
+    """
+    Codes are redis keys expiring with the code, so nothing has to be purged.
+
+    A code is consumed with one GETDEL, so it can't be used twice. Failed attempts are counted per user,
+    after PASSWORDLESS_EMAIL_CODE_MAX_ATTEMPTS of them no code of the user is accepted until the counter expires.
+    """
+
+    def create(self, user: User) -> AuthCode:
+        auth_code = AuthCode(id=uuid4(), user=user, code=gen_code(), expires=default_expiration())
+
+        pipeline = self.redis.pipeline()
+        pipeline.set(self.get_code_key(user, auth_code.code), str(auth_code.id), ex=self.ttl)
+        pipeline.set(self.get_id_key(auth_code.id), json.dumps([user.username, auth_code.code]), ex=self.ttl)
+        pipeline.execute()
+
+        return auth_code
+
+    def get_valid_code(self, user: User, code: str) -> AuthCode | None:
+        code_id = self.redis.get(self.get_code_key(user, code))
+        if code_id is None or self.is_locked(user):
+            return None
+
+        return AuthCode(id=UUID(code_id.decode()), user=user, code=code)
+
+    def consume(self, user: User, code: str) -> bool:
+        if self.is_locked(user):
+            return False
+
+        if self.redis.getdel(self.get_code_key(user, code)) is None:
+            self.register_failed_attempt(user)
+            return False
+
+        self.redis.delete(self.get_attempts_key(user))
+        return True
+
+    def get_username_and_code(self, code_id: str) -> tuple[str, str] | None:
+        value = self.redis.get(self.get_id_key(code_id))
+        if value is None:
+            return None
+
+        username, code = json.loads(value)
+        return username, code
+
+    def purge(self) -> int:
+        return 0
+
+    def is_locked(self, user: User) -> bool:
+        return int(self.redis.get(self.get_attempts_key(user)) or 0) >= settings.PASSWORDLESS_EMAIL_CODE_MAX_ATTEMPTS
+
+    def register_failed_attempt(self, user: User) -> None:
+        key = self.get_attempts_key(user)
+        if self.redis.incr(key) == 1:
+            self.redis.expire(key, self.ttl)
+
+    @property
+    def redis(self) -> redis.Redis:
+        return get_redis_client(settings.PASSWORDLESS_EMAIL_CODE_REDIS_URL)
+
+    @property
+    def ttl(self) -> int:
+        return int(settings.PASSWORDLESS_EMAIL_CODE_EXPIRATION_TIME.total_seconds())
+
+    @staticmethod
+    def get_code_key(user: User, code: str) -> str:
+        return f"auth_code_{user.id}_{code}"
+
+    @staticmethod
+    def get_id_key(code_id: UUID | str) -> str:
+        return f"auth_code_id_{code_id}"
+
+    @staticmethod
+    def get_attempts_key(user: User) -> str:
+        return f"auth_code_attempts_{user.id}"
+
+
+@cache
+def get_redis_client(url: str) -> redis.Redis:
+    return redis.Redis.from_url(url)
+
+
+def get_auth_code_store(user: User | None = None) -> DatabaseAuthCodeStore | RedisAuthCodeStore:
+    """Pass the user to check a code: codes of the apple review accounts are rows created in the admin, whatever the store is"""
+    if settings.PASSWORDLESS_EMAIL_CODE_STORE == "redis" and not (user is not None and user.is_apple_review_account()):
+        return RedisAuthCodeStore()
+
+    return DatabaseAuthCodeStore()
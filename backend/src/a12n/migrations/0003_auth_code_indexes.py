@@ -0,0 +1,24 @@
+# Generated by Django 4.2.21 on 2026-10-18 12:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("a12n", "0002_verbose_name_for_l12n"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="passwordlessemailauthcode",
+            index=models.Index(condition=models.Q(("used__isnull", True)), fields=["user", "code"], name="a12n_auth_code_unused_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="passwordlessemailauthcode",
+            index=models.Index(fields=["expires"], name="a12n_auth_code_expires_idx"),
+        ),
+    ]
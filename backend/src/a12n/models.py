@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
 from django.conf import settings
@@ -27,6 +27,30 @@ class PasswordlessEmailAuthCodeQuerySet(models.QuerySet):
             used__isnull=True,
         ).first()
 
+    def consume_valid_code(self, user: User, code: str) -> bool:
+        """Mark the code as used if it is valid; the check and the update are one statement"""
+        now = timezone.now()
+        return (
+            self.filter(
+                user=user,
+                code=code,
+                expires__gt=now,
+                used__isnull=True,
+            ).update(used=now, modified=now)
+            > 0
+        )
+
+    def purge(self, retention: timedelta, batch_size: int = 1000) -> int:
+        """Delete codes expired or used longer than `retention` ago in batches, return number of deleted codes"""
+        threshold = timezone.now() - retention
+        stale = self.filter(models.Q(expires__lt=threshold) | models.Q(used__lt=threshold))
+
+        deleted = 0
+        while ids := list(stale.values_list("id", flat=True)[:batch_size]):
+            deleted += self.filter(id__in=ids).delete()[0]
+
+        return deleted
+
 
 PasswordlessEmailAuthCodeManager = models.Manager.from_queryset(PasswordlessEmailAuthCodeQuerySet)
 
@@ -46,3 +70,7 @@ class PasswordlessEmailAuthCode(TimestampedModel):
     class Meta:
         verbose_name = _("Passwordless email auth code")
         verbose_name_plural = _("Passwordless email auth codes")
+        indexes = [
+            models.Index(fields=["user", "code"], condition=models.Q(used__isnull=True), name="a12n_auth_code_unused_idx"),
+            models.Index(fields=["expires"], name="a12n_auth_code_expires_idx"),
+        ]
@@ -1,15 +1,13 @@
 from collections.abc import Callable
 from dataclasses import dataclass
 
-from django.db.transaction import on_commit
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt.tokens import SlidingToken, Token
 
-from a12n.models import PasswordlessEmailAuthCode
+from a12n.auth_code_store import get_auth_code_store
 from app.exceptions import AppServiceException
 from app.services import BaseService
-from mindbox.tasks import notify_user_logged_in
 from users.models import User
 from users.services import UserEmailConfirmator
 
@@ -28,13 +26,19 @@ class TokenGeneratorByCode(BaseService):
 
     def act(self) -> Token:
         if self.device_uuid:
-            on_commit(lambda: notify_user_logged_in.delay(str(self.user.id), self.device_uuid))
+            self.notify_mindbox()
         UserEmailConfirmator(self.user)()
         return SlidingToken.for_user(self.user)
 
+    def notify_mindbox(self) -> None:
+        from mindbox.models import MindboxOutboxOperation
+        from mindbox.services import MindboxOutboxEventCreator
+
+        MindboxOutboxEventCreator(user=self.user, operation=MindboxOutboxOperation.NOTIFY_USER_LOGGED_IN, params={"device_uuid": self.device_uuid})()
+
     @cached_property
     def user(self) -> User:
-        user = User.objects.filter(username__iexact=self.username).first()
+        user = User.objects.by_username(self.username).first()
         if not user:
             raise TokenGeneratorByCodeException(_("Account does not exist, try another one or create a new one."))
         return user
@@ -50,8 +54,8 @@ class TokenGeneratorByCode(BaseService):
             raise TokenGeneratorByCodeException(_("Inactive user, please, contact the administrator."))
 
     def validate_code(self) -> None:
-        auth_code = PasswordlessEmailAuthCode.objects.get_valid_code(self.user, self.code)
-        if not auth_code:
+        store = get_auth_code_store(self.user)
+        # codes of the apple review accounts are reused by the reviewers
+        is_valid = store.get_valid_code(self.user, self.code) is not None if self.user.is_apple_review_account() else store.consume(self.user, self.code)
+        if not is_valid:
             raise TokenGeneratorByCodeException(_("Invalid code, please try again."))
-        if not self.user.is_apple_review_account():
-            auth_code.mark_as_used()
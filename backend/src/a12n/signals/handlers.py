@@ -0,0 +1,30 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from a12n.api.authentication import bump_cache_version, users, validated_tokens
+from users.models import User
+
+
+def evict_cached_user(instance: User, update_fields: frozenset[str] | None = None, **kwargs: Any) -> None:
+    users.delete(instance.pk)
+
+    # users cached by other processes
+    if not instance.is_active and (update_fields is None or "is_active" in update_fields):
+        bump_cache_version()
+
+
+def evict_deleted_user(instance: User, **kwargs: Any) -> None:
+    users.delete(instance.pk)
+    bump_cache_version()
+
+
+def evict_validated_tokens(**kwargs: Any) -> None:
+    validated_tokens.clear()
+    bump_cache_version()
+
+
+post_save.connect(evict_cached_user, sender=User, dispatch_uid="evict_cached_user_on_save")
+post_delete.connect(evict_deleted_user, sender=User, dispatch_uid="evict_cached_user_on_delete")
+post_save.connect(evict_validated_tokens, sender=BlacklistedToken, dispatch_uid="evict_validated_tokens_on_blacklist")
@@ -0,0 +1,8 @@
+from app.celery import celery
+
+
+@celery.task(name="purge_passwordless_email_auth_codes")
+def purge_passwordless_email_auth_codes() -> int:
+    from a12n.auth_code_store import get_auth_code_store
+
+    return get_auth_code_store().purge()
@@ -11,8 +11,8 @@ pytestmark = [
 
 
 @pytest.fixture(autouse=True)
-def mock_notify_task(mocker):
-    return mocker.patch("mindbox.tasks.notify_user_logged_in.delay")
+def mock_drain_mindbox_outbox(mocker):
+    return mocker.patch("mindbox.tasks.drain_mindbox_outbox.apply_async")
 
 
 @pytest.fixture(autouse=True)
@@ -4,6 +4,7 @@ from rest_framework_simplejwt.tokens import Token
 
 from a12n.models import PasswordlessEmailAuthCode
 from a12n.services.token_by_code_generator import TokenGeneratorByCode, TokenGeneratorByCodeException
+from mindbox.models import MindboxOutboxEvent, MindboxOutboxOperation
 
 
 pytestmark = [
@@ -26,8 +27,8 @@ def auth_code(user):
 
 
 @pytest.fixture(autouse=True)
-def mock_notify_task(mocker):
-    return mocker.patch("mindbox.tasks.notify_user_logged_in.delay")
+def mock_drain_mindbox_outbox(mocker):
+    return mocker.patch("mindbox.tasks.drain_mindbox_outbox.apply_async")
 
 
 @pytest.fixture
@@ -46,26 +47,28 @@ def test_successful_token_generation(service, user, auth_code):
     assert user.email_confirmed_at is not None
 
 
-def test_call_notify_task(service, user, mock_notify_task, django_capture_on_commit_callbacks):
-    with django_capture_on_commit_callbacks(execute=True):
-        service()
+def test_add_notify_event_to_mindbox_outbox(service, user):
+    service()
 
-    mock_notify_task.assert_called_once_with(str(user.id), "device-123")
+    event = MindboxOutboxEvent.objects.get()
+    assert event.user == user
+    assert event.operation == MindboxOutboxOperation.NOTIFY_USER_LOGGED_IN
+    assert event.params == {"device_uuid": "device-123"}
 
 
-def test_not_call_notify_task_if_device_uuid_is_empty(service, user, mock_notify_task, django_capture_on_commit_callbacks):
+def test_schedule_mindbox_outbox_drain(service, mock_drain_mindbox_outbox, django_capture_on_commit_callbacks):
     with django_capture_on_commit_callbacks(execute=True):
         service()
 
-    mock_notify_task.assert_called_once_with(str(user.id), "device-123")
+    mock_drain_mindbox_outbox.assert_called_once()
 
 
-def test_no_notification_without_device_uuid(service, mock_notify_task):
+def test_no_notification_without_device_uuid(service):
     service.device_uuid = ""
 
     service()
 
-    mock_notify_task.assert_not_called()
+    assert not MindboxOutboxEvent.objects.exists()
 
 
 def test_case_insensitive_username(user, service):
@@ -121,3 +124,13 @@ def test_used_code(user, service):
 
     with pytest.raises(TokenGeneratorByCodeException, match="Invalid code"):
         service()
+
+
+def test_apple_review_account_logs_in_with_database_code_when_redis_store_is_enabled(service, user, auth_code, settings, mocker):
+    settings.PASSWORDLESS_EMAIL_CODE_STORE = "redis"
+    settings.APPLE_REVIEW_ACCOUNT_EMAIL = user.email
+    get_redis_client = mocker.patch("a12n.auth_code_store.get_redis_client")
+
+    assert isinstance(service(), Token)
+    assert isinstance(service(), Token)  # review codes are reused
+    get_redis_client.assert_not_called()
@@ -0,0 +1,134 @@
+from datetime import timedelta
+
+import fakeredis
+import pytest
+from django.utils import timezone
+
+from a12n.auth_code_store import DatabaseAuthCodeStore, RedisAuthCodeStore, get_auth_code_store
+from a12n.models import PasswordlessEmailAuthCode
+from a12n.tasks import purge_passwordless_email_auth_codes
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def store():
+    return DatabaseAuthCodeStore()
+
+
+@pytest.fixture
+def auth_code(store, user):
+    return store.create(user)
+
+
+def test_database_store_is_used_by_default():
+    assert isinstance(get_auth_code_store(), DatabaseAuthCodeStore)
+
+
+def test_code_is_consumed_once(store, user, auth_code):
+    assert store.consume(user, auth_code.code) is True
+    assert store.consume(user, auth_code.code) is False
+    assert PasswordlessEmailAuthCode.objects.get(id=auth_code.id).used is not None
+
+
+def test_code_of_other_user_is_not_consumed(store, factory, auth_code):
+    assert store.consume(factory.user(), auth_code.code) is False
+
+
+def test_valid_code_is_not_consumed_when_checked(store, user, auth_code):
+    assert store.get_valid_code(user, auth_code.code).id == auth_code.id
+    assert store.consume(user, auth_code.code) is True
+
+
+def test_username_and_code(store, user, auth_code):
+    assert store.get_username_and_code(str(auth_code.id)) == (user.username, auth_code.code)
+
+
+def test_stale_codes_are_purged(user, auth_code, settings):
+    settings.PASSWORDLESS_EMAIL_CODE_RETENTION = timedelta(days=1)
+    expired = PasswordlessEmailAuthCode.objects.create(user=user, expires=timezone.now() - timedelta(days=2))
+    used = PasswordlessEmailAuthCode.objects.create(user=user, used=timezone.now() - timedelta(days=2))
+
+    assert purge_passwordless_email_auth_codes() == 2
+
+    assert set(PasswordlessEmailAuthCode.objects.values_list("id", flat=True)) == {auth_code.id}
+    assert not PasswordlessEmailAuthCode.objects.filter(id__in=[expired.id, used.id]).exists()
+
+
+@pytest.fixture
+def redis(mocker):
+    redis = fakeredis.FakeRedis()
+    mocker.patch("a12n.auth_code_store.get_redis_client", return_value=redis)
+    return redis
+
+
+@pytest.fixture
+def redis_store(settings, redis):
+    settings.PASSWORDLESS_EMAIL_CODE_STORE = "redis"
+    settings.PASSWORDLESS_EMAIL_CODE_MAX_ATTEMPTS = 3
+    return RedisAuthCodeStore()
+
+
+@pytest.fixture
+def redis_code(redis_store, user):
+    return redis_store.create(user)
+
+
+def test_redis_store_is_used_if_enabled(redis_store, user):
+    assert isinstance(get_auth_code_store(), RedisAuthCodeStore)
+    assert isinstance(get_auth_code_store(user), RedisAuthCodeStore)
+
+
+def test_database_store_is_used_for_apple_review_account(redis_store, user, settings):
+    settings.APPLE_REVIEW_ACCOUNT_EMAIL = user.email
+
+    assert isinstance(get_auth_code_store(user), DatabaseAuthCodeStore)
+
+
+def test_redis_code_is_consumed_once(redis_store, user, redis_code):
+    assert redis_store.consume(user, redis_code.code) is True
+    assert redis_store.consume(user, redis_code.code) is False
+
+
+def test_redis_code_of_other_user_is_not_consumed(redis_store, factory, redis_code):
+    assert redis_store.consume(factory.user(), redis_code.code) is False
+
+
+def test_redis_code_is_not_consumed_when_checked(redis_store, user, redis_code):
+    assert redis_store.get_valid_code(user, redis_code.code).id == redis_code.id
+    assert redis_store.consume(user, redis_code.code) is True
+
+
+def test_redis_username_and_code(redis_store, user, redis_code):
+    assert redis_store.get_username_and_code(str(redis_code.id)) == (user.username, redis_code.code)
+
+
+def test_redis_keys_expire_with_code(redis_store, redis, user, redis_code, settings):
+    ttl = settings.PASSWORDLESS_EMAIL_CODE_EXPIRATION_TIME.total_seconds()
+
+    assert 0 < redis.ttl(redis_store.get_code_key(user, redis_code.code)) <= ttl
+    assert 0 < redis.ttl(redis_store.get_id_key(redis_code.id)) <= ttl
+
+
+def test_user_is_locked_out_after_failed_attempts(redis_store, redis, user, redis_code):
+    for _ in range(3):
+        assert redis_store.consume(user, "wrong") is False
+
+    assert redis_store.consume(user, redis_code.code) is False
+    assert redis_store.get_valid_code(user, redis_code.code) is None
+    assert redis.ttl(redis_store.get_attempts_key(user)) > 0
+
+
+def test_failed_attempts_are_reset_by_valid_code(redis_store, user, redis_code):
+    for _ in range(2):
+        redis_store.consume(user, "wrong")
+
+    assert redis_store.consume(user, redis_code.code) is True
+
+    another_code = redis_store.create(user)
+    for _ in range(2):
+        redis_store.consume(user, "wrong")
+    assert redis_store.consume(user, another_code.code) is True
@@ -0,0 +1,145 @@
+import pytest
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import SlidingToken
+
+from a12n.api.authentication import LastLoginBuffer, bump_cache_version, get_cache_version, users, validated_tokens
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    validated_tokens.clear()
+    users.clear()
+
+
+@pytest.fixture
+def as_jwt_user(as_anon, user):
+    as_anon.credentials(HTTP_AUTHORIZATION=f"Bearer {SlidingToken.for_user(user)}")
+    return as_anon
+
+
+@pytest.fixture
+def verify_token(mocker):
+    return mocker.spy(SlidingToken, "verify")
+
+
+def test_token_is_verified_once(as_jwt_user, verify_token):
+    as_jwt_user.get("/api/demo/users/me/")
+    as_jwt_user.get("/api/demo/users/me/")
+
+    assert verify_token.call_count == 1
+
+
+def test_user_is_cached(as_jwt_user, user):
+    as_jwt_user.get("/api/demo/users/me/")
+
+    assert users.get(user.id)[1] == user
+
+
+def test_deactivated_user_is_not_authenticated(as_jwt_user, user):
+    as_jwt_user.get("/api/demo/users/me/")
+
+    user.is_active = False
+    user.save(update_fields=["is_active"])
+
+    as_jwt_user.get("/api/demo/users/me/", expected_status=401)
+
+
+def test_blacklisted_token_is_evicted(as_jwt_user, user):
+    token = SlidingToken.for_user(user)
+    as_jwt_user.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    as_jwt_user.get("/api/demo/users/me/")
+
+    token.blacklist()
+
+    assert not validated_tokens.entries
+
+
+def test_caches_of_other_version_are_not_used(as_jwt_user, verify_token):
+    as_jwt_user.get("/api/demo/users/me/")
+
+    bump_cache_version()  # e.g. by another process
+    as_jwt_user.get("/api/demo/users/me/")
+
+    assert verify_token.call_count == 2
+
+
+def test_deactivation_changes_shared_cache_version(user):
+    version = get_cache_version()
+
+    user.is_active = False
+    user.save(update_fields=["is_active"])
+
+    assert get_cache_version() != version
+
+
+def test_other_user_changes_keep_shared_cache_version(user):
+    version = get_cache_version()
+
+    user.first_name = "Changed"
+    user.save(update_fields=["first_name"])
+
+    assert get_cache_version() == version
+
+
+def test_blacklisting_changes_shared_cache_version(user):
+    version = get_cache_version()
+
+    SlidingToken.for_user(user).blacklist()
+
+    assert get_cache_version() != version
+
+
+def test_pending_last_logins_are_flushed_by_timer(user, settings, mocker):
+    settings.LAST_LOGIN_FLUSH_INTERVAL_SECONDS = 5
+    timer = mocker.patch("a12n.api.authentication.threading.Timer")
+    buffer = LastLoginBuffer()
+
+    buffer.record(user)
+    buffer.record(user)
+
+    timer.assert_called_once_with(5, buffer.flush_on_timer)
+    timer.return_value.start.assert_called_once()
+
+
+def test_flush_cancels_timer(user, mocker):
+    timer = mocker.patch("a12n.api.authentication.threading.Timer")
+    buffer = LastLoginBuffer()
+    buffer.record(user)
+
+    buffer.flush()
+
+    timer.return_value.cancel.assert_called_once()
+    assert buffer.timer is None
+
+
+def test_last_logins_are_written_on_flush(user, settings):
+    settings.LAST_LOGIN_FLUSH_SIZE = 100
+    buffer = LastLoginBuffer()
+
+    buffer.record(user)
+    user.refresh_from_db()
+    assert user.last_login is None
+
+    buffer.flush()
+    user.refresh_from_db()
+    assert user.last_login is not None
+    assert user.last_login <= timezone.now()
+
+
+def test_last_logins_are_flushed_when_buffer_is_full(user, factory, settings):
+    settings.LAST_LOGIN_FLUSH_SIZE = 2
+    other_user = factory.user()
+    buffer = LastLoginBuffer()
+
+    buffer.record(user)
+    buffer.record(other_user)
+
+    user.refresh_from_db()
+    other_user.refresh_from_db()
+    assert user.last_login is not None
+    assert other_user.last_login is not None
@@ -5,7 +5,7 @@ from django.http.request import HttpRequest
 from django.utils.translation import gettext_lazy as _
 
 from app.admin.model_admin import ModelAdmin
-from app.models import ShopDeadLetter
+from app.models import ShopDeadLetter, ShopInboxEvent
 from product_access.api.demo.serializers import OrderCheckoutSerializer
 from product_access.services import ProductCheckoutProcessor
 
@@ -25,11 +25,13 @@ class ShopDeadLetterAdmin(ModelAdmin):
     list_display = [
         "event_type",
         "created",
+        "replayed_at",
     ]
 
     list_filter = [
         "event_type",
         "created",
+        "replayed_at",
     ]
 
     search_fields = [
@@ -39,6 +41,7 @@ class ShopDeadLetterAdmin(ModelAdmin):
     ]
     actions = [
         "resend_grant_access_event",
+        "replay_through_inbox",
     ]
 
     @admin.action(description=_("Resend grant access events"))
@@ -53,3 +56,44 @@ class ShopDeadLetterAdmin(ModelAdmin):
             _("Events are resent").format(count=queryset.count()),
             messages.SUCCESS,
         )
+
+    @admin.action(description=_("Replay through the shop inbox"))
+    def replay_through_inbox(self, request: HttpRequest, queryset: QuerySet[ShopDeadLetter]) -> None:
+        from app.tasks import replay_shop_dead_letters
+
+        replay_shop_dead_letters.delay(ids=[str(dead_letter_id) for dead_letter_id in queryset.values_list("id", flat=True)])
+
+        self.message_user(request, _("Events will be replayed in the background"), messages.SUCCESS)
+
+
+@register(ShopInboxEvent)
+class ShopInboxEventAdmin(ModelAdmin):
+    list_display = [
+        "event_type",
+        "ordering_key",
+        "created",
+        "processed_at",
+        "attempts",
+    ]
+    list_filter = [
+        "event_type",
+        "processed_at",
+    ]
+    search_fields = [
+        "=event_key",
+        "=ordering_key",
+    ]
+    readonly_fields = [
+        "event_key",
+        "event_type",
+        "ordering_key",
+        "raw_data",
+        "processed_at",
+        "attempts",
+        "last_error",
+        "created",
+        "modified",
+    ]
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
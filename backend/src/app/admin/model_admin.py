@@ -1,11 +1,23 @@
+from pathlib import PurePath
+
+from django.conf import settings
 from django.contrib import admin
 from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.core import signing
+from django.core.exceptions import PermissionDenied
+from django.core.files.storage import storages
+from django.db.models import QuerySet
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse
+from django.urls import URLPattern, path
+from django.utils.translation import gettext_lazy as _
 
 
 class ModelAdmin(admin.ModelAdmin):
     """App-wide admin customizations"""
 
     export_action_names: list[str] = []
+    export_field_names: list[str] | None = None
+    export_compress: bool = False
 
     def changelist_view(self, request, extra_context=None):  # type: ignore
         if request.method == "POST" and "action" in request.POST:
@@ -16,3 +28,46 @@ class ModelAdmin(admin.ModelAdmin):
                 return getattr(self, action)(request, queryset)
 
         return super().changelist_view(request, extra_context)
+
+    @admin.action(description=_("Export to CSV"))
+    def export_as_csv(self, request: HttpRequest, queryset: QuerySet) -> HttpResponse:
+        """Add to `actions` and `export_action_names` to export selected or all rows, large exports are rendered in background"""
+        from app.services import ExportModelAsCSV
+
+        return ExportModelAsCSV(
+            admin_view=self,
+            request=request,
+            queryset=queryset,
+            field_names=self.export_field_names,
+            compress=self.export_compress,
+            run_async=queryset.count() > settings.CSV_EXPORT_ASYNC_THRESHOLD,
+        )()
+
+    def get_urls(self) -> list[URLPattern]:
+        opts = self.model._meta  # noqa: SLF001
+        return [
+            path(
+                "export/<str:token>/",
+                self.admin_site.admin_view(self.download_export),
+                name=f"{opts.app_label}_{opts.model_name}_download_export",
+            ),
+            *super().get_urls(),
+        ]
+
+    def download_export(self, request: HttpRequest, token: str) -> FileResponse:
+        """Serve a file rendered by the background export, links are signed and expire after CSV_EXPORT_LINK_MAX_AGE_SECONDS"""
+        from app.services.export_model_as_csv import EXPORT_LINK_SALT
+
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+
+        try:
+            export_path = signing.loads(token, salt=EXPORT_LINK_SALT, max_age=settings.CSV_EXPORT_LINK_MAX_AGE_SECONDS)
+        except signing.BadSignature:
+            raise Http404
+
+        storage = storages["exports"]
+        if not storage.exists(export_path):
+            raise Http404  # the export is not ready yet
+
+        return FileResponse(storage.open(export_path), as_attachment=True, filename=PurePath(export_path).name)
@@ -1,7 +1,14 @@
 from django.conf import settings
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 
 class AppPagination(PageNumberPagination):
     page_size_query_param = "page_size"
     max_page_size = settings.MAX_PAGE_SIZE
+
+
+class AppCursorPagination(CursorPagination):
+    """Keyset pagination for large append-only lists, paged by `created` in the reverse order"""
+
+    page_size_query_param = "page_size"
+    max_page_size = settings.MAX_PAGE_SIZE
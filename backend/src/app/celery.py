@@ -1,6 +1,7 @@
 import os
 
 from celery import Celery
+from celery.schedules import crontab
 from django.conf import settings
 
 
@@ -12,4 +13,17 @@ celery = Celery("app")
 celery.config_from_object("django.conf:settings", namespace="CELERY")
 celery.autodiscover_tasks(lambda: settings.INSTALLED_APPS)
 
-celery.conf.beat_schedule = {}
+celery.conf.beat_schedule = {
+    "purge_passwordless_email_auth_codes": {
+        "task": "purge_passwordless_email_auth_codes",
+        "schedule": crontab(minute=0),
+    },
+    "mindbox_drain_outbox": {  # drains are scheduled on commit, the sweep sends events stranded by a lost drain
+        "task": "mindbox_drain_outbox",
+        "schedule": crontab(minute="*/5"),
+    },
+    "drain_shop_inbox": {  # the same sweep for acknowledged shop events
+        "task": "drain_shop_inbox",
+        "schedule": crontab(minute="*/5"),
+    },
+}
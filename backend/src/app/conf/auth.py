@@ -80,7 +80,7 @@ SIMPLE_JWT = {
     "SIGNING_KEY": env.str("JWT_PRIVATE_KEY", multiline=True),
     "VERIFYING_KEY": env.str("JWT_PUBLIC_KEY", multiline=True),
     "AUTH_HEADER_TYPES": ("Bearer",),
-    "UPDATE_LAST_LOGIN": True,
+    "UPDATE_LAST_LOGIN": False,  # last logins are batched by a12n.api.authentication.LastLoginBuffer
 }
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -98,8 +98,19 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+JWT_VALIDATED_TOKEN_CACHE_SIZE = env("JWT_VALIDATED_TOKEN_CACHE_SIZE", cast=int, default=10000)
+JWT_VALIDATED_TOKEN_CACHE_SECONDS = env("JWT_VALIDATED_TOKEN_CACHE_SECONDS", cast=int, default=300)
+JWT_USER_CACHE_SIZE = env("JWT_USER_CACHE_SIZE", cast=int, default=10000)
+JWT_USER_CACHE_SECONDS = env("JWT_USER_CACHE_SECONDS", cast=int, default=30)
+LAST_LOGIN_FLUSH_SIZE = env("LAST_LOGIN_FLUSH_SIZE", cast=int, default=100)
+LAST_LOGIN_FLUSH_INTERVAL_SECONDS = env("LAST_LOGIN_FLUSH_INTERVAL_SECONDS", cast=int, default=60)
+
 PASSWORDLESS_EMAIL_CODE_LENGTH = 4
 PASSWORDLESS_EMAIL_CODE_EXPIRATION_TIME = timedelta(minutes=20)
+PASSWORDLESS_EMAIL_CODE_STORE = env("PASSWORDLESS_EMAIL_CODE_STORE", cast=str, default="database")  # database or redis
+PASSWORDLESS_EMAIL_CODE_REDIS_URL = env("PASSWORDLESS_EMAIL_CODE_REDIS_URL", cast=str, default="redis://localhost:6379/2")
+PASSWORDLESS_EMAIL_CODE_MAX_ATTEMPTS = env("PASSWORDLESS_EMAIL_CODE_MAX_ATTEMPTS", cast=int, default=5)
+PASSWORDLESS_EMAIL_CODE_RETENTION = timedelta(days=env("PASSWORDLESS_EMAIL_CODE_RETENTION_DAYS", cast=int, default=7))
 
 #
 # Security notice: we use plain bcrypt to store passwords.
@@ -4,6 +4,7 @@ from app.conf.environ import env
 CACHALOT_ENABLED = env("CACHALOT_ENABLED", cast=bool, default=False)
 CACHE_ENABLED = CACHALOT_ENABLED
 CACHE_DURATION_SECONDS = env("CACHE_DURATION_SECONDS", cast=int, default=60 * 5)
+PRODUCT_ACCESS_CACHE_MAX_DURATION_SECONDS = env("PRODUCT_ACCESS_CACHE_MAX_DURATION_SECONDS", cast=int, default=60 * 60 * 3)
 
 if CACHALOT_ENABLED:
     CACHES = {
@@ -9,5 +9,16 @@ DATABASES = {
     "default": env.db(),
 }
 
+# Optional read replica, see app.db_router.ReplicaRouter
+if env("REPLICA_DATABASE_URL", cast=str, default=""):
+    DATABASES["replica"] = {
+        **env.db("REPLICA_DATABASE_URL"),
+        "TEST": {"MIRROR": env("REPLICA_DATABASE_TEST_MIRROR", cast=str, default="default") or None},
+    }
+    DATABASE_ROUTERS = ["app.db_router.ReplicaRouter"]
+
+# For how long a client that has written something reads from the primary
+REPLICA_PIN_SECONDS = env("REPLICA_PIN_SECONDS", cast=int, default=5)
+
 # https://docs.djangoproject.com/en/3.2/releases/3.2/#customizing-type-of-auto-created-primary-keys
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
@@ -0,0 +1,6 @@
+from app.conf.environ import env
+
+
+CSV_EXPORT_CHUNK_SIZE = env("CSV_EXPORT_CHUNK_SIZE", cast=int, default=2000)
+CSV_EXPORT_ASYNC_THRESHOLD = env("CSV_EXPORT_ASYNC_THRESHOLD", cast=int, default=50000)
+CSV_EXPORT_LINK_MAX_AGE_SECONDS = env("CSV_EXPORT_LINK_MAX_AGE_SECONDS", cast=int, default=24 * 60 * 60)
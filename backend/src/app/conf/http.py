@@ -7,3 +7,10 @@ BACKEND_APP_URL = env("BACKEND_APP_URL", cast=str)
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 2500
 
 ALLOWED_HOSTS = ["*"]  # host validation is not necessary in 2020
+
+# Outbound HTTP transport, see app/http_transport.py
+HTTP_CONNECT_TIMEOUT = env("HTTP_CONNECT_TIMEOUT", cast=float, default=3.05)
+HTTP_READ_TIMEOUT = env("HTTP_READ_TIMEOUT", cast=float, default=20)
+HTTP_RETRIES = env("HTTP_RETRIES", cast=int, default=3)
+HTTP_RETRY_BACKOFF_FACTOR = env("HTTP_RETRY_BACKOFF_FACTOR", cast=float, default=0.3)
+HTTP_POOL_MAXSIZE = env("HTTP_POOL_MAXSIZE", cast=int, default=10)
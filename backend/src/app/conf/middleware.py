@@ -8,5 +8,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "app.middleware.real_ip.real_ip_middleware",
+    "app.middleware.request_memo.request_memo_middleware",
+    "app.middleware.replica_routing.replica_routing_middleware",
     "axes.middleware.AxesMiddleware",
 ]
@@ -5,3 +5,8 @@ MINDBOX_ENABLED = env("MINDBOX_ENABLED", cast=bool, default=True)
 MINDBOX_URL = env("MINDBOX_URL", cast=str, default="https://api.mindbox.ru/v3/")
 MINDBOX_ENDPOINT_ID = env("MINDBOX_ENDPOINT_ID", cast=str, default="")
 MINDBOX_ENDPOINT_SECRET_KEY = env("MINDBOX_ENDPOINT_SECRET_KEY", cast=str)
+
+MINDBOX_OUTBOX_DRAIN_DELAY_SECONDS = env("MINDBOX_OUTBOX_DRAIN_DELAY_SECONDS", cast=int, default=10)
+MINDBOX_OUTBOX_BATCH_SIZE = env("MINDBOX_OUTBOX_BATCH_SIZE", cast=int, default=500)
+MINDBOX_OUTBOX_MAX_ATTEMPTS = env("MINDBOX_OUTBOX_MAX_ATTEMPTS", cast=int, default=5)
+MINDBOX_OUTBOX_CLAIM_SECONDS = env("MINDBOX_OUTBOX_CLAIM_SECONDS", cast=int, default=10 * 60)
@@ -7,3 +7,14 @@ TINKOFF_TERMINAL_PASSWORD = env("TINKOFF_TERMINAL_PASSWORD", cast=str, default="
 TINKOFF_TAXATION = env("TINKOFF_TAXATION", cast=str, default="")
 TINKOFF_TAX = env("TINKOFF_TAX", cast=str, default="")
 TINKOFF_PAYMENT_OBJECT = env("TINKOFF_PAYMENT_OBJECT", cast=str, default="")
+
+# the limit is shared by all workers only with the shared redis cache (CACHALOT_ENABLED), otherwise every worker has its own one
+RECURRENT_CHARGE_RATE_PER_MINUTE = env("RECURRENT_CHARGE_RATE_PER_MINUTE", cast=int, default=30)
+RECURRENT_CHARGE_BATCH_SIZE = env("RECURRENT_CHARGE_BATCH_SIZE", cast=int, default=100)
+RECURRENT_CHARGE_SHARDS = env("RECURRENT_CHARGE_SHARDS", cast=int, default=4)
+RECURRENT_CHARGE_CLAIM_SECONDS = env("RECURRENT_CHARGE_CLAIM_SECONDS", cast=int, default=60 * 60)
+
+RECURRENT_CHARGE_ASYNC_ENGINE = env("RECURRENT_CHARGE_ASYNC_ENGINE", cast=bool, default=False)
+RECURRENT_CHARGE_CONCURRENCY = env("RECURRENT_CHARGE_CONCURRENCY", cast=int, default=50)
+RECURRENT_CHARGE_DB_WRITERS = env("RECURRENT_CHARGE_DB_WRITERS", cast=int, default=4)
+RECURRENT_CHARGE_WRITE_BATCH_SIZE = env("RECURRENT_CHARGE_WRITE_BATCH_SIZE", cast=int, default=20)
@@ -0,0 +1,8 @@
+from app.conf.environ import env
+
+
+# Shop events of these types are stored in the inbox and processed by celery workers instead of the request
+SHOP_INBOX_EVENT_TYPES = env.list("SHOP_INBOX_EVENT_TYPES", default=[])
+SHOP_INBOX_BATCH_SIZE = env("SHOP_INBOX_BATCH_SIZE", cast=int, default=100)
+SHOP_INBOX_MAX_ATTEMPTS = env("SHOP_INBOX_MAX_ATTEMPTS", cast=int, default=5)
+SHOP_INBOX_RETRY_DELAY_SECONDS = env("SHOP_INBOX_RETRY_DELAY_SECONDS", cast=int, default=60)
@@ -9,6 +9,16 @@ STORAGES = {
             default="django.core.files.storage.FileSystemStorage",
         ),
     },
+    "exports": {  # admin exports contain personal data, files are downloaded via signed links to the admin only
+        "BACKEND": env(
+            "EXPORT_FILE_STORAGE",
+            cast=str,
+            default="django.core.files.storage.FileSystemStorage",
+        ),
+        "OPTIONS": {
+            "location": env("EXPORT_STORAGE_LOCATION", cast=str, default="private/exports"),
+        },
+    },
     "staticfiles": {
         "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
     },
@@ -2,9 +2,10 @@ from dataclasses import dataclass
 from json import JSONDecodeError
 from urllib.parse import urljoin
 
-import requests
 from django.utils.functional import cached_property
 
+from app import http_transport
+
 
 @dataclass
 class ConvenientHTTPClient:
@@ -19,7 +20,8 @@ class ConvenientHTTPClient:
         headers: dict[str, str] | None = None,
         raise_for_status: bool = True,
     ) -> tuple[dict, int]:
-        response = getattr(requests, method)(
+        response = http_transport.request(
+            method,
             self._join_url(path=endpoint),
             headers=self._get_headers(headers),
             json=data,
@@ -0,0 +1,27 @@
+from typing import Any
+
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+
+from app.utils import get_read_db_alias, pin_to_primary
+
+
+class ReplicaRouter:
+    """
+    Send reads to the replica within `replica_reads()` scope, e.g. safe requests, and everything else to the primary.
+
+    The first write pins the rest of the scope to the primary, so the scope reads its own writes.
+    """
+
+    def db_for_read(self, model: type[Model], **hints: Any) -> str:
+        return get_read_db_alias()
+
+    def db_for_write(self, model: type[Model], **hints: Any) -> str:
+        pin_to_primary()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> bool:
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, model_name: str | None = None, **hints: Any) -> bool:
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,86 @@
+"""
+Shared transport for outbound HTTP calls.
+
+Every process keeps one `requests.Session` per origin (scheme + host + port), so connections are
+reused with keep-alive instead of paying for a TCP and TLS handshake on every call. Sessions have
+default connect/read timeouts, a bounded connection pool and retry with backoff: connection errors
+are retried for every method, read errors and 502/503/504 responses only for idempotent ones.
+"""
+
+import os
+import threading
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+__all__ = [
+    "TransportSession",
+    "get",
+    "get_session",
+    "post",
+    "request",
+]
+
+_sessions: dict[tuple[int, str], "TransportSession"] = {}
+_sessions_lock = threading.Lock()
+
+
+class TransportSession(requests.Session):
+    """Session with default timeouts, pooling and retries configured from settings."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+            pool_block=False,
+            max_retries=Retry(
+                total=settings.HTTP_RETRIES,
+                connect=settings.HTTP_RETRIES,
+                read=settings.HTTP_RETRIES,
+                status=settings.HTTP_RETRIES,
+                backoff_factor=settings.HTTP_RETRY_BACKOFF_FACTOR,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                raise_on_status=False,
+            ),
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        kwargs.setdefault("timeout", (settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_READ_TIMEOUT))
+        return super().request(method, url, **kwargs)
+
+
+def get_session(url: str) -> TransportSession:
+    """Return session of the current process for the origin of the given url."""
+    parts = urlsplit(url)
+    key = (os.getpid(), f"{parts.scheme}://{parts.netloc}")  # forked workers must not share sockets of the parent
+
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            if key not in _sessions:
+                _sessions[key] = TransportSession()
+            session = _sessions[key]
+
+    return session
+
+
+def request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    return get_session(url).request(method.upper(), url, **kwargs)
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    return request("get", url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    return request("post", url, **kwargs)
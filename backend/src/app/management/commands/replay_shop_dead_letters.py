@@ -0,0 +1,18 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from app.services import ShopDeadLetterReplayer
+
+
+class Command(BaseCommand):
+    help = "Send shop dead letters to the shop inbox to be processed again"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--event-type", type=str, required=False, help="Replay only letters of this event type")
+        parser.add_argument("--batch-size", type=int, default=100, help="Number of letters replayed within one transaction")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        replayed, failed = ShopDeadLetterReplayer(batch_size=options["batch_size"], event_type=options["event_type"])()
+
+        self.stdout.write(self.style.SUCCESS(f"Replayed {replayed} letters, {failed} letters are still invalid."))
@@ -0,0 +1,70 @@
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from app.utils import replica_reads, use_primary
+from app.utils.db_routing import is_pinned_to_primary
+
+
+PIN_TO_PRIMARY_CACHE_KEY = "pin_to_primary_{user_id}"
+
+SAFE_METHODS = ["GET", "HEAD", "OPTIONS"]
+
+
+def replica_routing_middleware(get_response: Callable) -> Callable:
+    """Read from the replica while serving safe requests.
+
+    A user who has written something reads from the primary for the next REPLICA_PIN_SECONDS,
+    so they don't miss their writes while the replica lags behind. The pin is kept in the shared cache,
+    so it works for token and JWT clients that don't send cookies, whatever process serves the next request.
+    """
+
+    def middleware(request: HttpRequest) -> HttpResponse:
+        if request.method not in SAFE_METHODS or is_user_pinned_to_primary(get_user_id(request)):
+            scope = use_primary()
+        else:
+            scope = replica_reads()
+
+        with scope:
+            response = get_response(request)
+            if is_pinned_to_primary():
+                pin_user_to_primary(request)
+
+        return response
+
+    return middleware
+
+
+def get_user_id(request: HttpRequest) -> Any | None:
+    """Authenticate the request like the API does, so token and JWT users are known before the view authenticates them"""
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return user.id
+
+    drf_request = Request(request)
+    for authenticator in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        try:
+            user_and_auth = authenticator().authenticate(drf_request)
+        except APIException:
+            return None
+
+        if user_and_auth is not None:
+            return user_and_auth[0].id
+
+    return None
+
+
+def is_user_pinned_to_primary(user_id: Any | None) -> bool:
+    return user_id is not None and cache.get(PIN_TO_PRIMARY_CACHE_KEY.format(user_id=user_id)) is not None
+
+
+def pin_user_to_primary(request: HttpRequest) -> None:
+    user = getattr(request, "user", None)  # set by DRF once the view has authenticated the request
+    if user is not None and user.is_authenticated:
+        cache.set(PIN_TO_PRIMARY_CACHE_KEY.format(user_id=user.id), True, timeout=settings.REPLICA_PIN_SECONDS)
@@ -0,0 +1,18 @@
+from collections.abc import Callable
+
+from django.http import HttpRequest, HttpResponse
+
+from app.utils import request_memo_scope
+
+
+def request_memo_middleware(get_response: Callable) -> Callable:
+    """Let services memoize their answers (e.g. user entitlements) for the life of one request.
+
+    Nothing is shared between requests: the memo is dropped once the response is ready.
+    """
+
+    def middleware(request: HttpRequest) -> HttpResponse:
+        with request_memo_scope():
+            return get_response(request)
+
+    return middleware
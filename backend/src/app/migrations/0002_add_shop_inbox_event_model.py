@@ -0,0 +1,40 @@
+# Generated by Django 4.2.21 on 2026-10-18 13:00
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0001_shop_dead_letter"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="shopdeadletter",
+            name="replayed_at",
+            field=models.DateTimeField(blank=True, help_text="When the event was sent to the shop inbox again", null=True),
+        ),
+        migrations.CreateModel(
+            name="ShopInboxEvent",
+            fields=[
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("modified", models.DateTimeField(blank=True, db_index=True, null=True)),
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("event_key", models.CharField(help_text="Event id or hash of the payload for events without id", max_length=128, unique=True)),
+                ("event_type", models.CharField(max_length=32)),
+                ("ordering_key", models.CharField(max_length=255)),
+                ("raw_data", models.JSONField(default=dict)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True, default="")),
+            ],
+            options={
+                "verbose_name": "Shop inbox event",
+                "verbose_name_plural": "Shop inbox events",
+                "ordering": ["created"],
+                "indexes": [models.Index(condition=models.Q(("processed_at__isnull", True)), fields=["ordering_key", "created"], name="shop_inbox_pending_idx")],
+            },
+        ),
+    ]
@@ -1,9 +1,12 @@
 import uuid
+from datetime import datetime, timedelta
 from typing import Any
 
 from behaviors.behaviors import Timestamped
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
@@ -37,6 +40,24 @@ class DefaultModel(models.Model):
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+    def update_changed_fields(self, **kwargs: Any) -> list[str]:
+        """Like update_from_kwargs, but set only the fields whose values differ. Return names of the changed fields to save."""
+        changed = []
+        for key, value in kwargs.items():
+            field = self._meta.get_field(key)
+            if field.is_relation:
+                current, new = getattr(self, field.attname), getattr(value, "pk", value)
+            else:
+                current, new = getattr(self, key), field.to_python(value)
+                if isinstance(new, datetime) and settings.USE_TZ and timezone.is_naive(new):
+                    new = timezone.make_aware(new)
+
+            if current != new:
+                setattr(self, key, value)
+                changed.append(key)
+
+        return changed
+
     def setattr_and_save(self, key: str, value: Any) -> None:
         """Shortcut for testing -- set attribute of the model and save"""
         setattr(self, key, value)
@@ -62,6 +83,7 @@ class ShopDeadLetter(TimestampedModel):
     event_type = models.CharField(max_length=32, db_index=True)
     raw_data = models.JSONField(default=dict)
     details = models.TextField(help_text=_("Error details"), blank=True, default="")
+    replayed_at = models.DateTimeField(null=True, blank=True, help_text=_("When the event was sent to the shop inbox again"))
 
     class Meta:
         verbose_name = _("Shop dead letter")
@@ -70,3 +92,48 @@ class ShopDeadLetter(TimestampedModel):
 
     def __str__(self) -> str:
         return f"{self.event_type} {self.created}"
+
+
+class ShopInboxEventQuerySet(models.QuerySet):
+    def pending(self) -> "ShopInboxEventQuerySet":
+        return self.filter(processed_at__isnull=True, attempts__lt=settings.SHOP_INBOX_MAX_ATTEMPTS)
+
+    def ready_to_process(self) -> "ShopInboxEventQuerySet":
+        """Pending events excluding failed ones that were retried less than a retry delay ago"""
+        retry_after = timezone.now() - timedelta(seconds=settings.SHOP_INBOX_RETRY_DELAY_SECONDS)
+        return self.pending().filter(models.Q(attempts=0) | models.Q(modified__lte=retry_after))
+
+    def heads(self) -> "ShopInboxEventQuerySet":
+        """The earliest pending event of every ordering key"""
+        return self.filter(
+            id__in=self.model.objects.pending().order_by("ordering_key", "created", "id").distinct("ordering_key").values("id"),
+        )
+
+
+class ShopInboxEvent(TimestampedModel):
+    """
+    Event received from the shop, to be processed by `ShopInboxDrainer`.
+
+    Events are deduplicated by event key, events with the same ordering key (usually the user) are processed in order of arrival.
+    """
+
+    objects = ShopInboxEventQuerySet.as_manager()
+
+    event_key = models.CharField(max_length=128, unique=True, help_text=_("Event id or hash of the payload for events without id"))
+    event_type = models.CharField(max_length=32)
+    ordering_key = models.CharField(max_length=255)
+    raw_data = models.JSONField(default=dict)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        verbose_name = _("Shop inbox event")
+        verbose_name_plural = _("Shop inbox events")
+        ordering = ["created"]
+        indexes = [
+            models.Index(fields=["ordering_key", "created"], condition=models.Q(processed_at__isnull=True), name="shop_inbox_pending_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event_type} {self.event_key}"
@@ -1,10 +1,22 @@
 from app.services.base_service import BaseService
+from app.services.bulk_csv_importer import BulkCSVImporter, BulkImportFailure, BulkImportResult
 from app.services.export_model_as_csv import ExportModelAsCSV
 from app.services.platform_detector import PlatformDetector
+from app.services.shop_dead_letter_replayer import ShopDeadLetterReplayer
+from app.services.shop_inbox_drainer import ShopInboxDrainer
+from app.services.shop_inbox_event_creator import ShopInboxEventCreator
+from app.services.shop_inbox_event_processor import ShopInboxEventProcessor
 
 
 __all__ = [
     "BaseService",
+    "BulkCSVImporter",
+    "BulkImportFailure",
+    "BulkImportResult",
     "ExportModelAsCSV",
     "PlatformDetector",
+    "ShopDeadLetterReplayer",
+    "ShopInboxDrainer",
+    "ShopInboxEventCreator",
+    "ShopInboxEventProcessor",
 ]
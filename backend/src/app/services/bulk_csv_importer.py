@@ -0,0 +1,128 @@
+import csv
+from abc import abstractmethod
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import KW_ONLY, dataclass, field
+from itertools import islice
+from multiprocessing import get_context
+from pathlib import Path
+from typing import ClassVar
+
+from django.db import connections, transaction
+
+from app.services.base_service import BaseService
+
+
+@dataclass
+class BulkImportFailure:
+    row: dict
+    reason: str
+
+
+@dataclass
+class BulkImportResult:
+    imported: int = 0
+    skipped: int = 0
+    failures: list[BulkImportFailure] = field(default_factory=list)
+
+    def merge(self, other: "BulkImportResult") -> None:
+        self.imported += other.imported
+        self.skipped += other.skipped
+        self.failures.extend(other.failures)
+
+    def fail(self, row: dict, reason: str) -> None:
+        self.failures.append(BulkImportFailure(row=row, reason=reason))
+
+    def write_failures(self, path: Path, delimiter: str = ";") -> None:
+        fieldnames = ["reason"]
+        for failure in self.failures:
+            fieldnames.extend(key for key in failure.row if key not in fieldnames)
+
+        with path.open("w", newline="") as output_file:
+            writer = csv.DictWriter(output_file, fieldnames=fieldnames, delimiter=delimiter)
+            writer.writeheader()
+            writer.writerows({"reason": failure.reason, **failure.row} for failure in self.failures)
+
+
+def import_chunk(importer: "BulkCSVImporter", rows: list[dict]) -> BulkImportResult:
+    return importer.import_chunk_atomically(rows)
+
+
+@dataclass
+class BulkCSVImporter(BaseService):
+    """
+    Stream rows of a CSV file in chunks and import every chunk within its own transaction.
+
+    Subclasses implement `import_chunk()` with set-based queries: resolve everything the chunk refers to
+    with one `IN` query and write with bulk operations. Rows that can't be imported are reported as failures
+    instead of stopping the import. With `workers` > 1 chunks are imported by a pool of forked processes.
+
+    `progress` is called with the number of bytes read and the file size every time a chunk is read.
+    """
+
+    delimiter: ClassVar[str] = ";"
+
+    data: Path
+    _: KW_ONLY
+    chunk_size: int = 1000
+    workers: int = 1
+    dry_run: bool = False
+    progress: Callable[[int, int], None] | None = field(default=None, repr=False)
+
+    def act(self) -> BulkImportResult:
+        if self.workers > 1:
+            return self.import_in_pool()
+
+        result = BulkImportResult()
+        for rows in self.get_chunks():
+            result.merge(self.import_chunk_atomically(rows))
+
+        return result
+
+    def import_in_pool(self) -> BulkImportResult:
+        result = BulkImportResult()
+        pending: set[Future] = set()
+
+        connections.close_all()  # forked workers must not share connections of the parent process
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=get_context("fork")) as executor:
+            for rows in self.get_chunks():
+                if len(pending) >= self.workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result.merge(future.result())
+
+                pending.add(executor.submit(import_chunk, self, rows))
+
+            for future in wait(pending).done:
+                result.merge(future.result())
+
+        return result
+
+    def __getstate__(self) -> dict:
+        return {**self.__dict__, "progress": None}  # reported by the parent process, callback may be not picklable
+
+    def get_chunks(self) -> Iterator[list[dict]]:
+        total_size = self.data.stat().st_size
+        with self.data.open("rb") as data:
+            reader = csv.DictReader((line.decode() for line in data), delimiter=self.delimiter)
+            while rows := list(islice(reader, self.chunk_size)):
+                if self.progress:
+                    self.progress(data.tell(), total_size)
+                yield rows
+
+    def import_chunk_atomically(self, rows: list[dict]) -> BulkImportResult:
+        try:
+            with transaction.atomic():
+                result = self.import_chunk(rows)
+                if self.dry_run:
+                    transaction.set_rollback(True)
+        except Exception as e:  # noqa: BLE001
+            result = BulkImportResult()
+            for row in rows:
+                result.fail(row, f"Chunk import failed: {e}")
+
+        return result
+
+    @abstractmethod
+    def import_chunk(self, rows: list[dict]) -> BulkImportResult:
+        raise NotImplementedError("Please implement in the importer class")
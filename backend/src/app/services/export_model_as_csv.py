@@ -1,26 +1,33 @@
 import csv
-from collections.abc import Iterable
-from dataclasses import dataclass
-from datetime import timedelta
+import io
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
 from typing import Any
+from uuid import uuid4
 
-from django.db.models import Model, QuerySet
-from django.db.models.options import Options
-from django.http import StreamingHttpResponse
+from django.conf import settings
+from django.contrib.admin import site
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.db.models import Model, Q, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+from django.http import HttpRequest, HttpResponse, HttpResponseRedirect, QueryDict, StreamingHttpResponse
+from django.urls import reverse
 from django.utils.encoding import force_str
-from django.utils.timezone import is_naive, make_naive, now
+from django.utils.html import format_html
+from django.utils.http import urlencode
+from django.utils.timezone import is_aware, make_naive, now
+from django.utils.translation import gettext as _
 
 from app.exceptions import AppServiceException
-from app.services import BaseService
+from app.services.base_service import BaseService
+from app.utils import get_replica_db_alias
 
 
-class Echo:
-    """
-    An object that implements just the write method (for StreamingHttpResponse).
-    """
-
-    def write(self, value: str) -> str:
-        return value
+EXPORT_LINK_SALT = "app.export_model_as_csv"
 
 
 class ExportModelAsCSVException(AppServiceException):
@@ -29,10 +36,157 @@ class ExportModelAsCSVException(AppServiceException):
     """
 
 
+@dataclass
+class ModelCSVRenderer:
+    """
+    Render queryset to CSV in chunks.
+
+    Columns that are plain model fields (including ones behind forward relations, e.g. `user__username`)
+    are fetched with `values_list()`, other columns (relations, properties and methods) are read from instances
+    with needed relations selected. Rows are paged by keyset on `(created, pk)` instead of offsets or server-side cursors.
+    Rows are read from the replica if there is one, so big exports don't load the primary.
+    """
+
+    queryset: QuerySet
+    field_names: list[str]
+    chunk_size: int = 2000
+    compress: bool = False
+
+    value_lookups: dict[str, str] = field(init=False, default_factory=dict)
+    select_related: set[str] = field(init=False, default_factory=set)
+
+    def __post_init__(self) -> None:
+        for field_name in self.field_names:
+            self.resolve_column(field_name)
+
+    def __iter__(self) -> Iterator[bytes]:
+        if not self.compress:
+            yield from (chunk.encode() for chunk in self.render_chunks())
+            return
+
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)  # gzip container
+        for chunk in self.render_chunks():
+            if compressed := compressor.compress(chunk.encode()):
+                yield compressed
+
+        yield compressor.flush()
+
+    def resolve_column(self, field_name: str) -> None:
+        model = self.queryset.model
+        relations = []
+        for part in field_name.split(LOOKUP_SEP):
+            try:
+                model_field = model._meta.get_field(part)  # noqa: SLF001
+            except LookupError:
+                break
+
+            if not model_field.is_relation:
+                if len(relations) == len(field_name.split(LOOKUP_SEP)) - 1:
+                    self.value_lookups[field_name] = field_name
+                return
+
+            if model_field.many_to_many or model_field.one_to_many:
+                return
+
+            relations.append(part)
+            model = model_field.related_model
+
+        if relations:
+            self.select_related.add(LOOKUP_SEP.join(relations))
+
+    @property
+    def keyset_fields(self) -> list[str]:
+        model_fields = {model_field.name for model_field in self.queryset.model._meta.fields}  # noqa: SLF001
+        return ["created", "pk"] if "created" in model_fields else ["pk"]
+
+    @property
+    def reads_values(self) -> bool:
+        return len(self.value_lookups) == len(self.field_names)
+
+    def render_chunks(self) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        writer.writerow(self.field_names)
+        for rows in self.get_pages():
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    def get_pages(self) -> Iterator[list[list[str]]]:
+        keyset_fields = self.keyset_fields
+        queryset = self.queryset.using(get_replica_db_alias()).order_by(*keyset_fields)
+        if self.reads_values:
+            queryset = queryset.values_list(*self.field_names, *keyset_fields)
+        else:
+            queryset = queryset.select_related(*self.select_related)
+
+        last_key = None
+        while True:
+            page = list(queryset.filter(self.get_keyset_filter(keyset_fields, last_key))[: self.chunk_size])
+            if not page:
+                return
+
+            if self.reads_values:
+                yield [[self.format_value(value) for value in row[: len(self.field_names)]] for row in page]
+                last_key = page[-1][len(self.field_names) :]
+            else:
+                yield [[self.format_value(self.get_attribute(obj, field_name)) for field_name in self.field_names] for obj in page]
+                last_key = tuple(getattr(page[-1], keyset_field) for keyset_field in keyset_fields)
+
+            if len(page) < self.chunk_size:
+                return
+
+    @staticmethod
+    def get_keyset_filter(keyset_fields: list[str], last_key: tuple | None) -> Q:
+        if last_key is None:
+            return Q()
+
+        if len(keyset_fields) == 1:
+            return Q(pk__gt=last_key[0])
+
+        return Q(created__gt=last_key[0]) | Q(created=last_key[0], pk__gt=last_key[1])
+
+    @staticmethod
+    def get_attribute(obj: Model, field_name: str) -> Any:
+        value: Any = obj
+        for part in field_name.split(LOOKUP_SEP):
+            if value is None:
+                return None
+            value = getattr(value, part)
+
+        return value
+
+    def format_value(self, value: Any) -> str:
+        try:
+            if isinstance(value, str):
+                return value
+            if isinstance(value, datetime):
+                return make_naive(value).isoformat() if is_aware(value) else value.isoformat()
+            if isinstance(value, date | time):
+                return value.isoformat()
+            if callable(value):
+                return self.format_value(value())
+
+            return force_str(value)
+
+        except (TypeError, AttributeError, ValueError):
+            return "ERROR"
+
+
 @dataclass
 class ExportModelAsCSV(BaseService):
     """
-    Stream admin queryset to CSV with optional date field + period filtering.
+    Export admin queryset to CSV with optional date field + period filtering.
+
+    Export is streamed to the response, or, with `run_async`, rendered by a celery task to the private exports storage
+    and a signed expiring link to the file is shown to the admin. The task gets the model, the date filter and either
+    primary keys of the rows selected on the page or the changelist filters and search to rebuild the queryset with,
+    so the request doesn't read every exported row.
     """
 
     admin_view: Any
@@ -41,66 +195,99 @@ class ExportModelAsCSV(BaseService):
     field_names: list[str] | None = None
     date_field: str | None = None
     period_days: int | None = None
+    compress: bool = False
+    run_async: bool = False
+
+    def act(self) -> HttpResponse:
+        queryset = self.get_filtered_queryset()
+        field_names = self.get_field_names()
+
+        try:
+            if self.run_async:
+                return self.schedule_export(queryset, field_names)
+
+            return self.build_response(queryset, field_names)
 
-    def act(self) -> StreamingHttpResponse:
-        model = self.admin_view.model
-        opts: Options = model._meta  # noqa: SLF001
-        field_names = self.get_field_names(opts)
-        queryset = self.get_filtered_queryset(model)
+        except Exception as e:  # noqa: BLE001
+            raise ExportModelAsCSVException(f"CSV export failed: {e}")
 
-        return self.build_response(queryset, field_names, opts)
+    @property
+    def model(self) -> type[Model]:
+        return self.admin_view.model
 
-    def get_field_names(self, opts: Options) -> list[str]:
-        return self.field_names or [field.name for field in opts.fields]
+    @property
+    def filename(self) -> str:
+        extension = "csv.gz" if self.compress else "csv"
+        return f"{self.model._meta.model_name}.{extension}"  # noqa: SLF001
 
-    def get_filtered_queryset(self, model: type[Model]) -> QuerySet[Model]:
-        queryset = self.queryset
-        if not queryset.exists():
-            queryset = model.objects.all()  # type: ignore
+    def get_field_names(self) -> list[str]:
+        return self.field_names or [model_field.name for model_field in self.model._meta.fields]  # noqa: SLF001
 
-        if self.date_field and self.period_days and self._model_has_field(model, self.date_field):
-            filter_value = now() - timedelta(days=self.period_days)
-            queryset = queryset.filter(**{f"{self.date_field}__gte": filter_value})
+    def get_filtered_queryset(self) -> QuerySet[Model]:
+        return self.queryset.filter(**self.get_date_filter())
 
-        return queryset.iterator()  # type: ignore
+    def get_date_filter(self) -> dict[str, datetime]:
+        if self.date_field and self.period_days and self._model_has_field(self.date_field):
+            return {f"{self.date_field}__gte": now() - timedelta(days=self.period_days)}
 
-    def _model_has_field(self, model: type[Model], field_name: str) -> bool:
+        return {}
+
+    def _model_has_field(self, field_name: str) -> bool:
         try:
-            model._meta.get_field(field_name)  # noqa: SLF001
+            self.model._meta.get_field(field_name)  # noqa: SLF001
             return True
         except LookupError:
             return False
 
-    def build_response(
-        self,
-        queryset: Iterable[Model],
-        field_names: list[str],
-        opts: Options,
-    ) -> StreamingHttpResponse:
-        try:
-            pseudo_buffer = Echo()
-            writer = csv.writer(pseudo_buffer)
-            response = StreamingHttpResponse(
-                (writer.writerow(row) for row in self.generate_rows(queryset, field_names)),
-                content_type="text/csv",
-            )
-            response["Content-Disposition"] = f'attachment; filename="{opts.model_name}.csv"'
-            return response
+    def build_response(self, queryset: QuerySet[Model], field_names: list[str]) -> StreamingHttpResponse:
+        response = StreamingHttpResponse(
+            ModelCSVRenderer(queryset=queryset, field_names=field_names, chunk_size=settings.CSV_EXPORT_CHUNK_SIZE, compress=self.compress),
+            content_type="application/gzip" if self.compress else "text/csv",
+        )
+        response["Content-Disposition"] = f'attachment; filename="{self.filename}"'
+        return response
 
-        except Exception as e:  # noqa: BLE001
-            raise ExportModelAsCSVException(f"CSV export failed: {e}")
+    def schedule_export(self, queryset: QuerySet[Model], field_names: list[str]) -> HttpResponseRedirect:
+        from app.tasks import export_model_as_csv
 
-    def generate_rows(self, queryset: Iterable[Model], field_names: list[str]) -> Iterable[list[str]]:
-        yield field_names
-        for obj in queryset:
-            yield [self.format_value(getattr(obj, field)) for field in field_names]
+        path = f"{now():%Y%m%d%H%M%S}-{uuid4().hex[:8]}-{self.filename}"
+        export_model_as_csv.delay(
+            app_label=self.model._meta.app_label,  # noqa: SLF001
+            model_name=self.model._meta.model_name,  # noqa: SLF001
+            user_id=str(self.request.user.pk),
+            changelist_params=dict(self.request.GET.lists()) if self.selects_across else None,
+            pks=None if self.selects_across else self.request.POST.getlist(ACTION_CHECKBOX_NAME) or None,
+            filters={lookup: value.isoformat() for lookup, value in self.get_date_filter().items()},
+            field_names=field_names,
+            path=path,
+            compress=self.compress,
+        )
 
-    def format_value(self, value: Any) -> str:
-        try:
-            value = value() if callable(value) else value
-            if hasattr(value, "isoformat"):
-                return make_naive(value).isoformat() if is_naive(value) else value.isoformat()
-            return force_str(value)
+        self.admin_view.message_user(
+            self.request,
+            format_html(_('Export is being prepared, it will be available <a href="{}">here</a> in a few minutes.'), self.get_download_url(path)),
+        )
+        return HttpResponseRedirect(self.request.get_full_path())
 
-        except (TypeError, AttributeError, ValueError):
-            return "ERROR"
+    @property
+    def selects_across(self) -> bool:
+        """All rows matching the changelist filters are exported, not only the ones selected on the page"""
+        return self.request.POST.get("select_across") == "1"
+
+    def get_download_url(self, path: str) -> str:
+        opts = self.model._meta  # noqa: SLF001
+        return reverse(f"admin:{opts.app_label}_{opts.model_name}_download_export", args=[signing.dumps(path, salt=EXPORT_LINK_SALT)])
+
+
+def get_admin_queryset(model: type[Model], user_id: str, changelist_params: dict[str, list[str]] | None) -> QuerySet:
+    """Rebuild the queryset the admin has shown to the user, filtered like the changelist if its parameters are given"""
+    model_admin = site._registry[model]  # noqa: SLF001
+    request = HttpRequest()
+    request.method = "GET"
+    request.GET = QueryDict(urlencode(changelist_params or {}, doseq=True))
+    request.user = get_user_model().objects.get(pk=user_id)
+
+    if changelist_params is None:
+        return model_admin.get_queryset(request)
+
+    return model_admin.get_changelist_instance(request).queryset
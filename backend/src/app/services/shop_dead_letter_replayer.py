@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from app.models import ShopDeadLetter
+from app.services.base_service import BaseService
+from app.services.shop_inbox_event_creator import ShopInboxEventCreator
+
+
+@dataclass
+class ShopDeadLetterReplayer(BaseService):
+    """
+    Send dead letters to the shop inbox again, so they are processed by the same pipeline as the incoming events.
+
+    Letters are claimed in batches with SKIP LOCKED, so replays may run concurrently. Replay is idempotent:
+    replayed letters are skipped and the inbox deduplicates events. Letters that are still invalid are left as they are.
+    """
+
+    batch_size: int = 100
+    event_type: str | None = None
+    ids: list[UUID] | None = None
+
+    def act(self) -> tuple[int, int]:
+        """Return numbers of replayed and failed letters"""
+        replayed = failed = 0
+        last_created = None
+        while letters := self.replay_batch(last_created):
+            replayed += sum(1 for letter in letters if letter.replayed_at is not None)
+            failed += sum(1 for letter in letters if letter.replayed_at is None)
+            last_created = letters[-1].created
+
+        return replayed, failed
+
+    @transaction.atomic
+    def replay_batch(self, last_created: datetime | None) -> list[ShopDeadLetter]:
+        letters = list(self.get_queryset(last_created).select_for_update(skip_locked=True).order_by("created")[: self.batch_size])
+        for letter in letters:
+            try:
+                with transaction.atomic():
+                    ShopInboxEventCreator(event_type=letter.event_type, raw_data=letter.raw_data, revive=True)()
+            except Exception:  # noqa: BLE001
+                continue
+
+            letter.replayed_at = letter.modified = timezone.now()
+
+        ShopDeadLetter.objects.bulk_update(letters, fields=["replayed_at", "modified"])
+        return letters
+
+    def get_queryset(self, last_created: datetime | None) -> QuerySet[ShopDeadLetter]:
+        queryset = ShopDeadLetter.objects.filter(replayed_at__isnull=True)
+        if last_created is not None:
+            queryset = queryset.filter(created__gt=last_created)
+        if self.event_type is not None:
+            queryset = queryset.filter(event_type=self.event_type)
+        if self.ids is not None:
+            queryset = queryset.filter(id__in=self.ids)
+
+        return queryset
@@ -0,0 +1,74 @@
+import traceback
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from app.models import ShopDeadLetter, ShopInboxEvent
+from app.services.base_service import BaseService
+from app.services.shop_inbox_event_processor import ShopInboxEventProcessor
+
+
+@dataclass
+class ShopInboxDrainer(BaseService):
+    """
+    Process a batch of pending shop inbox events.
+
+    A drainer claims the earliest pending events of ordering keys with SKIP LOCKED, and processes them with the events
+    following them. Other drainers only claim the earliest events too, so events of one key are never processed
+    concurrently or out of order. A failed event stops its key until it is retried, after `SHOP_INBOX_MAX_ATTEMPTS`
+    attempts it is moved to dead letters and the key moves on.
+    """
+
+    batch_size: int = field(default_factory=lambda: settings.SHOP_INBOX_BATCH_SIZE)
+
+    def act(self) -> int:
+        """Return number of events taken from the inbox"""
+        with transaction.atomic():
+            events = self.get_events()
+            handled: list[ShopInboxEvent] = []
+            stopped_keys: set[str] = set()
+            for event in events:
+                if event.ordering_key in stopped_keys:
+                    continue
+
+                if not self.process(event):
+                    stopped_keys.add(event.ordering_key)
+
+                event.modified = timezone.now()
+                handled.append(event)
+
+            ShopInboxEvent.objects.bulk_update(handled, fields=["processed_at", "attempts", "last_error", "modified"])
+
+        return len(events)
+
+    def get_events(self) -> list[ShopInboxEvent]:
+        heads = list(
+            ShopInboxEvent.objects.heads()
+            .ready_to_process()
+            .select_for_update(skip_locked=True)
+            .order_by("created", "id")[: self.batch_size],
+        )
+        if not heads:
+            return []
+
+        followers = ShopInboxEvent.objects.pending().filter(ordering_key__in={head.ordering_key for head in heads}).exclude(id__in=[head.id for head in heads])
+        return sorted([*heads, *followers.order_by("created", "id")[: self.batch_size]], key=lambda event: (event.created, event.id))
+
+    def process(self, event: ShopInboxEvent) -> bool:
+        """Return whether the following events of the key may be processed"""
+        try:
+            with transaction.atomic():
+                ShopInboxEventProcessor(event_type=event.event_type, raw_data=event.raw_data)()
+        except Exception:  # noqa: BLE001
+            event.attempts += 1
+            event.last_error = traceback.format_exc()
+            if event.attempts < settings.SHOP_INBOX_MAX_ATTEMPTS:
+                return False
+
+            ShopDeadLetter.objects.create(event_type=event.event_type, raw_data=event.raw_data, details=event.last_error)
+            return True
+
+        event.processed_at = timezone.now()
+        return True
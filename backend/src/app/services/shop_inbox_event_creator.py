@@ -0,0 +1,59 @@
+import hashlib
+import json
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.db.transaction import on_commit
+
+from app.models import ShopInboxEvent
+from app.services.base_service import BaseService
+from app.services.shop_inbox_event_processor import ShopInboxEventProcessor
+
+
+DRAIN_SCHEDULED_CACHE_KEY = "shop_inbox_drain_scheduled"
+
+
+@dataclass
+class ShopInboxEventCreator(BaseService):
+    """
+    Validate shop event and store it in the inbox, so the request is acknowledged before the event is processed.
+
+    Storing the same event again is a no-op. With `revive` an event that exhausted its attempts is given another round.
+    """
+
+    event_type: str
+    raw_data: dict
+    revive: bool = False
+
+    def act(self) -> ShopInboxEvent:
+        processor = ShopInboxEventProcessor(event_type=self.event_type, raw_data=self.raw_data)
+        event, created = ShopInboxEvent.objects.get_or_create(
+            event_key=self.get_event_key(),
+            defaults={
+                "event_type": self.event_type,
+                "ordering_key": processor.ordering_key,
+                "raw_data": self.raw_data,
+            },
+        )
+
+        if not created and self.revive and event.processed_at is None:
+            event.attempts = 0
+            event.save(update_fields=["attempts", "modified"])
+
+        on_commit(self.schedule_drain)
+
+        return event
+
+    def get_event_key(self) -> str:
+        if event_id := self.raw_data.get("event_id"):
+            return str(event_id)
+
+        payload = json.dumps(self.raw_data, sort_keys=True, default=str)
+        return f"{self.event_type}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+    @staticmethod
+    def schedule_drain(countdown: int = 0) -> None:
+        from app.tasks import drain_shop_inbox
+
+        if cache.add(DRAIN_SCHEDULED_CACHE_KEY, True, timeout=countdown + 60):
+            drain_shop_inbox.apply_async(countdown=countdown)
@@ -0,0 +1,70 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from django.utils.functional import cached_property
+from rest_framework.serializers import Serializer
+
+from app.services.base_service import BaseService
+
+
+class ShopEventType(NamedTuple):
+    serializer_class: type[Serializer]
+    handle: Callable[[dict], object]
+    get_ordering_key: Callable[[dict], str]
+
+
+def get_shop_event_types() -> dict[str, ShopEventType]:
+    from payments.api.demo.serializers import IncomingPaymentSerializer
+    from payments.services import PaymentFromShopProcessor
+    from product_access.api.demo.serializers import OrderCheckoutSerializer, OrderRefundSerializer, PromoAccessSerializer
+    from product_access.services import ProductAccessRevoker, ProductCheckoutProcessor, PromoProductCheckoutProcessor
+
+    return {
+        "order-checkedout": ShopEventType(
+            serializer_class=OrderCheckoutSerializer,
+            handle=lambda event: ProductCheckoutProcessor(checkout_event=event)(),
+            get_ordering_key=lambda event: f"user:{event['data']['user']['username'].lower()}",
+        ),
+        "order-refunded": ShopEventType(
+            serializer_class=OrderRefundSerializer,
+            handle=lambda event: ProductAccessRevoker(order_id=event["data"]["order_id"], access_revoke_time=event["event_time"])(),
+            # refund doesn't name the user, checkout and refund of the same order are ordered by event time by the revoker
+            get_ordering_key=lambda event: f"order:{event['data']['order_id']}",
+        ),
+        "promo-access": ShopEventType(
+            serializer_class=PromoAccessSerializer,
+            handle=lambda event: PromoProductCheckoutProcessor(checkout_event=event)(),
+            get_ordering_key=lambda event: f"user:{event['data']['user']['username'].lower()}",
+        ),
+        "incoming-payment-from-shop": ShopEventType(
+            serializer_class=IncomingPaymentSerializer,
+            handle=lambda event: PaymentFromShopProcessor(event)(),
+            get_ordering_key=lambda event: f"user:{event['user']['email'].lower()}",
+        ),
+    }
+
+
+@dataclass
+class ShopInboxEventProcessor(BaseService):
+    """Validate shop event and process it with the same service its API view uses"""
+
+    event_type: str
+    raw_data: dict
+
+    def act(self) -> object:
+        return self.shop_event_type.handle(self.validated_data)
+
+    @cached_property
+    def shop_event_type(self) -> ShopEventType:
+        return get_shop_event_types()[self.event_type]
+
+    @cached_property
+    def validated_data(self) -> dict:
+        serializer = self.shop_event_type.serializer_class(data=self.raw_data)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data.copy()
+
+    @property
+    def ordering_key(self) -> str:
+        return self.shop_event_type.get_ordering_key(self.validated_data)
@@ -23,6 +23,7 @@ include(
     "conf/ckeditor.py",
     "conf/comment.py",
     "conf/db.py",
+    "conf/export.py",
     "conf/healthchecks.py",
     "conf/http.py",
     "conf/i18n.py",
@@ -34,6 +35,7 @@ include(
     "conf/proxy.py",
     "conf/search.py",
     "conf/sentry.py",
+    "conf/shop.py",
     "conf/static.py",
     "conf/storage.py",
     "conf/templates.py",
@@ -0,0 +1,57 @@
+import tempfile
+from typing import Any
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.storage import storages
+
+from app.celery import celery
+
+
+@celery.task(name="export_model_as_csv", max_retries=0)
+def export_model_as_csv(
+    app_label: str,
+    model_name: str,
+    user_id: str,
+    changelist_params: dict[str, list[str]] | None,
+    pks: list[str] | None,
+    filters: dict[str, Any],
+    field_names: list[str],
+    path: str,
+    compress: bool = False,
+) -> str:
+    from app.services.export_model_as_csv import ModelCSVRenderer, get_admin_queryset
+
+    queryset = get_admin_queryset(apps.get_model(app_label, model_name), user_id, changelist_params).filter(**filters)
+    if pks is not None:
+        queryset = queryset.filter(pk__in=pks)
+
+    with tempfile.TemporaryFile() as export_file:
+        for chunk in ModelCSVRenderer(queryset=queryset, field_names=field_names, chunk_size=settings.CSV_EXPORT_CHUNK_SIZE, compress=compress):
+            export_file.write(chunk)
+
+        export_file.seek(0)
+        return storages["exports"].save(path, File(export_file))
+
+
+@celery.task(name="drain_shop_inbox")
+def drain_shop_inbox() -> None:
+    from app.models import ShopInboxEvent
+    from app.services import ShopInboxDrainer, ShopInboxEventCreator
+    from app.services.shop_inbox_event_creator import DRAIN_SCHEDULED_CACHE_KEY
+
+    cache.delete(DRAIN_SCHEDULED_CACHE_KEY)  # events committed from now on schedule the next drain
+    while ShopInboxDrainer()():
+        pass
+
+    if ShopInboxEvent.objects.pending().exists():
+        ShopInboxEventCreator.schedule_drain(countdown=settings.SHOP_INBOX_RETRY_DELAY_SECONDS)
+
+
+@celery.task(name="replay_shop_dead_letters")
+def replay_shop_dead_letters(event_type: str | None = None, ids: list[str] | None = None) -> tuple[int, int]:
+    from app.services import ShopDeadLetterReplayer
+
+    return ShopDeadLetterReplayer(event_type=event_type, ids=ids)()  # type: ignore[arg-type]
@@ -0,0 +1,134 @@
+"""
+Measure how fast schedule_recurrent_charges charges active recurrents against local fake Tinkoff and Mindbox servers.
+
+The scenario is not collected by the test suite, run it explicitly against the test database:
+
+    BENCHMARK_RECURRENTS=5000 BENCHMARK_TINKOFF_ERROR_CODES=1051:0.05,1013:0.01 pytest src/app/testing/benchmark_recurrent_charges.py -s
+
+Charges run in the current process with eager celery tasks, as the test suite is configured.
+"""
+
+import time
+from datetime import timedelta
+
+import pytest
+from django.utils.timezone import now
+
+from app.conf.environ import env
+from app.testing.fake_servers import FakeMindboxServer, FakeServerConfig, FakeTinkoffServer
+from mindbox.models import MindboxOutboxEvent
+from mindbox.services import MindboxOutboxDrainer
+from payments.models import ChargeAttemptLog, PaymentInstrument, Recurrent, RecurrentChargeAttempt
+from payments.tasks import schedule_recurrent_charges
+from products.models import Product
+from users.models import User
+
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+]
+
+
+def parse_error_codes(value: str) -> dict[str, float]:
+    """Parse `1051:0.05,1013:0.01` into ErrorCode shares"""
+    error_codes = {}
+    for pair in filter(None, value.split(",")):
+        error_code, share = pair.split(":")
+        error_codes[error_code.strip()] = float(share)
+
+    return error_codes
+
+
+def percentile(values: list[float], share: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * share), len(ordered) - 1)]
+
+
+@pytest.fixture
+def recurrents():
+    count = env("BENCHMARK_RECURRENTS", cast=int, default=1000)
+    product = Product.objects.create(name="Benchmark", product_type="subscription", lifetime=30)
+    users = User.objects.bulk_create([User(username=f"benchmark-{index}@example.com", email=f"benchmark-{index}@example.com") for index in range(count)])
+    instruments = PaymentInstrument.objects.bulk_create(
+        [PaymentInstrument(user=user, provider="TINKOFF", payment_method="CARD", rebill_id=f"benchmark-{index}", status="ACTIVE") for index, user in enumerate(users)],
+    )
+
+    return Recurrent.objects.bulk_create(
+        [
+            Recurrent(user=user, product=product, payment_instrument=instrument, amount=990, next_charge_date=now() - timedelta(days=1))
+            for user, instrument in zip(users, instruments, strict=True)
+        ],
+    )
+
+
+@pytest.fixture
+def tinkoff():
+    config = FakeServerConfig(
+        latency_ms=env("BENCHMARK_TINKOFF_LATENCY_MS", cast=float, default=300),
+        latency_jitter_ms=env("BENCHMARK_TINKOFF_LATENCY_JITTER_MS", cast=float, default=100),
+        error_rate=env("BENCHMARK_TINKOFF_ERROR_RATE", cast=float, default=0),
+        error_codes=parse_error_codes(env("BENCHMARK_TINKOFF_ERROR_CODES", cast=str, default="")),
+    )
+    with FakeTinkoffServer(config) as server:
+        yield server
+
+
+@pytest.fixture
+def mindbox():
+    config = FakeServerConfig(
+        latency_ms=env("BENCHMARK_MINDBOX_LATENCY_MS", cast=float, default=100),
+        error_rate=env("BENCHMARK_MINDBOX_ERROR_RATE", cast=float, default=0),
+    )
+    with FakeMindboxServer(config) as server:
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def _settings(settings, recurrents, tinkoff, mindbox):
+    settings.TINKOFF_API_URL = tinkoff.url
+    settings.MINDBOX_URL = f"{mindbox.url}/"
+    settings.MINDBOX_ENABLED = True
+    settings.RECURRENT_CHARGE_RATE_PER_MINUTE = env("BENCHMARK_RATE_PER_MINUTE", cast=int, default=len(recurrents) * 60)
+
+
+def drain_mindbox(recurrents: list[Recurrent]) -> int:
+    events = MindboxOutboxEvent.objects.filter(user__in=[recurrent.user_id for recurrent in recurrents])
+    while events.ready_to_send().exists() and MindboxOutboxDrainer()():
+        pass
+
+    return events.filter(sent_at__isnull=False).count()
+
+
+def get_latencies(recurrents: list[Recurrent], tinkoff: FakeTinkoffServer) -> list[float]:
+    """Seconds from Init of every charge to its saved attempt"""
+    init_times: dict[str, float] = {}
+    for arrived, path, body in tinkoff.requests:
+        if path.endswith("/Init"):
+            init_times.setdefault(str(body.get("OrderId", "")).split("-")[0], arrived)
+
+    latencies = []
+    for recurrent_id, created in RecurrentChargeAttempt.objects.filter(recurrent__in=recurrents).values_list("recurrent_id", "created"):
+        if recurrent_id.hex in init_times:
+            latencies.append(created.timestamp() - init_times[recurrent_id.hex])
+
+    return latencies
+
+
+def test_recurrent_charges(recurrents, tinkoff, mindbox):
+    started = time.time()
+    schedule_recurrent_charges()
+    charged = time.time()
+    delivered = drain_mindbox(recurrents)
+    drained = time.time()
+
+    latencies = get_latencies(recurrents, tinkoff)
+    print()  # noqa: T201
+    print(f"Charge attempts: {len(latencies)} of {len(recurrents)}, Tinkoff requests: {len(tinkoff.requests)}")  # noqa: T201
+    print(f"Duration: {charged - started:.1f}s, throughput: {len(latencies) / max(charged - started, 1e-9):.1f} charges/sec")  # noqa: T201
+    if latencies:
+        print(f"Latency from Init to saved attempt: p50 {percentile(latencies, 0.5):.3f}s, p99 {percentile(latencies, 0.99):.3f}s")  # noqa: T201
+    print(f"Mindbox operations: {len(mindbox.requests)} requests, {delivered / max(drained - charged, 1e-9):.1f} events/sec")  # noqa: T201
+
+    attempted = RecurrentChargeAttempt.objects.filter(recurrent__in=recurrents).values("recurrent").distinct().count()
+    failed = ChargeAttemptLog.objects.filter(user__in=[recurrent.user_id for recurrent in recurrents]).values("user").distinct().count()
+    assert attempted + failed == len(recurrents)
@@ -0,0 +1,179 @@
+"""
+Local stand-ins for Tinkoff and Mindbox APIs to measure throughput without hitting real services.
+
+Every server runs in a background thread of the current process. It answers after a configurable latency,
+fails with HTTP 500 at a configurable rate, and records when each request arrived.
+
+    with FakeTinkoffServer(FakeServerConfig(latency_ms=300, error_codes={"1051": 0.05})) as tinkoff:
+        settings.TINKOFF_API_URL = tinkoff.url
+"""
+
+import json
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from types import TracebackType
+from typing import Any, Self
+from urllib.parse import urlsplit
+
+from django.conf import settings
+
+
+__all__ = [
+    "FakeMindboxServer",
+    "FakeServerConfig",
+    "FakeTinkoffServer",
+]
+
+
+@dataclass
+class FakeServerConfig:
+    latency_ms: float = 0
+    latency_jitter_ms: float = 0
+    error_rate: float = 0  # share of requests failed with HTTP 500
+    error_codes: dict[str, float] = field(default_factory=dict)  # Tinkoff ErrorCode → share of declined charges
+
+    def sleep(self) -> None:
+        latency = self.latency_ms + random.uniform(-self.latency_jitter_ms, self.latency_jitter_ms)  # noqa: S311
+        if latency > 0:
+            time.sleep(latency / 1000)
+
+    def is_failed(self) -> bool:
+        return random.random() < self.error_rate  # noqa: S311
+
+    def get_error_code(self) -> str | None:
+        """Return ErrorCode of declined charge or None if the charge is confirmed"""
+        threshold = random.random()  # noqa: S311
+        for error_code, share in self.error_codes.items():
+            if threshold < share:
+                return error_code
+            threshold -= share
+
+        return None
+
+
+class FakeServer(ABC):
+    def __init__(self, config: FakeServerConfig | None = None, port: int = 0) -> None:
+        self.config = config or FakeServerConfig()
+        self.requests: list[tuple[float, str, dict[str, Any]]] = []  # arrival time, path and body of every request
+        self.lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_POST(self) -> None:
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                with server.lock:
+                    server.requests.append((time.time(), self.path, body))
+
+                server.config.sleep()
+                status, response = (500, {"Message": "Internal error"}) if server.config.is_failed() else server.respond(self.path, self.headers, body)
+
+                content = json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+        self.http_server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.http_server.daemon_threads = True
+        self.thread = threading.Thread(target=self.http_server.serve_forever, daemon=True)
+
+    def __enter__(self) -> Self:
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None) -> None:
+        self.http_server.shutdown()
+        self.http_server.server_close()
+
+    @property
+    def url(self) -> str:
+        host, port = self.http_server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @abstractmethod
+    def respond(self, path: str, headers: Any, body: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        raise NotImplementedError("Please implement in the server class")
+
+
+class FakeTinkoffServer(FakeServer):
+    """Serves /Init and /Charge of Tinkoff recurrent payments, requests must be signed like TinkoffTokenGenerator does"""
+
+    def __init__(self, config: FakeServerConfig | None = None, port: int = 0) -> None:
+        super().__init__(config, port)
+        self.payment_ids = count(start=1)
+        self.amounts: dict[str, int] = {}
+
+    def respond(self, path: str, headers: Any, body: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        method = urlsplit(path).path.rstrip("/").rsplit("/", maxsplit=1)[-1]
+
+        if not self.is_signed(body):
+            return 200, {"Success": False, "ErrorCode": "204", "Message": "Неверный токен"}
+
+        if method == "Init":
+            return 200, self.init(body)
+
+        if method == "Charge":
+            return 200, self.charge(body)
+
+        return 404, {"Success": False, "ErrorCode": "404", "Message": "Unknown method"}
+
+    def init(self, body: dict[str, Any]) -> dict[str, Any]:
+        with self.lock:
+            payment_id = str(next(self.payment_ids))
+            self.amounts[payment_id] = body.get("Amount", 0)
+
+        return {
+            "Success": True,
+            "ErrorCode": "0",
+            "TerminalKey": body.get("TerminalKey"),
+            "Status": "NEW",
+            "PaymentId": payment_id,
+            "OrderId": body.get("OrderId"),
+            "Amount": body.get("Amount"),
+        }
+
+    def charge(self, body: dict[str, Any]) -> dict[str, Any]:
+        payment_id = str(body.get("PaymentId"))
+        with self.lock:
+            amount = self.amounts.pop(payment_id, None)
+
+        if amount is None:
+            return {"Success": False, "ErrorCode": "255", "Message": "Платеж не найден", "PaymentId": payment_id}
+
+        error_code = self.config.get_error_code()
+        if error_code is not None:
+            return {"Success": False, "ErrorCode": error_code, "Status": "REJECTED", "PaymentId": payment_id, "Amount": amount, "Message": "Отказ"}
+
+        return {"Success": True, "ErrorCode": "0", "Status": "CONFIRMED", "PaymentId": payment_id, "Amount": amount}
+
+    @staticmethod
+    def is_signed(body: dict[str, Any]) -> bool:
+        from payments.services.tinkoff import TinkoffTokenGenerator
+
+        payload = {key: value for key, value in body.items() if key != "Token"}
+        return body.get("Token") == TinkoffTokenGenerator(payload)()
+
+
+class FakeMindboxServer(FakeServer):
+    """Serves operations/sync and operations/async of Mindbox, requests must have the endpoint secret key"""
+
+    def respond(self, path: str, headers: Any, body: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        if urlsplit(path).path.rstrip("/").rsplit("/", maxsplit=1)[-1] not in ("sync", "async"):
+            return 404, {"status": "NotFound"}
+
+        if headers.get("Authorization") != f"SecretKey {settings.MINDBOX_ENDPOINT_SECRET_KEY}":
+            return 401, {"status": "Unauthorized"}
+
+        return 200, {"status": "Success"}
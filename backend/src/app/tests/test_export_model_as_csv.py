@@ -0,0 +1,166 @@
+import csv
+import gzip
+import io
+
+import pytest
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.core import signing
+
+from app.services.export_model_as_csv import EXPORT_LINK_SALT, ModelCSVRenderer
+from app.tasks import export_model_as_csv
+from product_access.models import ProductAccess
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def access_items(factory):
+    return factory.cycle(5).product_access()
+
+
+@pytest.fixture
+def render():
+    def _render(field_names, chunk_size=2, compress=False):
+        content = b"".join(ModelCSVRenderer(queryset=ProductAccess.objects.all(), field_names=field_names, chunk_size=chunk_size, compress=compress))
+        if compress:
+            content = gzip.decompress(content)
+
+        return list(csv.reader(io.StringIO(content.decode())))
+
+    return _render
+
+
+def test_header(render):
+    assert render(["id", "order_id"]) == [["id", "order_id"]]
+
+
+def test_all_rows_are_exported_in_keyset_order(render, access_items):
+    rows = render(["id", "order_id"])
+
+    expected = sorted(access_items, key=lambda access: (access.created, access.id))
+    assert rows[1:] == [[str(access.id), access.order_id] for access in expected]
+
+
+def test_related_fields_are_read_with_values(render, access_items, django_assert_num_queries):
+    with django_assert_num_queries(3):  # 5 rows by 2 per page
+        rows = render(["order_id", "user__username"])
+
+    assert {row[1] for row in rows[1:]} == {access.user.username for access in access_items}
+
+
+def test_relations_are_selected(render, access_items, django_assert_num_queries):
+    with django_assert_num_queries(3):
+        rows = render(["order_id", "user"])
+
+    assert {row[1] for row in rows[1:]} == {str(access.user) for access in access_items}
+
+
+def test_gzip(render, access_items):
+    rows = render(["id"], compress=True)
+
+    assert len(rows) == 6
+
+
+def test_format_aware_datetime_as_local_time(render, factory):
+    access = factory.product_access(start_date="2032-01-01 15:00:00+03:00")
+
+    rows = render(["id", "start_date"])
+
+    assert rows[1] == [str(access.id), "2032-01-01T12:00:00"]
+
+
+@pytest.fixture
+def exports_storage(settings, tmp_path):
+    settings.STORAGES = {**settings.STORAGES, "exports": {"BACKEND": "django.core.files.storage.FileSystemStorage", "OPTIONS": {"location": str(tmp_path)}}}
+    return tmp_path
+
+
+@pytest.fixture
+def export(admin_user):
+    def _export(changelist_params=None, pks=None, filters=None, field_names=None):
+        return export_model_as_csv(
+            app_label="product_access",
+            model_name="productaccess",
+            user_id=str(admin_user.pk),
+            changelist_params=changelist_params,
+            pks=pks,
+            filters=filters or {},
+            field_names=field_names or ["id"],
+            path="export.csv",
+        )
+
+    return _export
+
+
+def test_task_exports_rows_by_primary_keys(export, exports_storage, access_items):
+    path = export(pks=[str(access_items[0].id)])
+
+    assert (exports_storage / path).read_text().splitlines() == ["id", str(access_items[0].id)]
+
+
+def test_task_exports_whole_table_with_filters(export, exports_storage, access_items):
+    access_items[0].setattr_and_save("order_id", "the-order")
+
+    path = export(filters={"order_id": "the-order"}, field_names=["order_id"])
+
+    assert (exports_storage / path).read_text().splitlines() == ["order_id", "the-order"]
+
+
+def test_task_rebuilds_changelist_queryset(export, exports_storage, access_items):
+    access_items[0].setattr_and_save("order_id", "the-order")
+
+    path = export(changelist_params={"q": ["the-order"]}, field_names=["order_id"])
+
+    assert (exports_storage / path).read_text().splitlines() == ["order_id", "the-order"]
+
+
+def test_export_across_changelist_sends_filters_instead_of_primary_keys(admin_client, admin_user, access_items, settings, mocker):
+    settings.CSV_EXPORT_ASYNC_THRESHOLD = 0
+    access_items[0].setattr_and_save("order_id", "the-order")
+    task = mocker.patch("app.tasks.export_model_as_csv.delay")
+
+    admin_client.post(
+        "/admin/product_access/productaccess/?q=the-order",
+        {"action": "export_as_csv", "select_across": "1", "index": "0", ACTION_CHECKBOX_NAME: [str(access_items[0].id)]},
+    )
+
+    assert task.call_args.kwargs["changelist_params"] == {"q": ["the-order"]}
+    assert task.call_args.kwargs["pks"] is None
+    assert task.call_args.kwargs["user_id"] == str(admin_user.pk)
+
+
+def test_export_is_downloaded_by_signed_link(admin_client, exports_storage):
+    (exports_storage / "export.csv").write_text("id\n")
+
+    response = admin_client.get(f"/admin/product_access/productaccess/export/{signing.dumps('export.csv', salt=EXPORT_LINK_SALT)}/")
+
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content) == b"id\n"
+
+
+def test_export_is_not_downloaded_by_tampered_link(admin_client, exports_storage):
+    (exports_storage / "other.csv").write_text("id\n")
+
+    response = admin_client.get(f"/admin/product_access/productaccess/export/{signing.dumps('export.csv', salt=EXPORT_LINK_SALT)[:-1]}x/")
+
+    assert response.status_code == 404
+
+
+def test_export_link_expires(admin_client, exports_storage, settings):
+    settings.CSV_EXPORT_LINK_MAX_AGE_SECONDS = -1
+    (exports_storage / "export.csv").write_text("id\n")
+
+    response = admin_client.get(f"/admin/product_access/productaccess/export/{signing.dumps('export.csv', salt=EXPORT_LINK_SALT)}/")
+
+    assert response.status_code == 404
+
+
+def test_export_is_not_downloaded_by_anonymous(client, exports_storage):
+    (exports_storage / "export.csv").write_text("id\n")
+
+    response = client.get(f"/admin/product_access/productaccess/export/{signing.dumps('export.csv', salt=EXPORT_LINK_SALT)}/")
+
+    assert response.status_code == 302
@@ -0,0 +1,31 @@
+import pytest
+from django.core.cache import cache
+
+from app.utils import FixedWindowRateLimiter
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+
+
+@pytest.fixture
+def limiter():
+    return FixedWindowRateLimiter(name="test", capacity=2, period=60)
+
+
+@pytest.mark.freeze_time("2032-01-01 10:00:15")
+def test_calls_are_allowed_until_window_is_exhausted(limiter):
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 45
+
+
+def test_calls_are_allowed_again_in_the_next_window(limiter, freezer):
+    freezer.move_to("2032-01-01 10:00:15")
+    limiter.acquire()
+    limiter.acquire()
+
+    freezer.move_to("2032-01-01 10:01:00")
+
+    assert limiter.acquire() == 0
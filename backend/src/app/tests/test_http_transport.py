@@ -0,0 +1,44 @@
+import pytest
+import requests_mock
+
+from app import http_transport
+
+
+@pytest.fixture
+def http_mock():
+    with requests_mock.Mocker() as mock:
+        yield mock
+
+
+def test_session_is_reused_for_the_same_origin():
+    assert http_transport.get_session("https://api.mindbox.ru/v3/operations") is http_transport.get_session("https://api.mindbox.ru/other")
+
+
+def test_different_origins_get_different_sessions():
+    assert http_transport.get_session("https://api.mindbox.ru/v3/") is not http_transport.get_session("https://securepay.tinkoff.ru/v2/")
+
+
+def test_default_timeout_is_set(http_mock, settings):
+    settings.HTTP_CONNECT_TIMEOUT = 1
+    settings.HTTP_READ_TIMEOUT = 5
+    http_mock.post("https://api.test/charge", json={"ok": True})
+
+    http_transport.post("https://api.test/charge", json={})
+
+    assert http_mock.last_request.timeout == (1, 5)
+
+
+def test_explicit_timeout_is_respected(http_mock):
+    http_mock.get("https://api.test/user", json={"ok": True})
+
+    http_transport.get("https://api.test/user", timeout=42)
+
+    assert http_mock.last_request.timeout == 42
+
+
+def test_pool_and_retries_are_configured(settings):
+    adapter = http_transport.TransportSession().get_adapter("https://api.test/")
+
+    assert adapter._pool_maxsize == settings.HTTP_POOL_MAXSIZE
+    assert adapter.max_retries.total == settings.HTTP_RETRIES
+    assert "POST" not in adapter.max_retries.allowed_methods
@@ -0,0 +1,168 @@
+import pytest
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+
+from app.db_router import ReplicaRouter
+from app.middleware.replica_routing import PIN_TO_PRIMARY_CACHE_KEY, replica_routing_middleware
+from app.utils import get_read_db_alias, replica_reads, use_primary
+from app.utils.db_routing import REPLICA_DB_ALIAS
+from users.models import User
+
+
+@pytest.fixture(autouse=True)
+def _replica(mocker):
+    mocker.patch("app.utils.db_routing.has_replica", return_value=True)
+
+
+@pytest.fixture
+def router():
+    return ReplicaRouter()
+
+
+def test_reads_go_to_primary_by_default(router):
+    assert router.db_for_read(User) == "default"
+
+
+def test_reads_go_to_replica_within_scope(router):
+    with replica_reads():
+        assert router.db_for_read(User) == "replica"
+
+
+def test_scope_is_pinned_to_primary_after_write(router):
+    with replica_reads():
+        assert router.db_for_write(User) == "default"
+
+        assert router.db_for_read(User) == "default"
+
+
+def test_primary_is_forced_within_replica_scope(router):
+    with replica_reads(), use_primary():
+        assert router.db_for_read(User) == "default"
+
+
+def test_primary_is_forced_by_decorator(router):
+    @use_primary()
+    def read():
+        return router.db_for_read(User)
+
+    with replica_reads():
+        assert read() == "default"
+
+
+def test_replica_is_not_used_without_replica(router, mocker):
+    mocker.patch("app.utils.db_routing.has_replica", return_value=False)
+
+    with replica_reads():
+        assert router.db_for_read(User) == "default"
+
+
+def test_migrations_are_applied_to_primary_only(router):
+    assert router.allow_migrate("default", "users") is True
+    assert router.allow_migrate("replica", "users") is False
+
+
+@pytest.fixture
+def serve():
+    def _serve(request, write=False):
+        aliases = []
+
+        def view(request):
+            aliases.append(get_read_db_alias())
+            if write:
+                ReplicaRouter().db_for_write(User)
+            return HttpResponse()
+
+        replica_routing_middleware(view)(request)
+        return aliases[0]
+
+    return _serve
+
+
+@pytest.fixture
+def user(factory):
+    return factory.user()
+
+
+@pytest.fixture
+def request_of(user):
+    def _request_of(method):
+        request = getattr(RequestFactory(), method)("/")
+        request.user = user
+        return request
+
+    return _request_of
+
+
+@pytest.mark.django_db
+def test_safe_request_reads_from_replica(serve, request_of, user):
+    alias = serve(request_of("get"))
+
+    assert alias == "replica"
+    assert cache.get(PIN_TO_PRIMARY_CACHE_KEY.format(user_id=user.id)) is None
+
+
+@pytest.mark.django_db
+def test_unsafe_request_reads_from_primary_and_pins_user(serve, request_of, user):
+    alias = serve(request_of("post"), write=True)
+
+    assert alias == "default"
+    assert cache.get(PIN_TO_PRIMARY_CACHE_KEY.format(user_id=user.id)) is not None
+
+
+@pytest.mark.django_db
+def test_pinned_user_reads_from_primary(serve, request_of, user):
+    serve(request_of("post"), write=True)
+
+    assert serve(request_of("get")) == "default"
+
+
+@pytest.mark.django_db
+def test_pin_of_another_user_is_ignored(serve, request_of, factory):
+    serve(request_of("post"), write=True)
+    request = RequestFactory().get("/")
+    request.user = factory.user()
+
+    assert serve(request) == "replica"
+
+
+@pytest.mark.django_db
+def test_token_client_is_pinned_without_cookies(serve, user):
+    token = Token.objects.create(user=user)
+
+    assert serve(RequestFactory().get("/", HTTP_AUTHORIZATION=f"Token {token}")) == "replica"
+
+    cache.set(PIN_TO_PRIMARY_CACHE_KEY.format(user_id=user.id), True)
+
+    assert serve(RequestFactory().get("/", HTTP_AUTHORIZATION=f"Token {token}")) == "default"
+
+
+@pytest.fixture
+def replica(settings):
+    """Second connection alias to the test database, so queries sent to the replica are told from queries to the primary"""
+    settings.DATABASE_ROUTERS = ["app.db_router.ReplicaRouter"]
+    connections.settings[REPLICA_DB_ALIAS] = {**connections[DEFAULT_DB_ALIAS].settings_dict}
+
+    yield connections[REPLICA_DB_ALIAS]
+
+    connections[REPLICA_DB_ALIAS].close()
+    del connections[REPLICA_DB_ALIAS]
+    del connections.settings[REPLICA_DB_ALIAS]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_api_client_reads_own_writes_from_primary(replica, as_user):
+    with CaptureQueriesContext(replica) as replica_queries:
+        as_user.get("/api/demo/users/me/")
+
+    assert len(replica_queries) > 0
+
+    as_user.patch("/api/demo/users/me/", data={"firstName": "Honest"})
+    with CaptureQueriesContext(replica) as replica_queries:
+        got = as_user.get("/api/demo/users/me/")
+
+    assert len(replica_queries) == 0
+    assert got["firstName"] == "Honest"
@@ -0,0 +1,42 @@
+import pytest
+
+from app.utils import clear_request_memo, memoize_for_request, request_memo_scope
+
+
+@pytest.fixture
+def compute(mocker):
+    return mocker.Mock(return_value=42)
+
+
+def test_compute_every_time_outside_of_scope(compute):
+    memoize_for_request("answer", compute)
+    memoize_for_request("answer", compute)
+
+    assert compute.call_count == 2
+
+
+def test_memoize_within_scope(compute):
+    with request_memo_scope():
+        assert memoize_for_request("answer", compute) == 42
+        assert memoize_for_request("answer", compute) == 42
+
+    compute.assert_called_once()
+
+
+def test_scopes_do_not_share_answers(compute):
+    with request_memo_scope():
+        memoize_for_request("answer", compute)
+
+    with request_memo_scope():
+        memoize_for_request("answer", compute)
+
+    assert compute.call_count == 2
+
+
+def test_clear(compute):
+    with request_memo_scope():
+        memoize_for_request("answer", compute)
+        clear_request_memo()
+        memoize_for_request("answer", compute)
+
+    assert compute.call_count == 2
@@ -0,0 +1,119 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from app.models import ShopDeadLetter, ShopInboxEvent
+from app.services import ShopDeadLetterReplayer, ShopInboxDrainer
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture(autouse=True)
+def _adjust_settings(settings):
+    settings.SHOP_INBOX_MAX_ATTEMPTS = 2
+
+
+@pytest.fixture(autouse=True)
+def drain_task(mocker):
+    return mocker.patch("app.tasks.drain_shop_inbox.apply_async")
+
+
+@pytest.fixture
+def revoker(mocker):
+    return mocker.patch("product_access.services.ProductAccessRevoker")
+
+
+@pytest.fixture
+def refund():
+    def refund(order_id, ordering_key=None, **kwargs):
+        return ShopInboxEvent.objects.create(
+            event_key=f"refund-{order_id}",
+            event_type="order-refunded",
+            ordering_key=ordering_key or f"order:{order_id}",
+            raw_data={"event_id": str(uuid.uuid4()), "event_type": "order-refunded", "event_time": "2025-01-01T10:00:00Z", "data": {"order_id": order_id}},
+            **kwargs,
+        )
+
+    return refund
+
+
+def processed_order_ids(revoker):
+    return [call.kwargs["order_id"] for call in revoker.call_args_list]
+
+
+def test_events_are_processed_in_order(refund, revoker):
+    refund("first", ordering_key="user:a")
+    refund("second", ordering_key="user:b")
+    refund("third", ordering_key="user:a")
+
+    ShopInboxDrainer()()
+
+    assert processed_order_ids(revoker) == ["first", "second", "third"]
+    assert not ShopInboxEvent.objects.pending().exists()
+
+
+def test_failed_event_stops_its_key_only(refund, revoker):
+    revoker.return_value.side_effect = [Exception("Oops"), None]
+    refund("failed", ordering_key="user:a")
+    refund("blocked", ordering_key="user:a")
+    refund("other", ordering_key="user:b")
+
+    ShopInboxDrainer()()
+
+    assert processed_order_ids(revoker) == ["failed", "other"]
+    failed = ShopInboxEvent.objects.get(event_key="refund-failed")
+    assert failed.attempts == 1
+    assert "Oops" in failed.last_error
+    assert ShopInboxEvent.objects.get(event_key="refund-blocked").processed_at is None
+
+
+def test_failed_event_is_not_retried_before_retry_delay(refund, revoker):
+    revoker.return_value.side_effect = Exception("Oops")
+    refund("failed")
+    ShopInboxDrainer()()
+
+    assert ShopInboxDrainer()() == 0
+
+
+def test_event_is_moved_to_dead_letters_after_max_attempts(refund, revoker):
+    revoker.return_value.side_effect = [Exception("Oops"), None]
+    failed = refund("failed", ordering_key="user:a", attempts=1)
+    ShopInboxEvent.objects.filter(id=failed.id).update(modified=timezone.now() - timedelta(minutes=5))
+    refund("next", ordering_key="user:a")
+
+    ShopInboxDrainer()()
+
+    assert processed_order_ids(revoker) == ["failed", "next"]
+    assert ShopDeadLetter.objects.get().raw_data["data"]["order_id"] == "failed"
+
+
+def test_dead_letters_are_replayed_through_inbox(revoker):
+    ShopDeadLetter.objects.create(
+        event_type="order-refunded",
+        raw_data={"event_id": "0b4f2f5e-9b5c-4bd2-8b43-1f7b7e0bcd8f", "event_type": "order-refunded", "event_time": "2025-01-01T10:00:00Z", "data": {"order_id": "1"}},
+    )
+    ShopDeadLetter.objects.create(event_type="order-refunded", raw_data={"data": {}})
+
+    assert ShopDeadLetterReplayer()() == (1, 1)
+    assert ShopDeadLetterReplayer()() == (0, 1)
+
+    ShopInboxDrainer()()
+    assert processed_order_ids(revoker) == ["1"]
+
+
+def test_replay_revives_exhausted_event(refund, revoker):
+    event = refund("dead", attempts=2)
+    ShopInboxEvent.objects.filter(id=event.id).update(event_key=event.raw_data["event_id"])
+    ShopDeadLetter.objects.create(event_type="order-refunded", raw_data=event.raw_data)
+
+    ShopDeadLetterReplayer()()
+    ShopInboxDrainer()()
+
+    event.refresh_from_db()
+    assert event.processed_at is not None
+    assert ShopInboxEvent.objects.count() == 1
@@ -0,0 +1,82 @@
+import pytest
+
+from app import http_transport
+from app.testing.fake_servers import FakeMindboxServer, FakeServerConfig, FakeTinkoffServer
+from payments.services.tinkoff import TinkoffTokenGenerator
+
+
+@pytest.fixture(autouse=True)
+def _settings(settings):
+    settings.TINKOFF_TERMINAL_PASSWORD = "secret"
+    settings.MINDBOX_ENDPOINT_SECRET_KEY = "mindbox-secret"
+    settings.HTTP_RETRIES = 0
+
+
+def sign(payload):
+    return {**payload, "Token": TinkoffTokenGenerator(payload)()}
+
+
+def init_and_charge(server):
+    init = http_transport.post(f"{server.url}/Init", json=sign({"TerminalKey": "test", "Amount": 99000, "OrderId": "order-1"})).json()
+    charge = http_transport.post(f"{server.url}/Charge", json=sign({"TerminalKey": "test", "PaymentId": init["PaymentId"], "RebillId": "rebill-1"})).json()
+    return init, charge
+
+
+def test_tinkoff_confirms_charge_of_initialized_payment():
+    with FakeTinkoffServer() as server:
+        init, charge = init_and_charge(server)
+
+    assert init["Success"] is True
+    assert init["Status"] == "NEW"
+    assert charge["Success"] is True
+    assert charge["Status"] == "CONFIRMED"
+    assert charge["PaymentId"] == init["PaymentId"]
+    assert charge["Amount"] == 99000
+
+
+def test_tinkoff_rejects_request_with_wrong_token():
+    with FakeTinkoffServer() as server:
+        response = http_transport.post(f"{server.url}/Init", json={"TerminalKey": "test", "Amount": 99000, "Token": "wrong"}).json()
+
+    assert response["Success"] is False
+    assert response["ErrorCode"] == "204"
+
+
+def test_tinkoff_declines_charges_with_configured_error_codes():
+    with FakeTinkoffServer(FakeServerConfig(error_codes={"1051": 1})) as server:
+        _, charge = init_and_charge(server)
+
+    assert charge["Success"] is False
+    assert charge["Status"] == "REJECTED"
+    assert charge["ErrorCode"] == "1051"
+
+
+def test_server_fails_with_configured_error_rate():
+    with FakeTinkoffServer(FakeServerConfig(error_rate=1)) as server:
+        response = http_transport.post(f"{server.url}/Init", json=sign({"TerminalKey": "test", "Amount": 99000}))
+
+    assert response.status_code == 500
+
+
+def test_requests_are_recorded():
+    with FakeTinkoffServer() as server:
+        init_and_charge(server)
+
+    assert [path for _arrived, path, _body in server.requests] == ["/Init", "/Charge"]
+    assert server.requests[0][2]["OrderId"] == "order-1"
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_mindbox_accepts_operations(mode):
+    with FakeMindboxServer() as server:
+        response = http_transport.post(f"{server.url}/operations/{mode}?operation=LMSEditCustomer", json={}, headers={"Authorization": "SecretKey mindbox-secret"})
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "Success"}
+
+
+def test_mindbox_requires_secret_key():
+    with FakeMindboxServer() as server:
+        response = http_transport.post(f"{server.url}/operations/sync?operation=LMSEditCustomer", json={}, headers={"Authorization": "SecretKey wrong"})
+
+    assert response.status_code == 401
@@ -1,8 +1,22 @@
+from app.utils.db_routing import get_read_db_alias, get_replica_db_alias, pin_to_primary, replica_reads, use_primary
+from app.utils.fixed_window_rate_limiter import FixedWindowRateLimiter
+from app.utils.lru_cache import LRUCache
 from app.utils.proxy import AuthenticatedProxySession, create_generic_proxy_session, create_google_proxy_session
+from app.utils.request_memo import clear_request_memo, memoize_for_request, request_memo_scope
 
 
 __all__ = [
     "AuthenticatedProxySession",
+    "FixedWindowRateLimiter",
+    "LRUCache",
+    "clear_request_memo",
     "create_generic_proxy_session",
     "create_google_proxy_session",
+    "get_read_db_alias",
+    "get_replica_db_alias",
+    "memoize_for_request",
+    "pin_to_primary",
+    "replica_reads",
+    "request_memo_scope",
+    "use_primary",
 ]
@@ -0,0 +1,71 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+REPLICA_DB_ALIAS = "replica"
+
+
+@dataclass
+class RoutingState:
+    replica_reads: bool
+    pinned_to_primary: bool = False
+
+
+_routing_state: ContextVar[RoutingState | None] = ContextVar("routing_state", default=None)
+
+
+def _routing_scope(state: RoutingState) -> Iterator[RoutingState]:
+    token = _routing_state.set(state)
+    try:
+        yield state
+    finally:
+        _routing_state.reset(token)
+
+
+@contextmanager
+def replica_reads() -> Iterator[RoutingState]:
+    """Send reads within the block to the replica until something is written; usable as a decorator too"""
+    yield from _routing_scope(RoutingState(replica_reads=True))
+
+
+@contextmanager
+def use_primary() -> Iterator[RoutingState]:
+    """Send all queries within the block to the primary, e.g. when the data must be fresh; usable as a decorator too"""
+    yield from _routing_scope(RoutingState(replica_reads=False))
+
+
+def pin_to_primary() -> None:
+    """Send the rest of reads of the current scope to the primary, so that they see what has been written"""
+    state = _routing_state.get()
+    if state is not None:
+        state.pinned_to_primary = True
+
+
+def is_pinned_to_primary() -> bool:
+    state = _routing_state.get()
+    return state is not None and state.pinned_to_primary
+
+
+def has_replica() -> bool:
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+def get_read_db_alias() -> str:
+    state = _routing_state.get()
+    if state is None or not state.replica_reads or state.pinned_to_primary or not has_replica():
+        return DEFAULT_DB_ALIAS
+
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:  # reads of a transaction must see its writes
+        return DEFAULT_DB_ALIAS
+
+    return REPLICA_DB_ALIAS
+
+
+def get_replica_db_alias() -> str:
+    """Alias for reads that may lag behind the primary no matter the scope, e.g. exports"""
+    return REPLICA_DB_ALIAS if has_replica() else DEFAULT_DB_ALIAS
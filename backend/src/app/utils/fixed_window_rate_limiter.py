@@ -0,0 +1,37 @@
+import time
+from dataclasses import dataclass
+
+from django.core.cache import cache
+
+
+@dataclass
+class FixedWindowRateLimiter:
+    """
+    Allow `capacity` calls within every `period` seconds window, counted in the cache.
+
+    Calls are counted per fixed window, so up to twice the capacity may pass around a window boundary.
+    The limit is shared only by processes using the same shared cache backend (e.g. redis),
+    with the default per-process cache every process has its own limit.
+    """
+
+    name: str
+    capacity: int
+    period: int = 60
+
+    def acquire(self) -> float:
+        """Count a call. Return 0 if it is allowed or number of seconds until the next window."""
+        now = time.time()
+        window = int(now // self.period)
+        key = f"rate_limit_{self.name}_{window}"
+
+        cache.add(key, 0, timeout=self.period * 2)
+        try:
+            used = cache.incr(key)
+        except ValueError:  # key has been evicted between add and incr
+            cache.set(key, 1, timeout=self.period * 2)
+            used = 1
+
+        if used <= self.capacity:
+            return 0
+
+        return (window + 1) * self.period - now
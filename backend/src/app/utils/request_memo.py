@@ -0,0 +1,38 @@
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+
+T = TypeVar("T")
+
+_request_memo: ContextVar[dict[Hashable, Any] | None] = ContextVar("request_memo", default=None)
+
+
+@contextmanager
+def request_memo_scope() -> Iterator[None]:
+    """Memoize answers within the block, e.g. for the life of one request"""
+    token = _request_memo.set({})
+    try:
+        yield
+    finally:
+        _request_memo.reset(token)
+
+
+def memoize_for_request(key: Hashable, compute: Callable[[], T]) -> T:
+    """Return memoized answer for the key, outside of the request scope always compute it"""
+    memo = _request_memo.get()
+    if memo is None:
+        return compute()
+
+    if key not in memo:
+        memo[key] = compute()
+
+    return memo[key]
+
+
+def clear_request_memo() -> None:
+    """Forget everything memoized so far, e.g. when memoized data is changed during the request"""
+    memo = _request_memo.get()
+    if memo is not None:
+        memo.clear()
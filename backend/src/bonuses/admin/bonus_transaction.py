@@ -1,7 +1,8 @@
 import uuid
 from typing import Any
 
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.core.exceptions import ValidationError
 from django.forms import ModelForm
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 from django.urls import reverse
@@ -10,11 +11,49 @@ from django.utils.translation import gettext_lazy as _
 
 from app.admin import ModelAdmin
 from bonuses.models import BonusAccount, BonusTransaction, BonusTransactionType
-from bonuses.services import BonusTransactionCreator
+from bonuses.services import BonusLedger, BonusLedgerEntry
+
+
+def get_signed_amount(transaction_type: str | None, amount: int) -> int:
+    if transaction_type in [BonusTransactionType.SPENT, BonusTransactionType.ADMIN_SPENT]:
+        return -abs(amount)
+
+    return abs(amount)
+
+
+def get_rejection_reason(account: BonusAccount, amount: int) -> str | None:
+    if not account.is_active:
+        return _("Bonus account is not active.")
+
+    if account.balance + amount < 0:
+        return _("Insufficient bonus balance.")
+
+    return None
+
+
+class BonusTransactionForm(ModelForm):
+    account_id: str | None = None  # set by the admin when the account is passed in the query string
+
+    def clean(self) -> dict[str, Any] | None:
+        super().clean()
+        account = self.cleaned_data.get("account")
+        if account is None and self.account_id:
+            account = BonusAccount.objects.filter(pk=self.account_id).first()
+
+        amount = self.cleaned_data.get("amount")
+        if account is None or amount is None:
+            return self.cleaned_data
+
+        reason = get_rejection_reason(account, get_signed_amount(self.cleaned_data.get("transaction_type"), amount))
+        if reason is not None:
+            raise ValidationError(reason)
+
+        return self.cleaned_data
 
 
 @admin.register(BonusTransaction)
 class BonusTransactionAdmin(ModelAdmin):
+    form = BonusTransactionForm
     list_display = ["account", "amount", "transaction_type", "reason", "created_by", "created"]
     list_filter = ["transaction_type", "created"]
 
@@ -39,7 +78,9 @@ class BonusTransactionAdmin(ModelAdmin):
 
     def get_form(self, request: HttpRequest, obj: Any | None = None, change: bool = False, **kwargs: Any) -> type[ModelForm]:
         self._request = request
-        return super().get_form(request, obj, change=change, **kwargs)
+        form = super().get_form(request, obj, change=change, **kwargs)
+        form.account_id = request.GET.get("account")  # type: ignore[attr-defined]
+        return form
 
     def get_model_perms(self, request: HttpRequest) -> dict:
         """Hide model from the admin index and app list."""
@@ -89,20 +130,12 @@ class BonusTransactionAdmin(ModelAdmin):
 
             obj.created_by = request.user if request.user.is_authenticated else None
 
-            if obj.transaction_type in [BonusTransactionType.SPENT, BonusTransactionType.ADMIN_SPENT]:
-                obj.amount = -abs(obj.amount)
-            else:
-                obj.amount = abs(obj.amount)
-
-            super().save_model(request, obj, form, change)
+            obj.amount = get_signed_amount(obj.transaction_type, obj.amount)
 
-            BonusTransactionCreator(
-                email=obj.account.user.email,
-                amount=abs(obj.amount),
-                transaction_type=obj.transaction_type,
-                reason=obj.reason,
-                created_by=obj.created_by,
-            ).update_balance(obj.account)
+            if BonusLedger(entries=[BonusLedgerEntry.from_transaction(obj)])()[0] is None:
+                # the account has changed concurrently since the form was validated
+                obj.account.refresh_from_db()
+                self.message_user(request, get_rejection_reason(obj.account, obj.amount) or _("Insufficient bonus balance."), messages.ERROR)
             return
 
         super().save_model(request, obj, form, change)
@@ -1,6 +1,9 @@
 from rest_framework import serializers
 
-from bonuses.models import BonusAccount
+from bonuses.models import BonusAccount, BonusTransactionType
+
+
+MAX_BATCH_OPERATIONS = 1000
 
 
 class BonusEmailSerializer(serializers.Serializer):
@@ -19,3 +22,17 @@ class BonusAccountSerializer(serializers.ModelSerializer):
     class Meta:
         model = BonusAccount
         fields = ("email", "balance", "is_active")
+
+
+class BonusBatchOperationSerializer(BonusChangeSerializer):
+    transaction_type = serializers.ChoiceField(choices=[BonusTransactionType.EARNED, BonusTransactionType.SPENT])
+
+
+class BonusBatchSerializer(serializers.Serializer):
+    operations = BonusBatchOperationSerializer(many=True, allow_empty=False, max_length=MAX_BATCH_OPERATIONS)
+
+
+class BonusBatchResultSerializer(serializers.Serializer):
+    email = serializers.EmailField()
+    balance = serializers.IntegerField(allow_null=True)
+    error = serializers.CharField(allow_null=True)
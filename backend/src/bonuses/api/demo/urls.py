@@ -9,4 +9,5 @@ urlpatterns = [
     path("account/", views.BonusAccountByEmailView.as_view(), name="bonus-account-by-email"),
     path("earn/", views.BonusEarnView.as_view(), name="bonus-earn"),
     path("spend/", views.BonusSpendView.as_view(), name="bonus-spend"),
+    path("batch/", views.BonusBatchView.as_view(), name="bonus-batch"),
 ]
@@ -5,9 +5,15 @@ from rest_framework.views import APIView
 
 from app.api.request import AuthenticatedRequest
 from bonuses.api.demo.permissions import BonusIntegrationPermission
-from bonuses.api.demo.serializers import BonusAccountSerializer, BonusChangeSerializer, BonusEmailSerializer
+from bonuses.api.demo.serializers import (
+    BonusAccountSerializer,
+    BonusBatchResultSerializer,
+    BonusBatchSerializer,
+    BonusChangeSerializer,
+    BonusEmailSerializer,
+)
 from bonuses.models import BonusAccount, BonusTransaction, BonusTransactionType
-from bonuses.services import BonusAccountGetter, BonusTransactionCreator
+from bonuses.services import BonusAccountGetter, BonusTransactionBatchCreator, BonusTransactionCreator
 
 
 class BonusAccountByEmailView(APIView):
@@ -74,3 +80,25 @@ class BonusSpendView(APIView):
         )()
 
         return Response(BonusAccountSerializer(bonus_account).data, status=HTTP_201_CREATED)
+
+
+class BonusBatchView(APIView):
+    permission_classes = [BonusIntegrationPermission]
+    queryset = BonusTransaction.objects.all()
+
+    @extend_schema(
+        request=BonusBatchSerializer,
+        responses={HTTP_200_OK: BonusBatchResultSerializer(many=True)},
+        description="Earn and spend bonuses for many users at once. Operations are applied in order within one transaction, "
+        "failed operations are returned with an error.",
+    )
+    def post(self, request: AuthenticatedRequest) -> Response:
+        serializer = BonusBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = BonusTransactionBatchCreator(
+            operations=serializer.validated_data["operations"],
+            created_by=request.user,
+        )()
+
+        return Response(BonusBatchResultSerializer(results, many=True).data, status=HTTP_200_OK)
@@ -0,0 +1,70 @@
+from collections import defaultdict
+from itertools import islice
+from typing import Any
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models import F, Sum, Value
+from django.db.models.functions import Greatest, TruncDate
+
+from bonuses.models import BonusAccount, BonusDailySummary, BonusTransaction
+
+
+class Command(BaseCommand):
+    """Daily summaries are maintained by the ledger, the command fills them for transactions made before they existed."""
+
+    help = "Rebuild bonus daily summaries from transactions"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Number of accounts rebuilt within one transaction")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        account_ids = BonusTransaction.objects.order_by("account_id").values_list("account_id", flat=True).distinct().iterator()
+
+        rebuilt = 0
+        while chunk := list(islice(account_ids, options["chunk_size"])):
+            self.rebuild(chunk)
+            rebuilt += len(chunk)
+            self.stdout.write(f"Rebuilt summaries of {rebuilt} accounts.")
+
+    @transaction.atomic
+    def rebuild(self, account_ids: list[UUID]) -> None:
+        accounts = BonusAccount.objects.select_for_update().in_bulk(account_ids)
+        days = defaultdict(list)
+        for day in (
+            BonusTransaction.objects.filter(account_id__in=account_ids)
+            .annotate(date=TruncDate("created"))
+            .values("account_id", "date")
+            .annotate(earned=Sum(Greatest("amount", Value(0))), spent=Sum(Greatest(F("amount") * -1, Value(0))))
+            .order_by("account_id", "date")
+        ):
+            days[day["account_id"]].append(day)
+
+        summaries = []
+        for account_id, account_days in days.items():
+            # closing balances are restored backwards from the current one
+            balances = []
+            balance = accounts[account_id].balance
+            for day in reversed(account_days):
+                balances.append(max(balance, 0))
+                balance -= day["earned"] - day["spent"]
+
+            earned_total = spent_total = 0
+            for day, day_balance in zip(account_days, reversed(balances), strict=True):
+                earned_total += day["earned"]
+                spent_total += day["spent"]
+                summaries.append(
+                    BonusDailySummary(
+                        account_id=account_id,
+                        date=day["date"],
+                        earned=day["earned"],
+                        spent=day["spent"],
+                        earned_total=earned_total,
+                        spent_total=spent_total,
+                        balance=day_balance,
+                    ),
+                )
+
+        BonusDailySummary.objects.filter(account_id__in=account_ids).delete()
+        BonusDailySummary.objects.bulk_create(summaries)
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.21 on 2026-10-18 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bonuses', '0006_set_created_by_fk_nullable'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BonusDailySummary',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('modified', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('date', models.DateField(verbose_name='Date')),
+                ('earned', models.PositiveIntegerField(default=0, verbose_name='Earned')),
+                ('spent', models.PositiveIntegerField(default=0, verbose_name='Spent')),
+                ('earned_total', models.PositiveBigIntegerField(default=0, help_text='Earned since the account was opened', verbose_name='Earned total')),
+                ('spent_total', models.PositiveBigIntegerField(default=0, help_text='Spent since the account was opened', verbose_name='Spent total')),
+                ('balance', models.PositiveIntegerField(default=0, help_text='Balance at the end of the day', verbose_name='Balance')),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_summaries', to='bonuses.bonusaccount', verbose_name='Bonus account')),
+            ],
+            options={
+                'verbose_name': 'Bonus daily summary',
+                'verbose_name_plural': 'Bonus daily summaries',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='bonusdailysummary',
+            constraint=models.UniqueConstraint(fields=('account', 'date'), name='bonus_daily_summary_account_date_unique'),
+        ),
+    ]
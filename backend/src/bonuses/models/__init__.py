@@ -1,9 +1,12 @@
 from bonuses.models.bonus_account import BonusAccount
+from bonuses.models.bonus_daily_summary import BonusDailyChange, BonusDailySummary
 from bonuses.models.bonus_transaction import BonusTransaction, BonusTransactionType
 
 
 __all__ = [
     "BonusAccount",
+    "BonusDailyChange",
+    "BonusDailySummary",
     "BonusTransaction",
     "BonusTransactionType",
 ]
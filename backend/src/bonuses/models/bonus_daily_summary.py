@@ -0,0 +1,92 @@
+from collections.abc import Iterable
+from datetime import date
+from typing import NamedTuple
+from uuid import UUID, uuid4
+
+from django.db import connection
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from app.models import TimestampedModel, models
+
+
+class BonusDailyChange(NamedTuple):
+    account_id: UUID
+    date: date
+    earned: int
+    spent: int
+    balance: int  # balance at the end of the day
+
+
+class BonusDailySummaryQuerySet(models.QuerySet):
+    def as_of(self, account_id: UUID, day: date) -> "BonusDailySummary | None":
+        """Summary of the last day with changes not later than given one"""
+        return self.filter(account_id=account_id, date__lte=day).order_by("-date").first()
+
+    def record(self, changes: Iterable[BonusDailyChange]) -> None:
+        """
+        Add daily changes of accounts to their summaries, running totals are continued from the previous summary of the account.
+        Must be called with changed accounts locked, at most one change per account and day.
+        """
+        changes = list(changes)
+        if not changes:
+            return
+
+        table = connection.ops.quote_name(self.model._meta.db_table)  # noqa: SLF001
+        values = ", ".join(["(%s::uuid, %s::uuid, %s::date, %s::integer, %s::integer, %s::integer)"] * len(changes))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (id, created, modified, account_id, date, earned, spent, earned_total, spent_total, balance)
+                SELECT change.id, %s, NULL, change.account_id, change.date, change.earned, change.spent,
+                    COALESCE(previous.earned_total, 0) + change.earned, COALESCE(previous.spent_total, 0) + change.spent, change.balance
+                FROM (VALUES {values}) AS change (id, account_id, date, earned, spent, balance)
+                LEFT JOIN LATERAL (
+                    SELECT earned_total, spent_total FROM {table}
+                    WHERE account_id = change.account_id AND date <= change.date
+                    ORDER BY date DESC LIMIT 1
+                ) AS previous ON TRUE
+                ON CONFLICT (account_id, date) DO UPDATE SET
+                    earned = {table}.earned + EXCLUDED.earned,
+                    spent = {table}.spent + EXCLUDED.spent,
+                    earned_total = EXCLUDED.earned_total,
+                    spent_total = EXCLUDED.spent_total,
+                    balance = EXCLUDED.balance,
+                    modified = EXCLUDED.created
+                """,  # noqa: S608
+                [timezone.now(), *(value for change in changes for value in (uuid4(), *change))],
+            )
+
+
+class BonusDailySummary(TimestampedModel):
+    """
+    Bonuses earned and spent by an account during a day, along with running totals and the balance at the end of the day.
+
+    Rows exist only for days with transactions. Balance as of date and totals for any period are lookups
+    of the last summary not later than period bounds.
+    """
+
+    objects = BonusDailySummaryQuerySet.as_manager()
+
+    account = models.ForeignKey(
+        "bonuses.BonusAccount",
+        on_delete=models.CASCADE,
+        verbose_name=_("Bonus account"),
+        related_name="daily_summaries",
+    )
+    date = models.DateField(_("Date"))
+    earned = models.PositiveIntegerField(_("Earned"), default=0)
+    spent = models.PositiveIntegerField(_("Spent"), default=0)
+    earned_total = models.PositiveBigIntegerField(_("Earned total"), default=0, help_text=_("Earned since the account was opened"))
+    spent_total = models.PositiveBigIntegerField(_("Spent total"), default=0, help_text=_("Spent since the account was opened"))
+    balance = models.PositiveIntegerField(_("Balance"), default=0, help_text=_("Balance at the end of the day"))
+
+    class Meta:
+        verbose_name = _("Bonus daily summary")
+        verbose_name_plural = _("Bonus daily summaries")
+        constraints = [
+            models.UniqueConstraint(fields=["account", "date"], name="bonus_daily_summary_account_date_unique"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.account_id} {self.date}"
@@ -1,10 +1,23 @@
 from bonuses.services.bonus_account_getter import BonusAccountGetter, BonusAccountGetterException
+from bonuses.services.bonus_balance_bulk_importer import BonusBalanceBulkImporter, BonusBalanceBulkImporterException
+from bonuses.services.bonus_ledger import BonusLedger, BonusLedgerEntry
+from bonuses.services.bonus_summary_getter import BonusSummary, BonusSummaryGetter, BonusSummaryGetterException
+from bonuses.services.bonus_transaction_batch_creator import BonusTransactionBatchCreator, BonusTransactionBatchResult
 from bonuses.services.bonus_transaction_creator import BonusTransactionCreator, BonusTransactionCreatorException
 
 
 __all__ = [
     "BonusAccountGetter",
     "BonusAccountGetterException",
+    "BonusBalanceBulkImporter",
+    "BonusBalanceBulkImporterException",
+    "BonusLedger",
+    "BonusLedgerEntry",
+    "BonusSummary",
+    "BonusSummaryGetter",
+    "BonusSummaryGetterException",
+    "BonusTransactionBatchCreator",
+    "BonusTransactionBatchResult",
     "BonusTransactionCreator",
     "BonusTransactionCreatorException",
 ]
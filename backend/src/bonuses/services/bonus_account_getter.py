@@ -25,7 +25,7 @@ class BonusAccountGetter(BaseService):
 
     def get_user(self) -> User:
         try:
-            user = User.objects.get(username=self.email)
+            user = User.objects.get_by_username(self.email)
         except User.DoesNotExist:
             raise BonusAccountGetterException(_("User matching query does not exist."))
 
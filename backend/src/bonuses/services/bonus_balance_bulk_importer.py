@@ -0,0 +1,183 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import connection
+from django.utils import timezone
+
+from app.exceptions import AppServiceException
+from app.services import BulkCSVImporter, BulkImportResult
+from bonuses.models import BonusAccount, BonusDailyChange, BonusDailySummary, BonusTransaction, BonusTransactionType
+from users.models import User
+
+
+MAX_AMOUNT = 2_000_000_000
+
+EARNING_REASON = "Перенос истории транзакции (начисление) из getcourse"
+SPENDING_REASON = "Перенос истории транзакции (списание) из getcourse"
+DECREASING_CORRECTION_REASON = "Корректировка бонусного баланса (снижение) по getcourse"
+INCREASING_CORRECTION_REASON = "Корректировка бонусного баланса (увеличение) по getcourse"
+
+
+class BonusBalanceBulkImporterException(AppServiceException):
+    """Raise if row can't be reconciled with the account."""
+
+
+@dataclass
+class BonusBalanceBulkImporter(BulkCSVImporter):
+    """
+    Reconcile bonus balances with the getcourse export.
+
+    For every row the income and spending history is transferred and the balance is corrected to the expected one.
+    Accounts of a chunk are loaded and locked with one query, transactions are computed in memory
+    and written with one bulk insert, balances are set with one `UPDATE ... FROM (VALUES ...)`,
+    daily summaries are updated with one upsert.
+    A row either applies completely or fails without transactions.
+    """
+
+    delimiter = ","
+
+    created_by: User | None = None
+
+    def import_chunk(self, rows: list[dict]) -> BulkImportResult:
+        result = BulkImportResult()
+        parsed_rows = []
+        for row in rows:
+            try:
+                parsed_row = self.parse_row(row)
+            except (KeyError, ValueError) as e:
+                result.fail(row, f"Failed to parse values: {e}")
+                continue
+
+            try:
+                validate_email(parsed_row[0])
+            except ValidationError:
+                result.fail(row, "Invalid email.")
+                continue
+
+            parsed_rows.append((row, parsed_row))
+
+        accounts = self.get_accounts(
+            emails={email for _row, (email, *_values) in parsed_rows},
+            emails_to_create={email for _row, (email, income, *_values) in parsed_rows if income > 0},
+        )
+
+        transactions: list[BonusTransaction] = []
+        new_balances: dict[BonusAccount, int] = {}
+        for row, (email, income, spending, expected_balance) in parsed_rows:
+            if income == 0 and spending == 0 and expected_balance == 0:
+                result.skipped += 1
+                continue
+
+            account = accounts.get(email)
+            if account is None:
+                result.fail(row, "User matching query does not exist.")
+                continue
+
+            try:
+                row_transactions = self.reconcile(account, new_balances.get(account, account.balance), income, spending, expected_balance)
+            except BonusBalanceBulkImporterException as e:
+                result.fail(row, str(e))
+                continue
+
+            transactions.extend(row_transactions)
+            new_balances[account] = new_balances.get(account, account.balance) + sum(transaction.amount for transaction in row_transactions)
+            result.imported += 1
+
+        BonusTransaction.objects.bulk_create(transactions)
+        self.update_balances({account.id: balance for account, balance in new_balances.items() if balance != account.balance})
+        BonusDailySummary.objects.record(self.get_daily_changes(transactions, new_balances))
+
+        return result
+
+    @staticmethod
+    def parse_row(row: dict) -> tuple[str, int, int, int]:
+        return (
+            row["email пользователя"].strip().lower(),
+            min(int(row["Приход"]), MAX_AMOUNT),
+            abs(min(int(row["Расход"]), MAX_AMOUNT)),
+            max(min(int(row["Сальдо"]), MAX_AMOUNT), -MAX_AMOUNT),
+        )
+
+    def reconcile(self, account: BonusAccount, balance: int, income: int, spending: int, expected_balance: int) -> list[BonusTransaction]:
+        if not account.is_active:
+            raise BonusBalanceBulkImporterException("Bonus account is not active.")
+
+        transactions = []
+        if income > 0:
+            transactions.append(self.build_transaction(account, income, BonusTransactionType.ADMIN_EARNED, EARNING_REASON))
+
+        # with negative expected balance everything earned is spent to get zero balance
+        spending_to_apply = income if expected_balance < 0 else spending
+        if spending_to_apply > 0:
+            transactions.append(self.build_transaction(account, -spending_to_apply, BonusTransactionType.ADMIN_SPENT, SPENDING_REASON))
+
+        balance += sum(transaction.amount for transaction in transactions)
+        if balance < 0:
+            raise BonusBalanceBulkImporterException("Insufficient bonus balance.")
+
+        expected_balance = max(expected_balance, 0)  # balance can't be negative
+        if balance > expected_balance:
+            correction = min(balance - expected_balance, MAX_AMOUNT)
+            transactions.append(self.build_transaction(account, -correction, BonusTransactionType.ADMIN_SPENT, DECREASING_CORRECTION_REASON))
+        elif balance < expected_balance:
+            correction = min(expected_balance - balance, MAX_AMOUNT)
+            transactions.append(self.build_transaction(account, correction, BonusTransactionType.ADMIN_EARNED, INCREASING_CORRECTION_REASON))
+
+        return transactions
+
+    def build_transaction(self, account: BonusAccount, amount: int, transaction_type: str, reason: str) -> BonusTransaction:
+        return BonusTransaction(
+            account=account,
+            amount=amount,
+            transaction_type=transaction_type,
+            reason=reason,
+            created_by=self.created_by or account.user,
+        )
+
+    def get_accounts(self, emails: set[str], emails_to_create: set[str]) -> dict[str, BonusAccount]:
+        """Return locked bonus accounts by email, creating missing users that earn bonuses and missing accounts"""
+        existing_usernames = {username.lower() for username in User.objects.by_usernames(emails_to_create).values_list("username", flat=True)}
+        # users created by a concurrent chunk are skipped and loaded below
+        User.objects.bulk_create([User(username=email, email=email) for email in emails_to_create - existing_usernames], ignore_conflicts=True)
+
+        users: dict[str, User] = {}
+        for user in User.objects.by_usernames(emails):
+            users.setdefault(user.username.lower(), user)
+        BonusAccount.objects.bulk_create([BonusAccount(user=user) for user in users.values()], ignore_conflicts=True)
+
+        emails_by_user_id = {user.id: email for email, user in users.items()}
+        accounts = {}
+        for account in BonusAccount.objects.filter(user_id__in=emails_by_user_id).select_for_update():
+            account.user = users[emails_by_user_id[account.user_id]]
+            accounts[emails_by_user_id[account.user_id]] = account
+
+        return accounts
+
+    @staticmethod
+    def get_daily_changes(transactions: list[BonusTransaction], balances: dict[BonusAccount, int]) -> list[BonusDailyChange]:
+        today = timezone.localdate()
+        changes = {account: BonusDailyChange(account_id=account.id, date=today, earned=0, spent=0, balance=balance) for account, balance in balances.items()}
+        for transaction in transactions:
+            change = changes[transaction.account]
+            changes[transaction.account] = change._replace(
+                earned=change.earned + max(transaction.amount, 0),
+                spent=change.spent + max(-transaction.amount, 0),
+            )
+
+        return [change for change in changes.values() if change.earned or change.spent]
+
+    @staticmethod
+    def update_balances(balances: dict[UUID, int]) -> None:
+        if not balances:
+            return
+
+        with connection.cursor() as cursor:
+            table = connection.ops.quote_name(BonusAccount._meta.db_table)  # noqa: SLF001
+            values = ", ".join(["(%s::uuid, %s::integer)"] * len(balances))
+            cursor.execute(
+                f"UPDATE {table} SET balance = new_balances.balance, modified = %s "  # noqa: S608
+                f"FROM (VALUES {values}) AS new_balances (id, balance) WHERE {table}.id = new_balances.id",
+                [timezone.now(), *(value for account_id_and_balance in balances.items() for value in account_id_and_balance)],
+            )
@@ -0,0 +1,106 @@
+from dataclasses import dataclass, field
+from datetime import date
+from operator import attrgetter
+from uuid import UUID, uuid4
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from app.services import BaseService
+from bonuses.models import BonusAccount, BonusDailyChange, BonusDailySummary, BonusTransaction
+
+
+@dataclass
+class BonusLedgerEntry:
+    account_id: UUID
+    amount: int  # signed: negative for spending
+    transaction_type: str
+    reason: str = ""
+    created_by_id: UUID | None = None
+    transaction_id: UUID = field(default_factory=uuid4)
+
+    @classmethod
+    def from_transaction(cls, bonus_transaction: BonusTransaction) -> "BonusLedgerEntry":
+        return cls(
+            account_id=bonus_transaction.account_id,
+            amount=bonus_transaction.amount,
+            transaction_type=bonus_transaction.transaction_type,
+            reason=bonus_transaction.reason,
+            created_by_id=bonus_transaction.created_by_id,
+            transaction_id=bonus_transaction.id,
+        )
+
+
+@dataclass
+class BonusLedger(BaseService):
+    """
+    Apply bonus transactions to account balances.
+
+    Every entry is one statement: the balance is changed by a conditional update that matches only an active account
+    with enough bonuses, and the transaction is inserted only if the update matched. So concurrent requests never
+    lose updates nor read-check-write the balance in python. Daily summaries of changed accounts are updated
+    within the same transaction while the accounts are still locked.
+
+    Returns new balances in the order of entries, None for entries that were not applied.
+    """
+
+    entries: list[BonusLedgerEntry]
+
+    APPLY_ENTRY_SQL = """
+        WITH account AS (
+            UPDATE {account_table}
+            SET balance = balance + %(amount)s, modified = %(now)s
+            WHERE id = %(account_id)s AND is_active AND balance + %(amount)s >= 0
+            RETURNING id, balance
+        ), bonus_transaction AS (
+            INSERT INTO {transaction_table} (id, created, modified, account_id, amount, transaction_type, reason, created_by_id)
+            SELECT %(transaction_id)s, %(now)s, NULL, id, %(amount)s, %(transaction_type)s, %(reason)s, %(created_by_id)s FROM account
+        )
+        SELECT balance FROM account
+    """
+
+    def act(self) -> list[int | None]:
+        balances: dict[UUID, int | None] = {}
+        sql = self.APPLY_ENTRY_SQL.format(
+            account_table=connection.ops.quote_name(BonusAccount._meta.db_table),  # noqa: SLF001
+            transaction_table=connection.ops.quote_name(BonusTransaction._meta.db_table),  # noqa: SLF001
+        )
+        now = timezone.now()
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            # the same lock order for every batch so that concurrent batches don't deadlock on each other's accounts
+            for entry in sorted(self.entries, key=attrgetter("account_id")):
+                cursor.execute(
+                    sql,
+                    {
+                        "account_id": entry.account_id,
+                        "amount": entry.amount,
+                        "transaction_id": entry.transaction_id,
+                        "transaction_type": entry.transaction_type,
+                        "reason": entry.reason,
+                        "created_by_id": entry.created_by_id,
+                        "now": now,
+                    },
+                )
+                row = cursor.fetchone()
+                balances[entry.transaction_id] = row[0] if row else None
+
+            BonusDailySummary.objects.record(self.get_daily_changes(balances, day=timezone.localdate(now)))
+
+        return [balances[entry.transaction_id] for entry in self.entries]
+
+    def get_daily_changes(self, balances: dict[UUID, int | None], day: date) -> list[BonusDailyChange]:
+        changes: dict[UUID, BonusDailyChange] = {}
+        for entry in sorted(self.entries, key=attrgetter("account_id")):
+            balance = balances[entry.transaction_id]
+            if balance is None:
+                continue
+
+            change = changes.get(entry.account_id, BonusDailyChange(account_id=entry.account_id, date=day, earned=0, spent=0, balance=0))
+            changes[entry.account_id] = change._replace(
+                earned=change.earned + max(entry.amount, 0),
+                spent=change.spent + max(-entry.amount, 0),
+                balance=balance,
+            )
+
+        return list(changes.values())
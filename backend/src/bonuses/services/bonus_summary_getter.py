@@ -0,0 +1,68 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from django.utils.functional import cached_property
+from django.utils.translation import gettext as _
+
+from app.exceptions import AppServiceException
+from app.services import BaseService
+from bonuses.models import BonusAccount, BonusDailySummary
+from users.models import User
+
+
+class BonusSummaryGetterException(AppServiceException):
+    """Exception for bonus summary getter errors."""
+
+
+@dataclass
+class BonusSummary:
+    balance_at_start: int
+    balance_at_end: int
+    earned: int
+    spent: int
+
+
+@dataclass
+class BonusSummaryGetter(BaseService):
+    """Return user's bonus balances and totals for the period, both bounds are inclusive"""
+
+    user: User
+    date_from: date
+    date_to: date
+
+    def act(self) -> BonusSummary:
+        if self.account is None:
+            return BonusSummary(balance_at_start=0, balance_at_end=0, earned=0, spent=0)
+
+        before = BonusDailySummary.objects.as_of(self.account.id, self.date_from - timedelta(days=1))
+        end = BonusDailySummary.objects.as_of(self.account.id, self.date_to)
+
+        return BonusSummary(
+            balance_at_start=self.get_balance(before),
+            balance_at_end=self.get_balance(end),
+            earned=(end.earned_total if end else 0) - (before.earned_total if before else 0),
+            spent=(end.spent_total if end else 0) - (before.spent_total if before else 0),
+        )
+
+    def validate_period(self) -> None:
+        if self.date_from > self.date_to:
+            raise BonusSummaryGetterException(_("Period start must not be later than its end."))
+
+    def get_validators(self) -> list[Callable]:
+        return [self.validate_period]
+
+    @cached_property
+    def account(self) -> BonusAccount | None:
+        return BonusAccount.objects.filter(user=self.user).first()
+
+    def get_balance(self, summary: BonusDailySummary | None) -> int:
+        """Balance at the end of the summary day, or before the first transaction if there is no summary"""
+        if summary is not None:
+            return summary.balance
+
+        first = BonusDailySummary.objects.filter(account=self.account).order_by("date").first()
+        if first is None:
+            return self.account.balance  # type: ignore[union-attr]
+
+        return first.balance - first.earned + first.spent
@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.utils.functional import cached_property
+from django.utils.translation import gettext as _
+
+from app.services import BaseService
+from bonuses.models import BonusAccount, BonusTransactionType
+from bonuses.services.bonus_ledger import BonusLedger, BonusLedgerEntry
+from users.models import User
+from users.services import UserCreator
+
+
+@dataclass
+class BonusTransactionBatchResult:
+    email: str
+    balance: int | None = None
+    error: str | None = None
+
+
+@dataclass
+class BonusTransactionBatchCreator(BaseService):
+    """
+    Batched BonusTransactionCreator for shop checkout bursts.
+
+    Users and accounts of all operations are resolved with one query each, all operations are applied
+    within one transaction. Operations that can't be applied are reported with an error instead of failing the batch.
+
+    Every operation is a dict with `email`, `amount`, `transaction_type` and optional `reason`.
+    """
+
+    operations: list[dict]
+    created_by: User
+
+    @transaction.atomic
+    def act(self) -> list[BonusTransactionBatchResult]:
+        results = [BonusTransactionBatchResult(email=operation["email"]) for operation in self.operations]
+        entries: list[tuple[BonusTransactionBatchResult, BonusLedgerEntry]] = []
+
+        for operation, result in zip(self.operations, results, strict=True):
+            account = self.accounts.get(User.objects.normalize_username(operation["email"]))
+            if account is None:
+                result.error = _("User matching query does not exist.")
+            elif not account.is_active:
+                result.error = _("Bonus account is not active.")
+            else:
+                entries.append((result, self.get_entry(operation, account)))
+
+        balances = BonusLedger(entries=[entry for _result, entry in entries])()
+        for (result, _entry), balance in zip(entries, balances, strict=True):
+            result.balance = balance
+            if balance is None:
+                result.error = _("Insufficient bonus balance.")
+
+        return results
+
+    @staticmethod
+    def is_spending(operation: dict) -> bool:
+        return operation["transaction_type"] in [BonusTransactionType.SPENT, BonusTransactionType.ADMIN_SPENT]
+
+    def get_entry(self, operation: dict, account: BonusAccount) -> BonusLedgerEntry:
+        return BonusLedgerEntry(
+            account_id=account.id,
+            amount=-operation["amount"] if self.is_spending(operation) else operation["amount"],
+            transaction_type=operation["transaction_type"],
+            reason=operation.get("reason", ""),
+            created_by_id=self.created_by.id,
+        )
+
+    @cached_property
+    def users(self) -> dict[str, User]:
+        """Return users by email, creating the ones that only earn bonuses"""
+        users: dict[str, User] = {}
+        for user in User.objects.by_usernames(operation["email"] for operation in self.operations):
+            users.setdefault(user.username.lower(), user)
+
+        for operation in self.operations:
+            email = User.objects.normalize_username(operation["email"])
+            if email not in users and not self.is_spending(operation):
+                users[email] = UserCreator(username=email)()
+
+        return users
+
+    @cached_property
+    def accounts(self) -> dict[str, BonusAccount]:
+        """Return bonus accounts by email, creating missing ones"""
+        user_ids = {user.id: email for email, user in self.users.items()}
+        accounts = {user_ids[account.user_id]: account for account in BonusAccount.objects.filter(user_id__in=user_ids)}
+
+        missing = [BonusAccount(user_id=user_id) for user_id, email in user_ids.items() if email not in accounts]
+        if missing:
+            BonusAccount.objects.bulk_create(missing, ignore_conflicts=True)
+            accounts.update(
+                {user_ids[account.user_id]: account for account in BonusAccount.objects.filter(user_id__in=[account.user_id for account in missing])},
+            )
+
+        return accounts
@@ -6,7 +6,8 @@ from django.utils.translation import gettext as _
 
 from app.exceptions import AppServiceException
 from app.services import BaseService
-from bonuses.models import BonusAccount, BonusTransaction, BonusTransactionType
+from bonuses.models import BonusAccount, BonusTransactionType
+from bonuses.services.bonus_ledger import BonusLedger, BonusLedgerEntry
 from users.models import User
 from users.services import UserCreator
 
@@ -24,9 +25,12 @@ class BonusTransactionCreator(BaseService):
     created_by: User | None = None
 
     def act(self) -> BonusAccount:
-        self.create_transaction(self.account)
+        balance = BonusLedger(entries=[self.entry])()[0]
+        if balance is None:
+            raise BonusTransactionCreatorException(_("Insufficient bonus balance."))
 
-        return self.update_balance(self.account)
+        self.account.balance = balance
+        return self.account
 
     def validate_user(self) -> None:
         if not self.user or not self.user.email:
@@ -40,16 +44,11 @@ class BonusTransactionCreator(BaseService):
         if not self.account.is_active:
             raise BonusTransactionCreatorException(_("Bonus account is not active."))
 
-    def validate_balance(self) -> None:
-        if self.is_spending and self.account.balance < self.amount:
-            raise BonusTransactionCreatorException(_("Insufficient bonus balance."))
-
     def get_validators(self) -> list[Callable]:
         return [
             self.validate_user,
             self.validate_amount,
             self.validate_account,
-            self.validate_balance,
         ]
 
     @cached_property
@@ -63,7 +62,7 @@ class BonusTransactionCreator(BaseService):
     @cached_property
     def user(self) -> User:
         try:
-            return User.objects.get(username=self.email)
+            return User.objects.get_by_username(self.email)
         except User.DoesNotExist:
             if self.is_earning:
                 return UserCreator(username=self.email)()
@@ -74,20 +73,12 @@ class BonusTransactionCreator(BaseService):
         account, _ = BonusAccount.objects.get_or_create(user=self.user)
         return account
 
-    def create_transaction(self, account: BonusAccount) -> BonusTransaction:
-        return BonusTransaction.objects.create(
-            account=account,
+    @cached_property
+    def entry(self) -> BonusLedgerEntry:
+        return BonusLedgerEntry(
+            account_id=self.account.id,
             amount=-self.amount if self.is_spending else self.amount,
             transaction_type=self.transaction_type,
             reason=self.reason,
-            created_by=self.created_by or self.user,
+            created_by_id=(self.created_by or self.user).id,
         )
-
-    def update_balance(self, account: BonusAccount) -> BonusAccount:
-        if self.is_spending:
-            account.balance -= self.amount
-        else:
-            account.balance += self.amount
-        account.save(update_fields=["balance"])
-
-        return account
@@ -0,0 +1,50 @@
+import pytest
+
+from bonuses.models import BonusTransaction, BonusTransactionType
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def account(factory):
+    return factory.bonus_account(balance=50)
+
+
+@pytest.fixture
+def add_transaction(admin_client, account):
+    return lambda transaction_type, amount: admin_client.post(
+        f"/admin/bonuses/bonustransaction/add/?account={account.id}",
+        {"transaction_type": transaction_type, "amount": amount, "reason": "Компенсация"},
+    )
+
+
+def test_transaction_is_applied(add_transaction, account):
+    response = add_transaction(BonusTransactionType.ADMIN_SPENT, 30)
+
+    account.refresh_from_db()
+    assert response.status_code == 302
+    assert account.balance == 20
+    assert BonusTransaction.objects.get(account=account).amount == -30
+
+
+def test_insufficient_balance_is_form_error(add_transaction, account):
+    response = add_transaction(BonusTransactionType.ADMIN_SPENT, 100)
+
+    account.refresh_from_db()
+    assert response.status_code == 200
+    assert response.context["adminform"].form.non_field_errors() == ["Insufficient bonus balance."]
+    assert account.balance == 50
+    assert not BonusTransaction.objects.exists()
+
+
+def test_inactive_account_is_form_error(add_transaction, account):
+    account.setattr_and_save("is_active", False)
+
+    response = add_transaction(BonusTransactionType.ADMIN_EARNED, 10)
+
+    assert response.status_code == 200
+    assert response.context["adminform"].form.non_field_errors() == ["Bonus account is not active."]
+    assert not BonusTransaction.objects.exists()
@@ -0,0 +1,85 @@
+import pytest
+from rest_framework import status
+
+from bonuses.models import BonusTransaction
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+base_url = "/api/demo/bonuses/batch/"
+
+
+def test_applies_operations_in_order(as_shop_user, bonus_account):
+    data = {
+        "operations": [
+            {"email": bonus_account.user.email, "amount": 150, "transactionType": "spent"},
+            {"email": bonus_account.user.email, "amount": 50, "transactionType": "earned", "reason": "checkout"},
+            {"email": bonus_account.user.email, "amount": 150, "transactionType": "spent"},
+        ],
+    }
+
+    response = as_shop_user.post(base_url, data=data, expected_status=status.HTTP_200_OK)
+
+    assert response == [
+        {"email": bonus_account.user.email, "balance": None, "error": "Insufficient bonus balance."},
+        {"email": bonus_account.user.email, "balance": 150, "error": None},
+        {"email": bonus_account.user.email, "balance": 0, "error": None},
+    ]
+    bonus_account.refresh_from_db()
+    assert bonus_account.balance == 0
+    assert BonusTransaction.objects.filter(account=bonus_account).count() == 2
+
+
+def test_earning_creates_missing_user(as_shop_user):
+    data = {"operations": [{"email": "new@example.com", "amount": 10, "transactionType": "earned"}]}
+
+    response = as_shop_user.post(base_url, data=data, expected_status=status.HTTP_200_OK)
+
+    assert response == [{"email": "new@example.com", "balance": 10, "error": None}]
+
+
+def test_reports_errors_per_operation(as_shop_user, bonus_account, factory):
+    inactive_account = factory.bonus_account(is_active=False)
+    data = {
+        "operations": [
+            {"email": "notfound@example.com", "amount": 10, "transactionType": "spent"},
+            {"email": inactive_account.user.email, "amount": 10, "transactionType": "earned"},
+            {"email": bonus_account.user.email, "amount": 10, "transactionType": "spent"},
+        ],
+    }
+
+    response = as_shop_user.post(base_url, data=data, expected_status=status.HTTP_200_OK)
+
+    assert [result["error"] for result in response] == [
+        "User matching query does not exist.",
+        "Bonus account is not active.",
+        None,
+    ]
+    assert response[2]["balance"] == 90
+
+
+def test_resolves_users_with_constant_number_of_queries(as_shop_user, factory, django_assert_max_num_queries):
+    accounts = [factory.bonus_account() for _ in range(10)]
+    data = {"operations": [{"email": account.user.email, "amount": 1, "transactionType": "earned"} for account in accounts]}
+
+    with django_assert_max_num_queries(len(accounts) + 10):
+        as_shop_user.post(base_url, data=data, expected_status=status.HTTP_200_OK)
+
+
+def test_400_for_admin_transaction_types(as_shop_user, bonus_account):
+    data = {"operations": [{"email": bonus_account.user.email, "amount": 10, "transactionType": "admin_earned"}]}
+
+    as_shop_user.post(base_url, data=data, expected_status=status.HTTP_400_BAD_REQUEST)
+
+
+def test_400_for_empty_batch(as_shop_user):
+    as_shop_user.post(base_url, data={"operations": []}, expected_status=status.HTTP_400_BAD_REQUEST)
+
+
+def test_forbid_for_anon(as_anon, bonus_account):
+    data = {"operations": [{"email": bonus_account.user.email, "amount": 10, "transactionType": "earned"}]}
+
+    as_anon.post(base_url, data=data, expected_status=status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,134 @@
+import csv
+
+import pytest
+
+from bonuses.models import BonusAccount, BonusTransaction, BonusTransactionType
+from bonuses.services import BonusBalanceBulkImporter
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def write_rows(tmp_path):
+    def write(*rows):
+        path = tmp_path / "balances.csv"
+        with path.open("w", encoding="utf-8") as output:
+            writer = csv.DictWriter(output, fieldnames=["email пользователя", "Приход", "Расход", "Сальдо"])
+            writer.writeheader()
+            writer.writerows({"email пользователя": email, "Приход": income, "Расход": spending, "Сальдо": balance} for email, income, spending, balance in rows)
+
+        return path
+
+    return write
+
+
+@pytest.fixture
+def admin(factory):
+    return factory.user(username="admin")
+
+
+@pytest.fixture
+def import_rows(write_rows, admin):
+    return lambda *rows: BonusBalanceBulkImporter(data=write_rows(*rows), created_by=admin, chunk_size=2)()
+
+
+@pytest.fixture
+def account(factory):
+    return factory.bonus_account(user=factory.user(username="vm@gmail.test"), balance=0)
+
+
+def get_amounts(account):
+    return list(BonusTransaction.objects.filter(account=account).order_by("created", "transaction_type").values_list("transaction_type", "amount"))
+
+
+def test_history_is_transferred(import_rows, account):
+    result = import_rows(("VM@gmail.test", 100, -30, 70))
+
+    account.refresh_from_db()
+    assert result.imported == 1
+    assert account.balance == 70
+    assert sorted(get_amounts(account)) == [(BonusTransactionType.ADMIN_EARNED, 100), (BonusTransactionType.ADMIN_SPENT, -30)]
+
+
+def test_balance_is_corrected_to_expected(import_rows, account):
+    account.setattr_and_save("balance", 20)
+
+    import_rows(("vm@gmail.test", 100, 30, 50))
+
+    account.refresh_from_db()
+    assert account.balance == 50
+    assert BonusTransaction.objects.filter(account=account, amount=-40, transaction_type=BonusTransactionType.ADMIN_SPENT).exists()
+
+
+def test_balance_is_zeroed_for_negative_expected_balance(import_rows, account):
+    account.setattr_and_save("balance", 20)
+
+    import_rows(("vm@gmail.test", 100, 300, -200))
+
+    account.refresh_from_db()
+    assert account.balance == 0
+
+
+def test_rows_of_the_same_account_are_applied_in_order(import_rows, account):
+    import_rows(("vm@gmail.test", 100, 0, 100), ("vm@gmail.test", 0, 40, 60), ("vm@gmail.test", 10, 0, 70))
+
+    account.refresh_from_db()
+    assert account.balance == 70
+
+
+def test_missing_earning_user_is_created(import_rows, admin):
+    import_rows(("new@gmail.test", 10, 0, 10))
+
+    assert BonusAccount.objects.get(user__username="new@gmail.test").balance == 10
+
+
+def test_missing_spending_user_fails(import_rows):
+    result = import_rows(("new@gmail.test", 0, 10, 0))
+
+    assert result.failures[0].reason == "User matching query does not exist."
+
+
+def test_invalid_email_fails_without_creating_user(import_rows):
+    result = import_rows(("not an email", 10, 0, 10), ("new@gmail.test", 10, 0, 10))
+
+    assert result.imported == 1
+    assert result.failures[0].reason == "Invalid email."
+    assert result.failures[0].row["email пользователя"] == "not an email"
+    assert not BonusAccount.objects.filter(user__username="not an email").exists()
+
+
+def test_row_fails_completely_if_balance_is_insufficient(import_rows, account):
+    result = import_rows(("vm@gmail.test", 10, 50, 0))
+
+    account.refresh_from_db()
+    assert result.failures[0].reason == "Insufficient bonus balance."
+    assert account.balance == 0
+    assert get_amounts(account) == []
+
+
+def test_inactive_account_fails(import_rows, account):
+    account.setattr_and_save("is_active", False)
+
+    result = import_rows(("vm@gmail.test", 10, 0, 10))
+
+    assert result.failures[0].reason == "Bonus account is not active."
+
+
+def test_empty_and_invalid_rows(import_rows, account):
+    result = import_rows(("vm@gmail.test", 0, 0, 0), ("vm@gmail.test", "many", 0, 0))
+
+    assert result.skipped == 1
+    assert len(result.failures) == 1
+
+
+def test_progress_is_reported_by_bytes(write_rows, admin, account, mocker):
+    progress = mocker.Mock()
+    data = write_rows(*[("vm@gmail.test", 1, 0, index + 1) for index in range(3)])
+
+    BonusBalanceBulkImporter(data=data, created_by=admin, chunk_size=2, progress=progress)()
+
+    assert progress.call_count == 2
+    assert progress.call_args.args == (data.stat().st_size, data.stat().st_size)
@@ -0,0 +1,57 @@
+import pytest
+
+from bonuses.models import BonusTransaction, BonusTransactionType
+from bonuses.services import BonusLedger, BonusLedgerEntry
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def entry(bonus_account):
+    return lambda amount: BonusLedgerEntry(account_id=bonus_account.id, amount=amount, transaction_type=BonusTransactionType.SPENT)
+
+
+def test_applies_balance_delta_with_transaction(bonus_account, entry):
+    spending = entry(-30)
+
+    balances = BonusLedger(entries=[spending])()
+
+    bonus_account.refresh_from_db()
+    assert balances == [70]
+    assert bonus_account.balance == 70
+    assert BonusTransaction.objects.get(pk=spending.transaction_id).amount == -30
+
+
+def test_balance_can_be_spent_to_zero(bonus_account, entry):
+    assert BonusLedger(entries=[entry(-100)])() == [0]
+
+
+def test_does_not_apply_entry_if_balance_is_insufficient(bonus_account, entry):
+    balances = BonusLedger(entries=[entry(-101)])()
+
+    bonus_account.refresh_from_db()
+    assert balances == [None]
+    assert bonus_account.balance == 100
+    assert not BonusTransaction.objects.filter(account=bonus_account).exists()
+
+
+def test_does_not_apply_entry_to_inactive_account(bonus_account, entry):
+    bonus_account.setattr_and_save("is_active", False)
+
+    assert BonusLedger(entries=[entry(10)])() == [None]
+
+
+def test_applies_entries_of_same_account_in_order(bonus_account, entry):
+    balances = BonusLedger(entries=[entry(-150), entry(100), entry(-150)])()
+
+    assert balances == [None, 200, 50]
+
+
+def test_returns_balances_in_order_of_entries(factory, bonus_account, entry):
+    another_account = factory.bonus_account(balance=5)
+    entries = [entry(-10), BonusLedgerEntry(account_id=another_account.id, amount=-10, transaction_type=BonusTransactionType.SPENT), entry(5)]
+
+    assert BonusLedger(entries=entries)() == [90, None, 95]
@@ -0,0 +1,74 @@
+from datetime import date
+
+import pytest
+from django.core.management import call_command
+
+from bonuses.models import BonusTransactionType
+from bonuses.services import BonusLedger, BonusLedgerEntry, BonusSummaryGetter, BonusSummaryGetterException
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def apply(bonus_account, freezer):
+    def apply(day, *amounts):
+        freezer.move_to(f"{day} 12:00")
+        BonusLedger(entries=[BonusLedgerEntry(account_id=bonus_account.id, amount=amount, transaction_type=BonusTransactionType.EARNED) for amount in amounts])()
+
+    return apply
+
+
+@pytest.fixture
+def get_summary(bonus_account):
+    return lambda date_from, date_to: BonusSummaryGetter(user=bonus_account.user, date_from=date_from, date_to=date_to)()
+
+
+@pytest.fixture(autouse=True)
+def _history(apply):
+    apply("2025-01-10", 50, -30)
+    apply("2025-01-20", -100)
+    apply("2025-02-05", 10)
+
+
+def test_daily_summary_is_maintained_by_ledger(bonus_account):
+    summary = bonus_account.daily_summaries.get(date=date(2025, 1, 10))
+
+    assert (summary.earned, summary.spent, summary.earned_total, summary.spent_total, summary.balance) == (50, 30, 50, 30, 120)
+
+
+@pytest.mark.parametrize(
+    ("date_from", "date_to", "expected"),
+    [
+        (date(2025, 1, 1), date(2025, 1, 31), (100, 20, 50, 130)),
+        (date(2025, 1, 11), date(2025, 2, 28), (120, 30, 10, 100)),
+        (date(2025, 1, 11), date(2025, 1, 19), (120, 120, 0, 0)),
+        (date(2024, 12, 1), date(2024, 12, 31), (100, 100, 0, 0)),
+        (date(2025, 3, 1), date(2025, 3, 31), (30, 30, 0, 0)),
+    ],
+)
+def test_period_summary(get_summary, date_from, date_to, expected):
+    summary = get_summary(date_from, date_to)
+
+    assert (summary.balance_at_start, summary.balance_at_end, summary.earned, summary.spent) == expected
+
+
+def test_zero_summary_without_account(factory):
+    summary = BonusSummaryGetter(user=factory.user(), date_from=date(2025, 1, 1), date_to=date(2025, 1, 31))()
+
+    assert (summary.balance_at_start, summary.balance_at_end, summary.earned, summary.spent) == (0, 0, 0, 0)
+
+
+def test_raises_for_reversed_period(get_summary):
+    with pytest.raises(BonusSummaryGetterException):
+        get_summary(date(2025, 2, 1), date(2025, 1, 1))
+
+
+def test_rebuilt_summaries_match_maintained_ones(bonus_account):
+    maintained = list(bonus_account.daily_summaries.order_by("date").values_list("date", "earned", "spent", "earned_total", "spent_total", "balance"))
+
+    call_command("rebuild_bonus_daily_summaries")
+
+    assert list(bonus_account.daily_summaries.order_by("date").values_list("date", "earned", "spent", "earned_total", "spent_total", "balance")) == maintained
@@ -1,3 +1,6 @@
+from collections.abc import Iterable
+from uuid import UUID
+
 from courses.api.demo.serializers import (
     CatalogCourseSerializer,
     CatalogCourseSeriesSerializer,
@@ -5,11 +8,11 @@ from courses.api.demo.serializers import (
     CourseSimpleSerializer,
 )
 from courses.api.demo.serializers.general import BlockFromPublishedLectureBlockField
+from django.apps import apps
 from drf_spectacular.utils import PolymorphicProxySerializer, extend_schema_field
 from lecturers.api.demo.serializers import LecturerSimpleSerializer
 from progress.api.demo.serializers import LectureProgressSimpleSerializer
 from rest_framework import serializers
-from rest_framework.utils.serializer_helpers import ReturnDict
 
 from main_page.models import (
     CourseBundleContent,
@@ -24,6 +27,9 @@ from main_page.models.main_page_content import (
     LECTURE_BUNDLE_CONTENT_REF,
     LECTURERS_CONTENT_REF,
 )
+from main_page.services import CourseBundleSkeletonGetter, LectureBundleSkeletonGetter
+from product_access.services import UserCourseSeriesGetter, UserLecturesGetter
+from users.models import User
 
 
 class LecturersContentSerializer(serializers.ModelSerializer):
@@ -163,13 +169,108 @@ class LectureForBundleSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+def get_lecture_bundle_items(bundles: Iterable[LectureBundleContent], user: User) -> dict[str, list[dict]]:
+    """Fill cached bundle lectures with availability and progress of the user"""
+    skeletons = LectureBundleSkeletonGetter(slugs=[bundle.slug for bundle in bundles], user=user)()
+    lecture_ids = {item["lecture_id"] for items in skeletons.values() for item in items}
+
+    available_lecture_ids = UserLecturesGetter(user=user)()
+    LectureProgress = apps.get_model("progress", "LectureProgress")
+    progress = {
+        lecture_progress.lecture_id: LectureProgressSimpleSerializer(lecture_progress).data
+        for lecture_progress in LectureProgress.objects.filter(user=user, lecture__in=lecture_ids)
+    }
+
+    return {
+        slug: [
+            {
+                **item["data"],
+                "is_available": item["lecture_id"] in available_lecture_ids,
+                "progress": progress.get(item["lecture_id"]),
+            }
+            for item in items
+        ]
+        for slug, items in skeletons.items()
+    }
+
+
+def get_course_bundle_items(bundles: Iterable[CourseBundleContent], user: User) -> dict[str, list[dict]]:
+    """Fill cached bundle courses and course series with availability, bookmarks and progress of the user"""
+    skeletons = CourseBundleSkeletonGetter(slugs=[bundle.slug for bundle in bundles], user=user)()
+    items = [item for items in skeletons.values() for item in items]
+    course_ids = {item["course_id"] for item in items if item["course_id"]}
+    course_series_ids = {item["course_series_id"] for item in items if item["course_series_id"]}
+    series_course_ids = {course_id for item in items for course_id in item["series_course_ids"]}
+
+    Course = apps.get_model("courses", "Course")
+    CourseSeries = apps.get_model("courses", "CourseSeries")
+    CourseProgress = apps.get_model("progress", "CourseProgress")
+    available_ids = {
+        *Course.objects.available_for_user(user).filter(pk__in=course_ids).values_list("id", flat=True),
+        *UserCourseSeriesGetter(user=user)(),
+    }
+    bookmarked_ids = {
+        *Course.objects.for_catalog_preview(user).filter(pk__in=course_ids, is_bookmarked=True).values_list("id", flat=True),
+        *CourseSeries.objects.for_catalog_preview(user).filter(pk__in=course_series_ids, is_bookmarked=True).values_list("id", flat=True),
+    }
+    completion_percents = dict(
+        CourseProgress.objects.filter(user=user, course__in=course_ids | series_course_ids).values_list("course_id", "completion_percent"),
+    )
+
+    def get_user_fields(item: dict) -> dict:
+        if item["course_id"]:
+            return {
+                "is_available": item["course_id"] in available_ids,
+                "is_bookmarked": item["course_id"] in bookmarked_ids,
+                "completion_percent": completion_percents.get(item["course_id"], 0),
+            }
+
+        return {
+            "is_available": item["course_series_id"] in available_ids,
+            "is_bookmarked": item["course_series_id"] in bookmarked_ids,
+            "completion_percent": get_series_completion_percent(item["series_course_ids"], completion_percents),
+        }
+
+    return {slug: [{**item["data"], **get_user_fields(item)} for item in items] for slug, items in skeletons.items()}
+
+
+def get_series_completion_percent(course_ids: list[UUID], completion_percents: dict[UUID, int]) -> int:
+    """Average progress of the series courses, not started ones count as zero"""
+    if not course_ids:
+        return 0
+
+    return round(sum(completion_percents.get(course_id, 0) for course_id in course_ids) / len(course_ids))
+
+
+class LectureBundleContentListSerializer(serializers.ListSerializer):
+    def to_representation(self, data: Iterable[LectureBundleContent]) -> list:  # type: ignore[override]
+        bundles = list(data)
+        self.context["bundle_items"] = get_lecture_bundle_items(bundles, self.context["request"].user)
+        return super().to_representation(bundles)
+
+
 class LectureBundleContentSerializer(serializers.ModelSerializer):
-    lectures = LectureForBundleSerializer(many=True, source="items")
+    lectures = serializers.SerializerMethodField()
 
     class Meta:
         model = LectureBundleContent
         fields = ["name", "slug", "badge_text", "badge_icon", "badge_color", "lectures"]
         read_only_fields = fields
+        list_serializer_class = LectureBundleContentListSerializer
+
+    @extend_schema_field(LectureForBundleSerializer(many=True))
+    def get_lectures(self, instance: LectureBundleContent) -> list[dict]:
+        if "bundle_items" not in self.context:
+            return get_lecture_bundle_items([instance], self.context["request"].user)[instance.slug]
+
+        return self.context["bundle_items"][instance.slug]
+
+
+class CourseBundleContentListSerializer(serializers.ListSerializer):
+    def to_representation(self, data: Iterable[CourseBundleContent]) -> list:  # type: ignore[override]
+        bundles = list(data)
+        self.context["bundle_items"] = get_course_bundle_items(bundles, self.context["request"].user)
+        return super().to_representation(bundles)
 
 
 class CourseBundleContentSerializer(serializers.ModelSerializer):
@@ -187,6 +288,7 @@ class CourseBundleContentSerializer(serializers.ModelSerializer):
             "items",
         ]
         read_only_fields = fields
+        list_serializer_class = CourseBundleContentListSerializer
 
     @extend_schema_field(
         field=PolymorphicProxySerializer(
@@ -196,19 +298,8 @@ class CourseBundleContentSerializer(serializers.ModelSerializer):
             many=True,
         ),
     )
-    def get_items(self, instance: CourseBundleContent) -> list[ReturnDict]:
-        courses = []
-        course_series = []
-        sort_weights = {}
-        for index, item in enumerate(instance.items.all()):
-            if item.course:
-                sort_weights[item.course.slug] = index
-                courses.append(item.course)
-            else:
-                sort_weights[item.course_series.slug] = index
-                course_series.append(item.course_series)
-        serialized_items = [
-            *CatalogCourseSerializer(instance=courses, many=True).data,
-            *CatalogCourseSeriesSerializer(instance=course_series, many=True).data,
-        ]
-        return sorted(serialized_items, key=lambda item: sort_weights[item["slug"]])
+    def get_items(self, instance: CourseBundleContent) -> list[dict]:
+        if "bundle_items" not in self.context:
+            return get_course_bundle_items([instance], self.context["request"].user)[instance.slug]
+
+        return self.context["bundle_items"][instance.slug]
@@ -1,22 +1,21 @@
 from typing import Any
 
 from courses.api.demo.serializers import MainPageRecommendationCourseSerializer
-from courses.models import Category, Course
-from django.conf import settings
-from django.db.models import Prefetch, QuerySet
-from lecturers.models import Lecturer
+from courses.models import Course
+from django.db.models import QuerySet
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
 from app.api.request import AuthenticatedRequest
 from app.api.viewsets import ListOnlyModelViewSet, ReadonlyModelViewSet
-from app.models import models
 from main_page.api.demo.filters import CourseBundleContentFilterSet, LectureBundleContentFilterSet
 from main_page.api.demo.serializers import (
     CourseBundleContentSerializer,
     LectureBundleContentSerializer,
     MainPageContentSerializer,
 )
-from main_page.models import CourseBundleContent, CourseBundleItem, LectureBundleContent, LectureBundleItem, MainPageContent, MainPageRecommendation
+from main_page.models import CourseBundleContent, LectureBundleContent, MainPageContent, MainPageRecommendation
+from main_page.services import MainPageContentGetter
 
 
 class MainPageRecommendationsViewSet(ListOnlyModelViewSet):
@@ -37,25 +36,14 @@ class MainPageContentViewSet(ListOnlyModelViewSet):
 
     request: AuthenticatedRequest
 
-    def get_queryset(self) -> QuerySet[MainPageContent]:
-        qs = super().get_queryset()
+    def list(self, request: AuthenticatedRequest, *args: Any, **kwargs: Any) -> Response:  # type: ignore[override]
+        content = MainPageContentGetter(user=request.user)()
 
-        if self.request.user.interests.exists() and not self.request.user.all_interests:
-            qs = qs.with_personalization(self.request.user).order_by(  # type: ignore[attr-defined]
-                models.F("is_personalized").desc(nulls_last=True),
-                "position_on_page",
-                "created",
-            )
-        return qs
+        page = self.paginate_queryset(content)  # type: ignore[arg-type]
+        if page is not None:
+            return self.get_paginated_response(page)
 
-    def get_serializer_context(self) -> dict[str, Any]:
-        context = super().get_serializer_context()
-
-        # May be it would be better to move this shit to model properties with serializer refactoring
-        context["lecturers_qs"] = Lecturer.objects.for_viewset().visible_on_main_page()[: settings.MAX_LECTURERS_ON_MAIN_PAGE]
-        context["categories_qs"] = Category.objects.for_viewset().all()
-
-        return context
+        return Response(content)
 
 
 class LectureBundleContentViewSet(ReadonlyModelViewSet):
@@ -65,11 +53,6 @@ class LectureBundleContentViewSet(ReadonlyModelViewSet):
     filterset_class = LectureBundleContentFilterSet
     lookup_field = "slug"
 
-    request: AuthenticatedRequest
-
-    def get_queryset(self) -> QuerySet[LectureBundleContent]:
-        return super().get_queryset().prefetch_related(Prefetch("items", queryset=LectureBundleItem.objects.for_viewset(self.request.user)))
-
 
 class CourseBundleContentViewSet(ReadonlyModelViewSet):
     serializer_class = CourseBundleContentSerializer
@@ -77,8 +60,3 @@ class CourseBundleContentViewSet(ReadonlyModelViewSet):
     queryset = CourseBundleContent.objects.active()
     filterset_class = CourseBundleContentFilterSet
     lookup_field = "slug"
-
-    request: AuthenticatedRequest
-
-    def get_queryset(self) -> QuerySet[CourseBundleContent]:
-        return super().get_queryset().prefetch_related(Prefetch("items", queryset=CourseBundleItem.objects.for_viewset(self.request.user)))
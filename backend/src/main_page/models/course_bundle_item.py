@@ -1,26 +1,11 @@
 from typing import Self
 
-from django.apps import apps
 from django.utils.translation import gettext_lazy as _
 
 from app.models import TimestampedModel, models
-from users.models import User
 
 
 class CourseBundleItemQuerySet(models.QuerySet):
-    def for_viewset(self, user: User) -> Self:
-        Course = apps.get_model("courses", "Course")
-        CourseSeries = apps.get_model("courses", "CourseSeries")
-        courses_with_aggregations = models.Prefetch(
-            "course",
-            queryset=Course.objects.for_catalog_preview(user).select_related("category"),
-        )
-        series_prefetch = models.Prefetch(
-            "course_series",
-            queryset=CourseSeries.objects.for_catalog_preview(user).with_published_course_versions(),
-        )
-        return self.published().prefetch_related(series_prefetch).prefetch_related(courses_with_aggregations).order_by("position_in_course_bundle")
-
     def published(self) -> Self:
         return self.filter(models.Q(course__course_versions__state="published") | models.Q(course_series__state="published")).distinct()
 
@@ -1,19 +1,11 @@
 from typing import Self
 
-from django.apps import apps
-from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _
 
 from app.models import TimestampedModel, models
-from users.models import User
 
 
 class LectureBundleItemQuerySet(models.QuerySet):
-    def for_viewset(self, user: User) -> Self:
-        Lecture = apps.get_model("courses", "Lecture")
-        lectures_prefetch = Prefetch("lecture", queryset=Lecture.objects.personalized(user).with_courses(user).prefetch_published_lecture_blocks())
-        return self.prefetch_related(lectures_prefetch).filter_with_published_courses().order_by("position_in_lecture_bundle")
-
     def filter_with_published_courses(self) -> Self:
         return self.filter(lecture__courses__course_versions__state="published").distinct()
 
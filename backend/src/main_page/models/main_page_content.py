@@ -5,7 +5,6 @@ from django.utils.translation import gettext_lazy as _
 
 from app.models import TimestampedModel, models
 from main_page.types import MainPageContentType
-from users.models import User
 
 
 LECTURERS_CONTENT_REF = "lecturerscontent"
@@ -26,28 +25,6 @@ class MainPageContentQuerySet(models.QuerySet):
     def active(self) -> Self:
         return self.filter(is_hidden=False)
 
-    def with_personalization(self, user: User) -> Self:
-        from main_page.models import CourseBundleContent, LectureBundleContent
-
-        user_interest_ids = user.interests.values_list("id", flat=True)
-
-        return self.annotate(
-            is_personalized=(
-                models.Exists(
-                    CourseBundleContent.objects.filter(
-                        personalization_categories__in=user_interest_ids,
-                        pk=models.OuterRef("pk"),
-                    ),
-                )
-                | models.Exists(
-                    LectureBundleContent.objects.filter(
-                        personalization_categories__in=user_interest_ids,
-                        pk=models.OuterRef("pk"),
-                    ),
-                )
-            ),
-        )
-
 
 MainPageContentManager = models.Manager.from_queryset(MainPageContentQuerySet)
 
@@ -0,0 +1,12 @@
+from main_page.services.bundle_skeleton_getter import BundleSkeletonGetter, CourseBundleSkeletonGetter, LectureBundleSkeletonGetter
+from main_page.services.main_page_content_cache_invalidator import MainPageContentCacheInvalidator
+from main_page.services.main_page_content_getter import MainPageContentGetter
+
+
+__all__ = [
+    "BundleSkeletonGetter",
+    "CourseBundleSkeletonGetter",
+    "LectureBundleSkeletonGetter",
+    "MainPageContentCacheInvalidator",
+    "MainPageContentGetter",
+]
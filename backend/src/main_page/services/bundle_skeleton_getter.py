@@ -0,0 +1,162 @@
+from abc import abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import ClassVar
+from uuid import UUID, uuid4
+
+from courses.api.demo.serializers import CatalogCourseSerializer, CatalogCourseSeriesSerializer
+from courses.models import Course, CourseSeries, CourseVersion, Lecture
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import cached_property
+
+from app.services import BaseService
+from main_page.models import CourseBundleItem, LectureBundleItem
+from users.models import User
+
+
+BUNDLE_SKELETON_VERSION_CACHE_KEY = "bundle_skeleton_version"
+
+
+@dataclass
+class BundleSkeletonGetter(BaseService):
+    """
+    Return serialized published bundle items ordered by their position, by bundle slug.
+
+    Bundle contents are the same for every user, so they are serialized once and cached per bundle slug under a common version.
+    Fields listed in user_fields are blanked before caching, bundle serializers fill them for the requesting user.
+    The user is needed only to build missing skeletons with the existing personalized querysets.
+    """
+
+    cache_prefix: ClassVar[str]
+    user_fields: ClassVar[list[str]]
+
+    slugs: list[str]
+    user: User
+
+    def act(self) -> dict[str, list[dict]]:
+        if not settings.CACHE_ENABLED:
+            return self.build_skeletons(self.slugs)
+
+        cache_keys = {self.get_cache_key(slug): slug for slug in self.slugs}
+        skeletons = {cache_keys[key]: skeleton for key, skeleton in cache.get_many(cache_keys).items()}
+
+        missing_slugs = [slug for slug in self.slugs if slug not in skeletons]
+        if missing_slugs:
+            built_skeletons = self.build_skeletons(missing_slugs)
+            cache.set_many({self.get_cache_key(slug): skeleton for slug, skeleton in built_skeletons.items()}, timeout=settings.CACHE_DURATION_SECONDS)
+            skeletons.update(built_skeletons)
+
+        return skeletons
+
+    def build_skeletons(self, slugs: list[str]) -> dict[str, list[dict]]:
+        rows = self.get_items(slugs)
+        serialized_items = self.serialize_items({tuple(item) for _, *item in rows})
+
+        skeletons: dict[str, list[dict]] = {slug: [] for slug in slugs}
+        for slug, *item in rows:
+            if tuple(item) in serialized_items:
+                skeletons[slug].append(serialized_items[tuple(item)])
+
+        return skeletons
+
+    @abstractmethod
+    def get_items(self, slugs: list[str]) -> list[tuple]:
+        raise NotImplementedError("Please implement in the getter class")
+
+    @abstractmethod
+    def serialize_items(self, items: set[tuple]) -> dict[tuple, dict]:
+        raise NotImplementedError("Please implement in the getter class")
+
+    def without_user_fields(self, data: dict) -> dict:
+        return {**data, **dict.fromkeys(self.user_fields)}
+
+    def get_cache_key(self, slug: str) -> str:
+        return f"{self.cache_prefix}_{self.cache_version}_{slug}"
+
+    @cached_property
+    def cache_version(self) -> str:
+        return cache.get_or_set(BUNDLE_SKELETON_VERSION_CACHE_KEY, lambda: uuid4().hex, timeout=None)  # type: ignore[return-value]
+
+    @staticmethod
+    def invalidate() -> None:
+        cache.set(BUNDLE_SKELETON_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+
+
+@dataclass
+class CourseBundleSkeletonGetter(BundleSkeletonGetter):
+    """Items are `{"course_id", "course_series_id", "series_course_ids", "data"}`, one of the ids is None"""
+
+    cache_prefix = "course_bundle_skeleton"
+    user_fields = ["is_available", "is_bookmarked", "completion_percent"]
+
+    def get_items(self, slugs: list[str]) -> list[tuple]:
+        return list(
+            CourseBundleItem.objects.filter(bundle__slug__in=slugs)
+            .published()
+            .order_by("position_in_course_bundle")
+            .values_list("bundle__slug", "course_id", "course_series_id"),
+        )
+
+    def serialize_items(self, items: set[tuple]) -> dict[tuple, dict]:
+        course_ids = [course_id for course_id, _ in items if course_id]
+        course_series_ids = [course_series_id for _, course_series_id in items if course_series_id]
+
+        courses = list(Course.objects.for_catalog_preview(self.user).select_related("category").filter(pk__in=course_ids))
+        course_series = list(CourseSeries.objects.for_catalog_preview(self.user).with_published_course_versions().filter(pk__in=course_series_ids))
+        series_course_ids = self.get_series_course_ids(course_series_ids)
+
+        serialized_items = {}
+        for course, data in zip(courses, CatalogCourseSerializer(instance=courses, many=True).data, strict=True):
+            serialized_items[(course.id, None)] = {
+                "course_id": course.id,
+                "course_series_id": None,
+                "series_course_ids": [],
+                "data": self.without_user_fields(data),
+            }
+        for series, data in zip(course_series, CatalogCourseSeriesSerializer(instance=course_series, many=True).data, strict=True):
+            serialized_items[(None, series.id)] = {
+                "course_id": None,
+                "course_series_id": series.id,
+                "series_course_ids": series_course_ids[series.id],
+                "data": self.without_user_fields(data),
+            }
+
+        return serialized_items
+
+    @staticmethod
+    def get_series_course_ids(course_series_ids: list[UUID]) -> dict[UUID, list[UUID]]:
+        series_course_ids = defaultdict(list)
+        for course_series_id, course_id in CourseVersion.objects.filter(course_series__in=course_series_ids, state="published").values_list("course_series_id", "course_id"):
+            series_course_ids[course_series_id].append(course_id)
+
+        return series_course_ids
+
+
+@dataclass
+class LectureBundleSkeletonGetter(BundleSkeletonGetter):
+    """Items are `{"lecture_id", "data"}`"""
+
+    cache_prefix = "lecture_bundle_skeleton"
+    user_fields = ["is_available", "progress"]
+
+    def get_items(self, slugs: list[str]) -> list[tuple]:
+        return list(
+            LectureBundleItem.objects.filter(bundle__slug__in=slugs)
+            .filter_with_published_courses()
+            .order_by("position_in_lecture_bundle")
+            .values_list("bundle__slug", "lecture_id"),
+        )
+
+    def serialize_items(self, items: set[tuple]) -> dict[tuple, dict]:
+        from main_page.api.demo.serializers import LectureForBundleSerializer
+
+        lectures = Lecture.objects.personalized(self.user).with_courses(self.user).prefetch_published_lecture_blocks().filter(pk__in=[lecture_id for (lecture_id,) in items])
+
+        return {
+            (lecture.id,): {
+                "lecture_id": lecture.id,
+                "data": self.without_user_fields(LectureForBundleSerializer(LectureBundleItem(lecture=lecture)).data),
+            }
+            for lecture in lectures
+        }
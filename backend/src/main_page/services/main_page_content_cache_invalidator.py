@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from django.core.cache import cache
+
+from app.services import BaseService
+from main_page.services.main_page_content_getter import MAIN_PAGE_CONTENT_CACHE_KEY
+
+
+@dataclass
+class MainPageContentCacheInvalidator(BaseService):
+    """Drop serialized main page content, it is rebuilt by the next request"""
+
+    def act(self) -> None:
+        cache.delete(MAIN_PAGE_CONTENT_CACHE_KEY)
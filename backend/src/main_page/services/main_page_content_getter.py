@@ -0,0 +1,74 @@
+import json
+from collections import defaultdict
+from dataclasses import dataclass
+
+from courses.models import Category
+from django.conf import settings
+from django.core.cache import cache
+from lecturers.models import Lecturer
+from rest_framework.renderers import JSONRenderer
+
+from app.services import BaseService
+from main_page.models import CourseBundleContent, LectureBundleContent, MainPageContent
+from users.models import User
+
+
+MAIN_PAGE_CONTENT_CACHE_KEY = "main_page_content"
+
+
+@dataclass
+class MainPageContentGetter(BaseService):
+    """
+    Return serialized main page content ordered for the user.
+
+    Content is the same for every user, so it is serialized once and cached as plain JSON
+    along with categories each bundle is personalized for. Bundles matching user's interests
+    are moved up at request time without touching the database.
+    """
+
+    user: User
+
+    def act(self) -> list[dict]:
+        payload = self.get_payload()
+        if self.user.all_interests:
+            return payload["items"]
+
+        interest_ids = {str(interest_id) for interest_id in self.user.interests.values_list("id", flat=True)}
+        if not interest_ids:
+            return payload["items"]
+
+        personalization_categories = payload["personalization_categories"]
+        return sorted(
+            payload["items"],
+            key=lambda item: interest_ids.isdisjoint(personalization_categories.get(item["id"], [])),
+        )
+
+    @classmethod
+    def get_payload(cls) -> dict:
+        if settings.CACHE_ENABLED:
+            return cache.get_or_set(MAIN_PAGE_CONTENT_CACHE_KEY, cls.build_payload, timeout=settings.CACHE_DURATION_SECONDS)  # type: ignore[return-value]
+
+        return cls.build_payload()
+
+    @staticmethod
+    def build_payload() -> dict:
+        from main_page.api.demo.serializers import MainPageContentSerializer
+
+        serializer = MainPageContentSerializer(
+            MainPageContent.objects.for_viewset(),
+            many=True,
+            context={
+                "lecturers_qs": Lecturer.objects.for_viewset().visible_on_main_page()[: settings.MAX_LECTURERS_ON_MAIN_PAGE],
+                "categories_qs": Category.objects.for_viewset().all(),
+            },
+        )
+
+        personalization_categories = defaultdict(list)
+        for model in (CourseBundleContent, LectureBundleContent):
+            for content_id, category_id in model.objects.active().filter(personalization_categories__isnull=False).values_list("pk", "personalization_categories"):
+                personalization_categories[str(content_id)].append(str(category_id))
+
+        return {
+            "items": json.loads(JSONRenderer().render(serializer.data)),
+            "personalization_categories": dict(personalization_categories),
+        }
@@ -0,0 +1,43 @@
+from typing import Any
+
+from courses.models import Category, Course, CourseSeries, CourseVersion, Lecture
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from lecturers.models import Lecturer
+
+from main_page.models import (
+    CategoriesContent,
+    CourseBundleContent,
+    CourseBundleItem,
+    LectureBundleContent,
+    LectureBundleItem,
+    LecturersContent,
+    MainPageContent,
+)
+from main_page.services import BundleSkeletonGetter, MainPageContentCacheInvalidator
+
+
+def invalidate_main_page_content_cache(**kwargs: Any) -> None:
+    MainPageContentCacheInvalidator()()
+
+
+def invalidate_bundle_skeletons(**kwargs: Any) -> None:
+    BundleSkeletonGetter.invalidate()
+
+
+for model in (MainPageContent, LecturersContent, CategoriesContent, LectureBundleContent, CourseBundleContent, Lecturer, Category):
+    post_save.connect(invalidate_main_page_content_cache, sender=model, dispatch_uid=f"invalidate_main_page_content_cache_on_{model.__name__}_save")
+    post_delete.connect(invalidate_main_page_content_cache, sender=model, dispatch_uid=f"invalidate_main_page_content_cache_on_{model.__name__}_delete")
+
+for model in (LectureBundleContent, CourseBundleContent):
+    m2m_changed.connect(
+        invalidate_main_page_content_cache,
+        sender=model.personalization_categories.through,
+        dispatch_uid=f"invalidate_main_page_content_cache_on_{model.__name__}_personalization_change",
+    )
+
+# bundle items are shown only while their courses are published, and are cached serialized with their courses and lectures
+for model in (LectureBundleContent, CourseBundleContent, LectureBundleItem, CourseBundleItem, CourseVersion, CourseSeries, Course, Lecture, Category):
+    post_save.connect(invalidate_bundle_skeletons, sender=model, dispatch_uid=f"invalidate_bundle_skeletons_on_{model.__name__}_save")
+    post_delete.connect(invalidate_bundle_skeletons, sender=model, dispatch_uid=f"invalidate_bundle_skeletons_on_{model.__name__}_delete")
+
+m2m_changed.connect(invalidate_bundle_skeletons, sender=Lecture.courses.through, dispatch_uid="invalidate_bundle_skeletons_on_lecture_courses_change")
@@ -1,9 +1,18 @@
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 
 pytestmark = [pytest.mark.django_db]
 
 
+@pytest.fixture
+def _enable_cache(settings):
+    settings.CACHE_ENABLED = True
+    cache.clear()
+
+
 @pytest.fixture
 def create_course_bundles(factory, user):
     def _create_course_bundles(count):
@@ -34,3 +43,22 @@ def test_course_bundles_list_no_nplus_one_queries(as_user, django_assert_max_num
 
     with django_assert_max_num_queries(22):
         as_user.get("/api/demo/main-page/course-bundles/")
+
+
+def count_warm_queries(as_user) -> int:
+    as_user.get("/api/demo/main-page/course-bundles/")
+
+    with CaptureQueriesContext(connection) as queries:
+        as_user.get("/api/demo/main-page/course-bundles/")
+
+    return len(queries)
+
+
+@pytest.mark.usefixtures("_enable_cache")
+def test_course_bundles_list_on_warm_cache_does_not_query_per_item(as_user, create_course_bundles):
+    create_course_bundles(2)
+    queries_for_small_bundles = count_warm_queries(as_user)
+
+    create_course_bundles(4)
+
+    assert count_warm_queries(as_user) == queries_for_small_bundles
@@ -1,4 +1,7 @@
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 
 pytestmark = [
@@ -6,6 +9,12 @@ pytestmark = [
 ]
 
 
+@pytest.fixture
+def _enable_cache(settings):
+    settings.CACHE_ENABLED = True
+    cache.clear()
+
+
 @pytest.fixture
 def create_lecture_bundles(factory, user, block):
     def _create_lecture_bundles(count):
@@ -24,3 +33,22 @@ def test_lecture_bundles_list_no_nplus_one_queries(as_user, django_assert_max_nu
 
     with django_assert_max_num_queries(10):
         as_user.get("/api/demo/main-page/lecture-bundles/")
+
+
+def count_warm_queries(as_user) -> int:
+    as_user.get("/api/demo/main-page/lecture-bundles/")
+
+    with CaptureQueriesContext(connection) as queries:
+        as_user.get("/api/demo/main-page/lecture-bundles/")
+
+    return len(queries)
+
+
+@pytest.mark.usefixtures("_enable_cache")
+def test_lecture_bundles_list_on_warm_cache_does_not_query_per_item(as_user, create_lecture_bundles):
+    create_lecture_bundles(2)
+    queries_for_small_bundles = count_warm_queries(as_user)
+
+    create_lecture_bundles(4)
+
+    assert count_warm_queries(as_user) == queries_for_small_bundles
@@ -0,0 +1,106 @@
+import pytest
+from django.core.cache import cache
+
+from main_page.services import CourseBundleSkeletonGetter, LectureBundleSkeletonGetter
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture(autouse=True)
+def _enable_cache(settings):
+    settings.CACHE_ENABLED = True
+    cache.clear()
+
+
+@pytest.fixture
+def course_bundle(factory):
+    return factory.course_bundle_content(is_hidden=False)
+
+
+@pytest.fixture
+def course_version(factory, course):
+    return factory.course_version(course=course, state="published")
+
+
+@pytest.fixture
+def course_bundle_items(factory, course_bundle, course, course_version, course_series):
+    return [
+        factory.course_bundle_item(bundle=course_bundle, course_series=course_series, course=None, position_in_course_bundle=1),
+        factory.course_bundle_item(bundle=course_bundle, course=course, course_series=None, position_in_course_bundle=2),
+    ]
+
+
+@pytest.fixture
+def lecture_bundle(factory):
+    return factory.lecture_bundle_content(is_hidden=False)
+
+
+@pytest.fixture
+def lecture_bundle_item(factory, lecture_bundle, lecture, course_version):
+    lecture.courses.set([course_version.course])
+    return factory.lecture_bundle_item(bundle=lecture_bundle, lecture=lecture)
+
+
+@pytest.mark.usefixtures("course_bundle_items")
+def test_course_bundle_skeleton(course_bundle, course, course_series, user):
+    got = CourseBundleSkeletonGetter(slugs=[course_bundle.slug], user=user)()[course_bundle.slug]
+
+    assert [(item["course_id"], item["course_series_id"]) for item in got] == [(None, course_series.id), (course.id, None)]
+    assert [item["data"]["slug"] for item in got] == [course_series.slug, course.slug]
+
+
+@pytest.mark.usefixtures("course_bundle_items")
+def test_course_bundle_skeleton_has_no_user_fields(course_bundle, user):
+    got = CourseBundleSkeletonGetter(slugs=[course_bundle.slug], user=user)()[course_bundle.slug]
+
+    for item in got:
+        assert item["data"]["is_available"] is None
+        assert item["data"]["is_bookmarked"] is None
+        assert item["data"]["completion_percent"] is None
+
+
+@pytest.mark.usefixtures("lecture_bundle_item")
+def test_lecture_bundle_skeleton(lecture_bundle, lecture, user):
+    got = LectureBundleSkeletonGetter(slugs=[lecture_bundle.slug], user=user)()[lecture_bundle.slug]
+
+    assert [item["lecture_id"] for item in got] == [lecture.id]
+    assert got[0]["data"]["slug"] == lecture.slug
+    assert got[0]["data"]["is_available"] is None
+    assert got[0]["data"]["progress"] is None
+
+
+def test_empty_bundle(course_bundle, user):
+    assert CourseBundleSkeletonGetter(slugs=[course_bundle.slug], user=user)() == {course_bundle.slug: []}
+
+
+@pytest.mark.usefixtures("course_bundle_items")
+def test_skeleton_is_cached(course_bundle, user, django_assert_num_queries):
+    CourseBundleSkeletonGetter(slugs=[course_bundle.slug], user=user)()
+
+    with django_assert_num_queries(0):
+        CourseBundleSkeletonGetter(slugs=[course_bundle.slug], user=user)()
+
+
+@pytest.mark.usefixtures("course_bundle_items")
+def test_skeleton_is_invalidated_when_course_is_unpublished(course_bundle, course_series, course_version, user):
+    CourseBundleSkeletonGetter(slugs=[course_bundle.slug], user=user)()
+
+    course_version.setattr_and_save("state", "archived")
+
+    got = CourseBundleSkeletonGetter(slugs=[course_bundle.slug], user=user)()[course_bundle.slug]
+
+    assert [(item["course_id"], item["course_series_id"]) for item in got] == [(None, course_series.id)]
+
+
+@pytest.mark.usefixtures("course_bundle_items")
+def test_skeleton_is_invalidated_when_course_is_renamed(course_bundle, course, user):
+    CourseBundleSkeletonGetter(slugs=[course_bundle.slug], user=user)()
+
+    course.setattr_and_save("name", "Renamed")
+
+    got = CourseBundleSkeletonGetter(slugs=[course_bundle.slug], user=user)()[course_bundle.slug]
+
+    assert got[1]["data"]["name"] == "Renamed"
@@ -0,0 +1,70 @@
+import pytest
+from django.core.cache import cache
+
+from main_page.services import MainPageContentGetter
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture(autouse=True)
+def _enable_cache(settings):
+    settings.CACHE_ENABLED = True
+    cache.clear()
+
+
+@pytest.fixture
+def category(factory):
+    return factory.category(slug="art")
+
+
+@pytest.fixture
+def course_bundle(factory, category):
+    return factory.course_bundle_content(is_hidden=False, position_on_page=2, personalization_categories=[category])
+
+
+@pytest.fixture
+def lecture_bundle(factory):
+    return factory.lecture_bundle_content(is_hidden=False, position_on_page=1)
+
+
+@pytest.fixture
+def get_content(user):
+    return lambda: MainPageContentGetter(user=user)()
+
+
+def test_content_is_ordered_by_position(get_content, course_bundle, lecture_bundle):
+    assert [item["id"] for item in get_content()] == [str(lecture_bundle.id), str(course_bundle.id)]
+
+
+def test_personalized_content_moves_up(get_content, user, course_bundle, lecture_bundle, category):
+    user.interests.add(category)
+
+    assert [item["id"] for item in get_content()] == [str(course_bundle.id), str(lecture_bundle.id)]
+
+
+def test_content_is_cached(get_content, course_bundle, lecture_bundle, django_assert_num_queries):
+    get_content()
+
+    with django_assert_num_queries(1):  # user interests only
+        get_content()
+
+
+def test_cache_is_invalidated_on_content_change(get_content, course_bundle, lecture_bundle):
+    get_content()
+
+    course_bundle.setattr_and_save("position_on_page", 0)
+
+    assert [item["id"] for item in get_content()] == [str(course_bundle.id), str(lecture_bundle.id)]
+
+
+def test_cache_is_invalidated_on_personalization_change(get_content, user, factory, lecture_bundle, course_bundle):
+    other_category = factory.category(slug="psychology")
+    user.interests.add(other_category)
+    get_content()
+
+    course_bundle.personalization_categories.add(other_category)
+
+    assert [item["id"] for item in get_content()] == [str(course_bundle.id), str(lecture_bundle.id)]
@@ -3,7 +3,7 @@ from typing import Any
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
 
-from mindbox.models import CorporateEmailDomain, MindboxOperationLog
+from mindbox.models import CorporateEmailDomain, MindboxOperationLog, MindboxOutboxEvent
 
 
 @admin.register(CorporateEmailDomain)
@@ -32,3 +32,18 @@ class MindboxOperationLogAdmin(admin.ModelAdmin):
 
     def has_change_permission(self, *args: Any, **kwargs: Any) -> bool:  # type: ignore
         return False
+
+
+@admin.register(MindboxOutboxEvent)
+class MindboxOutboxEventAdmin(admin.ModelAdmin):
+    fields = ["user", "operation", "params", "coalesce_key", "sent_at", "attempts", "last_error"]
+    list_display = ["operation", "user", "created", "sent_at", "attempts"]
+    list_filter = ["operation"]
+    raw_id_fields = ["user"]
+    ordering = ["-created"]
+
+    def has_add_permission(self, *args: Any, **kwargs: Any) -> bool:  # type: ignore
+        return False
+
+    def has_change_permission(self, *args: Any, **kwargs: Any) -> bool:  # type: ignore
+        return False
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.21 on 2025-09-02 10:00
+
+import app.json_encoders
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('mindbox', '0004_add_corporate_email_domain_model'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MindboxOutboxEvent',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('modified', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('operation', models.CharField(choices=[('register_customer', 'Register customer'), ('edit_customer', 'Edit customer'), ('send_customer_interests', 'Send customer interests'), ('notify_user_logged_in', 'Notify user logged in'), ('send_payment_attempt', 'Send payment attempt')], max_length=64, verbose_name='Operation')),
+                ('params', models.JSONField(blank=True, default=dict, encoder=app.json_encoders.AppJSONEncoder, verbose_name='Params')),
+                ('coalesce_key', models.CharField(max_length=255, verbose_name='Coalesce key')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='Sent at')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Attempts')),
+                ('last_error', models.TextField(blank=True, verbose_name='Last error')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Mindbox outbox event',
+                'verbose_name_plural': 'Mindbox outbox events',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='mindboxoutboxevent',
+            index=models.Index(condition=models.Q(('sent_at__isnull', True)), fields=['created'], name='mindbox_outbox_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mindbox', '0005_add_mindbox_outbox_event_model'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mindboxoutboxevent',
+            name='claimed_until',
+            field=models.DateTimeField(blank=True, help_text='Event is being sent by a drainer and must not be taken by another one until this time.', null=True, verbose_name='Claimed until'),
+        ),
+    ]
@@ -1,8 +1,11 @@
 from mindbox.models.corporate_email_domain import CorporateEmailDomain
 from mindbox.models.mindbox_operation_log import MindboxOperationLog
+from mindbox.models.mindbox_outbox_event import MindboxOutboxEvent, MindboxOutboxOperation
 
 
 __all__ = [
     "CorporateEmailDomain",
     "MindboxOperationLog",
+    "MindboxOutboxEvent",
+    "MindboxOutboxOperation",
 ]
@@ -0,0 +1,69 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from app.json_encoders import AppJSONEncoder
+from app.models import TimestampedModel
+
+
+class MindboxOutboxOperation(models.TextChoices):
+    REGISTER_CUSTOMER = "register_customer", _("Register customer")
+    EDIT_CUSTOMER = "edit_customer", _("Edit customer")
+    SEND_CUSTOMER_INTERESTS = "send_customer_interests", _("Send customer interests")
+    NOTIFY_USER_LOGGED_IN = "notify_user_logged_in", _("Notify user logged in")
+    SEND_PAYMENT_ATTEMPT = "send_payment_attempt", _("Send payment attempt")
+
+
+class MindboxOutboxEventQuerySet(models.QuerySet):
+    def pending(self) -> "MindboxOutboxEventQuerySet":
+        return self.filter(sent_at__isnull=True, attempts__lt=settings.MINDBOX_OUTBOX_MAX_ATTEMPTS)
+
+    def ready_to_send(self) -> "MindboxOutboxEventQuerySet":
+        """Pending events excluding failed ones that were retried less than a drain delay ago"""
+        retry_after = timezone.now() - timedelta(seconds=settings.MINDBOX_OUTBOX_DRAIN_DELAY_SECONDS)
+        return self.pending().filter(models.Q(attempts=0) | models.Q(modified__lte=retry_after)).not_claimed()
+
+    def not_claimed(self) -> "MindboxOutboxEventQuerySet":
+        return self.filter(models.Q(claimed_until__isnull=True) | models.Q(claimed_until__lt=timezone.now()))
+
+
+class MindboxOutboxEvent(TimestampedModel):
+    """
+    Mindbox operation to be sent after the transaction that caused it is committed.
+
+    Events with the same coalesce key describe the same state of the customer, so only the latest one is sent.
+    """
+
+    objects = MindboxOutboxEventQuerySet.as_manager()
+
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        verbose_name=_("User"),
+        related_name="+",
+    )
+    operation = models.CharField(_("Operation"), max_length=64, choices=MindboxOutboxOperation.choices)
+    params = models.JSONField(_("Params"), encoder=AppJSONEncoder, default=dict, blank=True)
+    coalesce_key = models.CharField(_("Coalesce key"), max_length=255)
+    sent_at = models.DateTimeField(_("Sent at"), null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(_("Attempts"), default=0)
+    last_error = models.TextField(_("Last error"), blank=True)
+    claimed_until = models.DateTimeField(
+        _("Claimed until"),
+        null=True,
+        blank=True,
+        help_text=_("Event is being sent by a drainer and must not be taken by another one until this time."),
+    )
+
+    class Meta:
+        verbose_name = _("Mindbox outbox event")
+        verbose_name_plural = _("Mindbox outbox events")
+        indexes = [
+            models.Index(fields=["created"], condition=models.Q(sent_at__isnull=True), name="mindbox_outbox_pending_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.operation} — {self.user_id}"
@@ -1,10 +1,16 @@
 from mindbox.services.client import MindboxClient
 from mindbox.services.mindbox_magic_link_generator import MindboxMagicLinkGenerator
+from mindbox.services.mindbox_outbox_drainer import MindboxOutboxDrainer
+from mindbox.services.mindbox_outbox_event_creator import MindboxOutboxEventCreator
+from mindbox.services.mindbox_outbox_event_sender import MindboxOutboxEventSender
 from mindbox.services.mindbox_progress_notifier import MindboxProgressNotifier
 
 
 __all__ = [
     "MindboxClient",
     "MindboxMagicLinkGenerator",
+    "MindboxOutboxDrainer",
+    "MindboxOutboxEventCreator",
+    "MindboxOutboxEventSender",
     "MindboxProgressNotifier",
 ]
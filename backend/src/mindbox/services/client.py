@@ -20,7 +20,14 @@ class MindboxClient:
     secret_key: str
     client: ConvenientHTTPClient
 
-    def __init__(self) -> None:
+    def __init__(self, mode: str = "sync", defer_logs: bool = False) -> None:
+        """
+        Use `mode="async"` to have operations queued by Mindbox instead of waiting for their processing.
+        With `defer_logs` operation logs are collected in `self.logs` for a single bulk insert instead of one insert per operation.
+        """
+        self.mode = mode
+        self.defer_logs = defer_logs
+        self.logs: list[MindboxOperationLog] = []
         self.endpoint_id = settings.MINDBOX_ENDPOINT_ID
         self.secret_key = settings.MINDBOX_ENDPOINT_SECRET_KEY
         self.mindbox_http = ConvenientHTTPClient(base_url=settings.MINDBOX_URL)
@@ -45,7 +52,7 @@ class MindboxClient:
 
         response, status = self.mindbox_http.request(
             method="post",
-            endpoint=f"operations/sync?endpointId={self.endpoint_id}&operation={operation}",
+            endpoint=f"operations/{self.mode}?endpointId={self.endpoint_id}&operation={operation}",
             headers=self.headers,
             data=content,
             raise_for_status=False,
@@ -84,7 +91,7 @@ class MindboxClient:
 
         response, status = self.mindbox_http.request(
             method="post",
-            endpoint=f"operations/sync?endpointId={self.endpoint_id}&operation={operation}",
+            endpoint=f"operations/{self.mode}?endpointId={self.endpoint_id}&operation={operation}",
             headers=self.headers,
             data=content,
             raise_for_status=False,
@@ -106,7 +113,7 @@ class MindboxClient:
 
         response, status_code = self.mindbox_http.request(
             method="post",
-            endpoint=f"operations/sync?endpointId={self.endpoint_id}&operation={operation}",
+            endpoint=f"operations/{self.mode}?endpointId={self.endpoint_id}&operation={operation}",
             headers=self.headers,
             data=content,
             raise_for_status=False,
@@ -125,7 +132,7 @@ class MindboxClient:
 
         response, status = self.mindbox_http.request(
             method="post",
-            endpoint=f"operations/sync?endpointId={self.endpoint_id}&operation={operation}&deviceUUID={device_uuid}",
+            endpoint=f"operations/{self.mode}?endpointId={self.endpoint_id}&operation={operation}&deviceUUID={device_uuid}",
             headers=self.headers,
             data=content,
             raise_for_status=False,
@@ -151,7 +158,7 @@ class MindboxClient:
 
         response, status = self.mindbox_http.request(
             method="post",
-            endpoint=f"operations/sync?endpointId={self.endpoint_id}&operation={operation}",
+            endpoint=f"operations/{self.mode}?endpointId={self.endpoint_id}&operation={operation}",
             headers=self.headers,
             data=content,
             raise_for_status=False,
@@ -177,7 +184,7 @@ class MindboxClient:
 
         response, status = self.mindbox_http.request(
             method="post",
-            endpoint=f"operations/sync?endpointId={self.endpoint_id}&operation={operation}",
+            endpoint=f"operations/{self.mode}?endpointId={self.endpoint_id}&operation={operation}",
             headers=self.headers,
             data=content,
             raise_for_status=False,
@@ -209,7 +216,7 @@ class MindboxClient:
 
         response, status = self.mindbox_http.request(
             method="post",
-            endpoint=f"operations/sync?endpointId={self.endpoint_id}&operation={operation}",
+            endpoint=f"operations/{self.mode}?endpointId={self.endpoint_id}&operation={operation}",
             headers=self.headers,
             data=content,
             raise_for_status=False,
@@ -248,7 +255,7 @@ class MindboxClient:
 
         response, status = self.mindbox_http.request(
             method="post",
-            endpoint=f"operations/sync?endpointId={self.endpoint_id}&operation={operation}",
+            endpoint=f"operations/{self.mode}?endpointId={self.endpoint_id}&operation={operation}",
             headers=self.headers,
             data=content,
             raise_for_status=False,
@@ -272,7 +279,7 @@ class MindboxClient:
 
         response, status = self.mindbox_http.request(
             method="post",
-            endpoint=f"operations/sync?endpointId={self.endpoint_id}&operation={operation}",
+            endpoint=f"operations/{self.mode}?endpointId={self.endpoint_id}&operation={operation}",
             headers=self.headers,
             data=content,
             raise_for_status=False,
@@ -286,4 +293,8 @@ class MindboxClient:
         log_data = {"operation": operation, "content": content}
         if destination:
             log_data["destination"] = destination
-        MindboxOperationLog.objects.create(**log_data)
+
+        if self.defer_logs:
+            self.logs.append(MindboxOperationLog(**log_data))
+        else:
+            MindboxOperationLog.objects.create(**log_data)
@@ -4,7 +4,7 @@ from urllib.parse import urlencode, urljoin
 from django.conf import settings
 from django.utils.functional import cached_property
 
-from a12n.models import PasswordlessEmailAuthCode
+from a12n.auth_code_store import get_auth_code_store
 from app.services import BaseService
 from users.models import User
 from users.services import UserEditor
@@ -15,7 +15,7 @@ class MindboxMagicLinkGenerator(BaseService):
     username: str
 
     def act(self) -> str:
-        auth_code = PasswordlessEmailAuthCode.objects.create(user=self.user)
+        auth_code = get_auth_code_store().create(self.user)
         magic_link_page = "/product-checkedout/"
         encoded_magic_link_params = urlencode({"email": self.username, "code": auth_code.code})
         return urljoin(settings.ABSOLUTE_URL, f"{magic_link_page}?{encoded_magic_link_params}")
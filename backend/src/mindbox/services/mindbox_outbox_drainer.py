@@ -0,0 +1,83 @@
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from app.services import BaseService
+from mindbox.models import MindboxOperationLog, MindboxOutboxEvent
+from mindbox.services.client import MindboxClient
+from mindbox.services.mindbox_outbox_event_sender import MindboxOutboxEventSender
+
+
+@dataclass
+class MindboxOutboxDrainer(BaseService):
+    """
+    Send a batch of pending outbox events to Mindbox.
+
+    Events are claimed with SKIP LOCKED and marked with `claimed_until` in a short transaction, so drainers may run concurrently
+    and no transaction is open while Mindbox is called. Events with the same coalesce key are sent once using the current state
+    of the user, operations are queued with Mindbox async API, and the results are recorded in a second short transaction
+    along with the logs. Failed events are retried after a drain delay up to `MINDBOX_OUTBOX_MAX_ATTEMPTS` times,
+    events of a drainer that died are taken again when their claim expires.
+    """
+
+    batch_size: int = field(default_factory=lambda: settings.MINDBOX_OUTBOX_BATCH_SIZE)
+
+    def act(self) -> int:
+        """Return number of events taken from the outbox"""
+        events = self.claim_events()
+        if not events:
+            return 0
+
+        client = MindboxClient(mode="async", defer_logs=True)
+        sent, failed = [], []
+        for coalesced_events in self.coalesce(events).values():
+            try:
+                MindboxOutboxEventSender(event=coalesced_events[-1], client=client)()
+            except Exception as e:  # noqa: BLE001
+                for event in coalesced_events:
+                    event.attempts += 1
+                    event.last_error = str(e)
+                failed.extend(coalesced_events)
+            else:
+                sent.extend(coalesced_events)
+
+        self.record_results(sent, failed, logs=client.logs)
+
+        return len(events)
+
+    @transaction.atomic
+    def claim_events(self) -> list[MindboxOutboxEvent]:
+        events = list(
+            MindboxOutboxEvent.objects.ready_to_send()
+            .select_related("user")
+            .select_for_update(skip_locked=True, of=("self",))
+            .order_by("created")[: self.batch_size],
+        )
+        MindboxOutboxEvent.objects.filter(id__in=[event.id for event in events]).update(
+            claimed_until=timezone.now() + timedelta(seconds=settings.MINDBOX_OUTBOX_CLAIM_SECONDS),
+        )
+
+        return events
+
+    @staticmethod
+    @transaction.atomic
+    def record_results(sent: list[MindboxOutboxEvent], failed: list[MindboxOutboxEvent], logs: list[MindboxOperationLog]) -> None:
+        now = timezone.now()
+        for event in failed:
+            event.modified = now
+            event.claimed_until = None
+
+        MindboxOutboxEvent.objects.filter(id__in=[event.id for event in sent]).update(sent_at=now, claimed_until=None, modified=now)
+        MindboxOutboxEvent.objects.bulk_update(failed, fields=["attempts", "last_error", "claimed_until", "modified"])
+        MindboxOperationLog.objects.bulk_create(logs)
+
+    @staticmethod
+    def coalesce(events: list[MindboxOutboxEvent]) -> dict[str, list[MindboxOutboxEvent]]:
+        coalesced: dict[str, list[MindboxOutboxEvent]] = {}
+        for event in events:
+            coalesced.setdefault(event.coalesce_key, []).append(event)
+
+        return coalesced
@@ -0,0 +1,57 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.transaction import on_commit
+
+from app.services import BaseService
+from mindbox.models import MindboxOutboxEvent, MindboxOutboxOperation
+from users.models import User
+
+
+COALESCE_PARAMS = {
+    MindboxOutboxOperation.NOTIFY_USER_LOGGED_IN: ["device_uuid"],
+    MindboxOutboxOperation.SEND_PAYMENT_ATTEMPT: ["recurrent_charge_attempt_id"],
+}
+
+DRAIN_SCHEDULED_CACHE_KEY = "mindbox_outbox_drain_scheduled"
+
+
+@dataclass
+class MindboxOutboxEventCreator(BaseService):
+    """
+    Append Mindbox operation to the outbox within the current transaction.
+
+    Events are sent by `MindboxOutboxDrainer`, the drain is scheduled once per `MINDBOX_OUTBOX_DRAIN_DELAY_SECONDS`
+    for all events committed during this period.
+    """
+
+    user: User
+    operation: MindboxOutboxOperation
+    params: dict[str, Any] = field(default_factory=dict)
+
+    def act(self) -> MindboxOutboxEvent | None:
+        if not settings.MINDBOX_ENABLED:
+            return None
+
+        event = MindboxOutboxEvent.objects.create(
+            user=self.user,
+            operation=self.operation,
+            params=self.params,
+            coalesce_key=self.get_coalesce_key(),
+        )
+        on_commit(self.schedule_drain)
+
+        return event
+
+    def get_coalesce_key(self) -> str:
+        return ":".join([self.operation, str(self.user.id), *(str(self.params[param]) for param in COALESCE_PARAMS.get(self.operation, []))])
+
+    @staticmethod
+    def schedule_drain() -> None:
+        from mindbox.tasks import drain_mindbox_outbox
+
+        delay = settings.MINDBOX_OUTBOX_DRAIN_DELAY_SECONDS
+        if cache.add(DRAIN_SCHEDULED_CACHE_KEY, True, timeout=delay + 60):
+            drain_mindbox_outbox.apply_async(countdown=delay)
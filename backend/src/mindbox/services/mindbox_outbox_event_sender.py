@@ -0,0 +1,65 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from app.services import BaseService
+from mindbox.models import MindboxOutboxEvent, MindboxOutboxOperation
+from mindbox.services.client import MindboxClient
+from payments.models import RecurrentChargeAttempt, RecurrentChargeStatus
+
+
+@dataclass
+class MindboxOutboxEventSender(BaseService):
+    """Send Mindbox operation described by the outbox event using the current state of the user"""
+
+    event: MindboxOutboxEvent
+    client: MindboxClient = field(default_factory=MindboxClient)
+
+    def act(self) -> None:
+        self.get_sender()()
+
+    def get_sender(self) -> Callable[[], None]:
+        return {
+            MindboxOutboxOperation.REGISTER_CUSTOMER: self.register_customer,
+            MindboxOutboxOperation.EDIT_CUSTOMER: self.edit_customer,
+            MindboxOutboxOperation.SEND_CUSTOMER_INTERESTS: self.send_customer_interests,
+            MindboxOutboxOperation.NOTIFY_USER_LOGGED_IN: self.notify_user_logged_in,
+            MindboxOutboxOperation.SEND_PAYMENT_ATTEMPT: self.send_payment_attempt,
+        }[self.event.operation]
+
+    def register_customer(self) -> None:
+        self.client.register_customer(email=self.event.user.username)
+
+    def edit_customer(self) -> None:
+        user = self.event.user
+        self.client.edit_customer(email=user.username, first_name=user.first_name, last_name=user.last_name, birth_date=user.birthdate)
+
+    def send_customer_interests(self) -> None:
+        user = self.event.user
+        interests = ["all-interests"] if user.all_interests else user.interests.slugs()
+
+        self.client.edit_customer(email=user.username, interests=interests)
+
+    def notify_user_logged_in(self) -> None:
+        self.client.user_logged_in(email=self.event.user.username, device_uuid=self.event.params["device_uuid"])
+
+    def send_payment_attempt(self) -> None:
+        if "attempt_number" in self.event.params:
+            attempt_number, attempt_success = self.event.params["attempt_number"], self.event.params["attempt_success"]
+        else:
+            attempt_number, attempt_success = self.get_payment_attempt_summary()
+
+        self.client.send_payment_attempt(
+            email=self.event.user.username,
+            num_attempt=f"{attempt_number}attempt",
+            attempt_success=attempt_success,
+        )
+
+    def get_payment_attempt_summary(self) -> tuple[str, bool]:
+        """Count attempts of the cycle for events created before the summary has been put into params"""
+        recurrent_charge_attempt = RecurrentChargeAttempt.objects.select_related("recurrent").get(pk=self.event.params["recurrent_charge_attempt_id"])
+        attempts_count = RecurrentChargeAttempt.objects.filter(
+            recurrent=recurrent_charge_attempt.recurrent,
+            created__gte=recurrent_charge_attempt.recurrent.next_charge_date,
+        ).count()
+
+        return str(attempts_count), recurrent_charge_attempt.status == RecurrentChargeStatus.SUCCESS
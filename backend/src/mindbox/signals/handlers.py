@@ -0,0 +1,14 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+
+from mindbox.models import CorporateEmailDomain
+from mindbox.utils import invalidate_corporate_email_domains
+
+
+def invalidate_corporate_email_domains_on_change(**kwargs: Any) -> None:
+    invalidate_corporate_email_domains()
+
+
+post_save.connect(invalidate_corporate_email_domains_on_change, sender=CorporateEmailDomain, dispatch_uid="invalidate_corporate_email_domains_on_save")
+post_delete.connect(invalidate_corporate_email_domains_on_change, sender=CorporateEmailDomain, dispatch_uid="invalidate_corporate_email_domains_on_delete")
@@ -1,46 +1,34 @@
 from datetime import timedelta
 
 from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
 
 from app.celery import celery
-from payments.models import Recurrent, RecurrentChargeAttempt, RecurrentChargeStatus
+from mindbox.models import MindboxOutboxEvent, MindboxOutboxOperation
+from payments.models import Recurrent
 from product_access.models import ProductAccess
 from users.models import User
 
 
 @celery.task(name="mindbox_notify_user_logged_in")
 def notify_user_logged_in(user_id: str, device_uuid: str) -> None:
-    from mindbox.services import MindboxClient
-
-    user = User.objects.get(pk=user_id)
-    MindboxClient().user_logged_in(email=user.username, device_uuid=device_uuid)
+    send_outbox_operation(user_id, MindboxOutboxOperation.NOTIFY_USER_LOGGED_IN, device_uuid=device_uuid)
 
 
 @celery.task(name="mindbox_register_customer")
 def register_customer(user_id: str) -> None:
-    from mindbox.services import MindboxClient
-
-    user = User.objects.get(pk=user_id)
-    MindboxClient().register_customer(email=user.username)
+    send_outbox_operation(user_id, MindboxOutboxOperation.REGISTER_CUSTOMER)
 
 
 @celery.task(name="mindbox_edit_customer")
 def edit_customer(user_id: str) -> None:
-    from mindbox.services import MindboxClient
-
-    user = User.objects.get(pk=user_id)
-    MindboxClient().edit_customer(email=user.username, first_name=user.first_name, last_name=user.last_name, birth_date=user.birthdate)
+    send_outbox_operation(user_id, MindboxOutboxOperation.EDIT_CUSTOMER)
 
 
 @celery.task(name="mindbox_send_customer_interests")
 def send_customer_interests(user_id: str) -> None:
-    from mindbox.services import MindboxClient
-
-    user = User.objects.get(pk=user_id)
-
-    interests = ["all-interests"] if user.all_interests else user.interests.slugs()
-
-    MindboxClient().edit_customer(email=user.username, interests=interests)
+    send_outbox_operation(user_id, MindboxOutboxOperation.SEND_CUSTOMER_INTERESTS)
 
 
 @celery.task(name="mindbox_notify_course_progress")
@@ -56,9 +44,9 @@ def notify_course_progress(course_progress_id: str) -> None:
 def update_or_create_recurrent_order(user_id: str, recurrent_id: str) -> None:
     from mindbox.services import MindboxClient
 
-    user = User.objects.get(pk=user_id)
-    recurrent = Recurrent.objects.get(pk=recurrent_id)
-    product_access = ProductAccess.objects.filter(user=user, product=recurrent.product).first()
+    recurrent = Recurrent.objects.select_related("user").get(pk=recurrent_id)
+    user = recurrent.user
+    product_access = ProductAccess.objects.select_related("product").filter(user_id=user_id, product_id=recurrent.product_id).first()
 
     next_charge_date = (
         recurrent.next_charge_date.date() if recurrent.next_charge_date else (product_access.end_date.date() + timedelta(days=product_access.product.lifetime))  # type: ignore
@@ -74,19 +62,25 @@ def update_or_create_recurrent_order(user_id: str, recurrent_id: str) -> None:
 
 @celery.task(name="mindbox_send_payment_attempt")
 def send_payment_attempt(user_id: str, recurrent_charge_attempt_id: str) -> None:
-    from mindbox.services import MindboxClient
+    send_outbox_operation(user_id, MindboxOutboxOperation.SEND_PAYMENT_ATTEMPT, recurrent_charge_attempt_id=recurrent_charge_attempt_id)
 
-    user = User.objects.get(pk=user_id)
-    recurrent_charge_attempt = RecurrentChargeAttempt.objects.get(pk=recurrent_charge_attempt_id)
-    attempts_count = RecurrentChargeAttempt.objects.filter(
-        recurrent=recurrent_charge_attempt.recurrent,
-        created__gte=recurrent_charge_attempt.recurrent.next_charge_date,
-    ).count()
 
-    attempt_success = recurrent_charge_attempt.status == RecurrentChargeStatus.SUCCESS
+@celery.task(name="mindbox_drain_outbox")
+def drain_mindbox_outbox() -> None:
+    from mindbox.services import MindboxOutboxDrainer, MindboxOutboxEventCreator
+    from mindbox.services.mindbox_outbox_event_creator import DRAIN_SCHEDULED_CACHE_KEY
 
-    MindboxClient().send_payment_attempt(
-        email=user.username,
-        num_attempt=f"{attempts_count}attempt",
-        attempt_success=attempt_success,
-    )
+    cache.delete(DRAIN_SCHEDULED_CACHE_KEY)  # events committed from now on schedule the next drain
+    while MindboxOutboxDrainer()() == settings.MINDBOX_OUTBOX_BATCH_SIZE:
+        pass
+
+    if MindboxOutboxEvent.objects.pending().exists():
+        MindboxOutboxEventCreator.schedule_drain()
+
+
+def send_outbox_operation(user_id: str, operation: MindboxOutboxOperation, **params: str) -> None:
+    """Send operation right away, kept for the tasks enqueued before the outbox was introduced"""
+    from mindbox.services import MindboxOutboxEventSender
+
+    user = User.objects.get(pk=user_id)
+    MindboxOutboxEventSender(event=MindboxOutboxEvent(user=user, operation=operation, params=params))()
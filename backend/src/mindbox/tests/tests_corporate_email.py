@@ -0,0 +1,53 @@
+import pytest
+
+from mindbox.models import CorporateEmailDomain
+from mindbox.utils import invalidate_corporate_email_domains, is_corporate_email
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture(autouse=True)
+def corporate_domain():
+    invalidate_corporate_email_domains()
+    return CorporateEmailDomain.objects.create(domain="corp.example")
+
+
+@pytest.mark.parametrize(
+    ("email", "is_corporate"),
+    [
+        ("boss@corp.example", True),
+        ("Boss@CORP.example", True),
+        ("boss@mail.corp.example", True),
+        ("boss@notcorp.example", False),
+        ("boss@example", False),
+        ("boss@corp.example.org", False),
+    ],
+)
+def test_corporate_email(email, is_corporate):
+    assert is_corporate_email(email) is is_corporate
+
+
+def test_domains_are_not_queried_twice(django_assert_num_queries):
+    is_corporate_email("boss@corp.example")
+
+    with django_assert_num_queries(0):
+        is_corporate_email("boss@corp.example")
+
+
+def test_new_domain_is_used_after_save():
+    is_corporate_email("boss@other.example")
+
+    CorporateEmailDomain.objects.create(domain="other.example")
+
+    assert is_corporate_email("boss@other.example") is True
+
+
+def test_deleted_domain_is_not_used(corporate_domain):
+    is_corporate_email("boss@corp.example")
+
+    corporate_domain.delete()
+
+    assert is_corporate_email("boss@corp.example") is False
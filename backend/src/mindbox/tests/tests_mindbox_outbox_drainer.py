@@ -0,0 +1,173 @@
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from mindbox.models import MindboxOperationLog, MindboxOutboxEvent, MindboxOutboxOperation
+from mindbox.services import MindboxOutboxDrainer
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def add_event(user):
+    def _add_event(operation=MindboxOutboxOperation.EDIT_CUSTOMER, **params):
+        coalesce_key = ":".join([operation, str(user.id), *params.values()])
+        return MindboxOutboxEvent.objects.create(user=user, operation=operation, params=params, coalesce_key=coalesce_key)
+
+    return _add_event
+
+
+@pytest.fixture
+def drain():
+    return lambda **kwargs: MindboxOutboxDrainer(**kwargs)()
+
+
+def test_coalesce_events_of_the_same_customer_and_operation(drain, add_event, mock_mindbox_request):
+    events = [add_event() for _ in range(10)]
+
+    assert drain() == 10
+
+    mock_mindbox_request.assert_called_once()
+    assert MindboxOutboxEvent.objects.filter(id__in=[event.id for event in events], sent_at__isnull=False).count() == 10
+
+
+def test_send_distinct_operations_separately(drain, add_event, mock_mindbox_request):
+    add_event()
+    add_event(MindboxOutboxOperation.NOTIFY_USER_LOGGED_IN, device_uuid="device-1")
+    add_event(MindboxOutboxOperation.NOTIFY_USER_LOGGED_IN, device_uuid="device-2")
+
+    drain()
+
+    assert mock_mindbox_request.call_count == 3
+
+
+def test_operations_are_sent_via_async_api(drain, add_event, mock_mindbox_request):
+    add_event()
+
+    drain()
+
+    assert mock_mindbox_request.call_args.kwargs["endpoint"] == "operations/async?endpointId=TheEndpoint&operation=LMSEditCustomer"
+
+
+def test_logs_are_written(drain, add_event):
+    add_event()
+    add_event(MindboxOutboxOperation.NOTIFY_USER_LOGGED_IN, device_uuid="device-1")
+
+    drain()
+
+    assert set(MindboxOperationLog.objects.values_list("operation", flat=True)) == {"LMSEditCustomer", "LMSLoggedIn"}
+
+
+def test_sent_events_are_not_sent_again(drain, add_event, mock_mindbox_request):
+    add_event()
+    drain()
+
+    assert drain() == 0
+    mock_mindbox_request.assert_called_once()
+
+
+def test_batch_size(drain, add_event):
+    add_event(MindboxOutboxOperation.NOTIFY_USER_LOGGED_IN, device_uuid="device-1")
+    add_event(MindboxOutboxOperation.NOTIFY_USER_LOGGED_IN, device_uuid="device-2")
+
+    assert drain(batch_size=1) == 1
+    assert MindboxOutboxEvent.objects.pending().count() == 1
+
+
+def test_failed_event_is_kept_for_retry(drain, add_event, mock_mindbox_request):
+    mock_mindbox_request.return_value = ({"status": "Error"}, 500)
+    event = add_event()
+
+    drain()
+
+    event.refresh_from_db()
+    assert event.sent_at is None
+    assert event.attempts == 1
+    assert "Mindbox operation error" in event.last_error
+    assert not MindboxOperationLog.objects.exists()
+
+
+def test_failed_event_is_not_retried_before_drain_delay(drain, add_event, mock_mindbox_request):
+    mock_mindbox_request.return_value = ({"status": "Error"}, 500)
+    add_event()
+    drain()
+
+    assert drain() == 0
+
+
+def test_failure_does_not_block_other_events(drain, add_event, mock_mindbox_request):
+    mock_mindbox_request.side_effect = [({"status": "Error"}, 500), ({"status": "Success"}, 200)]
+    failed = add_event()
+    sent = add_event(MindboxOutboxOperation.NOTIFY_USER_LOGGED_IN, device_uuid="device-1")
+
+    drain()
+
+    failed.refresh_from_db()
+    sent.refresh_from_db()
+    assert failed.sent_at is None
+    assert sent.sent_at is not None
+
+
+def test_events_exceeding_max_attempts_are_skipped(drain, add_event, mock_mindbox_request, settings):
+    settings.MINDBOX_OUTBOX_MAX_ATTEMPTS = 3
+    event = add_event()
+    MindboxOutboxEvent.objects.filter(id=event.id).update(attempts=3, modified=timezone.now() - timezone.timedelta(days=1))
+
+    assert drain() == 0
+    mock_mindbox_request.assert_not_called()
+
+
+def test_payment_attempt_is_sent_from_event_params(drain, user, mocker):
+    send_payment_attempt = mocker.patch("mindbox.services.client.MindboxClient.send_payment_attempt")
+    MindboxOutboxEvent.objects.create(
+        user=user,
+        operation=MindboxOutboxOperation.SEND_PAYMENT_ATTEMPT,
+        params={"recurrent_charge_attempt_id": "d5d3f9c5-2bd5-4f57-9e5b-0d6f7c1f3a11", "attempt_number": "2", "attempt_success": False},  # attempt is not read
+        coalesce_key="send_payment_attempt",
+    )
+
+    drain()
+
+    send_payment_attempt.assert_called_once_with(email=user.username, num_attempt="2attempt", attempt_success=False)
+
+
+def test_claimed_events_are_not_taken(drain, add_event, mock_mindbox_request):
+    event = add_event()
+    event.setattr_and_save("claimed_until", timezone.now() + timezone.timedelta(minutes=1))
+
+    assert drain() == 0
+    mock_mindbox_request.assert_not_called()
+
+
+def test_events_of_expired_claim_are_taken(drain, add_event, mock_mindbox_request):
+    event = add_event()
+    event.setattr_and_save("claimed_until", timezone.now() - timezone.timedelta(minutes=1))
+
+    assert drain() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_events_are_sent_outside_transaction(drain, add_event, mock_mindbox_request):
+    in_atomic_block = []
+    mock_mindbox_request.side_effect = lambda *args, **kwargs: in_atomic_block.append(connection.in_atomic_block) or ({"status": "Success"}, 200)
+    event = add_event()
+
+    drain()
+
+    event.refresh_from_db()
+    assert in_atomic_block == [False]
+    assert event.sent_at is not None
+    assert event.claimed_until is None
+
+
+def test_claim_of_failed_event_is_released(drain, add_event, mock_mindbox_request):
+    mock_mindbox_request.return_value = ({"status": "Error"}, 500)
+    event = add_event()
+
+    drain()
+
+    event.refresh_from_db()
+    assert event.claimed_until is None
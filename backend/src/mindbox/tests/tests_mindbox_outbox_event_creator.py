@@ -0,0 +1,57 @@
+import pytest
+
+from mindbox.models import MindboxOutboxEvent, MindboxOutboxOperation
+from mindbox.services import MindboxOutboxEventCreator
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture(autouse=True)
+def mock_drain_mindbox_outbox(mocker):
+    return mocker.patch("mindbox.tasks.drain_mindbox_outbox.apply_async")
+
+
+def test_create_event(user):
+    MindboxOutboxEventCreator(user=user, operation=MindboxOutboxOperation.EDIT_CUSTOMER)()
+
+    event = MindboxOutboxEvent.objects.get()
+    assert event.user == user
+    assert event.operation == MindboxOutboxOperation.EDIT_CUSTOMER
+    assert event.coalesce_key == f"edit_customer:{user.id}"
+    assert event.sent_at is None
+
+
+def test_coalesce_key_includes_operation_params(user):
+    MindboxOutboxEventCreator(user=user, operation=MindboxOutboxOperation.NOTIFY_USER_LOGGED_IN, params={"device_uuid": "device-123"})()
+
+    assert MindboxOutboxEvent.objects.get().coalesce_key == f"notify_user_logged_in:{user.id}:device-123"
+
+
+def test_no_event_if_mindbox_is_disabled(user, settings):
+    settings.MINDBOX_ENABLED = False
+
+    MindboxOutboxEventCreator(user=user, operation=MindboxOutboxOperation.EDIT_CUSTOMER)()
+
+    assert not MindboxOutboxEvent.objects.exists()
+
+
+def test_drain_is_scheduled_after_commit(user, mock_drain_mindbox_outbox, django_capture_on_commit_callbacks, settings):
+    settings.MINDBOX_OUTBOX_DRAIN_DELAY_SECONDS = 15
+
+    with django_capture_on_commit_callbacks(execute=True):
+        MindboxOutboxEventCreator(user=user, operation=MindboxOutboxOperation.EDIT_CUSTOMER)()
+
+    mock_drain_mindbox_outbox.assert_called_once_with(countdown=15)
+
+
+def test_drain_is_scheduled_once_for_many_events(user, mock_drain_mindbox_outbox, django_capture_on_commit_callbacks, mocker):
+    mocker.patch("django.core.cache.cache.add", side_effect=[True, False])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        MindboxOutboxEventCreator(user=user, operation=MindboxOutboxOperation.EDIT_CUSTOMER)()
+        MindboxOutboxEventCreator(user=user, operation=MindboxOutboxOperation.EDIT_CUSTOMER)()
+
+    mock_drain_mindbox_outbox.assert_called_once()
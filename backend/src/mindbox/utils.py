@@ -1,6 +1,36 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+
 from mindbox.models import CorporateEmailDomain
 
 
+CORPORATE_EMAIL_DOMAINS_VERSION_CACHE_KEY = "corporate_email_domains_version"
+
+_corporate_email_domains: tuple[str | None, frozenset[str]] = (None, frozenset())
+
+
+def get_corporate_email_domains() -> frozenset[str]:
+    """
+    Return corporate domains loaded once per process and reloaded when their version in the cache changes,
+    i.e. after any domain is saved or deleted.
+    """
+    global _corporate_email_domains  # noqa: PLW0603
+
+    version = cache.get_or_set(CORPORATE_EMAIL_DOMAINS_VERSION_CACHE_KEY, lambda: uuid4().hex, timeout=None)
+    if _corporate_email_domains[0] != version:
+        domains = frozenset(domain.lower().strip(".") for domain in CorporateEmailDomain.objects.values_list("domain", flat=True))
+        _corporate_email_domains = (version, domains)
+
+    return _corporate_email_domains[1]
+
+
+def invalidate_corporate_email_domains() -> None:
+    cache.set(CORPORATE_EMAIL_DOMAINS_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+
+
 def is_corporate_email(email: str) -> bool:
-    domain = email.lower().split("@")[-1]
-    return CorporateEmailDomain.objects.filter(domain=domain).exists()
+    """Email is corporate if its domain or any parent domain of it is corporate"""
+    labels = email.lower().split("@")[-1].strip(".").split(".")
+    domains = get_corporate_email_domains()
+    return any(".".join(labels[index:]) in domains for index in range(len(labels)))
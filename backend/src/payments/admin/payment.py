@@ -37,6 +37,25 @@ class PaymentAdmin(ModelAdmin):
         "amount",
     )
     autocomplete_fields = ("user", "product", "recurrent")
+    actions = ("export_as_csv",)
+    export_action_names = ["export_as_csv"]
+    export_field_names = [
+        "id",
+        "external_payment_id",
+        "order_id",
+        "user__username",
+        "product__name",
+        "provider",
+        "payment_method",
+        "source",
+        "status",
+        "amount",
+        "bonus_applied",
+        "is_recurrent",
+        "paid_at",
+        "created",
+    ]
+    export_compress = True
     readonly_fields = (
         "id",
         "external_payment_id",
@@ -1,4 +1,7 @@
+from typing import Any
+
 from django.contrib.admin import register
+from django.db.transaction import on_commit
 from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
 from nested_admin import NestedTabularInline
@@ -66,6 +69,7 @@ class RecurrentAdmin(ModelAdmin):
         "id",
         "user",
         "product",
+        "charge_attempts_in_cycle",
         "created",
         "modified",
     )
@@ -90,6 +94,7 @@ class RecurrentAdmin(ModelAdmin):
                     "next_charge_date",
                     "last_attempt_charge_date",
                     "last_attempt_charge_status",
+                    "charge_attempts_in_cycle",
                 ),
             },
         ),
@@ -105,3 +110,11 @@ class RecurrentAdmin(ModelAdmin):
 
     def has_add_permission(self, request: HttpRequest) -> bool:
         return False
+
+    def save_model(self, request: HttpRequest, obj: Recurrent, form: Any, change: bool) -> None:
+        super().save_model(request, obj, form, change)
+        on_commit(obj.invalidate_user_access_cache)  # status is a part of user's cached entitlements
+
+    def delete_model(self, request: HttpRequest, obj: Recurrent) -> None:
+        super().delete_model(request, obj)
+        on_commit(obj.invalidate_user_access_cache)
@@ -8,7 +8,7 @@ from payments.api.demo.permissions import PaymentIntegrationPermission
 from payments.api.demo.serializers import IncomingPaymentSerializer
 from payments.models import Payment
 from payments.services import PaymentFromShopProcessor
-from product_access.api.demo.decorators import dead_letter_creation
+from product_access.api.demo.decorators import dead_letter_creation, shop_event_ingestion
 
 
 class PaymentFromShopView(APIView):
@@ -20,6 +20,7 @@ class PaymentFromShopView(APIView):
         responses={201: None},
     )
     @dead_letter_creation(event_type="incoming-payment-from-shop")
+    @shop_event_ingestion(event_type="incoming-payment-from-shop")
     def post(self, request: Request) -> Response:
         serializer = IncomingPaymentSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -0,0 +1,63 @@
+from typing import Any
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from payments.models import Recurrent, RecurrentChargeAttempt
+
+
+class Command(BaseCommand):
+    """Counters are maintained by RecurrentChargeAttemptCreator, the command checks them against the charge attempts history."""
+
+    help = "Rebuild charge attempts in billing cycle of recurrents from charge attempts"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of recurrents checked within one transaction")
+        parser.add_argument("--dry-run", action="store_true", help="Only report recurrents with wrong counters")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        recurrent_ids = Recurrent.objects.order_by("id").values_list("id", flat=True)
+
+        checked = fixed = 0
+        last_id = None
+        while True:
+            batch = recurrent_ids.filter(id__gt=last_id) if last_id is not None else recurrent_ids
+            ids = list(batch[: options["batch_size"]])
+            if not ids:
+                break
+
+            fixed += self.rebuild(ids, dry_run=options["dry_run"])
+            checked += len(ids)
+            last_id = ids[-1]
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{'Dry run completed' if options['dry_run'] else 'Rebuild completed'}. Checked {checked} recurrents, {fixed} had wrong counters.",
+            ),
+        )
+
+    @transaction.atomic
+    def rebuild(self, recurrent_ids: list[UUID], dry_run: bool) -> int:
+        attempts = (
+            RecurrentChargeAttempt.objects.filter(recurrent=OuterRef("pk"), created__gte=OuterRef("next_charge_date"))
+            .order_by()
+            .values("recurrent")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        recurrents = Recurrent.objects.filter(id__in=recurrent_ids).select_for_update().annotate(actual_attempts=Coalesce(Subquery(attempts), 0))
+
+        wrong = []
+        for recurrent in recurrents:
+            if recurrent.charge_attempts_in_cycle != recurrent.actual_attempts:
+                self.stdout.write(f"Recurrent {recurrent.id}: {recurrent.charge_attempts_in_cycle} attempts in cycle, {recurrent.actual_attempts} in history")
+                recurrent.charge_attempts_in_cycle = recurrent.actual_attempts
+                wrong.append(recurrent)
+
+        if not dry_run:
+            Recurrent.objects.bulk_update(wrong, fields=["charge_attempts_in_cycle"])
+
+        return len(wrong)
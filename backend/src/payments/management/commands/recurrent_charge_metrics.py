@@ -0,0 +1,21 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from app.utils import replica_reads
+from payments.services import RecurrentChargeMetricsGetter
+
+
+class Command(BaseCommand):
+    help = "Show state of the recurring charge queue"
+
+    @replica_reads()
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        metrics = RecurrentChargeMetricsGetter()()
+        latency = f"{metrics.average_charge_latency_seconds:.2f}s" if metrics.average_charge_latency_seconds is not None else "n/a"
+
+        self.stdout.write(f"Queue depth: {metrics.queue_depth}")
+        self.stdout.write(f"In flight: {metrics.in_flight}")
+        self.stdout.write(f"Charges today: {metrics.charges_today}")
+        self.stdout.write(f"Average charge latency: {latency}")
+        self.stdout.write(self.style.SUCCESS(f"Projected drain time: {metrics.projected_drain_seconds / 60:.1f} min"))
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2025-09-01 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0009_add_charge_attempt_log_model'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recurrent',
+            name='charge_claimed_until',
+            field=models.DateTimeField(blank=True, help_text='Recurrent is already dispatched for charging and must not be scheduled again until this time.', null=True, verbose_name='Charge claimed until'),
+        ),
+    ]
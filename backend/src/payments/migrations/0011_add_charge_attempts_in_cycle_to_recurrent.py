@@ -0,0 +1,30 @@
+# Generated by Django 4.2.21 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+SQL_FILL_CHARGE_ATTEMPTS_IN_CYCLE = """
+UPDATE payments_recurrent
+SET charge_attempts_in_cycle = (
+    SELECT COUNT(*) FROM payments_recurrentchargeattempt
+    WHERE payments_recurrentchargeattempt.recurrent_id = payments_recurrent.id
+    AND payments_recurrentchargeattempt.created >= payments_recurrent.next_charge_date
+)
+WHERE next_charge_date IS NOT NULL;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0010_add_charge_claimed_until_to_recurrent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recurrent',
+            name='charge_attempts_in_cycle',
+            field=models.PositiveIntegerField(default=0, help_text='Charge attempts since the next charge date has been set, maintained by RecurrentChargeAttemptCreator.', verbose_name='Charge attempts in billing cycle'),
+        ),
+        migrations.RunSQL(SQL_FILL_CHARGE_ATTEMPTS_IN_CYCLE, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-18 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0011_add_charge_attempts_in_cycle_to_recurrent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='shop_event_fingerprint',
+            field=models.CharField(blank=True, default='', help_text='Hash of the last shop event applied to the payment, the same event is not applied twice.', max_length=64, verbose_name='Shop event fingerprint'),
+        ),
+    ]
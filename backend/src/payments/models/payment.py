@@ -186,6 +186,13 @@ class Payment(TimestampedModel):
         blank=True,
         help_text=_("Raw response from payment provider."),
     )
+    shop_event_fingerprint = models.CharField(
+        _("Shop event fingerprint"),
+        max_length=64,
+        blank=True,
+        default="",
+        help_text=_("Hash of the last shop event applied to the payment, the same event is not applied twice."),
+    )
 
     class Meta:
         verbose_name = _("Payment")
@@ -17,7 +17,21 @@ class RecurrentChargeStatus(models.TextChoices):
     FAIL = "FAIL", _("Fail")
 
 
+class RecurrentQuerySet(models.QuerySet):
+    def due_for_charge(self) -> "RecurrentQuerySet":
+        return self.filter(
+            status=RecurrentStatus.ACTIVE,
+            next_charge_date__lte=now().date(),
+            payment_instrument__isnull=False,
+        )
+
+    def not_claimed_for_charge(self) -> "RecurrentQuerySet":
+        return self.filter(models.Q(charge_claimed_until__isnull=True) | models.Q(charge_claimed_until__lt=now()))
+
+
 class Recurrent(TimestampedModel):
+    objects = RecurrentQuerySet.as_manager()
+
     user = models.ForeignKey(
         "users.User",
         on_delete=models.PROTECT,
@@ -76,6 +90,17 @@ class Recurrent(TimestampedModel):
         blank=True,
         db_index=True,
     )
+    charge_attempts_in_cycle = models.PositiveIntegerField(
+        _("Charge attempts in billing cycle"),
+        default=0,
+        help_text=_("Charge attempts since the next charge date has been set, maintained by RecurrentChargeAttemptCreator."),
+    )
+    charge_claimed_until = models.DateTimeField(
+        _("Charge claimed until"),
+        null=True,
+        blank=True,
+        help_text=_("Recurrent is already dispatched for charging and must not be scheduled again until this time."),
+    )
 
     class Meta:
         verbose_name = _("Recurrent payment")
@@ -105,8 +130,9 @@ class Recurrent(TimestampedModel):
             raise ValueError("Product or its lifetime is missing.")
 
         self.next_charge_date = base_date + timedelta(days=self.product.lifetime)  # type: ignore[arg-type]
+        self.charge_attempts_in_cycle = 0
         if commit:
-            self.save(update_fields=["next_charge_date"])
+            self.save(update_fields=["next_charge_date", "charge_attempts_in_cycle"])
 
     def deactivate(self, commit: bool = True) -> None:
         """Deactivates the recurrent subscription."""
@@ -114,3 +140,10 @@ class Recurrent(TimestampedModel):
         self.status = RecurrentStatus.CANCELLED
         if commit:
             self.save(update_fields=["status"])
+            self.invalidate_user_access_cache()
+
+    def invalidate_user_access_cache(self) -> None:
+        """Recurrent status is part of user's cached entitlements."""
+        from product_access.services import UserProductAccessCacheInvalidator
+
+        UserProductAccessCacheInvalidator(user=self.user)()
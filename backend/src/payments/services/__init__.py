@@ -1,6 +1,9 @@
 from payments.services.payment_creator import PaymentCreator, PaymentCreatorException
 from payments.services.payment_from_shop_processor import PaymentFromShopProcessor, PaymentFromShopProcessorException
 from payments.services.recurrent_charge_attempt_creator import RecurrentChargeAttemptCreator, RecurrentChargeAttemptCreatorException
+from payments.services.recurrent_charge_engine import RecurrentCharge, RecurrentChargeEngine
+from payments.services.recurrent_charge_metrics_getter import RecurrentChargeMetrics, RecurrentChargeMetricsGetter
+from payments.services.recurrent_charge_scheduler import RecurrentChargeScheduler
 from payments.services.recurring_payment_processor import RecurringPaymentProcessor, RecurringPaymentProcessorException
 from payments.services.tinkoff.tinkoff_recurring_charge_processor import TinkoffRecurringChargeProcessor, TinkoffRecurringChargeProcessorException
 
@@ -12,6 +15,11 @@ __all__ = [
     "PaymentFromShopProcessorException",
     "RecurrentChargeAttemptCreator",
     "RecurrentChargeAttemptCreatorException",
+    "RecurrentCharge",
+    "RecurrentChargeEngine",
+    "RecurrentChargeMetrics",
+    "RecurrentChargeMetricsGetter",
+    "RecurrentChargeScheduler",
     "RecurringPaymentProcessor",
     "RecurringPaymentProcessorException",
     "TinkoffRecurringChargeProcessor",
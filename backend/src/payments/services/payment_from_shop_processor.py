@@ -1,11 +1,17 @@
+import hashlib
+import json
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Any, TypeVar
 
+from django.db import IntegrityError
 from django.db.transaction import atomic, on_commit
 from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
 
 from app.exceptions import AppServiceException
+from app.json_encoders import AppJSONEncoder
+from app.models import DefaultModel
 from app.services import BaseService
 from mindbox.tasks import update_or_create_recurrent_order
 from payments.models import Payment, PaymentInstrument, PaymentInstrumentStatus, Recurrent, RecurrentChargeAttempt, RecurrentChargeStatus
@@ -14,6 +20,9 @@ from users.models import User
 from users.services import UserEditor
 
 
+ModelT = TypeVar("ModelT", bound=DefaultModel)
+
+
 class PaymentFromShopProcessorException(AppServiceException):
     """Exception for errors in PaymentFromShopProcessor."""
 
@@ -24,17 +33,22 @@ class PaymentFromShopProcessor(BaseService):
 
     @atomic
     def act(self) -> Payment:
+        if (payment := self.get_already_applied_payment()) is not None:
+            return payment
+
         user = self.user_with_creation_state[0]
         try:
-            payment, created = Payment.objects.update_or_create(
+            payment, _written = self.update_or_create(
+                Payment,
                 external_payment_id=self.payment_data["payment_id"],
-                order_id=self.payment_data["order_id"],
-                user=user,
-                product=self.product,
-                source=self.payment_data["source"],
-                provider=self.payment_data["provider"],
-                payment_method=self.payment_data["payment_method"],
+                immutable_fields=["user", "product"],
                 defaults=dict(
+                    order_id=self.payment_data["order_id"],
+                    user=user,
+                    product=self.product,
+                    source=self.payment_data["source"],
+                    provider=self.payment_data["provider"],
+                    payment_method=self.payment_data["payment_method"],
                     is_recurrent=self.payment_data.get("is_recurrent"),
                     status=self.payment_data["status"],
                     paid_at=self.payment_data["paid_at"],
@@ -45,6 +59,7 @@ class PaymentFromShopProcessor(BaseService):
                     bonus_applied=self.payment_data.get("bonus_applied") or 0,
                     promo_code=self.payment_data.get("promo_code") or "",
                     provider_response=self.payment_data.get("provider_response"),
+                    shop_event_fingerprint=self.fingerprint,
                 ),
             )
 
@@ -57,6 +72,47 @@ class PaymentFromShopProcessor(BaseService):
                 _("Unexpected error during payment import: {error}").format(error=str(e)),
             ) from e
 
+    def get_already_applied_payment(self) -> Payment | None:
+        """Replayed and duplicated shop events are found by one lookup of the unique external payment id"""
+        return Payment.objects.filter(external_payment_id=self.payment_data["payment_id"], shop_event_fingerprint=self.fingerprint).first()
+
+    @cached_property
+    def fingerprint(self) -> str:
+        return hashlib.sha256(json.dumps(self.payment_data, sort_keys=True, cls=AppJSONEncoder).encode()).hexdigest()
+
+    @staticmethod
+    def update_or_create(
+        model: type[ModelT],
+        defaults: dict[str, Any],
+        immutable_fields: list[str] | None = None,
+        **lookup: Any,
+    ) -> tuple[ModelT, list[str]]:
+        """Like QuerySet.update_or_create, but write only the fields that differ. Return the instance and names of the written fields.
+
+        Existing instance with a different value of any of `immutable_fields` is not updated, the error is raised instead.
+        """
+        instance = model.objects.select_for_update().filter(**lookup).first()  # type: ignore[attr-defined]
+        if instance is None:
+            try:
+                with atomic():
+                    return model.objects.create(**lookup, **defaults), list(defaults)  # type: ignore[attr-defined]
+            except IntegrityError:
+                instance = model.objects.select_for_update().filter(**lookup).first()  # type: ignore[attr-defined]
+                if instance is None:
+                    raise
+
+        for field_name in immutable_fields or []:
+            if getattr(instance, field_name) != defaults[field_name]:
+                raise PaymentFromShopProcessorException(
+                    _("{model} {instance} belongs to another {field}").format(model=model.__name__, instance=instance.pk, field=field_name),
+                )
+
+        changed = instance.update_changed_fields(**defaults)
+        if changed:
+            instance.save(update_fields=[*changed, "modified"])
+
+        return instance, changed
+
     @cached_property
     def user_with_creation_state(self) -> tuple[User, bool]:
         user_data = self.payment_data["user"]
@@ -83,8 +139,8 @@ class PaymentFromShopProcessor(BaseService):
 
         try:
             product = Product.objects.get(id=product_data["lms_id"])
-            product.shop_id = product_data["shop_id"]
-            product.save(update_fields=["shop_id", "modified"])
+            if product.update_changed_fields(shop_id=product_data["shop_id"]):
+                product.save(update_fields=["shop_id", "modified"])
             return product
         except Product.DoesNotExist:
             raise PaymentFromShopProcessorException(_("Product {product} does not exist").format(product=product_data["lms_id"]))
@@ -93,7 +149,8 @@ class PaymentFromShopProcessor(BaseService):
         instrument = self.create_or_update_payment_instrument(payment)
 
         try:
-            recurrent, created = Recurrent.objects.update_or_create(
+            recurrent, written_fields = self.update_or_create(
+                Recurrent,
                 user=payment.user,
                 product=payment.product,
                 defaults=dict(
@@ -106,7 +163,15 @@ class PaymentFromShopProcessor(BaseService):
                 ),
             )
 
-            if payment.recurrent != recurrent:
+            if "next_charge_date" in written_fields and recurrent.charge_attempts_in_cycle:
+                # a new billing cycle has started in the shop
+                recurrent.charge_attempts_in_cycle = 0
+                recurrent.save(update_fields=["charge_attempts_in_cycle", "modified"])
+
+            if written_fields:
+                recurrent.invalidate_user_access_cache()
+
+            if payment.recurrent_id != recurrent.id:
                 payment.recurrent = recurrent
                 payment.save(update_fields=["recurrent"])
 
@@ -135,7 +200,8 @@ class PaymentFromShopProcessor(BaseService):
 
         attempt = attempts[0]
 
-        instrument, created = PaymentInstrument.objects.update_or_create(
+        instrument, _written = self.update_or_create(
+            PaymentInstrument,
             user=payment.user,
             provider=self.payment_data["recurrent"]["provider"],
             payment_method=self.payment_data["recurrent"]["charge_method"],
@@ -149,7 +215,7 @@ class PaymentFromShopProcessor(BaseService):
             ),
         )
 
-        if instrument and payment.payment_instrument != instrument:
+        if instrument and payment.payment_instrument_id != instrument.id:
             payment.payment_instrument = instrument
             payment.save(update_fields=["payment_instrument"])
 
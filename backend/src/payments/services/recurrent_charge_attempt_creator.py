@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any
 
+from django.db.models import F
 from django.db.transaction import atomic
 from django.utils.timezone import now
 
@@ -46,7 +47,11 @@ class RecurrentChargeAttemptCreator(BaseService):
         return charge_attempt
 
     def update_last_attempt_info(self, recurrent: Recurrent) -> None:
-        recurrent.last_attempt_charge_date = now()
-        recurrent.last_attempt_charge_status = self.status
-
-        recurrent.save(update_fields=["last_attempt_charge_date", "last_attempt_charge_status"])
+        """Count the attempt with one UPDATE, so concurrent attempts of the recurrent are never lost"""
+        Recurrent.objects.filter(pk=recurrent.pk).update(
+            charge_attempts_in_cycle=F("charge_attempts_in_cycle") + 1,
+            last_attempt_charge_date=now(),
+            last_attempt_charge_status=self.status,
+            modified=now(),
+        )
+        recurrent.refresh_from_db(fields=["charge_attempts_in_cycle", "last_attempt_charge_date", "last_attempt_charge_status", "modified"])
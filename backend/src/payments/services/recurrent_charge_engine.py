@@ -0,0 +1,140 @@
+import asyncio
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+import sentry_sdk
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils.translation import gettext as _
+
+from app.services import BaseService
+from payments.models import ChargeAttemptLog, PaymentProvider, Recurrent
+from payments.services.recurrent_charge_metrics_getter import RecurrentChargeMetricsGetter
+from payments.services.recurring_payment_processor import RecurringPaymentProcessor, RecurringPaymentProcessorException
+from payments.services.tinkoff import TinkoffAsyncClient, TinkoffRecurringCharge, TinkoffRecurringInit
+from payments.services.tinkoff.tinkoff_recurring_charge_processor import TinkoffRecurringChargeProcessor
+
+
+@dataclass
+class RecurrentCharge:
+    recurrent: Recurrent
+    payment_id: str = ""
+    response: dict[str, Any] = field(default_factory=dict)
+    error: Exception | None = None
+    traceback: str = ""
+    duration: float = 0
+
+
+@dataclass
+class RecurrentChargeEngine(BaseService):
+    """
+    Charge many recurrents concurrently on one event loop.
+
+    Every recurrent is validated like in RecurringPaymentProcessor, then up to RECURRENT_CHARGE_CONCURRENCY
+    Init → Charge pipelines run at once through one TinkoffAsyncClient. Finished charges are handed in batches
+    of RECURRENT_CHARGE_WRITE_BATCH_SIZE to RECURRENT_CHARGE_DB_WRITERS threads, every batch is saved within one transaction.
+    So the worker waits for the network of many recurrents at once instead of one by one.
+    """
+
+    recurrent_ids: list[str]
+
+    def act(self) -> list[RecurrentCharge]:
+        try:
+            charges = self.get_charges()
+            if charges:
+                asyncio.run(self.charge_all(charges))
+        finally:
+            Recurrent.objects.filter(id__in=self.recurrent_ids).update(charge_claimed_until=None)
+
+        return charges
+
+    def get_charges(self) -> list[RecurrentCharge]:
+        charges = []
+        for recurrent in Recurrent.objects.filter(id__in=self.recurrent_ids).select_related("user", "product", "payment_instrument"):
+            try:
+                RecurringPaymentProcessor(recurrent).validate()
+                if recurrent.payment_instrument.provider != PaymentProvider.TINKOFF:  # type: ignore[union-attr]
+                    raise RecurringPaymentProcessorException(_("Unsupported payment provider."))
+            except RecurringPaymentProcessorException as e:
+                sentry_sdk.capture_exception(e)
+                continue
+
+            charges.append(RecurrentCharge(recurrent=recurrent))
+
+        return charges
+
+    async def charge_all(self, charges: list[RecurrentCharge]) -> None:
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(settings.RECURRENT_CHARGE_CONCURRENCY)
+        batch: list[RecurrentCharge] = []
+        writes: list[asyncio.Future] = []
+
+        with ThreadPoolExecutor(max_workers=settings.RECURRENT_CHARGE_DB_WRITERS, thread_name_prefix="recurrent-charge-writer") as writers:
+
+            async def charge_and_save(client: TinkoffAsyncClient, charge: RecurrentCharge) -> None:
+                async with semaphore:
+                    await self.charge(client, charge)
+
+                batch.append(charge)
+                if len(batch) >= settings.RECURRENT_CHARGE_WRITE_BATCH_SIZE:
+                    writes.append(loop.run_in_executor(writers, self.save, batch.copy()))
+                    batch.clear()
+
+            async with TinkoffAsyncClient(max_connections=settings.RECURRENT_CHARGE_CONCURRENCY) as client:
+                await asyncio.gather(*[charge_and_save(client, charge) for charge in charges])
+
+            if batch:
+                writes.append(loop.run_in_executor(writers, self.save, batch))
+
+            await asyncio.gather(*writes)
+
+    async def charge(self, client: TinkoffAsyncClient, charge: RecurrentCharge) -> None:
+        started = monotonic()
+        try:
+            charge.payment_id = await client.init(TinkoffRecurringInit(charge.recurrent).payload)
+            charge.response = await client.charge(TinkoffRecurringCharge(charge.recurrent, charge.payment_id).payload)
+        except Exception as e:  # noqa: BLE001
+            charge.error = e
+            charge.traceback = traceback.format_exc()
+        finally:
+            charge.duration = monotonic() - started
+
+    def save(self, charges: list[RecurrentCharge]) -> None:
+        """Runs in a writer thread, so closes the connection that django opened for the thread"""
+        try:
+            with transaction.atomic():
+                for charge in charges:
+                    try:
+                        with transaction.atomic():
+                            self.save_charge(charge)
+                    except Exception as e:  # noqa: BLE001
+                        sentry_sdk.capture_exception(e)
+
+                ChargeAttemptLog.objects.bulk_create([self.get_error_log(charge) for charge in charges if charge.error])
+
+            for charge in charges:
+                RecurrentChargeMetricsGetter.record_charge(charge.duration)
+        finally:
+            connections.close_all()
+
+    @staticmethod
+    def save_charge(charge: RecurrentCharge) -> None:
+        if charge.error:
+            sentry_sdk.capture_exception(charge.error)
+            return
+
+        payment, _attempt = TinkoffRecurringChargeProcessor(charge.recurrent).process_charge(charge.response, charge.payment_id)
+        RecurringPaymentProcessor(charge.recurrent).complete_charge(payment)
+
+    @staticmethod
+    def get_error_log(charge: RecurrentCharge) -> ChargeAttemptLog:
+        return ChargeAttemptLog(
+            user=charge.recurrent.user,
+            external_payment_id=charge.payment_id,
+            provider=charge.recurrent.payment_instrument.provider if charge.recurrent.payment_instrument else "",
+            error_message=str(charge.error),
+            traceback=charge.traceback,
+        )
@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.timezone import now
+
+from app.services import BaseService
+from payments.models import Recurrent
+
+
+CHARGE_METRICS_TIMEOUT = 60 * 60 * 24
+
+
+@dataclass
+class RecurrentChargeMetrics:
+    queue_depth: int
+    in_flight: int
+    charges_today: int
+    average_charge_latency_seconds: float | None
+    projected_drain_seconds: float
+
+
+@dataclass
+class RecurrentChargeMetricsGetter(BaseService):
+    """
+    Return state of the recurring charge queue: how many recurrents are due, how long
+    charges take and how long it is going to take to charge every due recurrent.
+    """
+
+    def act(self) -> RecurrentChargeMetrics:
+        due_recurrents = Recurrent.objects.due_for_charge()
+        queue_depth = due_recurrents.count()
+        charges_count, duration_ms = self.get_charge_counters()
+        average_latency = duration_ms / charges_count / 1000 if charges_count else None
+
+        seconds_per_charge = 60 / settings.RECURRENT_CHARGE_RATE_PER_MINUTE
+        if average_latency is not None:
+            seconds_per_charge = max(seconds_per_charge, average_latency / settings.RECURRENT_CHARGE_SHARDS)
+
+        return RecurrentChargeMetrics(
+            queue_depth=queue_depth,
+            in_flight=queue_depth - due_recurrents.not_claimed_for_charge().count(),
+            charges_today=charges_count,
+            average_charge_latency_seconds=average_latency,
+            projected_drain_seconds=queue_depth * seconds_per_charge,
+        )
+
+    @classmethod
+    def record_charge(cls, duration_seconds: float) -> None:
+        count_key, duration_key = cls.get_counter_keys()
+        cache.add(count_key, 0, timeout=CHARGE_METRICS_TIMEOUT)
+        cache.add(duration_key, 0, timeout=CHARGE_METRICS_TIMEOUT)
+        cache.incr(count_key)
+        cache.incr(duration_key, round(duration_seconds * 1000))
+
+    @classmethod
+    def get_charge_counters(cls) -> tuple[int, int]:
+        count_key, duration_key = cls.get_counter_keys()
+        counters = cache.get_many([count_key, duration_key])
+        return counters.get(count_key, 0), counters.get(duration_key, 0)
+
+    @staticmethod
+    def get_counter_keys() -> tuple[str, str]:
+        today = now().date().isoformat()
+        return f"recurrent_charges_count_{today}", f"recurrent_charges_duration_ms_{today}"
@@ -0,0 +1,53 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import timedelta
+from uuid import UUID
+
+from django.conf import settings
+from django.db.transaction import atomic
+from django.utils.timezone import now
+
+from app.services import BaseService
+from payments.models import Recurrent
+
+
+@dataclass
+class RecurrentChargeScheduler(BaseService):
+    """
+    Claim recurrents due for charge page by page and split every page into shards for parallel charging.
+
+    Rows are claimed with `SELECT ... FOR UPDATE SKIP LOCKED` and marked with `charge_claimed_until`,
+    so concurrently running schedulers never dispatch the same recurrent twice. The claim lasts
+    until the moment the recurrent is expected to be charged under the global rate limit plus a safety lease.
+    """
+
+    def act(self) -> Iterator[list[str]]:
+        claimed_count = 0
+        last_id = None
+        while recurrent_ids := self.claim_page(after_id=last_id, claimed_before=claimed_count):
+            last_id = recurrent_ids[-1]
+            claimed_count += len(recurrent_ids)
+            yield from self.split_into_shards(recurrent_ids)
+
+    @atomic
+    def claim_page(self, after_id: UUID | None, claimed_before: int) -> list[UUID]:
+        recurrents = Recurrent.objects.due_for_charge().not_claimed_for_charge().select_for_update(skip_locked=True).order_by("id")
+        if after_id is not None:
+            recurrents = recurrents.filter(id__gt=after_id)
+
+        recurrent_ids = list(recurrents.values_list("id", flat=True)[: settings.RECURRENT_CHARGE_BATCH_SIZE])
+
+        expected_charge_delay = (claimed_before + len(recurrent_ids)) * 60 / settings.RECURRENT_CHARGE_RATE_PER_MINUTE
+        Recurrent.objects.filter(id__in=recurrent_ids).update(
+            charge_claimed_until=now() + timedelta(seconds=expected_charge_delay + settings.RECURRENT_CHARGE_CLAIM_SECONDS),
+        )
+
+        return recurrent_ids
+
+    @staticmethod
+    def split_into_shards(recurrent_ids: list[UUID]) -> list[list[str]]:
+        shards: list[list[str]] = [[] for _ in range(settings.RECURRENT_CHARGE_SHARDS)]
+        for recurrent_id in recurrent_ids:
+            shards[recurrent_id.int % settings.RECURRENT_CHARGE_SHARDS].append(str(recurrent_id))
+
+        return [shard for shard in shards if shard]
@@ -35,19 +35,22 @@ class RecurringPaymentProcessor(BaseService):
     def act(self) -> None:
         try:
             payment, _ = self.run_charge()
-            self.recurrent.refresh_from_db()
-
-            if not payment:
-                self.maybe_deactivate_recurrent()
-                return
-
-            self.update_next_charge_date()
-            self.grant_access_to_product(payment)
+            self.complete_charge(payment)
 
         except RecurringPaymentProcessorException as exc:
             self._log_error(exc)
             raise
 
+    def complete_charge(self, payment: Payment | None) -> None:
+        self.recurrent.refresh_from_db()
+
+        if not payment:
+            self.maybe_deactivate_recurrent()
+            return
+
+        self.update_next_charge_date()
+        self.grant_access_to_product(payment)
+
     def run_charge(self) -> tuple[Payment | None, RecurrentChargeAttempt | None]:
         from payments.services import TinkoffRecurringChargeProcessor
 
@@ -59,12 +62,7 @@ class RecurringPaymentProcessor(BaseService):
         raise RecurringPaymentProcessorException(_("Unsupported payment provider."))
 
     def maybe_deactivate_recurrent(self) -> None:
-        attempts_count = RecurrentChargeAttempt.objects.filter(
-            recurrent=self.recurrent,
-            created__gte=self.recurrent.next_charge_date,
-        ).count()
-
-        if attempts_count >= MAX_CHARGE_ATTEMPTS:
+        if self.recurrent.charge_attempts_in_cycle >= MAX_CHARGE_ATTEMPTS:
             self.recurrent.deactivate()
 
     def update_next_charge_date(self) -> None:
@@ -123,12 +121,7 @@ class RecurringPaymentProcessor(BaseService):
             raise RecurringPaymentProcessorException(_("Last successful charge is not before next charge date."))
 
     def validate_charge_attempts_count(self) -> None:
-        attempts_count = RecurrentChargeAttempt.objects.filter(
-            recurrent=self.recurrent,
-            created__gte=self.recurrent.next_charge_date,
-        ).count()
-
-        if attempts_count >= MAX_CHARGE_ATTEMPTS:
+        if self.recurrent.charge_attempts_in_cycle >= MAX_CHARGE_ATTEMPTS:
             raise RecurringPaymentProcessorException(_("Too many charge attempts."))
 
     def validate_payment_exists(self) -> None:
@@ -1,9 +1,11 @@
+from payments.services.tinkoff.tinkoff_async_client import TinkoffAsyncClient
 from payments.services.tinkoff.tinkoff_recurring_charge import TinkoffRecurringCharge, TinkoffRecurringChargeException
 from payments.services.tinkoff.tinkoff_recurring_init import TinkoffRecurringInit, TinkoffRecurringInitException
 from payments.services.tinkoff.tinkoff_token_generator import TinkoffTokenGenerator
 
 
 __all__ = [
+    "TinkoffAsyncClient",
     "TinkoffRecurringCharge",
     "TinkoffRecurringChargeException",
     "TinkoffRecurringInit",
@@ -0,0 +1,56 @@
+from types import TracebackType
+from typing import Any
+
+import httpx
+from django.conf import settings
+
+from payments.services.tinkoff.tinkoff_recurring_init import TinkoffRecurringInitException
+from payments.services.tinkoff.tinkoff_token_generator import TinkoffTokenGenerator
+
+
+class TinkoffAsyncClient:
+    """
+    Asynchronous client for Tinkoff API used by RecurrentChargeEngine.
+
+    All requests go through one HTTP/2 client, so concurrent Init and Charge calls are multiplexed
+    over a few keep-alive connections instead of opening a connection per call.
+    """
+
+    def __init__(self, max_connections: int) -> None:
+        self.client = httpx.AsyncClient(
+            base_url=settings.TINKOFF_API_URL,
+            http2=True,
+            timeout=httpx.Timeout(settings.HTTP_READ_TIMEOUT, connect=settings.HTTP_CONNECT_TIMEOUT),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=settings.HTTP_RETRIES,  # connection errors only, Init and Charge are not idempotent
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            ),
+        )
+
+    async def __aenter__(self) -> "TinkoffAsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None) -> None:
+        await self.client.aclose()
+
+    async def init(self, payload: dict[str, Any]) -> str:
+        data = await self.post("Init", payload)
+
+        if not data.get("Success") or not data.get("PaymentId"):
+            raise TinkoffRecurringInitException(f"Tinkoff Init failed: {data}")
+
+        return str(data["PaymentId"])
+
+    async def charge(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return await self.post("Charge", payload)
+
+    async def post(self, method: str, payload: dict[str, Any]) -> dict[str, Any]:
+        response = await self.client.post(
+            f"/{method}",
+            json={
+                **payload,
+                "Token": TinkoffTokenGenerator(payload)(),
+            },
+        )
+        return response.json()
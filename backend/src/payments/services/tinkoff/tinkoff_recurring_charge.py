@@ -3,11 +3,11 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
-import requests
 import sentry_sdk
 from django.conf import settings
 from django.utils.functional import cached_property
 
+from app import http_transport
 from app.exceptions import AppServiceException
 from app.services import BaseService
 from payments.models import ChargeAttemptLog, Recurrent
@@ -42,7 +42,7 @@ class TinkoffRecurringCharge(BaseService):
 
     def post_tinkoff_charge(self, payload: dict[str, Any]) -> dict[str, Any]:
         url = f"{settings.TINKOFF_API_URL}/Charge"
-        response = requests.post(url, json=payload, timeout=20)
+        response = http_transport.post(url, json=payload)
         response.json()
         return response.json()
 
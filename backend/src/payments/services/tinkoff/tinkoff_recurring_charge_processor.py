@@ -4,13 +4,11 @@ from decimal import Decimal
 from typing import Any
 
 import sentry_sdk
-from django.db.transaction import on_commit
 from django.utils.functional import cached_property
 from django.utils.timezone import now
 
 from app.exceptions import AppServiceException
 from app.services import BaseService
-from mindbox.tasks import send_payment_attempt
 from payments.models import (
     ChargeAttemptLog,
     Payment,
@@ -40,18 +38,22 @@ class TinkoffRecurringChargeProcessor(BaseService):
             payment_id = TinkoffRecurringInit(self.recurrent)()
             recurring_charge = TinkoffRecurringCharge(self.recurrent, payment_id)()
 
-            if not recurring_charge:
-                return None, None
-
-            payment = self.create_payment(recurring_charge, payment_id)
-            last_charge_attempt = self.create_charge_attempt(recurring_charge, payment)
-
-            return payment, last_charge_attempt
+            return self.process_charge(recurring_charge, payment_id)
 
         except TinkoffRecurringChargeProcessorException as exc:
             self._log_error(exc, recurring_charge)
             raise
 
+    def process_charge(self, recurring_charge: dict[str, Any], payment_id: str) -> tuple[Payment | None, RecurrentChargeAttempt | None]:
+        """Save the Charge response, used by RecurrentChargeEngine that sends requests itself"""
+        if not recurring_charge:
+            return None, None
+
+        payment = self.create_payment(recurring_charge, payment_id)
+        last_charge_attempt = self.create_charge_attempt(recurring_charge, payment)
+
+        return payment, last_charge_attempt
+
     def create_payment(self, recurring_charge: dict[str, Any], payment_id: str) -> Payment | None:
         from payments.services import PaymentCreator
 
@@ -76,6 +78,8 @@ class TinkoffRecurringChargeProcessor(BaseService):
         )()
 
     def create_charge_attempt(self, recurring_charge: dict[str, Any], payment: Payment | None) -> RecurrentChargeAttempt:
+        from mindbox.models import MindboxOutboxOperation
+        from mindbox.services import MindboxOutboxEventCreator
         from payments.services import RecurrentChargeAttemptCreator
 
         recurring_charge_attempt = RecurrentChargeAttemptCreator(
@@ -90,7 +94,15 @@ class TinkoffRecurringChargeProcessor(BaseService):
             external_payment_id=recurring_charge.get("PaymentId", ""),
         )()
 
-        on_commit(lambda: send_payment_attempt.delay(str(self.recurrent.user.id), str(recurring_charge_attempt.id)))
+        MindboxOutboxEventCreator(
+            user=self.recurrent.user,
+            operation=MindboxOutboxOperation.SEND_PAYMENT_ATTEMPT,
+            params={
+                "recurrent_charge_attempt_id": str(recurring_charge_attempt.id),
+                "attempt_number": str(self.recurrent.charge_attempts_in_cycle),
+                "attempt_success": recurring_charge_attempt.status == RecurrentChargeStatus.SUCCESS,
+            },
+        )()
 
         return recurring_charge_attempt
 
@@ -2,12 +2,12 @@ import traceback
 from dataclasses import dataclass
 from typing import Any
 
-import requests
 import sentry_sdk
 from django.conf import settings
 from django.utils.functional import cached_property
 from django.utils.timezone import now
 
+from app import http_transport
 from app.exceptions import AppServiceException
 from app.services import BaseService
 from payments.models import ChargeAttemptLog, Recurrent
@@ -43,7 +43,7 @@ class TinkoffRecurringInit(BaseService):
 
     def post_tinkoff_init(self, payload: dict[str, Any]) -> str:
         url = f"{settings.TINKOFF_API_URL}/Init"
-        response = requests.post(url, json=payload, timeout=20)
+        response = http_transport.post(url, json=payload)
         data = response.json()
 
         if not data.get("Success") or not data.get("PaymentId"):
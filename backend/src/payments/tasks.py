@@ -1,25 +1,68 @@
-from django.utils.timezone import now
+from time import monotonic
+
+import sentry_sdk
+from django.conf import settings
 
 from app.celery import celery
-from payments.models import Recurrent, RecurrentStatus
-from payments.services import RecurringPaymentProcessor
+from app.utils import FixedWindowRateLimiter
+from payments.models import Recurrent
+from payments.services import RecurrentChargeEngine, RecurrentChargeMetricsGetter, RecurrentChargeScheduler, RecurringPaymentProcessor
 
 
 @celery.task(name="schedule_recurrent_charges", max_retries=0)
 def schedule_recurrent_charges() -> None:
-    today = now().date()
+    for recurrent_ids in RecurrentChargeScheduler()():
+        run_recurrent_charges.delay(recurrent_ids)
+
+
+@celery.task(name="run_recurrent_charges", max_retries=0)
+def run_recurrent_charges(recurrent_ids: list[str]) -> None:
+    """Charge recurrents within the global rate limit, postpone the rest when the limit is exhausted"""
+    limiter = FixedWindowRateLimiter(name="recurrent_charges", capacity=settings.RECURRENT_CHARGE_RATE_PER_MINUTE)
 
-    recurrents = Recurrent.objects.filter(
-        status=RecurrentStatus.ACTIVE,
-        next_charge_date__lte=today,
-        payment_instrument__isnull=False,
-    )
+    if settings.RECURRENT_CHARGE_ASYNC_ENGINE:
+        charge_recurrents_concurrently(recurrent_ids, limiter)
+        return
 
-    for recurrent in recurrents:
-        run_recurrent_charge.delay(str(recurrent.id))
+    for index, recurrent_id in enumerate(recurrent_ids):
+        wait_seconds = limiter.acquire()
+        if wait_seconds:
+            run_recurrent_charges.apply_async(args=[recurrent_ids[index:]], countdown=wait_seconds)
+            return
 
+        try:
+            charge_recurrent(recurrent_id)
+        except Exception as e:  # noqa: BLE001
+            sentry_sdk.capture_exception(e)
 
-@celery.task(name="run_recurrent_charge", max_retries=0, rate_limit="3/m")
+
+@celery.task(name="run_recurrent_charge", max_retries=0)
 def run_recurrent_charge(recurrent_id: str) -> None:
-    recurrent = Recurrent.objects.get(id=recurrent_id)
-    RecurringPaymentProcessor(recurrent)()
+    run_recurrent_charges([recurrent_id])
+
+
+def charge_recurrents_concurrently(recurrent_ids: list[str], limiter: FixedWindowRateLimiter) -> None:
+    for index in range(len(recurrent_ids)):
+        wait_seconds = limiter.acquire()
+        if wait_seconds:
+            run_recurrent_charges.apply_async(args=[recurrent_ids[index:]], countdown=wait_seconds)
+            recurrent_ids = recurrent_ids[:index]
+            break
+
+    if not recurrent_ids:
+        return
+
+    try:
+        RecurrentChargeEngine(recurrent_ids)()
+    except Exception as e:  # noqa: BLE001
+        sentry_sdk.capture_exception(e)
+
+
+def charge_recurrent(recurrent_id: str) -> None:
+    started = monotonic()
+    try:
+        recurrent = Recurrent.objects.get(id=recurrent_id)
+        RecurringPaymentProcessor(recurrent)()
+    finally:
+        Recurrent.objects.filter(id=recurrent_id).update(charge_claimed_until=None)
+        RecurrentChargeMetricsGetter.record_charge(monotonic() - started)
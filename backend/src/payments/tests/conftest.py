@@ -101,4 +101,4 @@ def mock_tinkoff_post(monkeypatch):
             )
         return MockResponse({})
 
-    monkeypatch.setattr("requests.post", mock_post)
+    monkeypatch.setattr("app.http_transport.post", mock_post)
@@ -1,4 +1,7 @@
+from datetime import datetime
+
 import pytest
+from django.db import IntegrityError
 
 from payments.models import Payment, PaymentInstrument, RecurrentChargeAttempt, RecurrentChargeStatus
 from payments.services import PaymentFromShopProcessor, PaymentFromShopProcessorException
@@ -27,6 +30,60 @@ def test_idempotency_of_payment_creation(payment_data):
     assert Payment.objects.count() == 1
 
 
+def test_duplicate_event_is_not_applied_again(payment_data, mocker):
+    PaymentFromShopProcessor(payment_data)()
+    user_editor = mocker.patch("payments.services.payment_from_shop_processor.UserEditor")
+
+    payment = PaymentFromShopProcessor(payment_data)()
+
+    user_editor.assert_not_called()
+    assert payment == Payment.objects.get()
+
+
+def test_changed_event_updates_payment(payment_data):
+    first = PaymentFromShopProcessor(payment_data)()
+
+    payment_data["status"] = "REFUNDED"
+    second = PaymentFromShopProcessor(payment_data)()
+    first.refresh_from_db()
+
+    assert second.id == first.id
+    assert first.status == "REFUNDED"
+    assert first.shop_event_fingerprint == PaymentFromShopProcessor(payment_data).fingerprint
+
+
+def test_payment_of_another_user_is_not_moved(payment_data, factory):
+    payment = PaymentFromShopProcessor(payment_data)()
+
+    payment_data["user"]["email"] = factory.user().username
+    with pytest.raises(PaymentFromShopProcessorException, match="belongs to another user"):
+        PaymentFromShopProcessor(payment_data)()
+
+    assert Payment.objects.get().user == payment.user
+
+
+def test_payment_of_another_product_is_not_moved(payment_data, factory):
+    payment = PaymentFromShopProcessor(payment_data)()
+
+    payment_data["product"]["lms_id"] = factory.product().id
+    with pytest.raises(PaymentFromShopProcessorException, match="belongs to another product"):
+        PaymentFromShopProcessor(payment_data)()
+
+    assert Payment.objects.get().product == payment.product
+
+
+def test_integrity_error_of_creation_is_not_replaced(payment_data):
+    with pytest.raises(IntegrityError):
+        PaymentFromShopProcessor.update_or_create(Payment, external_payment_id="ext-1", defaults={"order_id": "order-1", "order_price": None})
+
+
+def test_product_is_bound_to_shop_id(payment_data, product):
+    PaymentFromShopProcessor(payment_data)()
+    product.refresh_from_db()
+
+    assert product.shop_id == "shop-789"
+
+
 def test_optional_fields_defaults(payment_data):
     for key in ("discount_price", "bonus_applied", "promo_code", "provider_response"):
         payment_data.pop(key, None)
@@ -80,6 +137,30 @@ def test_recurrent_is_updated(payment_data, recurrent_data):
     assert second.recurrent.id == recurrent.id
 
 
+def test_charge_attempts_in_cycle_are_kept_if_next_charge_date_is_unchanged(payment_data, recurrent_data):
+    payment_data["recurrent"] = recurrent_data.copy()
+    recurrent = PaymentFromShopProcessor(payment_data)().recurrent
+    recurrent.setattr_and_save("charge_attempts_in_cycle", 2)
+
+    payment_data["recurrent"]["amount"] = 150
+    PaymentFromShopProcessor(payment_data)()
+    recurrent.refresh_from_db()
+
+    assert recurrent.charge_attempts_in_cycle == 2
+
+
+def test_charge_attempts_in_cycle_are_reset_with_next_charge_date(payment_data, recurrent_data):
+    payment_data["recurrent"] = recurrent_data.copy()
+    recurrent = PaymentFromShopProcessor(payment_data)().recurrent
+    recurrent.setattr_and_save("charge_attempts_in_cycle", 2)
+
+    payment_data["recurrent"]["next_charge_date"] = datetime(2030, 3, 1, 12, 0)
+    PaymentFromShopProcessor(payment_data)()
+    recurrent.refresh_from_db()
+
+    assert recurrent.charge_attempts_in_cycle == 0
+
+
 def test_recurrent_not_created_if_not_present(payment_data):
     payment = PaymentFromShopProcessor(payment_data)()
 
@@ -104,3 +104,16 @@ def test_charge_attempt_missing_required(factory):
 
     with pytest.raises(TypeError):
         RecurrentChargeAttemptCreator(recurrent=recurrent)()
+
+
+def test_charge_attempts_in_cycle_are_counted(factory):
+    user = factory.user()
+    recurrent = factory.recurrent(user=user, product=factory.product(), payment_instrument=factory.payment_instrument(user=user))
+
+    for _ in range(2):
+        RecurrentChargeAttemptCreator(recurrent=recurrent, amount=Decimal("50.00"), provider_response={}, status=RecurrentChargeStatus.FAIL)()
+
+    assert recurrent.charge_attempts_in_cycle == 2
+    recurrent.refresh_from_db()
+    assert recurrent.charge_attempts_in_cycle == 2
+    assert recurrent.last_attempt_charge_status == RecurrentChargeStatus.FAIL
@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+import pytest
+from django.utils.timezone import now
+
+from payments.models import ChargeAttemptLog, Payment, PaymentStatus, RecurrentChargeAttempt, RecurrentChargeStatus
+from payments.services import RecurrentChargeEngine
+from product_access.models import ProductAccess
+
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),  # charges are saved by writer threads with their own connections
+]
+
+
+@pytest.fixture(autouse=True)
+def _settings(settings):
+    settings.RECURRENT_CHARGE_CONCURRENCY = 2
+    settings.RECURRENT_CHARGE_DB_WRITERS = 2
+    settings.RECURRENT_CHARGE_WRITE_BATCH_SIZE = 2
+
+
+@pytest.fixture
+def tinkoff_responses():
+    return {
+        "Init": {"Success": True, "Status": "NEW", "PaymentId": "3093639567"},
+        "Charge": {"Success": True, "Status": "CONFIRMED", "PaymentId": "13660", "Amount": 100000},
+    }
+
+
+@pytest.fixture(autouse=True)
+def tinkoff_post(mocker, tinkoff_responses):
+    async def post(self, method, payload):
+        return tinkoff_responses[method]
+
+    return mocker.patch("payments.services.tinkoff.TinkoffAsyncClient.post", autospec=True, side_effect=post)
+
+
+@pytest.fixture
+def make_recurrent(factory):
+    def _make_recurrent():
+        user = factory.user()
+        return factory.recurrent(
+            user=user,
+            product=factory.product(lifetime=365),
+            payment_instrument=factory.payment_instrument(user=user, rebill_id="rebill-1"),
+            status="ACTIVE",
+            amount=1000,
+            next_charge_date=now() - timedelta(minutes=1),
+        )
+
+    return _make_recurrent
+
+
+def test_every_recurrent_is_charged(make_recurrent, tinkoff_post):
+    recurrents = [make_recurrent() for _ in range(5)]
+
+    RecurrentChargeEngine([str(recurrent.id) for recurrent in recurrents])()
+
+    assert Payment.objects.filter(status=PaymentStatus.PAID).count() == 5
+    assert RecurrentChargeAttempt.objects.filter(status=RecurrentChargeStatus.SUCCESS).count() == 5
+    assert ProductAccess.objects.count() == 5
+    assert [call.args[1] for call in tinkoff_post.call_args_list].count("Charge") == 5
+
+
+def test_next_charge_date_is_updated(make_recurrent):
+    recurrent = make_recurrent()
+    next_charge_date = recurrent.next_charge_date
+
+    RecurrentChargeEngine([str(recurrent.id)])()
+    recurrent.refresh_from_db()
+
+    assert recurrent.next_charge_date > next_charge_date
+
+
+def test_failed_charge_creates_attempt_without_payment(make_recurrent, tinkoff_responses):
+    tinkoff_responses["Charge"] = {"Success": False, "Status": "REJECTED", "PaymentId": "13660", "ErrorCode": "1051"}
+    recurrent = make_recurrent()
+
+    RecurrentChargeEngine([str(recurrent.id)])()
+
+    assert not Payment.objects.exists()
+    assert RecurrentChargeAttempt.objects.get().error_code == "1051"
+
+
+def test_init_error_is_logged(make_recurrent, tinkoff_responses):
+    tinkoff_responses["Init"] = {"Success": False, "ErrorCode": "9999"}
+    recurrent = make_recurrent()
+
+    RecurrentChargeEngine([str(recurrent.id)])()
+
+    log = ChargeAttemptLog.objects.get()
+    assert log.user == recurrent.user
+    assert "Tinkoff Init failed" in log.error_message
+    assert not RecurrentChargeAttempt.objects.exists()
+
+
+def test_invalid_recurrent_is_not_charged(make_recurrent, tinkoff_post):
+    recurrent = make_recurrent()
+    recurrent.setattr_and_save("next_charge_date", now() + timedelta(days=1))
+
+    RecurrentChargeEngine([str(recurrent.id)])()
+
+    tinkoff_post.assert_not_called()
+
+
+def test_claims_are_released(make_recurrent):
+    recurrent = make_recurrent()
+    recurrent.setattr_and_save("charge_claimed_until", now() + timedelta(hours=1))
+
+    RecurrentChargeEngine([str(recurrent.id)])()
+    recurrent.refresh_from_db()
+
+    assert recurrent.charge_claimed_until is None
@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+import pytest
+from django.utils.timezone import now
+
+from payments.models import Recurrent, RecurrentStatus
+from payments.services import RecurrentChargeScheduler
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture(autouse=True)
+def _settings(settings):
+    settings.RECURRENT_CHARGE_BATCH_SIZE = 2
+    settings.RECURRENT_CHARGE_SHARDS = 2
+
+
+@pytest.fixture
+def make_recurrent(factory):
+    def _make_recurrent(**kwargs):
+        user = factory.user()
+        return factory.recurrent(
+            user=user,
+            payment_instrument=factory.payment_instrument(user=user),
+            next_charge_date=now() - timedelta(days=1),
+            **kwargs,
+        )
+
+    return _make_recurrent
+
+
+def scheduled_ids():
+    return {recurrent_id for shard in RecurrentChargeScheduler()() for recurrent_id in shard}
+
+
+def test_all_due_recurrents_are_scheduled(make_recurrent):
+    recurrents = [make_recurrent() for _ in range(5)]
+
+    assert scheduled_ids() == {str(recurrent.id) for recurrent in recurrents}
+
+
+def test_scheduled_recurrents_are_claimed(make_recurrent):
+    recurrent = make_recurrent()
+
+    scheduled_ids()
+
+    recurrent.refresh_from_db()
+    assert recurrent.charge_claimed_until > now()
+
+
+def test_claimed_recurrents_are_not_scheduled_twice(make_recurrent):
+    make_recurrent()
+    scheduled_ids()
+
+    assert scheduled_ids() == set()
+
+
+def test_expired_claim_is_scheduled_again(make_recurrent):
+    recurrent = make_recurrent()
+    recurrent.setattr_and_save("charge_claimed_until", now() - timedelta(minutes=1))
+
+    assert scheduled_ids() == {str(recurrent.id)}
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"status": RecurrentStatus.CANCELLED},
+        {"next_charge_date": now() + timedelta(days=2)},
+    ],
+)
+def test_not_due_recurrents_are_not_scheduled(make_recurrent, kwargs):
+    recurrent = make_recurrent()
+    Recurrent.objects.filter(id=recurrent.id).update(**kwargs)
+
+    assert scheduled_ids() == set()
+
+
+def test_batch_is_split_into_shards(make_recurrent):
+    recurrents = [make_recurrent() for _ in range(2)]
+
+    shards = RecurrentChargeScheduler.split_into_shards([recurrent.id for recurrent in recurrents])
+
+    assert 1 <= len(shards) <= 2
+    assert {recurrent_id for shard in shards for recurrent_id in shard} == {str(recurrent.id) for recurrent in recurrents}
@@ -4,7 +4,8 @@ from decimal import Decimal
 import pytest
 from django.utils.timezone import now
 
-from payments.models import Payment, PaymentProvider, PaymentStatus, RecurrentChargeAttempt, RecurrentChargeStatus
+from payments.models import Payment, PaymentProvider, PaymentStatus, RecurrentChargeStatus
+from payments.services import RecurrentChargeAttemptCreator
 from payments.services.recurring_payment_processor import MAX_CHARGE_ATTEMPTS, RecurringPaymentProcessor, RecurringPaymentProcessorException
 from product_access.models import ProductAccess
 
@@ -53,13 +54,13 @@ def test_deactivate_on_max_attempts(factory, monkeypatch):
     recurrent = make_recurrent(factory)
 
     def charge_processor_act(self):
-        RecurrentChargeAttempt.objects.create(recurrent=recurrent, status=RecurrentChargeStatus.FAIL, amount=1000)
+        RecurrentChargeAttemptCreator(recurrent=recurrent, amount=1000, provider_response={}, status=RecurrentChargeStatus.FAIL)()
         return (None, None)
 
     monkeypatch.setattr("payments.services.TinkoffRecurringChargeProcessor.act", charge_processor_act)
 
     for _ in range(MAX_CHARGE_ATTEMPTS - 1):
-        RecurrentChargeAttempt.objects.create(recurrent=recurrent, status=RecurrentChargeStatus.FAIL, amount=1000)
+        RecurrentChargeAttemptCreator(recurrent=recurrent, amount=1000, provider_response={}, status=RecurrentChargeStatus.FAIL)()
 
     RecurringPaymentProcessor(recurrent=recurrent)()
     recurrent.refresh_from_db()
@@ -67,6 +68,19 @@ def test_deactivate_on_max_attempts(factory, monkeypatch):
     assert recurrent.is_active() is False
 
 
+def test_successful_charge_resets_attempts_in_cycle(factory, monkeypatch):
+    recurrent = make_recurrent(factory)
+    recurrent.setattr_and_save("charge_attempts_in_cycle", MAX_CHARGE_ATTEMPTS - 1)
+    payment = type("Payment", (), {"status": PaymentStatus.PAID, "amount": 1000, "order_id": "order-123"})()
+    monkeypatch.setattr("payments.services.TinkoffRecurringChargeProcessor.act", lambda self: (payment, None))
+
+    RecurringPaymentProcessor(recurrent=recurrent)()
+    recurrent.refresh_from_db()
+
+    assert recurrent.charge_attempts_in_cycle == 0
+    assert recurrent.is_active() is True
+
+
 def test_validate_recurrent_status_inactive(factory):
     recurrent = make_recurrent(factory, status="INACTIVE")
     processor = RecurringPaymentProcessor(recurrent=recurrent)
@@ -119,8 +133,7 @@ def test_validate_last_successful_charge_not_before_next(factory):
 
 def test_validate_charge_attempts_count_exceeded(factory):
     recurrent = make_recurrent(factory)
-    for _ in range(MAX_CHARGE_ATTEMPTS):
-        RecurrentChargeAttempt.objects.create(recurrent=recurrent, created=now(), status=RecurrentChargeStatus.FAIL, amount=1000)
+    recurrent.setattr_and_save("charge_attempts_in_cycle", MAX_CHARGE_ATTEMPTS)
     processor = RecurringPaymentProcessor(recurrent=recurrent)
 
     with pytest.raises(RecurringPaymentProcessorException, match="Too many charge attempts"):
@@ -1,6 +1,6 @@
 import pytest
-import requests
 
+from app import http_transport
 from payments.models import PaymentStatus, RecurrentChargeStatus
 from payments.services.tinkoff.tinkoff_recurring_charge_processor import TinkoffRecurringChargeProcessor, TinkoffRecurringChargeProcessorException
 
@@ -59,8 +59,8 @@ def test_charge_processor_no_payment_on_fail(factory):
 
         return SuccessResponse()
 
-    orig_post = requests.post
-    requests.post = mock_post
+    orig_post = http_transport.post
+    http_transport.post = mock_post
     try:
         payment, charge_attempt = TinkoffRecurringChargeProcessor(recurrent=recurrent)()
 
@@ -69,7 +69,7 @@ def test_charge_processor_no_payment_on_fail(factory):
         assert charge_attempt.status == RecurrentChargeStatus.FAIL
         assert charge_attempt.external_payment_id == "99999"
     finally:
-        requests.post = orig_post
+        http_transport.post = orig_post
 
 
 def test_charge_processor_handles_exceptions(factory, monkeypatch):
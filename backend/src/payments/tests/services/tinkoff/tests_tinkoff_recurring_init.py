@@ -38,7 +38,7 @@ def test_init_error(monkeypatch, factory):
         def json(self):
             return {"Success": False, "ErrorCode": "5", "Message": "fail"}
 
-    monkeypatch.setattr("requests.post", lambda *a, **kw: ErrorResponse())
+    monkeypatch.setattr("app.http_transport.post", lambda *a, **kw: ErrorResponse())
     service = TinkoffRecurringInit(recurrent=recurrent)
     with pytest.raises(TinkoffRecurringInitException):
         service()
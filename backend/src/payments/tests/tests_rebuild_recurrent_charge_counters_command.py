@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils.timezone import now
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def recurrent(factory, user, product, payment_instrument):
+    recurrent = factory.recurrent(user=user, product=product, payment_instrument=payment_instrument, next_charge_date=now() - timedelta(days=1))
+    factory.recurrent_charge_attempt(recurrent=recurrent, status="FAIL")
+    factory.recurrent_charge_attempt(recurrent=recurrent, status="FAIL")
+    return recurrent
+
+
+def test_counters_are_rebuilt_from_attempts(recurrent):
+    call_command("rebuild_recurrent_charge_counters")
+
+    recurrent.refresh_from_db()
+    assert recurrent.charge_attempts_in_cycle == 2
+
+
+def test_attempts_of_previous_cycles_are_not_counted(recurrent):
+    recurrent.setattr_and_save("next_charge_date", now() + timedelta(days=1))
+
+    call_command("rebuild_recurrent_charge_counters")
+
+    recurrent.refresh_from_db()
+    assert recurrent.charge_attempts_in_cycle == 0
+
+
+def test_dry_run_does_not_change_counters(recurrent):
+    call_command("rebuild_recurrent_charge_counters", dry_run=True)
+
+    recurrent.refresh_from_db()
+    assert recurrent.charge_attempts_in_cycle == 0
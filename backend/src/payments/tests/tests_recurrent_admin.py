@@ -0,0 +1,41 @@
+import pytest
+from django.contrib.admin import site
+
+from payments.admin.recurrent import RecurrentAdmin
+from payments.models import Recurrent, RecurrentStatus
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def model_admin():
+    return RecurrentAdmin(Recurrent, site)
+
+
+@pytest.fixture
+def recurrent(factory):
+    return factory.recurrent(user=factory.user(), product=factory.product(), status=RecurrentStatus.ACTIVE)
+
+
+@pytest.fixture
+def invalidator(mocker):
+    return mocker.patch("product_access.services.UserProductAccessCacheInvalidator")
+
+
+def test_user_access_cache_is_invalidated_when_recurrent_is_saved(model_admin, recurrent, invalidator, rf, django_capture_on_commit_callbacks):
+    recurrent.status = RecurrentStatus.CANCELLED
+
+    with django_capture_on_commit_callbacks(execute=True):
+        model_admin.save_model(rf.post("/"), recurrent, form=None, change=True)
+
+    invalidator.assert_called_once_with(user=recurrent.user)
+
+
+def test_user_access_cache_is_invalidated_when_recurrent_is_deleted(model_admin, recurrent, invalidator, rf, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        model_admin.delete_model(rf.post("/"), recurrent)
+
+    invalidator.assert_called_once_with(user=recurrent.user)
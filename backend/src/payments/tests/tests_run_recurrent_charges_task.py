@@ -0,0 +1,49 @@
+import pytest
+
+from payments.tasks import run_recurrent_charges
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def charge_recurrent(mocker):
+    return mocker.patch("payments.tasks.charge_recurrent")
+
+
+@pytest.fixture
+def postpone(mocker):
+    return mocker.patch("payments.tasks.run_recurrent_charges.apply_async")
+
+
+def test_recurrents_are_charged_within_rate_limit(charge_recurrent, postpone, mocker):
+    mocker.patch("app.utils.FixedWindowRateLimiter.acquire", side_effect=[0, 0, 30])
+
+    run_recurrent_charges(["first", "second", "third", "fourth"])
+
+    assert [call.args[0] for call in charge_recurrent.call_args_list] == ["first", "second"]
+    postpone.assert_called_once_with(args=[["third", "fourth"]], countdown=30)
+
+
+def test_failed_charge_does_not_stop_batch(charge_recurrent, postpone, mocker):
+    mocker.patch("app.utils.FixedWindowRateLimiter.acquire", return_value=0)
+    charge_recurrent.side_effect = [Exception("boom"), None]
+
+    run_recurrent_charges(["first", "second"])
+
+    assert charge_recurrent.call_count == 2
+    postpone.assert_not_called()
+
+
+def test_async_engine_charges_allowed_recurrents_at_once(charge_recurrent, postpone, mocker, settings):
+    settings.RECURRENT_CHARGE_ASYNC_ENGINE = True
+    mocker.patch("app.utils.FixedWindowRateLimiter.acquire", side_effect=[0, 0, 30])
+    engine = mocker.patch("payments.tasks.RecurrentChargeEngine")
+
+    run_recurrent_charges(["first", "second", "third", "fourth"])
+
+    engine.assert_called_once_with(["first", "second"])
+    postpone.assert_called_once_with(args=[["third", "fourth"]], countdown=30)
+    charge_recurrent.assert_not_called()
@@ -50,6 +50,20 @@ class ProductAccessAdmin(ModelAdmin):
         ("revoked_at", EmptyFieldListFilter),
     ]
     ordering = ["-created"]
+    actions = ["export_as_csv"]
+    export_action_names = ["export_as_csv"]
+    export_field_names = [
+        "id",
+        "order_id",
+        "user__username",
+        "product__name",
+        "start_date",
+        "end_date",
+        "granted_at",
+        "revoked_at",
+        "created",
+    ]
+    export_compress = True
 
     def has_add_permission(self, request: HttpRequest) -> bool:
         return False
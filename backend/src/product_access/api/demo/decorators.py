@@ -3,13 +3,16 @@ from collections.abc import Callable
 from typing import Any
 
 import sentry_sdk
+from django.conf import settings
 from django.db import InternalError, OperationalError
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.status import HTTP_202_ACCEPTED
 from rest_framework.views import APIView
 
 from app.exceptions import AppDatabaseException
 from app.models import ShopDeadLetter
+from app.services import ShopInboxEventCreator
 
 
 ViewMethod = Callable[..., Response]
@@ -35,3 +38,19 @@ def dead_letter_creation(event_type: str) -> Decorator:
         return drf_handler_method
 
     return decorator
+
+
+def shop_event_ingestion(event_type: str) -> Decorator:
+    """Store events of types listed in `SHOP_INBOX_EVENT_TYPES` to the inbox and acknowledge them without processing"""
+
+    def decorator(func: ViewMethod) -> ViewMethod:
+        def drf_handler_method(self: APIView, request: Request, *args: Any, **kwargs: Any) -> Response:
+            if event_type not in settings.SHOP_INBOX_EVENT_TYPES:
+                return func(self, request, *args, **kwargs)
+
+            event = ShopInboxEventCreator(event_type=event_type, raw_data=request.data)()
+            return Response({"event_id": str(event.id)}, status=HTTP_202_ACCEPTED)
+
+        return drf_handler_method
+
+    return decorator
@@ -4,7 +4,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from product_access.api.demo.decorators import dead_letter_creation
+from product_access.api.demo.decorators import dead_letter_creation, shop_event_ingestion
 from product_access.api.demo.permissions import ShopIntegrationPermission
 from product_access.api.demo.serializers import OrderCheckoutSerializer, OrderRefundSerializer, PromoAccessSerializer
 from product_access.models import ProductAccess
@@ -25,6 +25,7 @@ class OrderCheckoutView(APIView):
         ),
     )
     @dead_letter_creation(event_type="order-checkedout")
+    @shop_event_ingestion(event_type="order-checkedout")
     def post(self, request: Request) -> Response:
         serializer = OrderCheckoutSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -42,6 +43,7 @@ class OrderRefundView(APIView):
         responses=None,
     )
     @dead_letter_creation(event_type="order-refunded")
+    @shop_event_ingestion(event_type="order-refunded")
     def post(self, request: Request) -> Response:
         serializer = OrderRefundSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -68,6 +70,7 @@ class PromoAccessView(APIView):
         ),
     )
     @dead_letter_creation(event_type="promo-access")
+    @shop_event_ingestion(event_type="promo-access")
     def post(self, request: Request) -> Response:
         serializer = PromoAccessSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -43,7 +43,7 @@ class Command(BaseCommand):
                     continue
 
                 try:
-                    user = User.objects.get(username=user_email)
+                    user = User.objects.get_by_username(user_email)
                     access = ProductAccess.objects.filter(
                         user=user,
                         product__id=lms_id,
@@ -1,10 +1,9 @@
-import csv
 from pathlib import Path
 from typing import Any
 
 from django.core.management.base import BaseCommand, CommandParser
 
-from product_access.services import SubscriptionAccessImporter
+from product_access.services import SubscriptionAccessBulkImporter
 from products.models import Product
 
 
@@ -14,13 +13,29 @@ class Command(BaseCommand):
     def add_arguments(self, parser: CommandParser) -> None:
         parser.add_argument("--data", type=str)
         parser.add_argument("--product_id", type=str)
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Number of rows imported within one transaction")
+        parser.add_argument("--workers", type=int, default=1, help="Number of processes importing chunks in parallel")
+        parser.add_argument("--dry-run", action="store_true", help="Roll back every chunk after importing it")
+        parser.add_argument("--failures", type=str, required=False, help="Path to output CSV file for rows that were not imported")
 
     def handle(self, *args: Any, **options: Any) -> str | None:
-        product = Product.objects.get(id=options["product_id"])
-        with Path(options["data"]).open() as data:
-            reader = csv.DictReader(data, delimiter=";")
-            for row in reader:
-                try:
-                    SubscriptionAccessImporter(data=row, product=product)()
-                except Exception as e:  # noqa: BLE001
-                    self.stderr.write(self.style.ERROR(f"Can't import subscription access: {row}, {e}"))
+        result = SubscriptionAccessBulkImporter(
+            data=Path(options["data"]),
+            product=Product.objects.get(id=options["product_id"]),
+            chunk_size=options["chunk_size"],
+            workers=options["workers"],
+            dry_run=options["dry_run"],
+        )()
+
+        for failure in result.failures:
+            self.stderr.write(self.style.ERROR(f"Can't import subscription access: {failure.row}, {failure.reason}"))
+
+        if options["failures"] and result.failures:
+            result.write_failures(Path(options["failures"]))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{'Dry run completed' if options['dry_run'] else 'Import completed'}. "
+                f"Imported {result.imported} rows, skipped {result.skipped}, failed {len(result.failures)}.",
+            ),
+        )
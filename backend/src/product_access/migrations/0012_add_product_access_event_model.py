@@ -0,0 +1,42 @@
+# Generated by Django 4.2.21 on 2026-10-18 11:02
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0013_add_lifetime_to_product"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("product_access", "0011_normalize_datetimes_for_start_date_and_end_date_in_product_access"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductAccessEvent",
+            fields=[
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("modified", models.DateTimeField(blank=True, db_index=True, null=True)),
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("order_id", models.CharField(db_index=True, max_length=128, verbose_name="Order ID")),
+                ("event_type", models.CharField(choices=[("granted", "Granted"), ("revoked", "Revoked")], max_length=16, verbose_name="Event type")),
+                ("event_time", models.DateTimeField(verbose_name="Event time")),
+                ("start_date", models.DateTimeField(blank=True, null=True, verbose_name="Start date")),
+                ("end_date", models.DateTimeField(blank=True, null=True, verbose_name="End date")),
+                ("product", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name="+", to="products.product", verbose_name="Product")),
+                ("user", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name="+", to=settings.AUTH_USER_MODEL, verbose_name="User")),
+            ],
+            options={
+                "verbose_name": "Product access event",
+                "verbose_name_plural": "Product access events",
+                "ordering": ["event_time"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="productaccessevent",
+            constraint=models.UniqueConstraint(fields=("order_id", "event_type", "event_time"), name="product_access_event_unique"),
+        ),
+    ]
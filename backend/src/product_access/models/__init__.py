@@ -1,6 +1,9 @@
 from product_access.models.product_access import ProductAccess
+from product_access.models.product_access_event import ProductAccessEvent, ProductAccessEventType
 
 
 __all__ = [
     "ProductAccess",
+    "ProductAccessEvent",
+    "ProductAccessEventType",
 ]
@@ -1,5 +1,8 @@
+from datetime import UTC, datetime, time, timedelta
+
 from django.db import models
-from django.db.models import Q, QuerySet
+from django.db.models import Min, Q, QuerySet
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -17,6 +20,29 @@ class ProductAccessQuerySet(QuerySet):
             Q(revoked_at__isnull=True),
         )
 
+    def next_change_for_user(self, user: User) -> datetime | None:
+        """
+        Return the moment when active_for_user() starts returning different rows for the user:
+        the nearest day some access starts or the day after some active access ends.
+        """
+        today = timezone.now().date()
+        boundaries = self.filter(user=user, revoked_at__isnull=True).aggregate(
+            next_start_day=Min(TruncDate("start_date"), filter=Q(start_date__date__gt=today)),
+            last_active_day=Min(TruncDate("end_date"), filter=Q(start_date__date__lte=today, end_date__date__gte=today)),
+        )
+
+        change_days = []
+        if boundaries["next_start_day"] is not None:
+            change_days.append(boundaries["next_start_day"])
+        if boundaries["last_active_day"] is not None:
+            change_days.append(boundaries["last_active_day"] + timedelta(days=1))
+
+        if not change_days:
+            return None
+
+        # active_for_user() compares with the date of timezone.now(), which is in UTC
+        return datetime.combine(min(change_days), time.min, tzinfo=UTC)
+
     def all_subscriptions_for_user(self, user: User) -> "ProductAccessQuerySet":
         return self.filter(
             user=user,
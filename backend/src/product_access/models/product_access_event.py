@@ -0,0 +1,66 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from app.models import TimestampedModel
+
+
+class ProductAccessEventType(models.TextChoices):
+    GRANTED = "granted", _("Granted")
+    REVOKED = "revoked", _("Revoked")
+
+
+class ProductAccessEvent(TimestampedModel):
+    """
+    Shop event of the order access, in the order the shop emitted them.
+
+    Access of the order is derived from its events by ProductAccessFolder, so events may be stored
+    in any order and the same event stored twice is a no-op.
+    """
+
+    order_id = models.CharField(
+        _("Order ID"),
+        max_length=128,
+        db_index=True,
+    )
+    event_type = models.CharField(
+        _("Event type"),
+        max_length=16,
+        choices=ProductAccessEventType.choices,
+    )
+    event_time = models.DateTimeField(
+        _("Event time"),
+    )
+    product = models.ForeignKey(
+        "products.Product",
+        on_delete=models.PROTECT,
+        verbose_name=_("Product"),
+        related_name="+",
+        null=True,  # revoke events carry no access data
+        blank=True,
+    )
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        verbose_name=_("User"),
+        related_name="+",
+        null=True,  # revoke events carry no access data
+        blank=True,
+    )
+    start_date = models.DateTimeField(
+        _("Start date"),
+        null=True,
+        blank=True,
+    )
+    end_date = models.DateTimeField(
+        _("End date"),
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        verbose_name = _("Product access event")
+        verbose_name_plural = _("Product access events")
+        ordering = ["event_time"]
+        constraints = [
+            models.UniqueConstraint(fields=["order_id", "event_type", "event_time"], name="product_access_event_unique"),
+        ]
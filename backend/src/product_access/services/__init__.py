@@ -1,19 +1,24 @@
+from product_access.services.direct_access_bulk_importer import DirectAccessBulkImporter
 from product_access.services.direct_access_importer import DirectAccessImporter
 from product_access.services.post_checkout_link_generator import PostCheckoutLinkGenerator
+from product_access.services.product_access_event_recorder import ProductAccessEventRecorder
+from product_access.services.product_access_folder import ProductAccessFolder
 from product_access.services.product_access_provider import ProductAccessProvider
 from product_access.services.product_access_revoker import ProductAccessRevoker
 from product_access.services.product_checkout_processor import ProductCheckoutProcessor, ProductCheckoutProcessorException
 from product_access.services.promo_product_checkout_processor import PromoProductCheckoutProcessor, PromoProductCheckoutProcessorException
+from product_access.services.subscription_access_bulk_importer import SubscriptionAccessBulkImporter
 from product_access.services.subscription_access_importer import SubscriptionAccessImporter
 from product_access.services.subscription_boundaries_calculator import (
     SubscriptionBoundaries,
     SubscriptionBoundariesCalculator,
 )
-from product_access.services.timed_product_access_provider import TimedAccessProviderWarning, TimedProductAccessProvider
+from product_access.services.timed_product_access_provider import TimedProductAccessProvider
 from product_access.services.user_course_plans_getter import UserCoursePlansGetter
 from product_access.services.user_course_series_getter import UserCourseSeriesGetter
 from product_access.services.user_course_versions_getter import UserCourseVersionsGetter
 from product_access.services.user_courses_with_access_start_date_getter import UserCoursesWithAccessStartDateGetter
+from product_access.services.user_entitlements_getter import UserEntitlements, UserEntitlementsGetter
 from product_access.services.user_lectures_getter import UserLecturesGetter
 from product_access.services.user_product_access_cache_invalidator import UserProductAccessCacheInvalidator
 from product_access.services.user_recurring_subscription_checker import UserRecurringSubscriptionChecker
@@ -21,23 +26,28 @@ from product_access.services.user_subscription_checker import UserSubscriptionCh
 
 
 __all__ = [
+    "DirectAccessBulkImporter",
     "DirectAccessImporter",
     "PostCheckoutLinkGenerator",
+    "ProductAccessEventRecorder",
+    "ProductAccessFolder",
     "ProductAccessProvider",
     "ProductAccessRevoker",
     "ProductCheckoutProcessor",
     "ProductCheckoutProcessorException",
     "PromoProductCheckoutProcessor",
     "PromoProductCheckoutProcessorException",
+    "SubscriptionAccessBulkImporter",
     "SubscriptionAccessImporter",
     "SubscriptionBoundaries",
     "SubscriptionBoundariesCalculator",
-    "TimedAccessProviderWarning",
     "TimedProductAccessProvider",
     "UserCoursePlansGetter",
     "UserCourseSeriesGetter",
     "UserCourseVersionsGetter",
     "UserCoursesWithAccessStartDateGetter",
+    "UserEntitlements",
+    "UserEntitlementsGetter",
     "UserLecturesGetter",
     "UserProductAccessCacheInvalidator",
     "UserRecurringSubscriptionChecker",
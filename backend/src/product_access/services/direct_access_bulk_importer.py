@@ -0,0 +1,130 @@
+import uuid
+import zoneinfo
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.utils import timezone
+
+from app.services import BulkCSVImporter, BulkImportResult
+from bonuses.models import BonusAccount
+from product_access.models import ProductAccess, ProductAccessEvent, ProductAccessEventType
+from product_access.services.direct_access_importer import DirectAccessImporter
+from product_access.services.product_access_event_recorder import ProductAccessEventRecorder
+from products.models import Product
+from users.models import User
+
+
+@dataclass
+class DirectAccessBulkImporter(BulkCSVImporter):
+    """
+    Set-based DirectAccessImporter for large files.
+
+    Products and users of the whole chunk are resolved with one query each, missing ones are created in bulk,
+    access is granted with one grant event per order. Unlike the checkout processor it doesn't notify mindbox about user changes.
+    """
+
+    def import_chunk(self, rows: list[dict]) -> BulkImportResult:
+        result = BulkImportResult()
+        orders: dict[str, tuple[dict, dict]] = {}
+        for row in rows:
+            if row["name"].lower().startswith("подписка"):
+                result.skipped += 1
+                continue
+
+            try:
+                order = self.parse_order(row)
+            except (KeyError, ValueError, ValidationError) as e:
+                result.fail(row, str(e))
+                continue
+
+            orders[order["order_id"]] = (row, order)
+
+        products = self.get_products([order for _, order in orders.values()])
+        users = self.get_users([order for _, order in orders.values()])
+
+        events = []
+        for row, order in orders.values():
+            product = products.get(order["product"]["lms_id"] or order["product"]["shop_id"])
+            if product is None:
+                result.fail(row, f"Product {order['product']['lms_id']} does not exist")
+                continue
+
+            events.append(
+                ProductAccessEvent(
+                    order_id=order["order_id"],
+                    event_type=ProductAccessEventType.GRANTED,
+                    event_time=order["event_time"],
+                    product=product,
+                    user=users[order["user"]["username"]],
+                    start_date=timezone.make_aware(datetime.combine(order["start_date"], datetime.min.time()), timezone.get_default_timezone()),
+                    end_date=None,
+                ),
+            )
+
+        accesses = ProductAccessEventRecorder(events=events)()
+        # update creation time so that access granted during import can be removed based on this value
+        ProductAccess.objects.filter(order_id__in=accesses.keys()).update(created=datetime(2024, 1, 1, tzinfo=zoneinfo.ZoneInfo("UTC")))
+        result.imported += len(events)
+
+        return result
+
+    def parse_order(self, row: dict) -> dict:
+        checkout_event = DirectAccessImporter(data=row).checkout_event
+        order = {**checkout_event["data"], "event_time": checkout_event["event_time"]}
+
+        validate_email(order["user"]["username"])
+        if order["product"]["lms_id"]:
+            uuid.UUID(order["product"]["lms_id"])
+
+        return order
+
+    def get_products(self, orders: list[dict]) -> dict[str, Product]:
+        """Return products by lms id or by shop id for orders without lms id, creating missing shop products"""
+        shop_ids = {order["product"]["shop_id"]: order["product"]["name"] for order in orders if not order["product"]["lms_id"]}
+        lms_shop_ids = {order["product"]["lms_id"]: order["product"]["shop_id"] for order in orders if order["product"]["lms_id"]}
+
+        products: dict[str, Product] = {product.shop_id: product for product in Product.objects.filter(shop_id__in=shop_ids.keys())}
+        new_products = [Product(shop_id=shop_id, name=name) for shop_id, name in shop_ids.items() if shop_id not in products]
+        Product.objects.bulk_create(new_products)
+        products.update({product.shop_id: product for product in new_products})
+
+        products_to_update = []
+        for product in Product.objects.filter(id__in=lms_shop_ids.keys()):
+            products[str(product.id)] = product
+            if product.shop_id != lms_shop_ids[str(product.id)]:
+                product.shop_id = lms_shop_ids[str(product.id)]
+                product.modified = timezone.now()
+                products_to_update.append(product)
+
+        Product.objects.bulk_update(products_to_update, fields=["shop_id", "modified"])
+
+        return products
+
+    def get_users(self, orders: list[dict]) -> dict[str, User]:
+        """Return users by username, creating missing ones along with their bonus accounts"""
+        names = {order["user"]["username"]: (order["user"]["first_name"], order["user"]["last_name"]) for order in orders}
+        users: dict[str, User] = {}
+        for user in User.objects.by_usernames(names.keys()):
+            users.setdefault(user.username.lower(), user)
+
+        users_to_update = []
+        for username, user in users.items():
+            if (user.first_name, user.last_name) != names[username]:
+                user.first_name, user.last_name = names[username]
+                users_to_update.append(user)
+
+        User.objects.bulk_update(users_to_update, fields=["first_name", "last_name"])
+
+        new_usernames = [username for username in names if username not in users]
+        # users created by a concurrent chunk are skipped, so every new user is loaded again to get the stored one
+        User.objects.bulk_create(
+            [User(username=username, email=username, first_name=names[username][0], last_name=names[username][1]) for username in new_usernames],
+            ignore_conflicts=True,
+        )
+        for user in User.objects.by_usernames(new_usernames):
+            users.setdefault(user.username.lower(), user)
+        BonusAccount.objects.bulk_create([BonusAccount(user=users[username]) for username in new_usernames], ignore_conflicts=True)
+
+        return users
@@ -0,0 +1,64 @@
+from collections.abc import Collection
+from dataclasses import dataclass
+
+from django.db.transaction import atomic, on_commit
+
+from app.services import BaseService
+from product_access.models import ProductAccess, ProductAccessEvent, ProductAccessEventType
+from product_access.services.product_access_folder import ProductAccessFolder
+
+
+@dataclass
+class ProductAccessEventRecorder(BaseService):
+    """
+    Store access events of the shop orders and return the refolded access of the orders.
+
+    Storing is an idempotent insert, so duplicated and late events are cheap and write nothing to the access.
+    Access rows of the orders stay locked until the caller's transaction commits. Orders that were imported
+    before the event log existed are seeded with the events their access was created from.
+
+    Events of one order recorded by concurrent transactions may be folded without each other,
+    so the orders are refolded once more under a lock after the commit.
+    """
+
+    events: list[ProductAccessEvent]
+
+    @atomic
+    def act(self) -> dict[str, ProductAccess]:
+        order_ids = {event.order_id for event in self.events}
+
+        ProductAccessEvent.objects.bulk_create([*self.get_seed_events(order_ids), *self.events], ignore_conflicts=True)
+        on_commit(lambda: ProductAccessFolder(order_ids=order_ids, lock=True)())
+
+        return ProductAccessFolder(order_ids=order_ids)()
+
+    @staticmethod
+    def get_seed_events(order_ids: Collection[str]) -> list[ProductAccessEvent]:
+        accesses = ProductAccess.objects.filter(order_id__in=order_ids).exclude(
+            order_id__in=ProductAccessEvent.objects.filter(order_id__in=order_ids).values("order_id"),
+        )
+
+        events = []
+        for access in accesses:
+            if access.user_id is not None or access.granted_at is not None:
+                events.append(
+                    ProductAccessEvent(
+                        order_id=access.order_id,
+                        event_type=ProductAccessEventType.GRANTED,
+                        event_time=access.granted_at or access.created,
+                        product_id=access.product_id,
+                        user_id=access.user_id,
+                        start_date=access.start_date,
+                        end_date=access.end_date,
+                    ),
+                )
+            if access.revoked_at is not None:
+                events.append(
+                    ProductAccessEvent(
+                        order_id=access.order_id,
+                        event_type=ProductAccessEventType.REVOKED,
+                        event_time=access.revoked_at,
+                    ),
+                )
+
+        return events
@@ -0,0 +1,116 @@
+from collections import defaultdict
+from collections.abc import Collection
+from dataclasses import dataclass
+
+from django.db import connection
+from django.db.transaction import atomic
+from django.utils import timezone
+
+from app.services import BaseService
+from product_access.models import ProductAccess, ProductAccessEvent, ProductAccessEventType
+from product_access.services.user_product_access_cache_invalidator import UserProductAccessCacheInvalidator
+
+
+@dataclass
+class ProductAccessFolder(BaseService):
+    """
+    Derive access of the orders from their events and store the columns the events changed.
+
+    Access is a function of the event log only, not of the order the events were received in:
+    the latest grant gives the access data, and the access is revoked if the latest event is a revoke.
+    A revoke of the order without grants gives an empty access, so the grant received later doesn't open it.
+
+    Access rows of the orders are locked until the end of the transaction. With `lock` folds of the same order
+    are serialized by an advisory lock taken before the rows are read.
+    """
+
+    order_ids: Collection[str]
+    lock: bool = False
+
+    GRANT_FIELDS = ["product", "user", "start_date", "end_date", "granted_at"]
+
+    def act(self) -> dict[str, ProductAccess]:
+        if not self.order_ids:
+            return {}
+
+        with atomic():
+            if self.lock:
+                self.lock_orders()
+
+            folded = {order_id: self.fold(order_id, events) for order_id, events in self.get_events_by_order().items()}
+            accesses = ProductAccess.objects.select_for_update().in_bulk(folded.keys(), field_name="order_id")
+            user_ids = {access.user_id for access in accesses.values()}
+
+            # an access created by a concurrent fold is skipped here and updated by the refold after commit
+            ProductAccess.objects.bulk_create([access for order_id, access in folded.items() if order_id not in accesses], ignore_conflicts=True)
+            for order_id, access in accesses.items():
+                self.update(access, folded[order_id])
+
+            accesses = ProductAccess.objects.in_bulk(folded.keys(), field_name="order_id")
+
+        UserProductAccessCacheInvalidator.invalidate_many(
+            user_ids={user_id for user_id in user_ids | {access.user_id for access in accesses.values()} if user_id is not None},
+        )
+
+        return accesses
+
+    def update(self, access: ProductAccess, folded: ProductAccess) -> None:
+        """
+        Write only the columns the events changed, so that access edited in the admin is kept
+        until a newer grant or revoke arrives. A duplicated or late event changes nothing.
+        """
+        update_fields = []
+        if access.granted_at != folded.granted_at:
+            update_fields.extend(self.GRANT_FIELDS)
+        if access.revoked_at != folded.revoked_at:
+            update_fields.append("revoked_at")
+
+        if update_fields:
+            for field in update_fields:
+                setattr(access, field, getattr(folded, field))
+            access.save(update_fields=[*update_fields, "modified"])
+
+    def lock_orders(self) -> None:
+        with connection.cursor() as cursor:
+            # the same lock order for every fold so that concurrent folds of several orders don't deadlock
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(hashtext(order_id)) FROM (SELECT unnest(%s::text[]) AS order_id ORDER BY 1) AS orders",
+                [sorted(self.order_ids)],
+            )
+
+    def get_events_by_order(self) -> dict[str, list[ProductAccessEvent]]:
+        events_by_order = defaultdict(list)
+        # revoke wins over the grant of the same moment: "granted" < "revoked"
+        for event in ProductAccessEvent.objects.filter(order_id__in=self.order_ids).order_by("order_id", "event_time", "event_type"):
+            events_by_order[event.order_id].append(event)
+
+        return events_by_order
+
+    @staticmethod
+    def fold(order_id: str, events: list[ProductAccessEvent]) -> ProductAccess:
+        last_event = events[-1]
+        revoked_at = last_event.event_time if last_event.event_type == ProductAccessEventType.REVOKED else None
+
+        grant = next((event for event in reversed(events) if event.event_type == ProductAccessEventType.GRANTED), None)
+        if grant is None:
+            return ProductAccess(
+                order_id=order_id,
+                product=None,
+                user=None,
+                start_date=events[0].created.replace(hour=0, minute=0, second=0, microsecond=0),
+                end_date=None,
+                granted_at=None,
+                revoked_at=revoked_at,
+                modified=timezone.now(),
+            )
+
+        return ProductAccess(
+            order_id=order_id,
+            product_id=grant.product_id,
+            user_id=grant.user_id,
+            start_date=grant.start_date,
+            end_date=grant.end_date,
+            granted_at=grant.event_time,
+            revoked_at=revoked_at,
+            modified=timezone.now(),
+        )
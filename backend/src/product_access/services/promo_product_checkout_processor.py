@@ -6,7 +6,7 @@ from django.db.transaction import atomic, on_commit
 from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
 
-from a12n.models import PasswordlessEmailAuthCode
+from a12n.auth_code_store import AuthCode, get_auth_code_store
 from app.exceptions import AppServiceException
 from app.services import BaseService
 from product_access.models import ProductAccess
@@ -70,8 +70,8 @@ class PromoProductCheckoutProcessor(BaseService):
         return UserEditor(username=user_data["username"])()
 
     @cached_property
-    def auth_code(self) -> PasswordlessEmailAuthCode:
-        return PasswordlessEmailAuthCode.objects.create(user=self.user_with_creation_state[0])
+    def auth_code(self) -> AuthCode:
+        return get_auth_code_store().create(self.user_with_creation_state[0])
 
     @cached_property
     def redirect_url(self) -> str:
@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from django.utils import timezone
+
+from app.services import BulkCSVImporter, BulkImportResult
+from product_access.models import ProductAccess, ProductAccessEvent, ProductAccessEventType
+from product_access.services.product_access_event_recorder import ProductAccessEventRecorder
+from product_access.services.subscription_access_importer import SubscriptionAccessImporter
+from products.models import Product
+from users.models import User
+
+
+@dataclass
+class SubscriptionAccessBulkImporter(BulkCSVImporter):
+    """
+    Set-based SubscriptionAccessImporter for large files: users and their existing access
+    are fetched with one query per chunk, access is granted with one grant event per user
+    """
+
+    product: Product
+
+    def import_chunk(self, rows: list[dict]) -> BulkImportResult:
+        result = BulkImportResult()
+        importers = []
+        for row in rows:
+            importer = SubscriptionAccessImporter(data=row, product=self.product)
+            if importer.has_subscription:
+                importers.append(importer)
+            else:
+                result.skipped += 1
+
+        users: dict[str, User] = {}
+        for user in User.objects.by_usernames(importer.username for importer in importers):
+            users.setdefault(user.username.lower(), user)
+
+        order_ids = dict(ProductAccess.objects.filter(user__in=users.values(), product=self.product).values_list("user_id", "order_id"))
+        events: dict[UUID, ProductAccessEvent] = {}
+
+        for importer in importers:
+            user = users.get(User.objects.normalize_username(importer.username))
+            if user is None:
+                result.fail(importer.data, f"User {importer.username} does not exist")
+                continue
+
+            try:
+                access_defaults = importer.access_defaults
+            except ValueError as e:
+                result.fail(importer.data, str(e))
+                continue
+
+            if user.id in order_ids:
+                # a new grant of the existing order, so that it is newer than the grant the access was created from
+                order_id, event_time = order_ids[user.id], timezone.now()
+            else:
+                order_id, event_time = str(access_defaults["order_id"]), access_defaults["granted_at"]
+
+            events[user.id] = ProductAccessEvent(
+                order_id=order_id,
+                event_type=ProductAccessEventType.GRANTED,
+                event_time=event_time,
+                product=self.product,
+                user=user,
+                start_date=access_defaults["start_date"],
+                end_date=access_defaults["end_date"],
+            )
+            result.imported += 1
+
+        ProductAccessEventRecorder(events=list(events.values()))()
+
+        return result
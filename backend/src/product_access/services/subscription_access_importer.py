@@ -17,25 +17,37 @@ class SubscriptionAccessImporter(BaseService):
     product: Product
 
     def act(self) -> ProductAccess | None:
-        if self.data["Последний день подписки"].strip() == "":
+        if not self.has_subscription:
             return None
 
         return ProductAccess.objects.update_or_create(
             user=self.user,
             product=self.product,
-            defaults=dict(
-                start_date=timezone.make_aware(datetime(2024, 1, 1)),
-                end_date=timezone.make_aware(
-                    datetime.combine(
-                        datetime.fromisoformat(self.data["Последний день подписки"]).date(),
-                        datetime.max.time(),
-                    ),
+            defaults=self.access_defaults,
+        )[0]
+
+    @property
+    def has_subscription(self) -> bool:
+        return self.data["Последний день подписки"].strip() != ""
+
+    @property
+    def access_defaults(self) -> dict:
+        return dict(
+            start_date=timezone.make_aware(datetime(2024, 1, 1)),
+            end_date=timezone.make_aware(
+                datetime.combine(
+                    datetime.fromisoformat(self.data["Последний день подписки"]).date(),
+                    datetime.max.time(),
                 ),
-                granted_at=timezone.make_aware(datetime(2024, 1, 1)),
-                order_id=uuid4(),
             ),
-        )[0]
+            granted_at=timezone.make_aware(datetime(2024, 1, 1)),
+            order_id=uuid4(),
+        )
+
+    @property
+    def username(self) -> str:
+        return self.data["E-mail"].strip()
 
     @cached_property
     def user(self) -> User:
-        return User.objects.get(username=self.data["E-mail"].strip())
+        return User.objects.get_by_username(self.username)
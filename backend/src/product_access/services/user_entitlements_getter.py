@@ -0,0 +1,223 @@
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, time, timedelta
+from math import ceil
+from operator import itemgetter
+from typing import Any
+from uuid import UUID, uuid4
+
+from courses.models import CoursePlan, CourseSeries, CourseVersion
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import CharField, Exists, Value
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from app.services import BaseService
+from app.utils import memoize_for_request
+from payments.models import Recurrent, RecurrentStatus
+from product_access.models import ProductAccess
+from users.models import User
+
+
+AVAILABLE_COURSE_VERSION_STATES = ["published", "archived"]
+
+
+@dataclass
+class UserEntitlements:
+    course_series_ids: set[UUID]
+    course_version_ids: set[UUID]
+    course_version_ids_with_series: set[UUID]
+    course_plan_ids: set[UUID]
+    course_plan_ids_with_series: set[UUID]
+    subscription_start_date: datetime | None
+    subscription_end_date: datetime | None
+    has_subscription: bool
+    has_recurring_subscription: bool
+
+
+@dataclass
+class UserEntitlementsGetter(BaseService):
+    """
+    Return snapshot of everything user has access to.
+
+    Snapshot is computed from two queries, one for user's product access and one for everything it grants,
+    and is cached as one blob under a per-user version, so invalidation is a version bump instead of deleting every derived key.
+    """
+
+    user: User
+
+    def act(self) -> UserEntitlements:
+        return memoize_for_request(("user_entitlements", self.user.id), self.get_entitlements)
+
+    def get(self, name: str) -> Any:
+        """Return single entitlement; without cache only the queries it depends on are made"""
+        if settings.CACHE_ENABLED:
+            return getattr(self(), name)
+
+        return memoize_for_request(("user_entitlements", self.user.id, name), lambda: getattr(self, name))
+
+    def get_entitlements(self) -> UserEntitlements:
+        if settings.CACHE_ENABLED:
+            entitlements_dict = cache.get(self.cache_key)
+            if entitlements_dict is None:
+                entitlements_dict = self.get_entitlements_dict()
+                cache.set(self.cache_key, entitlements_dict, timeout=self.get_cache_timeout())
+
+            return UserEntitlements(**entitlements_dict)
+
+        return UserEntitlements(**self.get_entitlements_dict())
+
+    def get_entitlements_dict(self) -> dict:
+        return asdict(
+            UserEntitlements(
+                course_series_ids=self.course_series_ids,
+                course_version_ids=self.course_version_ids,
+                course_version_ids_with_series=self.course_version_ids_with_series,
+                course_plan_ids=self.course_plan_ids,
+                course_plan_ids_with_series=self.course_plan_ids_with_series,
+                subscription_start_date=self.subscription_start_date,
+                subscription_end_date=self.subscription_end_date,
+                has_subscription=self.has_subscription,
+                has_recurring_subscription=self.has_recurring_subscription,
+            ),
+        )
+
+    def get_cache_timeout(self, *upcoming_changes: datetime | None) -> int:
+        """
+        Cache until the nearest moment user's access changes, but not longer than configured maximum:
+        content of courses is not tracked and invalidates by timeout only.
+        """
+        timeout = settings.PRODUCT_ACCESS_CACHE_MAX_DURATION_SECONDS
+        now = timezone.now()
+        for change in (self.next_access_change, *upcoming_changes):
+            if change is not None:
+                timeout = min(timeout, ceil((change - now).total_seconds()))
+
+        return max(timeout, 1)
+
+    @staticmethod
+    def get_cache_version_key(user_id: int) -> str:
+        return f"user_entitlements_version_{user_id}"
+
+    @cached_property
+    def cache_version(self) -> str:
+        return cache.get_or_set(self.get_cache_version_key(self.user.id), lambda: uuid4().hex, timeout=None)  # type: ignore[return-value]
+
+    @property
+    def cache_key(self) -> str:
+        return self.get_versioned_cache_key("user_entitlements")
+
+    def get_versioned_cache_key(self, prefix: str) -> str:
+        return f"{prefix}_{self.user.id}_{self.cache_version}"
+
+    @cached_property
+    def access_rows(self) -> list[dict]:
+        """All of user's not revoked access, both active and upcoming, with whether user has an active recurrent"""
+        return list(
+            ProductAccess.objects.filter(user=self.user, revoked_at__isnull=True)
+            .annotate(
+                start_day=TruncDate("start_date"),
+                end_day=TruncDate("end_date"),
+                has_active_recurrent=Exists(Recurrent.objects.filter(user=self.user, status=RecurrentStatus.ACTIVE, product__product_type="subscription")),
+            )
+            .values("id", "product__product_type", "start_date", "end_date", "start_day", "end_day", "has_active_recurrent"),
+        )
+
+    @cached_property
+    def active_access(self) -> list[dict]:
+        """Same rows as ProductAccess.objects.active_for_user(), filtered in python"""
+        today = timezone.now().date()
+        return [access for access in self.access_rows if access["start_day"] <= today and (access["end_day"] is None or access["end_day"] >= today)]
+
+    @property
+    def next_access_change(self) -> datetime | None:
+        """Same moment as ProductAccess.objects.next_change_for_user(), computed from already read rows"""
+        today = timezone.now().date()
+        change_days = [access["start_day"] for access in self.access_rows if access["start_day"] > today]
+        change_days += [access["end_day"] + timedelta(days=1) for access in self.active_access if access["end_day"] is not None]
+
+        if not change_days:
+            return None
+
+        # active_for_user() compares with the date of timezone.now(), which is in UTC
+        return datetime.combine(min(change_days), time.min, tzinfo=UTC)
+
+    @cached_property
+    def access_item_ids(self) -> list[UUID]:
+        return [access["id"] for access in self.active_access]
+
+    @cached_property
+    def subscription_access(self) -> dict | None:
+        subscriptions = [access for access in self.active_access if access["product__product_type"] == "subscription"]
+        return max(subscriptions, key=itemgetter("start_date"), default=None)
+
+    @cached_property
+    def entitled_ids(self) -> dict[str, set[UUID]]:
+        """Ids of everything the active access grants, read with a single UNION query"""
+        entitled_ids: dict[str, set[UUID]] = defaultdict(set)
+        if not self.access_item_ids:
+            return entitled_ids
+
+        course_series = CourseSeries.objects.filter(products__access_items__in=self.access_item_ids)
+        parts = [
+            course_series.annotate(kind=Value("course_series", output_field=CharField())),
+            CourseVersion.objects.filter(
+                products__access_items__in=self.access_item_ids,
+                state__in=AVAILABLE_COURSE_VERSION_STATES,
+            ).annotate(kind=Value("course_version", output_field=CharField())),
+            CourseVersion.objects.filter(
+                course_series__in=course_series.values("id"),
+            ).annotate(kind=Value("course_version_of_series", output_field=CharField())),
+            CoursePlan.objects.filter(
+                course_version_plans__product__access_items__in=self.access_item_ids,
+                course_version__state__in=AVAILABLE_COURSE_VERSION_STATES,
+            ).annotate(kind=Value("course_plan", output_field=CharField())),
+            CoursePlan.objects.filter(
+                course_version__course_series__in=course_series.values("id"),
+                course_version__state__in=AVAILABLE_COURSE_VERSION_STATES,
+                default_for_version=True,
+            ).annotate(kind=Value("course_plan_of_series", output_field=CharField())),
+        ]
+        first, *rest = [part.order_by().values_list("id", "kind") for part in parts]
+        for entitled_id, kind in first.union(*rest, all=True):
+            entitled_ids[kind].add(entitled_id)
+
+        return entitled_ids
+
+    @property
+    def course_series_ids(self) -> set[UUID]:
+        return set(self.entitled_ids["course_series"])
+
+    @property
+    def course_version_ids(self) -> set[UUID]:
+        return set(self.entitled_ids["course_version"])
+
+    @property
+    def course_version_ids_with_series(self) -> set[UUID]:
+        return self.entitled_ids["course_version"] | self.entitled_ids["course_version_of_series"]
+
+    @property
+    def course_plan_ids(self) -> set[UUID]:
+        return set(self.entitled_ids["course_plan"])
+
+    @property
+    def course_plan_ids_with_series(self) -> set[UUID]:
+        return self.entitled_ids["course_plan"] | self.entitled_ids["course_plan_of_series"]
+
+    @property
+    def subscription_start_date(self) -> datetime | None:
+        return self.subscription_access["start_date"] if self.subscription_access else None
+
+    @property
+    def subscription_end_date(self) -> datetime | None:
+        return self.subscription_access["end_date"] if self.subscription_access else None
+
+    @property
+    def has_subscription(self) -> bool:
+        return self.subscription_access is not None
+
+    @property
+    def has_recurring_subscription(self) -> bool:
+        return self.has_subscription and any(access["has_active_recurrent"] for access in self.access_rows)
@@ -1,34 +1,56 @@
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 from courses.models import Course, Lecture
 from django.conf import settings
 from django.core.cache import cache
-from django.db.models import OuterRef, Q, QuerySet, Subquery
+from django.db.models import Min, OuterRef, Q, QuerySet, Subquery
 from django.utils import timezone
 from django.utils.functional import cached_property
 
 from app.services import BaseService
+from app.utils import memoize_for_request
 from product_access.services.user_courses_with_access_start_date_getter import UserCoursesWithAccessStartDateGetter
+from product_access.services.user_entitlements_getter import UserEntitlementsGetter
 from users.models import User
 
 
 @dataclass
 class UserLecturesGetter(BaseService):
+    """
+    Return ids of lectures available for user.
+
+    Cached next to the entitlement snapshot under the same version rather than inside it,
+    cause course availability lookups used here read the snapshot themselves.
+    """
+
     user: User
 
     def act(self) -> set[UUID]:
+        return memoize_for_request(("user_lectures", self.user.id), self.get_lectures)
+
+    def get_lectures(self) -> set[UUID]:
         if settings.CACHE_ENABLED:
-            return cache.get_or_set(  # type: ignore[return-value]
-                f"user_lectures_{self.user.id}",
-                self.get_avaialble_lectures,
-                timeout=settings.CACHE_DURATION_SECONDS,
-            )
+            entitlements = UserEntitlementsGetter(user=self.user)
+            cache_key = entitlements.get_versioned_cache_key("user_lectures")
+            lectures = cache.get(cache_key)
+            if lectures is None:
+                lectures = self.get_avaialble_lectures()
+                cache.set(cache_key, lectures, timeout=entitlements.get_cache_timeout(self.get_next_lecture_unlock()))
+
+            return lectures
+
         return self.get_avaialble_lectures()
 
     def get_avaialble_lectures(self) -> set[UUID]:
         return set(Lecture.objects.filter(self.allow_by_course_access_q & self.allow_by_schedule_q).values_list("id", flat=True))
 
+    def get_next_lecture_unlock(self) -> datetime | None:
+        return Lecture.objects.filter(self.allow_by_course_access_q, scheduled_at__gt=timezone.now()).aggregate(
+            next_unlock=Min("scheduled_at"),
+        )["next_unlock"]
+
     @cached_property
     def available_courses(self) -> QuerySet[Course]:
         return UserCoursesWithAccessStartDateGetter(user=self.user)()
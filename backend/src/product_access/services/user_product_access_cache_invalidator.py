@@ -1,8 +1,12 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
+from uuid import uuid4
 
 from django.core.cache import cache
 
 from app.services import BaseService
+from app.utils import clear_request_memo
+from product_access.services.user_entitlements_getter import UserEntitlementsGetter
 from users.models import User
 
 
@@ -10,21 +14,17 @@ from users.models import User
 class UserProductAccessCacheInvalidator(BaseService):
     """
     Invalidate all cache keys related to user's product access.
+
+    Every cached entitlement is stored under a per-user version, so bumping the version is enough.
+    Answers memoized by the current request are dropped as well.
     """
 
     user: User
 
     def act(self) -> None:
-        cache_keys = [
-            f"subscription_boundaries_{self.user.id}",
-            f"user_course_plans_{self.user.id}_with_series_True",
-            f"user_course_plans_{self.user.id}_with_series_False",
-            f"user_course_series_{self.user.id}",
-            f"user_course_versions_{self.user.id}_with_series_True",
-            f"user_course_versions_{self.user.id}_with_series_False",
-            f"user_lectures_{self.user.id}",
-            f"user_recurring_subscription_checker_{self.user.id}",
-            f"user_subscription_checker_{self.user.id}",
-        ]
-
-        cache.delete_many(cache_keys)
+        self.invalidate_many(user_ids=[self.user.id])
+
+    @staticmethod
+    def invalidate_many(user_ids: Iterable) -> None:
+        cache.set_many({UserEntitlementsGetter.get_cache_version_key(user_id): uuid4().hex for user_id in user_ids}, timeout=None)
+        clear_request_memo()
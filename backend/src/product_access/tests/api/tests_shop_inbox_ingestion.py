@@ -0,0 +1,75 @@
+import pytest
+
+from app.models import ShopInboxEvent
+from app.services import ShopInboxDrainer
+from product_access.models import ProductAccess
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+base_url = "/api/demo/order-checkout/"
+
+
+@pytest.fixture(autouse=True)
+def adjust_settings(settings):
+    settings.SHOP_INBOX_EVENT_TYPES = ["order-checkedout"]
+
+
+@pytest.fixture(autouse=True)
+def drain_task(mocker):
+    return mocker.patch("app.tasks.drain_shop_inbox.apply_async")
+
+
+def test_event_is_stored_and_acknowledged(as_shop_user, checkout_data, user):
+    response = as_shop_user.post(base_url, data=checkout_data, expected_status=202)
+
+    event = ShopInboxEvent.objects.get()
+    assert response == {"eventId": str(event.id)}
+    assert event.event_key == checkout_data["eventId"]
+    assert event.ordering_key == f"user:{user.username}"
+    assert not ProductAccess.objects.exists()
+
+
+def test_event_is_processed_by_drainer(as_shop_user, checkout_data, user, product):
+    as_shop_user.post(base_url, data=checkout_data, expected_status=202)
+
+    ShopInboxDrainer()()
+
+    access = ProductAccess.objects.get()
+    assert (access.user, access.product) == (user, product)
+    assert ShopInboxEvent.objects.get().processed_at is not None
+
+
+def test_duplicate_event_is_stored_once(as_shop_user, checkout_data):
+    first = as_shop_user.post(base_url, data=checkout_data, expected_status=202)
+    second = as_shop_user.post(base_url, data=checkout_data, expected_status=202)
+
+    assert first == second
+    assert ShopInboxEvent.objects.count() == 1
+
+
+def test_drain_is_scheduled(as_shop_user, checkout_data, drain_task, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        as_shop_user.post(base_url, data=checkout_data, expected_status=202)
+
+    drain_task.assert_called_once_with(countdown=0)
+
+
+def test_invalid_event_is_rejected(as_shop_user, checkout_data):
+    del checkout_data["data"]["user"]
+
+    as_shop_user.post(base_url, data=checkout_data, expected_status=400)
+
+    assert not ShopInboxEvent.objects.exists()
+
+
+def test_other_events_are_processed_synchronously(as_shop_user, checkout_data, settings):
+    settings.SHOP_INBOX_EVENT_TYPES = []
+
+    as_shop_user.post(base_url, data=checkout_data, expected_status=200)
+
+    assert ProductAccess.objects.exists()
+    assert not ShopInboxEvent.objects.exists()
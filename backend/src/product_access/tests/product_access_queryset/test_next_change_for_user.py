@@ -0,0 +1,57 @@
+from datetime import UTC, datetime
+
+import pytest
+from django.utils import timezone
+
+from product_access.models import ProductAccess
+
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.freeze_time("2010-03-10 15:00"),
+]
+
+
+@pytest.fixture
+def ya_user(factory):
+    return factory.user()
+
+
+@pytest.mark.parametrize(
+    ("start_date", "end_date", "expected"),
+    [
+        (datetime(2010, 3, 1), datetime(2010, 3, 15, 23, 59, 59), datetime(2010, 3, 16, tzinfo=UTC)),  # active access ends
+        (datetime(2010, 3, 12, 10, 0), datetime(2010, 3, 15), datetime(2010, 3, 12, tzinfo=UTC)),  # future access starts
+        (datetime(2010, 3, 10), datetime(2010, 3, 10, 23, 59, 59), datetime(2010, 3, 11, tzinfo=UTC)),  # last active day
+        (datetime(2010, 3, 1), datetime(2010, 3, 9), None),  # expired access never changes
+        (datetime(2010, 3, 1), None, None),  # eternal access never changes
+        (datetime(2010, 3, 11), None, datetime(2010, 3, 11, tzinfo=UTC)),  # future eternal access
+    ],
+)
+def test_next_change(user, product_access, start_date, end_date, expected):
+    product_access.start_date = start_date
+    product_access.end_date = end_date
+    product_access.save()
+
+    assert ProductAccess.objects.next_change_for_user(user) == expected
+
+
+def test_nearest_change_is_returned(user, factory, product):
+    factory.product_access(user=user, product=product, start_date=datetime(2010, 3, 1), end_date=datetime(2010, 3, 20))
+    factory.product_access(user=user, product=product, start_date=datetime(2010, 3, 14), end_date=None)
+
+    assert ProductAccess.objects.next_change_for_user(user) == datetime(2010, 3, 14, tzinfo=UTC)
+
+
+def test_ignore_access_of_other_users(user, product_access, ya_user):
+    product_access.setattr_and_save("start_date", datetime(2010, 3, 12))
+    product_access.setattr_and_save("user", ya_user)
+
+    assert ProductAccess.objects.next_change_for_user(user) is None
+
+
+def test_ignore_revoked_access(user, product_access):
+    product_access.setattr_and_save("start_date", datetime(2010, 3, 12))
+    product_access.setattr_and_save("revoked_at", timezone.now())
+
+    assert ProductAccess.objects.next_change_for_user(user) is None
@@ -0,0 +1,115 @@
+import csv
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from product_access.models import ProductAccess, ProductAccessEvent
+from product_access.services import DirectAccessBulkImporter
+from products.models import Product
+from users.models import User
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def rows():
+    return [
+        {
+            "orderId": "cm4wljl835r8g0119j2wsnpgh",
+            "username": "Some@gmail.test",
+            "firstName": "Какой-то",
+            "lastName": "Пользователь",
+            "startDate": "2024-12-20",
+            "shopId": "cm49wxvpf4sa00119jy6a9afe",
+            "lmsId": "",
+            "name": "О чём молчат картины: великие художники",
+        },
+        {
+            "orderId": "cm4wljl835r8g0119j2wsnpgi",
+            "username": "some@gmail.test",
+            "firstName": "Какой-то",
+            "lastName": "Пользователь",
+            "startDate": "2024-12-20",
+            "shopId": "cm49wxvpf4sa00119jy6a9aff",
+            "lmsId": "",
+            "name": "Подписка на 12 месяцев",
+        },
+    ]
+
+
+@pytest.fixture
+def data(tmp_path, rows):
+    path = tmp_path / "direct.csv"
+    with path.open("w") as output:
+        writer = csv.DictWriter(output, fieldnames=list(rows[0].keys()), delimiter=";")
+        writer.writeheader()
+        writer.writerows(rows)
+
+    return path
+
+
+@pytest.fixture
+def importer(data):
+    return DirectAccessBulkImporter(data=data)
+
+
+def test_access_is_created(importer):
+    result = importer()
+
+    access = ProductAccess.objects.get()
+    assert access.order_id == "cm4wljl835r8g0119j2wsnpgh"
+    assert access.user.username == "some@gmail.test"
+    assert access.product.shop_id == "cm49wxvpf4sa00119jy6a9afe"
+    assert access.created == datetime(2024, 1, 1, tzinfo=ZoneInfo("UTC"))
+    assert result.imported == 1
+    assert result.skipped == 1
+
+
+def test_access_is_granted_by_event(importer):
+    importer()
+
+    event = ProductAccessEvent.objects.get()
+    assert event.order_id == "cm4wljl835r8g0119j2wsnpgh"
+    assert event.user.username == "some@gmail.test"
+
+
+def test_existing_user_is_found_by_differently_cased_email(importer, factory):
+    user = factory.user(username="Some@Gmail.test")
+
+    importer()
+
+    assert ProductAccess.objects.get().user == user
+    assert User.objects.count() == 1
+
+
+def test_new_user_gets_bonus_account(importer):
+    importer()
+
+    assert User.objects.get(username="some@gmail.test").bonus_account is not None
+
+
+def test_existing_product_is_found_by_lms_id(importer, rows, product, data):
+    rows[0]["lmsId"] = str(product.id)
+    with data.open("w") as output:
+        writer = csv.DictWriter(output, fieldnames=list(rows[0].keys()), delimiter=";")
+        writer.writeheader()
+        writer.writerows(rows)
+
+    importer()
+
+    product.refresh_from_db()
+    assert ProductAccess.objects.get().product == product
+    assert product.shop_id == "cm49wxvpf4sa00119jy6a9afe"
+    assert Product.objects.count() == 1
+
+
+def test_import_is_idempotent(importer):
+    importer()
+
+    importer()
+
+    assert ProductAccess.objects.count() == 1
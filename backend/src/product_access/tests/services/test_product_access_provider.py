@@ -98,13 +98,14 @@ def test_skip_updating_if_new_grant_time_is_before_current_grant_time(provider,
     assert product_access.granted_at == make_dt("2030-01-04")
 
 
-def test_skip_updating_if_new_grant_time_is_before_current_revoke_time(provider, product_access, make_dt):
+def test_keep_revoked_if_new_grant_time_is_before_current_revoke_time(provider, product_access, make_dt):
     product_access.setattr_and_save("revoked_at", make_dt("2030-01-04"))
 
     provider()
 
     product_access.refresh_from_db()
-    assert product_access.granted_at == make_dt("2030-01-02")
+    assert product_access.granted_at == make_dt("2030-01-03")
+    assert product_access.revoked_at == make_dt("2030-01-04")
 
 
 def test_update_if_current_revoke_time_is_not_set(provider, product_access, make_dt):
@@ -0,0 +1,102 @@
+import csv
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from product_access.models import ProductAccess, ProductAccessEvent
+from product_access.services import SubscriptionAccessBulkImporter
+
+
+msk = ZoneInfo("Europe/Moscow")
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def rows():
+    return [
+        {"E-mail": "vm@gmail.test", "Последний день подписки": "2025-12-12T12:41:05.187Z"},
+        {"E-mail": "an@gmail.test", "Последний день подписки": ""},
+        {"E-mail": "unknown@gmail.test", "Последний день подписки": "2025-12-12T12:41:05.187Z"},
+    ]
+
+
+@pytest.fixture
+def data(tmp_path, rows):
+    path = tmp_path / "subscriptions.csv"
+    with path.open("w") as output:
+        writer = csv.DictWriter(output, fieldnames=list(rows[0].keys()), delimiter=";")
+        writer.writeheader()
+        writer.writerows(rows)
+
+    return path
+
+
+@pytest.fixture
+def importer(data, product):
+    return SubscriptionAccessBulkImporter(data=data, product=product)
+
+
+@pytest.fixture(autouse=True)
+def user(factory):
+    return factory.user(username="vm@gmail.test")
+
+
+def test_product_access_is_created(importer, user, product):
+    importer()
+
+    access = ProductAccess.objects.get()
+    assert access.user == user
+    assert access.product == product
+    assert access.end_date == datetime(2025, 12, 12, 23, 59, 59, 999999, tzinfo=msk)
+
+
+def test_existing_access_is_updated(importer, factory, user, product):
+    access = factory.product_access(user=user, product=product, granted_at=datetime(2024, 1, 1, tzinfo=msk), revoked_at=None)
+
+    importer()
+
+    access.refresh_from_db()
+    assert access.end_date == datetime(2025, 12, 12, 23, 59, 59, 999999, tzinfo=msk)
+    assert ProductAccess.objects.count() == 1
+
+
+def test_access_is_granted_by_event(importer, user):
+    importer()
+
+    event = ProductAccessEvent.objects.get()
+    assert event.order_id == ProductAccess.objects.get().order_id
+    assert event.user == user
+
+
+def test_user_is_found_by_differently_cased_email(importer, rows, data, user):
+    user.setattr_and_save("username", "VM@Gmail.test")
+    rows[0]["E-mail"] = " vm@GMAIL.test "
+    with data.open("w") as output:
+        writer = csv.DictWriter(output, fieldnames=list(rows[0].keys()), delimiter=";")
+        writer.writeheader()
+        writer.writerows(rows)
+
+    importer()
+
+    assert ProductAccess.objects.get().user == user
+
+
+def test_result_counts(importer):
+    result = importer()
+
+    assert result.imported == 1
+    assert result.skipped == 1
+    assert [failure.row["E-mail"] for failure in result.failures] == ["unknown@gmail.test"]
+
+
+def test_dry_run(importer):
+    importer.dry_run = True
+
+    importer()
+
+    assert ProductAccess.objects.count() == 0
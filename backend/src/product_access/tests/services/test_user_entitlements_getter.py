@@ -0,0 +1,94 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from product_access.services import UserEntitlementsGetter
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def getter(user):
+    return UserEntitlementsGetter(user=user)
+
+
+@pytest.fixture
+def cache_enabled(settings):
+    settings.CACHE_ENABLED = True
+
+
+@pytest.fixture
+def subscription_access(product_access, product):
+    product.setattr_and_save("product_type", "subscription")
+    return product_access
+
+
+@pytest.fixture
+def series_access(product_access, product, course_series):
+    product.course_series.add(course_series)
+    product.setattr_and_save("product_type", "course-series")
+    return product_access
+
+
+def test_empty_entitlements_without_access(getter):
+    entitlements = getter()
+
+    assert entitlements.course_series_ids == set()
+    assert entitlements.course_version_ids_with_series == set()
+    assert entitlements.course_plan_ids_with_series == set()
+    assert entitlements.has_subscription is False
+    assert entitlements.has_recurring_subscription is False
+    assert entitlements.subscription_start_date is None
+
+
+def test_subscription_boundaries_are_taken_from_access(getter, subscription_access):
+    entitlements = getter()
+
+    assert entitlements.has_subscription is True
+    assert entitlements.subscription_start_date == subscription_access.start_date
+    assert entitlements.subscription_end_date == subscription_access.end_date
+
+
+def test_series_are_included(getter, series_access, course_series):
+    assert course_series.id in getter().course_series_ids
+
+
+@pytest.mark.usefixtures("cache_enabled", "series_access")
+def test_cached_entitlements_are_read_without_queries(user, django_assert_num_queries):
+    UserEntitlementsGetter(user=user)()
+
+    with django_assert_num_queries(0):
+        UserEntitlementsGetter(user=user)()
+
+
+@pytest.mark.usefixtures("cache_enabled", "series_access")
+def test_cold_entitlements_are_read_with_two_queries(user, django_assert_num_queries):
+    with django_assert_num_queries(2):
+        UserEntitlementsGetter(user=user)()
+
+
+@pytest.mark.usefixtures("cache_enabled", "subscription_access")
+def test_single_entitlement_is_read_from_snapshot(getter):
+    assert getter.get("has_subscription") is True
+
+
+@pytest.mark.freeze_time("2010-03-10 23:00")
+def test_cache_timeout_lasts_until_access_ends(getter, product_access):
+    product_access.setattr_and_save("end_date", datetime(2010, 3, 10, 12, 0))
+
+    assert getter.get_cache_timeout() == 60 * 60
+
+
+@pytest.mark.freeze_time("2010-03-10 23:00")
+def test_cache_timeout_respects_upcoming_changes(getter):
+    assert getter.get_cache_timeout(datetime(2010, 3, 10, 23, 10, tzinfo=UTC)) == 60 * 10
+
+
+@pytest.mark.freeze_time("2010-03-10 23:00")
+def test_cache_timeout_is_limited_by_settings(getter, product_access, settings):
+    settings.PRODUCT_ACCESS_CACHE_MAX_DURATION_SECONDS = 60
+
+    assert getter.get_cache_timeout() == 60
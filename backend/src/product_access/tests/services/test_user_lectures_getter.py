@@ -73,3 +73,19 @@ def test_access_depends_on_schedule_time_when_lectures_history_is_not_available(
     lecture.setattr_and_save("scheduled_at", scheduled_at and make_dt(scheduled_at))
 
     assert (lecture.id in getter()) is expected
+
+
+@pytest.mark.freeze_time("2020-12-05")
+@pytest.mark.usefixtures("subscription_access")
+@pytest.mark.parametrize(
+    ("scheduled_at", "expected"),
+    [
+        ("2020-12-06", "2020-12-06"),
+        ("2020-12-04", None),
+        (None, None),
+    ],
+)
+def test_next_lecture_unlock(getter, lecture, make_dt, scheduled_at, expected):
+    lecture.setattr_and_save("scheduled_at", scheduled_at and make_dt(scheduled_at))
+
+    assert getter.get_next_lecture_unlock() == (expected and make_dt(expected))
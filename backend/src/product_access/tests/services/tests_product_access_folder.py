@@ -0,0 +1,153 @@
+from itertools import permutations
+
+import pytest
+
+from product_access.models import ProductAccess, ProductAccessEvent, ProductAccessEventType
+from product_access.services import ProductAccessEventRecorder, ProductAccessFolder
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def grant(user, product, make_dt):
+    return lambda event_time: ProductAccessEvent(
+        order_id="some-id",
+        event_type=ProductAccessEventType.GRANTED,
+        event_time=make_dt(event_time),
+        user=user,
+        product=product,
+        start_date=make_dt("2030-01-01"),
+        end_date=None,
+    )
+
+
+@pytest.fixture
+def revoke(make_dt):
+    return lambda event_time: ProductAccessEvent(
+        order_id="some-id",
+        event_type=ProductAccessEventType.REVOKED,
+        event_time=make_dt(event_time),
+    )
+
+
+@pytest.mark.parametrize("order", list(permutations(range(3))))
+def test_access_does_not_depend_on_order_of_events(grant, revoke, make_dt, order):
+    events = [grant("2030-01-02"), revoke("2030-01-03"), grant("2030-01-04")]
+
+    for index in order:
+        ProductAccessEventRecorder(events=[events[index]])()
+
+    access = ProductAccess.objects.get()
+    assert access.granted_at == make_dt("2030-01-04")
+    assert access.revoked_at is None
+
+
+@pytest.mark.parametrize("order", list(permutations(range(2))))
+def test_access_is_revoked_by_the_latest_revoke(grant, revoke, user, make_dt, order):
+    events = [grant("2030-01-02"), revoke("2030-01-03")]
+
+    for index in order:
+        ProductAccessEventRecorder(events=[events[index]])()
+
+    access = ProductAccess.objects.get()
+    assert access.user == user
+    assert access.granted_at == make_dt("2030-01-02")
+    assert access.revoked_at == make_dt("2030-01-03")
+
+
+def test_revoke_without_grant_gives_empty_access(revoke, make_dt):
+    ProductAccessEventRecorder(events=[revoke("2030-01-03")])()
+
+    access = ProductAccess.objects.get()
+    assert access.user is None
+    assert access.product is None
+    assert access.revoked_at == make_dt("2030-01-03")
+
+
+def test_duplicated_events_are_stored_once(grant):
+    ProductAccessEventRecorder(events=[grant("2030-01-02")])()
+    ProductAccessEventRecorder(events=[grant("2030-01-02"), grant("2030-01-02")])()
+
+    assert ProductAccessEvent.objects.count() == 1
+    assert ProductAccess.objects.count() == 1
+
+
+def test_revoke_wins_over_grant_of_the_same_moment(grant, revoke, make_dt):
+    ProductAccessEventRecorder(events=[revoke("2030-01-02"), grant("2030-01-02")])()
+
+    assert ProductAccess.objects.get().revoked_at == make_dt("2030-01-02")
+
+
+def test_existing_access_is_seeded_to_the_log(factory, user, product, revoke, make_dt):
+    factory.product_access(order_id="some-id", user=user, product=product, granted_at=make_dt("2030-01-02"))
+
+    ProductAccessEventRecorder(events=[revoke("2030-01-03")])()
+
+    assert ProductAccessEvent.objects.filter(event_type=ProductAccessEventType.GRANTED, event_time=make_dt("2030-01-02"), user=user).exists()
+    access = ProductAccess.objects.get()
+    assert access.user == user
+    assert access.revoked_at == make_dt("2030-01-03")
+
+
+def test_folder_recomputes_access_from_log(grant, revoke, make_dt):
+    ProductAccessEventRecorder(events=[grant("2030-01-02")])()
+    ProductAccess.objects.update(revoked_at=make_dt("2030-01-10"))
+
+    ProductAccessFolder(order_ids=["some-id"], lock=True)()
+
+    assert ProductAccess.objects.get().revoked_at is None
+
+
+def test_access_is_refolded_after_commit(grant, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        ProductAccessEventRecorder(events=[grant("2030-01-02")])()
+
+    assert len(callbacks) == 1
+    assert ProductAccess.objects.count() == 1
+
+
+def test_cache_of_previous_and_new_owners_is_invalidated(factory, grant, user, mocker):
+    invalidate = mocker.patch("product_access.services.UserProductAccessCacheInvalidator.invalidate_many")
+    previous_user = factory.user()
+    factory.product_access(order_id="some-id", user=previous_user, granted_at=None)
+
+    ProductAccessEventRecorder(events=[grant("2030-01-02")])()
+
+    assert set(invalidate.call_args.kwargs["user_ids"]) == {previous_user.id, user.id}
+
+
+@pytest.mark.parametrize("event_time", ["2030-01-02", "2030-01-01"])
+def test_duplicated_and_late_grants_keep_access_edited_in_admin(grant, make_dt, event_time):
+    ProductAccessEventRecorder(events=[grant("2030-01-02")])()
+    ProductAccess.objects.update(end_date=make_dt("2030-06-01"))
+
+    ProductAccessEventRecorder(events=[grant(event_time)])()
+
+    access = ProductAccess.objects.get()
+    assert access.end_date == make_dt("2030-06-01")
+    assert access.granted_at == make_dt("2030-01-02")
+
+
+def test_revoke_writes_only_revoke_time(grant, revoke, make_dt):
+    ProductAccessEventRecorder(events=[grant("2030-01-02")])()
+    ProductAccess.objects.update(end_date=make_dt("2030-06-01"))
+
+    ProductAccessEventRecorder(events=[revoke("2030-01-03")])()
+
+    access = ProductAccess.objects.get()
+    assert access.end_date == make_dt("2030-06-01")
+    assert access.revoked_at == make_dt("2030-01-03")
+
+
+def test_newer_grant_overwrites_access(grant, make_dt):
+    ProductAccessEventRecorder(events=[grant("2030-01-02")])()
+    ProductAccess.objects.update(end_date=make_dt("2030-06-01"))
+
+    ProductAccessEventRecorder(events=[grant("2030-01-03")])()
+
+    access = ProductAccess.objects.get()
+    assert access.end_date is None
+    assert access.granted_at == make_dt("2030-01-03")
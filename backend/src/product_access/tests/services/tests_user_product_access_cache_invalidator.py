@@ -1,7 +1,6 @@
 import pytest
-from django.core.cache import cache
 
-from product_access.services import UserProductAccessCacheInvalidator
+from product_access.services import UserEntitlementsGetter, UserProductAccessCacheInvalidator
 
 
 pytestmark = [
@@ -15,51 +14,43 @@ def invalidator(user):
 
 
 @pytest.fixture
-def cache_keys(user):
-    return [
-        f"subscription_boundaries_{user.id}",
-        f"user_course_plans_{user.id}_with_series_True",
-        f"user_course_plans_{user.id}_with_series_False",
-        f"user_course_series_{user.id}",
-        f"user_course_versions_{user.id}_with_series_True",
-        f"user_course_versions_{user.id}_with_series_False",
-        f"user_lectures_{user.id}",
-        f"user_recurring_subscription_checker_{user.id}",
-        f"user_subscription_checker_{user.id}",
-    ]
+def cache_enabled(settings):
+    settings.CACHE_ENABLED = True
 
 
 @pytest.fixture
-def prepare_cache(cache_keys):
-    for key in cache_keys:
-        cache.set(key, "dummy_value")
+def subscription_access(product_access, product):
+    product.setattr_and_save("product_type", "subscription")
+    return product_access
 
 
-def test_invalidate_all_keys(invalidator, cache_keys, prepare_cache):
-    # Ensure all keys exist before invalidation
-    for key in cache_keys:
-        assert cache.get(key) == "dummy_value"
+def get_cache_keys(user):
+    getter = UserEntitlementsGetter(user=user)
+    return [getter.cache_key, getter.get_versioned_cache_key("user_lectures")]
+
+
+def test_invalidation_changes_all_cache_keys(invalidator, user):
+    cache_keys = get_cache_keys(user)
 
     invalidator()
 
-    for key in cache_keys:
-        assert cache.get(key) is None
+    assert set(get_cache_keys(user)).isdisjoint(cache_keys)
 
 
-def test_invalidation_is_idempotent(invalidator, cache_keys):
-    # Call invalidation when keys don't exist — should not raise errors
+def test_invalidation_is_idempotent(invalidator, user):
+    invalidator()
+    cache_keys = get_cache_keys(user)
+
     invalidator()
 
-    for key in cache_keys:
-        assert cache.get(key) is None
+    assert set(get_cache_keys(user)).isdisjoint(cache_keys)
 
 
-def test_partial_cache_is_also_cleaned(invalidator, cache_keys):
-    # Set only part of the keys
-    for key in cache_keys[:3]:
-        cache.set(key, "partial_value")
+@pytest.mark.usefixtures("cache_enabled")
+def test_stale_entitlements_are_not_served_after_invalidation(invalidator, user, subscription_access):
+    assert UserEntitlementsGetter(user=user)().has_subscription is True
+    subscription_access.setattr_and_save("revoked_at", subscription_access.start_date)
 
     invalidator()
 
-    for key in cache_keys:
-        assert cache.get(key) is None
+    assert UserEntitlementsGetter(user=user)().has_subscription is False
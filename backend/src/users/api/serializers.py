@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from bonuses.models import BonusTransaction
 from users.models import User
 
 
@@ -72,6 +73,30 @@ class UserBonusesSerializer(serializers.Serializer):
     bonuses = serializers.IntegerField(min_value=0)
 
 
+class UserBonusTransactionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BonusTransaction
+        fields = [
+            "id",
+            "amount",
+            "transaction_type",
+            "reason",
+            "created",
+        ]
+
+
+class UserBonusSummaryQuerySerializer(serializers.Serializer):
+    date_from = serializers.DateField(required=False, help_text="Defaults to the first day of the month of `date_to`")
+    date_to = serializers.DateField(required=False, help_text="Defaults to today")
+
+
+class UserBonusSummarySerializer(serializers.Serializer):
+    balance_at_start = serializers.IntegerField(min_value=0)
+    balance_at_end = serializers.IntegerField(min_value=0)
+    earned = serializers.IntegerField(min_value=0)
+    spent = serializers.IntegerField(min_value=0)
+
+
 class UserCommentTokenSerializer(serializers.Serializer):
     signature = serializers.CharField()
     user_json_base64 = serializers.CharField()
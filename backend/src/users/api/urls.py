@@ -9,6 +9,8 @@ app_name = "users"
 urlpatterns = [
     path("account/", viewsets.SelfView.as_view({"get": "get", "patch": "partial_update"})),
     path("account/bonuses/", viewsets.SelfView.as_view({"get": "bonuses"})),
+    path("account/bonuses/summary/", viewsets.SelfView.as_view({"get": "bonus_summary"})),
+    path("account/bonuses/transactions/", viewsets.SelfView.as_view({"get": "bonus_transactions"})),
     path("account/comment-token/", viewsets.SelfView.as_view({"get": "comment_auth"})),
     path("account/deactivate/", viewsets.SelfView.as_view({"post": "deactivate"})),
     path("auth/register/", viewsets.SignUpView.as_view()),
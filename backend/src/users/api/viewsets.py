@@ -1,6 +1,7 @@
 from django.contrib.auth import logout
 from django.db.models import QuerySet
 from django.db.transaction import on_commit
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
@@ -12,15 +13,21 @@ from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CON
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import SlidingToken
 
-from a12n.models import PasswordlessEmailAuthCode
+from a12n.auth_code_store import get_auth_code_store
+from app.api.pagination import AppCursorPagination
 from app.api.request import AuthenticatedRequest
 from app.api.viewsets import RetrieveOrUpdateModelViewSet
 from app.services import PlatformDetector
+from bonuses.models import BonusTransaction
+from bonuses.services import BonusSummaryGetter
 from mindbox.tasks import send_customer_interests
 from users.api.serializers import (
     ResponseSocialUserSignUpSerializer,
     SocialUserSignUpSerializer,
     UserBonusesSerializer,
+    UserBonusSummaryQuerySerializer,
+    UserBonusSummarySerializer,
+    UserBonusTransactionSerializer,
     UserCommentTokenSerializer,
     UserInterestsSerializer,
     UserRecurrentInfoSerializer,
@@ -63,6 +70,32 @@ class SelfView(RetrieveOrUpdateModelViewSet):
         bonuses_count = UserBonusesGetter(user=request.user)()
         return Response(UserBonusesSerializer({"bonuses": bonuses_count}).data)
 
+    @extend_schema(
+        description="Get user bonus transactions, newest first",
+        responses=UserBonusTransactionSerializer(many=True),
+    )
+    @action(detail=False, methods=["get"])
+    def bonus_transactions(self, request: AuthenticatedRequest) -> Response:
+        paginator = AppCursorPagination()
+        transactions = paginator.paginate_queryset(BonusTransaction.objects.filter(account__user=request.user), request, view=self)
+        return paginator.get_paginated_response(UserBonusTransactionSerializer(transactions, many=True).data)
+
+    @extend_schema(
+        description="Get user bonus balances at the start and the end of the period and totals earned and spent during it",
+        parameters=[UserBonusSummaryQuerySerializer],
+        responses=UserBonusSummarySerializer,
+    )
+    @action(detail=False, methods=["get"])
+    def bonus_summary(self, request: AuthenticatedRequest) -> Response:
+        serializer = UserBonusSummaryQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        date_to = serializer.validated_data.get("date_to", timezone.localdate())
+        date_from = serializer.validated_data.get("date_from", date_to.replace(day=1))
+        summary = BonusSummaryGetter(user=request.user, date_from=date_from, date_to=date_to)()
+
+        return Response(UserBonusSummarySerializer(summary).data)
+
     @extend_schema(
         description="Get user cackle auth key",
         responses=UserCommentTokenSerializer,
@@ -120,7 +153,7 @@ class SignUpView(APIView):
         sign_up_data = dict(serializer.validated_data)
 
         user = UserSignerUp(**sign_up_data)()
-        auth_code = PasswordlessEmailAuthCode.objects.create(user=user)
+        auth_code = get_auth_code_store().create(user)
 
         send_user_auth_code_to_email.delay(str(auth_code.id))
 
@@ -144,7 +177,7 @@ class SignInView(APIView):
         sign_in_data = dict(serializer.validated_data)
 
         # Please, move it to service object
-        user = User.objects.filter(username__iexact=sign_in_data["username"]).first()
+        user = User.objects.by_username(sign_in_data["username"]).first()
         if not user:
             if PlatformDetector(request).is_ios:
                 return Response(status=400, data={"serviceError": _("Account does not exist, try another one.")})
@@ -152,7 +185,7 @@ class SignInView(APIView):
             return Response(status=400, data={"serviceError": _("Account does not exist, try another one or create a new one.")})
 
         if not user.is_apple_review_account():
-            auth_code = PasswordlessEmailAuthCode.objects.create(user=user)
+            auth_code = get_auth_code_store().create(user)
             send_user_auth_code_to_email.delay(str(auth_code.id))
 
         return Response({"username": user.username}, status=HTTP_200_OK)
@@ -34,7 +34,7 @@ class Command(BaseCommand):
                     birthday_str = row["Дата рождения"].strip()
 
                     try:
-                        user = User.objects.get(username__iexact=email)
+                        user = User.objects.get_by_username(email)
                         birthday = datetime.strptime(birthday_str, "%d.%m.%Y").date()  # noqa: DTZ007
                         user.birthdate = birthday
                         user.save(update_fields=["birthdate"])
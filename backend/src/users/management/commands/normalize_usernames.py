@@ -0,0 +1,81 @@
+import csv
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Count, F
+from django.db.models.functions import Lower
+
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = "Lowercase usernames and report users whose usernames differ in case only"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of users updated with one query")
+        parser.add_argument("--dry-run", action="store_true", help="Only report users that would be updated")
+        parser.add_argument("--output", type=str, required=False, help="Path to output CSV file for colliding users")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        collisions = self.get_collisions()
+        for username, users in collisions.items():
+            self.stderr.write(self.style.ERROR(f"Usernames collide with {username}: {', '.join(f'{user_id} {name}' for user_id, name in users)}"))
+
+        if options["output"] and collisions:
+            self.write_collisions(Path(options["output"]), collisions)
+
+        to_normalize = (
+            User.objects.alias(username_lower=Lower("username"))
+            .exclude(username=F("username_lower"))
+            .exclude(username_lower__in=collisions.keys())
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+        normalized = 0
+        last_id = None
+        while True:
+            batch = to_normalize.filter(id__gt=last_id) if last_id is not None else to_normalize
+            user_ids = list(batch[: options["batch_size"]])
+            if not user_ids:
+                break
+
+            if not options["dry_run"]:
+                User.objects.filter(id__in=user_ids).update(username=Lower("username"))
+
+            normalized += len(user_ids)
+            last_id = user_ids[-1]
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{'Dry run completed' if options['dry_run'] else 'Normalization completed'}. "
+                f"Normalized {normalized} usernames, found {len(collisions)} colliding usernames.",
+            ),
+        )
+
+    @staticmethod
+    def get_collisions() -> dict[str, list[tuple[UUID, str]]]:
+        colliding_usernames = (
+            User.objects.annotate(username_lower=Lower("username"))
+            .values("username_lower")
+            .annotate(count=Count("id"))
+            .filter(count__gt=1)
+            .values("username_lower")
+        )
+
+        collisions: dict[str, list[tuple[UUID, str]]] = {}
+        users = User.objects.alias(username_lower=Lower("username")).filter(username_lower__in=colliding_usernames).order_by("username", "id")
+        for user_id, username in users.values_list("id", "username"):
+            collisions.setdefault(username.lower(), []).append((user_id, username))
+
+        return collisions
+
+    @staticmethod
+    def write_collisions(path: Path, collisions: dict[str, list[tuple[UUID, str]]]) -> None:
+        with path.open("w", newline="") as output:
+            writer = csv.writer(output, delimiter=";")
+            writer.writerow(["normalized_username", "id", "username"])
+            for normalized_username, users in collisions.items():
+                writer.writerows([normalized_username, user_id, username] for user_id, username in users)
@@ -1,20 +1,61 @@
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, ClassVar
 from urllib.parse import urljoin
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, UserManager as _UserManager
 from django.db import models
+from django.db.models import Case, F, QuerySet, When
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
 from app.models import DefaultModel
+from app.utils import memoize_for_request
 
 
 if TYPE_CHECKING:
     from product_access.services import SubscriptionBoundaries
 
 
+class UserQuerySet(QuerySet):
+    """
+    Users are looked up by email case-insensitively with `lower(username)`, so that the functional index is used.
+    Of users whose usernames differ in case only the one with normalized username goes first.
+    """
+
+    @staticmethod
+    def normalize_username(username: str) -> str:
+        return username.strip().lower()
+
+    def by_username(self, username: str) -> "UserQuerySet":
+        normalized_username = self.normalize_username(username)
+        return (
+            self.alias(username_lower=Lower("username"))
+            .filter(username_lower=normalized_username)
+            .order_by(Case(When(username=normalized_username, then=0), default=1), "date_joined")
+        )
+
+    def by_usernames(self, usernames: Iterable[str]) -> "UserQuerySet":
+        return (
+            self.alias(username_lower=Lower("username"))
+            .filter(username_lower__in={self.normalize_username(username) for username in usernames})
+            .order_by(Case(When(username=F("username_lower"), then=0), default=1), "date_joined")
+        )
+
+    def get_by_username(self, username: str) -> "User":
+        user = self.by_username(username).first()
+        if user is None:
+            raise self.model.DoesNotExist("User matching query does not exist.")
+
+        return user
+
+
+class UserManager(_UserManager.from_queryset(UserQuerySet)):  # type: ignore[misc]
+    pass
+
+
 class User(AbstractUser, DefaultModel):
-    objects: ClassVar[_UserManager] = _UserManager()
+    objects: ClassVar[UserManager] = UserManager()
 
     phone = models.CharField(
         _("Phone"),
@@ -86,12 +127,18 @@ class User(AbstractUser, DefaultModel):
         ]
         verbose_name = _("User")
         verbose_name_plural = _("Users")
+        indexes = [
+            models.Index(Lower("username"), name="users_user_username_lower_idx"),
+        ]
 
     @property
     def subscription_boundaries(self) -> "SubscriptionBoundaries | None":
         from product_access.services import SubscriptionBoundariesCalculator
 
-        return SubscriptionBoundariesCalculator(user=self).get_any_subscription_boundaries()
+        return memoize_for_request(
+            ("subscription_boundaries", self.id),
+            SubscriptionBoundariesCalculator(user=self).get_any_subscription_boundaries,
+        )
 
     def get_login_as_url(self) -> str:
         return urljoin(settings.ABSOLUTE_URL, f"/auth/as/{self.pk}/")
@@ -99,7 +146,7 @@ class User(AbstractUser, DefaultModel):
     def has_recurring_subscription(self) -> bool:
         from product_access.services import UserRecurringSubscriptionChecker
 
-        return UserRecurringSubscriptionChecker(user=self)()
+        return memoize_for_request(("has_recurring_subscription", self.id), UserRecurringSubscriptionChecker(user=self))
 
     def is_apple_review_account(self) -> bool:
         return self.email in [
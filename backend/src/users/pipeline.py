@@ -14,7 +14,7 @@ def associate_by_email(strategy: Any, details: dict[str, Any], backend: Any, *ar
     if kwargs.get("user"):
         return {}  # user is already associated, skip
 
-    user = User.objects.filter(username__iexact=details.get("email")).first()
+    user = User.objects.by_username(details.get("email", "")).first()
     if user:
         return {"user": user}
 
@@ -1,5 +1,6 @@
 from users.services.auth_code_email_context_builder import AuthCodeEmailContextBuilder
 from users.services.oauth_user_fetcher import OAuthUserFetcher, OAuthUserFetcherException
+from users.services.user_bulk_importer import UserBulkImporter
 from users.services.user_comment_token_getter import UserCommentTokenGetter
 from users.services.user_creator import UserCreator
 from users.services.user_deactivator import UserDeactivator, UserDeactivatorException
@@ -15,6 +16,7 @@ __all__ = [
     "AuthCodeEmailContextBuilder",
     "OAuthUserFetcher",
     "OAuthUserFetcherException",
+    "UserBulkImporter",
     "UserCommentTokenGetter",
     "UserCreator",
     "UserDeactivator",
@@ -11,6 +11,7 @@ from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from rest_framework import status
 
+from app import http_transport
 from app.exceptions import AppServiceException
 from app.services import BaseService
 
@@ -59,7 +60,7 @@ class OAuthUserFetcher(BaseService):
     @cached_property
     def token_response(self) -> dict[str, Any]:
         try:
-            response = requests.post(
+            response = http_transport.post(
                 url=self.provider_data["token_url"],
                 data={
                     "code": self.code,
@@ -68,7 +69,6 @@ class OAuthUserFetcher(BaseService):
                     "redirect_uri": self.redirect_uri,
                     "grant_type": "authorization_code",
                 },
-                timeout=20,
             )
         except requests.RequestException as e:
             raise OAuthUserFetcherException(_("Failed to request access token.")) from e
@@ -106,10 +106,9 @@ class OAuthUserFetcher(BaseService):
             raise OAuthUserFetcherException(_("Failed to decode id_token from Apple."))
 
     def handle_mailru(self) -> dict[str, Any]:
-        response = requests.get(
+        response = http_transport.get(
             url=self.provider_data["userinfo_url"],
             params={"access_token": self.get_access_token()},
-            timeout=20,
         )
 
         if response.status_code != status.HTTP_200_OK:
@@ -118,10 +117,9 @@ class OAuthUserFetcher(BaseService):
         return response.json()
 
     def handle_default(self) -> dict[str, Any]:
-        response = requests.get(
+        response = http_transport.get(
             url=self.provider_data["userinfo_url"],
             headers={"Authorization": f"{self.provider_data['auth_scheme']} {self.get_access_token()}"},
-            timeout=20,
         )
 
         if response.status_code != status.HTTP_200_OK:
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+
+from app.services import BulkCSVImporter, BulkImportResult
+from users.models import User
+from users.services.user_importer import UserImporter, UserImporterException
+
+
+@dataclass
+class UserBulkImporter(BulkCSVImporter):
+    """
+    Set-based UserImporter for large files: every chunk is written with a single upsert
+    """
+
+    skip_if_user_exists: bool = False
+
+    def import_chunk(self, rows: list[dict]) -> BulkImportResult:
+        result = BulkImportResult()
+        users: dict[str, User] = {}
+        for row in rows:
+            try:
+                user = self.build_user(row)
+            except (UserImporterException, KeyError, ValueError) as e:
+                result.fail(row, str(e))
+                continue
+
+            users[user.username] = user
+
+        if self.skip_if_user_exists:
+            existent_usernames = {username.lower() for username in User.objects.by_usernames(users.keys()).values_list("username", flat=True)}
+            users = {username: user for username, user in users.items() if username.lower() not in existent_usernames}
+            result.skipped += len(existent_usernames)
+
+        User.objects.bulk_create(
+            users.values(),
+            update_conflicts=True,
+            unique_fields=["username"],
+            update_fields=["email", "first_name", "last_name", "date_joined", "avatar_slug"],
+        )
+        result.imported += len(users)
+
+        return result
+
+    def build_user(self, row: dict) -> User:
+        importer = UserImporter(data=row)
+        importer.validate_email()
+
+        return User(
+            username=importer.username,
+            email=importer.username,
+            first_name=importer.first_name,
+            last_name=importer.last_name,
+            date_joined=importer.date_joined,
+            avatar_slug="abstract",
+        )
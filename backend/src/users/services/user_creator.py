@@ -71,7 +71,7 @@ class UserCreator(BaseService):
         except ValidationError:
             raise UserCreatorException(_("Invalid email."))
 
-        if User.objects.filter(username=self.normalized_username).exists():
+        if User.objects.by_username(self.normalized_username).exists():
             raise UserCreatorException(_("User with such email already exists."))
 
     def get_validators(self) -> list[Callable]:
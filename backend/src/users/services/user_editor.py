@@ -4,14 +4,12 @@ from datetime import date
 from typing import Any, ClassVar
 
 from django.db import IntegrityError, transaction
-from django.db.transaction import on_commit
 from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
 
 from app.exceptions import AppServiceException
 from app.services import BaseService
-from mindbox.tasks import edit_customer
 from users.models import User
 from users.services.user_creator import UserCreator
 
@@ -29,6 +27,7 @@ class UserEditor(BaseService):
     """
 
     empty_value: ClassVar = str
+    mindbox_fields: ClassVar[frozenset[str]] = frozenset(("first_name", "last_name", "birthdate"))  # sent by MindboxOutboxEventSender.edit_customer
 
     username: str
     phone: str | None = empty_value
@@ -65,20 +64,32 @@ class UserEditor(BaseService):
                     if user is None:
                         raise
 
-        on_commit(lambda: edit_customer.delay(str(user.id)))
-        return self.update_user(user), False
+        changed_fields = self.update_user(user)
+        if self.mindbox_fields.intersection(changed_fields):
+            self.notify_mindbox(user)
+
+        return user, False
+
+    @staticmethod
+    def notify_mindbox(user: User) -> None:
+        from mindbox.models import MindboxOutboxOperation
+        from mindbox.services import MindboxOutboxEventCreator
+
+        MindboxOutboxEventCreator(user=user, operation=MindboxOutboxOperation.EDIT_CUSTOMER)()
 
     def get_user(self) -> User | None:
         try:
-            return User.objects.get(username=self.normalized_username)
+            return User.objects.get_by_username(self.normalized_username)
         except User.DoesNotExist:
             return None
 
-    def update_user(self, user: User) -> User:
-        user.update_from_kwargs(**self.user_kwargs)
-        user.save(update_fields=self.user_kwargs.keys())
+    def update_user(self, user: User) -> list[str]:
+        """Save only the fields that differ, so repeated edits with the same data don't write anything"""
+        changed_fields = user.update_changed_fields(**self.user_kwargs)
+        if changed_fields:
+            user.save(update_fields=changed_fields)
 
-        return user
+        return changed_fields
 
     @property
     def user_kwargs(self) -> dict[str, Any]:
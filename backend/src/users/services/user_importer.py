@@ -21,23 +21,29 @@ class UserImporter(BaseService):
     skip_if_user_exists: bool = False
 
     def act(self) -> User:
-        if self.skip_if_user_exists and self.existent_user is not None:
-            return self.existent_user
-
-        return User.objects.update_or_create(
-            username=self.username,
-            defaults=dict(
-                email=self.username,
-                first_name=self.first_name,
-                last_name=self.last_name,
-                date_joined=self.date_joined,
-                avatar_slug="abstract",
-            ),
-        )[0]
+        user = self.existent_user
+        if user is None:
+            return User.objects.create(username=self.username, **self.user_kwargs)
+
+        if not self.skip_if_user_exists:
+            user.update_from_kwargs(**self.user_kwargs)
+            user.save(update_fields=self.user_kwargs.keys())
+
+        return user
+
+    @property
+    def user_kwargs(self) -> dict:
+        return dict(
+            email=self.username,
+            first_name=self.first_name,
+            last_name=self.last_name,
+            date_joined=self.date_joined,
+            avatar_slug="abstract",
+        )
 
     @cached_property
     def existent_user(self) -> User | None:
-        return User.objects.filter(username=self.username).first()
+        return User.objects.by_username(self.username).first()
 
     def parse_date_joined(self, raw_value: str) -> datetime:
         return datetime.fromisoformat(raw_value)
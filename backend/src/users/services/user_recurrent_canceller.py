@@ -32,6 +32,7 @@ class UserRecurrentCanceller(BaseService):
         if recurrent.status == RecurrentStatus.ACTIVE:
             recurrent.status = RecurrentStatus.CANCELLED
             recurrent.save(update_fields=["status"])
+            recurrent.invalidate_user_access_cache()
 
     @cached_property
     def recurrent(self) -> Recurrent:
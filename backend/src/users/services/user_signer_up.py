@@ -34,7 +34,7 @@ class UserSignerUp(BaseService):
 
     @cached_property
     def existent_user(self) -> User | None:
-        return User.objects.filter(username=self.username).first()
+        return User.objects.by_username(self.username).first()
 
     def get_validators(self) -> list[Callable]:
         return [
@@ -1,6 +1,6 @@
 from django.conf import settings
 
-from a12n.models import PasswordlessEmailAuthCode
+from a12n.auth_code_store import get_auth_code_store
 from app.celery import celery
 from mindbox.services import MindboxClient
 from mindbox.utils import is_corporate_email
@@ -11,7 +11,11 @@ from users.services import AuthCodeEmailContextBuilder
     name="send_user_auth_code_to_email",
 )
 def send_user_auth_code_to_email(auth_code_id: str) -> None:
-    user_email, auth_code = PasswordlessEmailAuthCode.objects.values_list("user__username", "code").get(id=auth_code_id)
+    username_and_code = get_auth_code_store().get_username_and_code(auth_code_id)
+    if username_and_code is None:
+        return
+
+    user_email, auth_code = username_and_code
 
     context = AuthCodeEmailContextBuilder(user_email, auth_code)()
 
@@ -0,0 +1,54 @@
+import pytest
+
+
+pytestmark = [pytest.mark.django_db]
+
+transactions_url = "/api/demo/users/account/bonuses/transactions/"
+summary_url = "/api/demo/users/account/bonuses/summary/"
+
+
+@pytest.fixture
+def bonus_account(factory, user):
+    return factory.bonus_account(user=user)
+
+
+@pytest.fixture
+def transactions(factory, bonus_account, freezer):
+    transactions = []
+    for day in range(1, 4):
+        freezer.move_to(f"2025-01-0{day} 12:00")
+        transactions.append(factory.bonus_transaction(account=bonus_account, amount=day))
+
+    return transactions
+
+
+def test_transactions_are_paginated_newest_first(as_user, transactions):
+    first_page = as_user.get(transactions_url, data={"page_size": 2})
+    second_page = as_user.get(first_page["next"])
+
+    assert [item["amount"] for item in first_page["results"]] == [3, 2]
+    assert [item["amount"] for item in second_page["results"]] == [1]
+    assert second_page["next"] is None
+
+
+def test_only_own_transactions_are_listed(as_user, transactions, factory):
+    factory.bonus_transaction()
+
+    response = as_user.get(transactions_url)
+
+    assert len(response["results"]) == 3
+
+
+def test_summary_defaults_to_current_month(as_user, bonus_account):
+    response = as_user.get(summary_url)
+
+    assert response == {"balanceAtStart": 100, "balanceAtEnd": 100, "earned": 0, "spent": 0}
+
+
+def test_summary_for_reversed_period(as_user, bonus_account):
+    as_user.get(summary_url, data={"date_from": "2025-02-01", "date_to": "2025-01-01"}, expected_status=400)
+
+
+def test_forbid_for_anon(as_anon):
+    as_anon.get(transactions_url, expected_status=401)
+    as_anon.get(summary_url, expected_status=401)
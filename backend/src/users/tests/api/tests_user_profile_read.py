@@ -4,6 +4,8 @@ import pytest
 from django.conf import settings
 from django.utils.timezone import now
 
+from product_access.services import SubscriptionBoundariesCalculator, UserRecurringSubscriptionChecker
+
 
 pytestmark = [pytest.mark.django_db]
 
@@ -84,3 +86,14 @@ def test_anon(as_anon):
     response = as_anon.get(base_url, as_response=True)
 
     assert response.status_code == 401
+
+
+@pytest.mark.usefixtures("recurring_subscription")
+def test_subscription_facts_are_read_once_per_request(as_user, mocker):
+    get_boundaries = mocker.spy(SubscriptionBoundariesCalculator, "get_any_subscription_boundaries")
+    check_recurring_subscription = mocker.spy(UserRecurringSubscriptionChecker, "act")
+
+    as_user.get(base_url)
+
+    get_boundaries.assert_called_once()
+    check_recurring_subscription.assert_called_once()
@@ -82,12 +82,12 @@ def mock_provider_data(settings):
 
 @pytest.fixture
 def mock_token_response(mocker):
-    return mocker.patch("users.services.oauth_user_fetcher.requests.post")
+    return mocker.patch("users.services.oauth_user_fetcher.http_transport.post")
 
 
 @pytest.fixture
 def mock_userinfo_response(mocker):
-    return mocker.patch("users.services.oauth_user_fetcher.requests.get")
+    return mocker.patch("users.services.oauth_user_fetcher.http_transport.get")
 
 
 @pytest.fixture(autouse=True)
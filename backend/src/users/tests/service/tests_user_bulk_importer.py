@@ -0,0 +1,102 @@
+import csv
+
+import pytest
+
+from users.models import User
+from users.services import UserBulkImporter
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def rows():
+    return [
+        {"Имя": "Ванесса", "Фамилия": "Мэй", "E-mail": "VM@gmail.test", "Дата регистрации": "2024-12-12T13:39:58.000Z"},
+        {"Имя": "Анна", "Фамилия": "Нетребко", "E-mail": "an@gmail.test", "Дата регистрации": "2024-12-13T10:00:00.000Z"},
+    ]
+
+
+@pytest.fixture
+def data(tmp_path, rows):
+    path = tmp_path / "users.csv"
+    with path.open("w") as output:
+        writer = csv.DictWriter(output, fieldnames=list(rows[0].keys()), delimiter=";")
+        writer.writeheader()
+        writer.writerows(rows)
+
+    return path
+
+
+@pytest.fixture
+def importer(data):
+    return UserBulkImporter(data=data, chunk_size=1)
+
+
+def test_users_are_created(importer):
+    result = importer()
+
+    assert result.imported == 2
+    assert set(User.objects.values_list("username", "first_name")) == {("vm@gmail.test", "Ванесса"), ("an@gmail.test", "Анна")}
+
+
+def test_existing_users_are_updated(importer, factory):
+    user = factory.user(username="vm@gmail.test", first_name="Old")
+
+    importer()
+
+    user.refresh_from_db()
+    assert user.first_name == "Ванесса"
+
+
+def test_existing_users_are_skipped(importer, factory):
+    user = factory.user(username="vm@gmail.test", first_name="Old")
+    importer.skip_if_user_exists = True
+
+    result = importer()
+
+    user.refresh_from_db()
+    assert user.first_name == "Old"
+    assert result.skipped == 1
+
+
+@pytest.mark.parametrize("rows", [[{"Имя": "", "Фамилия": "", "E-mail": "not-an-email", "Дата регистрации": "2024-12-12T13:39:58.000Z"}]])
+def test_invalid_rows_are_reported(importer):
+    result = importer()
+
+    assert result.imported == 0
+    assert result.failures[0].row["E-mail"] == "not-an-email"
+    assert not User.objects.filter(username="not-an-email").exists()
+
+
+def test_dry_run_does_not_save_anything(importer):
+    importer.dry_run = True
+
+    result = importer()
+
+    assert result.imported == 2
+    assert User.objects.count() == 0
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [
+            {"Имя": "Ванесса", "Фамилия": "Мэй", "E-mail": "VM@gmail.test", "Дата регистрации": "2024-12-12T13:39:58.000Z"},
+            {"Имя": "Анна", "Фамилия": "", "E-mail": "not-an-email", "Дата регистрации": "2024-12-13T10:00:00.000Z"},
+        ],
+    ],
+)
+def test_failures_are_written_to_file(importer, tmp_path):
+    result = importer()
+    path = tmp_path / "failures.csv"
+
+    result.write_failures(path)
+
+    with path.open() as failures:
+        written = list(csv.DictReader(failures, delimiter=";"))
+    assert written == [
+        {"reason": result.failures[0].reason, "Имя": "Анна", "Фамилия": "", "E-mail": "not-an-email", "Дата регистрации": "2024-12-13T10:00:00.000Z"},
+    ]
@@ -3,6 +3,7 @@ from datetime import date
 import pytest
 from django.db import IntegrityError
 
+from mindbox.models import MindboxOutboxEvent, MindboxOutboxOperation
 from users.models import User
 from users.services import UserEditor, UserEditorException
 
@@ -26,8 +27,8 @@ def user(user):
 
 
 @pytest.fixture(autouse=True)
-def mock_edit_customer_task(mocker):
-    return mocker.patch("mindbox.tasks.edit_customer.delay")
+def mock_drain_mindbox_outbox(mocker):
+    return mocker.patch("mindbox.tasks.drain_mindbox_outbox.apply_async")
 
 
 @pytest.fixture
@@ -195,8 +196,37 @@ def test_update_user_rhash(user):
     assert user.rhash == "new_rhash"
 
 
-def test_edit_customer_task_is_called(user, mock_edit_customer_task, django_capture_on_commit_callbacks):
+def test_edit_customer_event_is_added_to_mindbox_outbox(user, mock_drain_mindbox_outbox, django_capture_on_commit_callbacks):
     with django_capture_on_commit_callbacks(execute=True):
-        UserEditor(username=user.username)()
+        UserEditor(username=user.username, first_name="User")()
 
-    mock_edit_customer_task.assert_called_once_with(str(user.id))
+    assert MindboxOutboxEvent.objects.get().operation == MindboxOutboxOperation.EDIT_CUSTOMER
+    mock_drain_mindbox_outbox.assert_called_once()
+
+
+def test_unchanged_user_is_not_saved_nor_sent_to_mindbox(user, editor, mocker):
+    editor()
+    save = mocker.spy(User, "save")
+
+    editor()
+
+    save.assert_not_called()
+    assert MindboxOutboxEvent.objects.count() == 1
+
+
+def test_only_changed_fields_are_saved(user, editor, mocker):
+    editor.phone = editor.empty_value
+    editor.birthdate = editor.empty_value
+    save = mocker.spy(User, "save")
+
+    editor()
+
+    assert sorted(save.call_args.kwargs["update_fields"]) == ["avatar_slug", "first_name", "last_name"]
+
+
+def test_edit_customer_event_is_not_added_if_mindbox_fields_are_unchanged(user):
+    UserEditor(username=user.username, phone="+78888888888", avatar_slug="abstract")()
+
+    user.refresh_from_db()
+    assert user.phone == "+78888888888"
+    assert not MindboxOutboxEvent.objects.exists()
@@ -104,3 +104,13 @@ def test_skip_existing_user_updating(importer, user):
 
     user.refresh_from_db()
     assert user.first_name != "Ванесса"
+
+
+def test_existing_user_with_differently_cased_username_is_updated(importer, factory):
+    user = factory.user(username="VM@Gmail.test")
+
+    importer()
+
+    user.refresh_from_db()
+    assert User.objects.count() == 1
+    assert user.first_name == "Ванесса"
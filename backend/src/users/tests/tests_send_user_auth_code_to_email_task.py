@@ -2,6 +2,7 @@ import pytest
 
 from a12n.models import PasswordlessEmailAuthCode
 from mindbox.models import CorporateEmailDomain
+from mindbox.utils import invalidate_corporate_email_domains
 from users.tasks import send_user_auth_code_to_email
 
 
@@ -13,6 +14,11 @@ def mock_context_builder(mocker):
     return mocker.patch("users.services.auth_code_email_context_builder.AuthCodeEmailContextBuilder.act", return_value={"a": "b"}, autospec=True)
 
 
+@pytest.fixture(autouse=True)
+def _reset_corporate_email_domains():
+    invalidate_corporate_email_domains()
+
+
 @pytest.fixture(autouse=True)
 def adjust_settings(settings):
     settings.MINDBOX_EMAIL_AUTH_CODE_OPERATION_NAME = "RegularOperation"
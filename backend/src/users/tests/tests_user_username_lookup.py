@@ -0,0 +1,59 @@
+import pytest
+from django.core.management import call_command
+
+from users.models import User
+
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+def test_user_is_found_case_insensitively(factory):
+    user = factory.user(username="Some@Email.test")
+
+    assert User.objects.get_by_username(" some@EMAIL.test ") == user
+
+
+def test_user_with_normalized_username_goes_first(factory):
+    factory.user(username="Some@Email.test")
+    user = factory.user(username="some@email.test")
+
+    assert User.objects.get_by_username("SOME@email.test") == user
+    assert User.objects.by_usernames(["SOME@email.test"]).first() == user
+
+
+def test_missing_user_is_not_found(factory):
+    factory.user(username="some@email.test")
+
+    with pytest.raises(User.DoesNotExist):
+        User.objects.get_by_username("other@email.test")
+
+
+def test_usernames_are_normalized(factory):
+    user = factory.user(username="Some@Email.test")
+
+    call_command("normalize_usernames")
+
+    user.refresh_from_db()
+    assert user.username == "some@email.test"
+
+
+def test_colliding_usernames_are_reported_and_kept(factory, tmp_path):
+    factory.user(username="Some@Email.test")
+    factory.user(username="some@email.test")
+    output = tmp_path / "collisions.csv"
+
+    call_command("normalize_usernames", output=str(output))
+
+    assert {"Some@Email.test", "some@email.test"} <= set(User.objects.values_list("username", flat=True))
+    assert "Some@Email.test" in output.read_text()
+
+
+def test_dry_run_changes_nothing(factory):
+    user = factory.user(username="Some@Email.test")
+
+    call_command("normalize_usernames", dry_run=True)
+
+    user.refresh_from_db()
+    assert user.username == "Some@Email.test"